@@ -0,0 +1,265 @@
+# actions/blob_store.py
+"""
+내용 주소 기반 백업 저장소 (.swing_backups/objects)
+
+- 키: 원본 바이트의 SHA-256 (같은 내용은 작업이 달라도 한 번만 저장)
+- 압축: zstandard가 설치되어 있으면 zstd, 없으면 zlib
+- 델타: 같은 파일의 이전 버전(base)이 있으면 줄 단위 델타로 저장 (전체 압축보다 작을 때만)
+- GC: 히스토리가 참조하는 blob과 그 델타 base의 참조 수를 세어, 참조가 없는 blob만 삭제
+
+객체 파일 형식: 1바이트 코덱 + 압축된 내용
+  'z' / 's'  전체 내용 (zlib / zstd)
+  'd' / 'e'  델타 (zlib / zstd) - {"base", "depth", "ops"} 헤더 줄 + 삽입 바이트
+"""
+import difflib
+import hashlib
+import json
+import os
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+MAX_DELTA_DEPTH = 16        # 델타 체인 최대 길이 (복원 비용 제한)
+MAX_DELTA_LINES = 50000     # 이보다 긴 파일은 델타 계산 생략 (difflib 비용)
+
+_FULL_CODECS = {b'z': 'zlib', b's': 'zstd'}
+_DELTA_CODECS = {b'd': 'zlib', b'e': 'zstd'}
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("zstd로 압축된 백업을 읽으려면 zstandard 패키지가 필요합니다")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+def fsync_path(path) -> None:
+    """파일 또는 디렉토리 fsync (디렉토리는 rename/생성 결과를 디스크에 반영하기 위해)"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class BlobStore:
+    """SHA-256 키 기반 압축/중복 제거/델타 백업 저장소"""
+
+    def __init__(self, root: Path, codec: Optional[str] = None):
+        self.root = Path(root)
+        self.codec = codec or ('zstd' if zstandard is not None else 'zlib')
+        self._unsynced: List[Path] = []  # 아직 fsync하지 않은 객체 (sync()에서 한 번에 처리)
+        self._depths: Dict[str, int] = {}  # digest -> 델타 체인 깊이 (이번 실행에서 확인한 것만)
+
+    # --- 경로 ---
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest[2:]
+
+    def exists(self, digest: str) -> bool:
+        return self._object_path(digest).exists()
+
+    def iter_digests(self) -> Iterator[str]:
+        if not self.root.exists():
+            return
+        for directory in self.root.iterdir():
+            if directory.is_dir() and len(directory.name) == 2:
+                for path in directory.iterdir():
+                    if not path.name.endswith('.tmp'):
+                        yield directory.name + path.name
+
+    # --- 저장 ---
+
+    def put(self, data: bytes, base: Optional[str] = None, base_data: Optional[bytes] = None) -> str:
+        """내용 저장 후 digest 반환 (이미 있으면 쓰지 않음, base가 있으면 델타 시도)
+
+        base_data: 호출한 쪽이 이미 가지고 있는 base 내용 (있으면 저장소에서 다시 복원하지 않음)
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if path.exists():
+            return digest
+
+        full = (b's' if self.codec == 'zstd' else b'z') + _compress(data, self.codec)
+        payload = full
+        if base and base != digest and self.exists(base):
+            delta, depth = self._encode_delta(data, base, base_data)
+            if delta is not None and len(delta) < len(full):
+                payload = delta
+                self._depths[digest] = depth
+        if payload is full:
+            self._depths[digest] = 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + '.tmp')
+        with open(temp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(temp_path, path)
+        self._unsynced.append(path)
+        return digest
+
+    def sync(self):
+        """put() 이후 새로 쓴 객체와 디렉토리를 한 번에 fsync (여러 파일을 쓴 뒤 마지막에 호출)"""
+        paths, self._unsynced = self._unsynced, []
+        for path in paths:
+            fsync_path(path)
+        for directory in {path.parent for path in paths}:
+            fsync_path(directory)
+
+    def put_text(self, text: str, base: Optional[str] = None, encoding: str = 'utf-8',
+                 base_text: Optional[str] = None) -> str:
+        base_data = base_text.encode(encoding) if base_text is not None else None
+        return self.put(text.encode(encoding), base, base_data)
+
+    def _depth(self, digest: str) -> int:
+        if digest not in self._depths:
+            header = self._read_header(digest)
+            self._depths[digest] = header.get('depth', 0) if header is not None else 0
+        return self._depths[digest]
+
+    def _encode_delta(self, data: bytes, base: str, base_data: Optional[bytes] = None):
+        """base 대비 줄 단위 델타와 체인 깊이 (체인이 너무 길거나 파일이 크면 (None, 0))"""
+        depth = self._depth(base) + 1
+        if depth > MAX_DELTA_DEPTH:
+            return None, 0
+
+        base_lines = (base_data if base_data is not None else self.get(base)).splitlines(keepends=True)
+        new_lines = data.splitlines(keepends=True)
+        if len(base_lines) > MAX_DELTA_LINES or len(new_lines) > MAX_DELTA_LINES:
+            return None, 0
+
+        # 편집은 보통 일부 구간만 바꾸므로 공통 앞/뒤 줄을 먼저 잘라내고 가운데만 비교
+        prefix = 0
+        limit = min(len(base_lines), len(new_lines))
+        while prefix < limit and base_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while (suffix < limit - prefix
+               and base_lines[len(base_lines) - 1 - suffix] == new_lines[len(new_lines) - 1 - suffix]):
+            suffix += 1
+
+        ops = [[0, 0, prefix]] if prefix else []  # base의 0:prefix 줄 복사
+        inserts = []
+        matcher = difflib.SequenceMatcher(None, base_lines[prefix:len(base_lines) - suffix],
+                                          new_lines[prefix:len(new_lines) - suffix], autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                ops.append([0, prefix + i1, prefix + i2])
+            elif j2 > j1:
+                chunk = b''.join(new_lines[prefix + j1:prefix + j2])
+                ops.append([1, len(chunk)])  # 삽입 바이트 길이
+                inserts.append(chunk)
+        if suffix:
+            ops.append([0, len(base_lines) - suffix, len(base_lines)])
+
+        body = json.dumps({'base': base, 'depth': depth, 'ops': ops}, separators=(',', ':')).encode('ascii')
+        codec_byte = b'e' if self.codec == 'zstd' else b'd'
+        return codec_byte + _compress(body + b'\n' + b''.join(inserts), self.codec), depth
+
+    # --- 읽기 ---
+
+    def _read_raw(self, digest: str) -> bytes:
+        with open(self._object_path(digest), 'rb') as f:
+            return f.read()
+
+    def _read_header(self, digest: str) -> Optional[Dict]:
+        """델타 객체의 헤더 (전체 내용 객체면 None)"""
+        raw = self._read_raw(digest)
+        codec = _DELTA_CODECS.get(raw[:1])
+        if codec is None:
+            return None
+        body = _decompress(raw[1:], codec)
+        return json.loads(body[:body.index(b'\n')])
+
+    def get(self, digest: str) -> bytes:
+        """내용 복원 (무결성 검증 포함)"""
+        raw = self._read_raw(digest)
+        marker = raw[:1]
+        if marker in _FULL_CODECS:
+            data = _decompress(raw[1:], _FULL_CODECS[marker])
+        elif marker in _DELTA_CODECS:
+            body = _decompress(raw[1:], _DELTA_CODECS[marker])
+            newline = body.index(b'\n')
+            header = json.loads(body[:newline])
+            base_lines = self.get(header['base']).splitlines(keepends=True)
+            pieces = []
+            offset = newline + 1
+            for op in header['ops']:
+                if op[0] == 0:
+                    pieces.extend(base_lines[op[1]:op[2]])
+                else:
+                    pieces.append(body[offset:offset + op[1]])
+                    offset += op[1]
+            data = b''.join(pieces)
+        else:
+            raise ValueError(f"알 수 없는 백업 객체 형식: {digest}")
+
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"백업 객체 손상: {digest}")
+        return data
+
+    def get_text(self, digest: str, encoding: str = 'utf-8') -> str:
+        return self.get(digest).decode(encoding)
+
+    # --- 참조 / GC ---
+
+    def references(self, digest: str) -> List[str]:
+        """이 blob이 복원에 필요로 하는 다른 blob (델타 base)"""
+        try:
+            header = self._read_header(digest)
+        except (OSError, ValueError):
+            return []
+        return [header['base']] if header else []
+
+    def reference_counts(self, roots: Iterable[str]) -> Counter:
+        """히스토리가 직접 참조하는 blob(roots)부터 델타 base까지 따라가며 참조 수 계산"""
+        counts = Counter()
+        stack = [digest for digest in roots if digest]
+        visited: Set[str] = set()
+        for digest in stack:
+            counts[digest] += 1
+        while stack:
+            digest = stack.pop()
+            if digest in visited:
+                continue
+            visited.add(digest)
+            for base in self.references(digest):
+                counts[base] += 1
+                stack.append(base)
+        return counts
+
+    def gc(self, roots: Iterable[str]) -> int:
+        """참조 수가 0인 blob 삭제 (삭제한 개수 반환)"""
+        counts = self.reference_counts(roots)
+        removed = 0
+        for digest in list(self.iter_digests()):
+            if counts[digest] == 0:
+                try:
+                    self._object_path(digest).unlink()
+                    self._depths.pop(digest, None)
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """저장된 blob 수와 디스크 사용량"""
+        count = 0
+        size = 0
+        for digest in self.iter_digests():
+            count += 1
+            size += self._object_path(digest).stat().st_size
+        return {'objects': count, 'bytes': size}
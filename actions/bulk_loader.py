@@ -0,0 +1,166 @@
+# actions/bulk_loader.py
+"""
+대량 파일 로더 - 디렉토리/글롭 /add 시 I/O와 CPU 작업을 파이프라인으로 처리
+
+- 작은 파일: 스레드 풀에서 읽기 + 인코딩 감지 + 구조 분석
+- 큰 파일: 프로세스 풀에서 읽기 + 디코딩 + 구조 분석 (GIL 회피)
+  REPL에는 이미 스피너/파일 감시 스레드가 돌고 있으므로 fork 대신 forkserver(없으면 spawn)로 워커를 만든다.
+- 결과는 입력 순서대로 FileManager에 등록 (주요 파일 우선 순서 유지)
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
+
+from .encoding_detector import EncodingDetector
+
+# 진행 상황 콜백: (완료 수, 전체 수, 파일 경로)
+ProgressCallback = Callable[[int, int, str], None]
+
+# 다른 스레드가 잡고 있던 락을 복사한 채 fork되면 워커가 멈출 수 있으므로 fork는 쓰지 않음
+PROCESS_START_METHODS = ('forkserver', 'spawn')
+
+# 워커 프로세스별 분석기 (프로세스마다 한 번만 생성)
+_worker_manager = None
+_worker_detector = None
+
+
+def _load_in_worker(resolved_path: str, cached_encoding: Optional[str] = None) -> Dict:
+    """워커 프로세스에서 큰 파일을 읽고 디코딩 + 분석 (pickle 가능한 최상위 함수)"""
+    global _worker_manager, _worker_detector
+    if _worker_manager is None:
+        from .file_manager import FileManager
+        _worker_manager = FileManager()
+        _worker_detector = EncodingDetector()
+
+    with open(resolved_path, 'rb') as f:
+        stat_result = os.fstat(f.fileno())
+        raw_data = f.read()
+
+    content = None
+    used_encoding = cached_encoding
+    if cached_encoding:
+        try:
+            content = raw_data.decode(cached_encoding)
+        except (UnicodeDecodeError, LookupError):
+            content = None
+    if content is None:
+        content, used_encoding = _worker_detector.decode(raw_data)
+
+    return {
+        'encoding': used_encoding,
+        'stat': stat_result,
+        'summary': _worker_manager.analyze_content(resolved_path, content)
+    }
+
+
+class BulkLoader:
+    """여러 파일을 병렬로 읽고 분석하여 FileManager에 순서대로 등록"""
+
+    def __init__(self, file_manager, max_workers: Optional[int] = None,
+                 max_processes: Optional[int] = None, process_threshold: int = 256 * 1024):
+        self.file_manager = file_manager
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.max_processes = max_processes if max_processes is not None else (os.cpu_count() or 1)
+        self.process_threshold = process_threshold  # 이 크기 이상이면 프로세스 풀에서 처리
+
+    def load(self, file_paths: List[str], progress_callback: Optional[ProgressCallback] = None) -> List[Dict]:
+        """파일 목록을 로드하고 입력 순서대로 add_single_file 형식의 결과 목록 반환"""
+        total = len(file_paths)
+        results = [None] * total
+        loaded = [None] * total
+        small_jobs = []
+        large_jobs = []
+
+        # 경로 해결과 크기 확인은 메인 스레드에서 (stat만 수행)
+        for index, file_path in enumerate(file_paths):
+            resolved_path = self.file_manager._resolve_file_path(file_path)
+            if not resolved_path:
+                results[index] = {
+                    'message': f"File not found: {file_path} (checked current dir, tests/fixtures/)",
+                    'analysis': None,
+                    'file_type': 'unknown'
+                }
+                continue
+            try:
+                size = os.path.getsize(resolved_path)
+            except OSError:
+                size = 0
+            if self.max_processes > 1 and size >= self.process_threshold:
+                large_jobs.append((index, resolved_path))
+            else:
+                small_jobs.append((index, resolved_path))
+
+        done = total - len(small_jobs) - len(large_jobs)
+        process_pool = None
+        try:
+            futures = {}
+            if large_jobs:
+                process_pool = _make_process_pool(min(self.max_processes, len(large_jobs)))
+                for index, resolved_path in large_jobs:
+                    cached_encoding = self.file_manager.encoding_detector.get_cached_encoding(resolved_path)
+                    future = process_pool.submit(_load_in_worker, resolved_path, cached_encoding)
+                    futures[future] = (index, resolved_path)
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as thread_pool:
+                for index, resolved_path in small_jobs:
+                    future = thread_pool.submit(self._load_in_thread, resolved_path)
+                    futures[future] = (index, resolved_path)
+
+                for future in as_completed(futures):
+                    index, resolved_path = futures[future]
+                    try:
+                        loaded[index] = (resolved_path, future.result())
+                    except Exception as e:
+                        results[index] = {
+                            'message': f"Error reading file {resolved_path}: {e}",
+                            'analysis': None,
+                            'file_type': 'unknown'
+                        }
+                    done += 1
+                    if progress_callback:
+                        progress_callback(done, total, resolved_path)
+        finally:
+            if process_pool:
+                process_pool.shutdown()
+
+        # 입력 순서대로 등록 (컨텍스트 파일 순서 보존)
+        for index, item in enumerate(loaded):
+            if item is None:
+                continue
+            resolved_path, payload = item
+            if payload['encoding']:
+                self.file_manager.encoding_detector.remember(resolved_path, payload['stat'], payload['encoding'])
+            try:
+                results[index] = self.file_manager.register_file(
+                    resolved_path, payload['encoding'], payload['stat'], payload['summary'])
+            except Exception as e:
+                results[index] = {
+                    'message': f"Error reading file {resolved_path}: {e}",
+                    'analysis': None,
+                    'file_type': 'unknown'
+                }
+
+        return results
+
+    def _load_in_thread(self, resolved_path: str) -> Dict:
+        """스레드 풀 작업: 읽기 + 인코딩 감지(캐시 공유) + 구조 분석"""
+        with open(resolved_path, 'rb') as f:
+            stat_result = os.fstat(f.fileno())
+            raw_data = f.read()
+
+        content, used_encoding = self.file_manager.encoding_detector.decode(raw_data, resolved_path, stat_result)
+        return {
+            'encoding': used_encoding,
+            'stat': stat_result,
+            'summary': self.file_manager.analyze_content(resolved_path, content)
+        }
+
+
+def _make_process_pool(max_workers: int):
+    """fork를 쓰지 않는 프로세스 풀 (multiprocessing import 비용은 큰 파일이 있을 때만)"""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    available = multiprocessing.get_all_start_methods()
+    method = next(name for name in PROCESS_START_METHODS if name in available)
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(method))
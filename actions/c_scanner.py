@@ -0,0 +1,134 @@
+# actions/c_scanner.py
+"""
+C 소스 단일 패스 스캐너 - 표준 함수, 섹션별 include, ctx typedef를 한 번에 수집
+
+미리 컴파일한 하나의 alternation 정규식으로 내용 전체를 한 번만 훑는다.
+FileManager의 _analyze_c_file_structure / _categorize_includes / ctx 구조체 탐색과
+동일한 결과를 내도록 각 규칙의 판정 방식을 그대로 따른다.
+"""
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+# 표준 함수명 -> 설명 (검사 순서가 결과 순서에 영향을 주므로 순서 유지)
+STANDARD_FUNCTIONS = {
+    'a000_init_proc': '프로그램 초기화 함수',
+    'b000_input_validation': '입력 데이터 검증 수행',
+    'b999_output_setting': '출력 전문의 순서 설정',
+    'c000_main_proc': '실제 프로그램의 주요 로직 처리',
+    'c300_get_svc_info': '서비스 정보 조회 함수',
+    'x000_mpfmoutq_proc': '출력 처리 수행 함수',
+    'z000_norm_exit_proc': '프로그램 정상 종료 처리',
+    'z999_err_exit_proc': '프로그램 에러 종료 처리'
+}
+
+# 섹션 마커 (한 줄에 여러 개가 있으면 앞의 것이 우선)
+SECTION_MARKERS = [
+    ('IO Formatter', 'io_formatter'),
+    ('Static Library', 'static_library'),
+    ('DBIO Library', 'dbio_library'),
+]
+
+# 모든 최상위 분기가 리터럴 문자(\n, 마커/함수명 첫 글자, t/T)로 시작하도록 구성하여
+# 정규식 엔진이 후보 문자까지 빠르게 건너뛸 수 있게 한다 (스캔 대상은 '\n' + content).
+# include 줄과 ctx typedef는 lookahead로 매칭하여 같은 줄의 함수명 매칭을 가리지 않는다.
+_MARKERS = '|'.join(re.escape(marker) for marker, _ in SECTION_MARKERS)
+_INCLUDE = (r'\n(?=[^\S\n]*#include[^\S\n]*[<"](?P<include>[^\n]*?)[>"])'
+            r'(?![^\n]*?(?:' + _MARKERS + '))')  # 섹션 마커 줄의 include는 무시
+_FUNCTIONS = '|'.join(map(re.escape, STANDARD_FUNCTIONS))
+_CTX_REST = r'(?=(?i:ypedef\s+struct\s+\w*ctx\w*\s+(?P<{}>\w+);))'
+_CTX = 't' + _CTX_REST.format('ctx') + '|T' + _CTX_REST.format('ctx_upper')
+
+# 함수명/섹션 마커 분기에 그룹을 두면 위 최적화가 꺼지므로 매칭된 텍스트로 구분
+C_MASTER_PATTERN = re.compile('|'.join([_INCLUDE, _FUNCTIONS, _CTX, _MARKERS]))
+
+# str.splitlines()가 '\n' 외에 줄 경계로 취급하는 문자 (있으면 줄 번호 계산을 느린 경로로)
+EXOTIC_LINE_BREAK_PATTERN = re.compile(r'\r(?!\n)|[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+LINE_BREAK_PATTERN = re.compile(r'\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+
+_FUNCTION_ORDER = {name: index for index, name in enumerate(STANDARD_FUNCTIONS)}
+
+
+@dataclass
+class CScanResult:
+    """C 소스 스캔 결과"""
+    found_functions: Dict[str, Dict] = field(default_factory=dict)
+    includes: Dict[str, List[str]] = field(default_factory=dict)
+    context_structs: List[str] = field(default_factory=list)
+
+
+def scan_c_source(content: str) -> CScanResult:
+    """C 소스를 한 번 스캔 (FileManager.analyze_content가 파일당 한 번 호출하고 결과를 각 분석에 전달)"""
+    includes = {
+        'system': [],           # 시스템 헤더 (<pfm*.h> 등)
+        'io_formatter': [],     # IO Formatter 섹션
+        'static_library': [],   # Static Library 섹션 (중요!)
+        'dbio_library': [],     # DBIO Library 섹션
+        'other': []
+    }
+    context_structs = []
+    function_hits = []  # (줄 인덱스, 함수명)
+    current_section = 'other'
+
+    # 줄 번호 계산: 보통은 '\n' 개수를 누적, 특이한 줄 경계가 있으면 splitlines 기준 오프셋 목록 사용
+    line_starts = None
+    if EXOTIC_LINE_BREAK_PATTERN.search(content):
+        line_starts = [0] + [m.end() for m in LINE_BREAK_PATTERN.finditer(content)]
+    counted_pos = 0
+    counted_lines = 0
+
+    text = '\n' + content  # 첫 줄도 줄 시작 분기로 매칭되도록
+    for match in C_MASTER_PATTERN.finditer(text):
+        kind = match.lastgroup
+        pos = match.start() - 1  # content 기준 위치
+
+        if kind is None and match.group() in STANDARD_FUNCTIONS:
+            # 표준 함수명
+            if line_starts is not None:
+                line_index = bisect_right(line_starts, pos) - 1
+                line_begin = line_starts[line_index]
+                line_end = line_starts[line_index + 1] if line_index + 1 < len(line_starts) else len(content)
+            else:
+                counted_lines += content.count('\n', counted_pos, pos)
+                counted_pos = pos
+                line_index = counted_lines
+                line_begin = content.rfind('\n', 0, pos) + 1
+                line_end = content.find('\n', pos)
+                if line_end < 0:
+                    line_end = len(content)
+            line = content[line_begin:line_end]
+            if '(' in line or 'void' in line or 'int' in line:
+                function_hits.append((line_index, match.group()))
+            continue
+
+        if kind in ('ctx', 'ctx_upper'):
+            context_structs.append(match.group(kind))
+            continue
+
+        if kind == 'include':
+            include_file = match.group('include')
+            # 시스템 헤더 분류
+            if include_file.startswith('pfm') or include_file.startswith('<'):
+                includes['system'].append(include_file)
+            else:
+                includes[current_section].append(include_file)
+        else:
+            # 섹션 마커 (한 줄에 여러 개면 SECTION_MARKERS 순서가 우선)
+            line_begin = content.rfind('\n', 0, pos) + 1
+            line_end = content.find('\n', pos)
+            line = content[line_begin:] if line_end < 0 else content[line_begin:line_end]
+            for marker, section in SECTION_MARKERS:
+                if marker in line:
+                    current_section = section
+                    break
+
+    # 한 줄에 여러 함수가 있으면 STANDARD_FUNCTIONS 순서, 같은 함수는 마지막 줄 번호 사용
+    found_functions = {}
+    for line_index, name in sorted(function_hits, key=lambda hit: (hit[0], _FUNCTION_ORDER[hit[1]])):
+        found_functions[name] = {
+            'description': STANDARD_FUNCTIONS[name],
+            'line_number': line_index + 1
+        }
+
+    return CScanResult(found_functions=found_functions, includes=includes, context_structs=context_structs)
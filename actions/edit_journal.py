@@ -0,0 +1,158 @@
+# actions/edit_journal.py
+"""
+편집 히스토리 저널 - 추가 전용(JSON Lines)
+
+한 줄이 하나의 레코드이며 파일 내용은 담지 않고 작업 메타데이터와 백업 파일 참조만 저장한다.
+- 기록: 파일 끝에 한 줄 추가 (히스토리 길이와 무관)
+- 최근 기록: 파일 끝에서부터 블록 단위로 역방향 읽기 (필요한 개수만 파싱)
+- 오래된 기록: 필요할 때만 역방향으로 훑어서 찾음
+- 압축: 롤백 표시 같은 부가 레코드를 작업 레코드에 합치고, 정리된 작업을 제거하여 다시 씀
+  (부가 레코드가 COMPACT_MAX_EXTRA개를 넘으면 FileEditor가 시작/기록 시 자동으로 압축)
+"""
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+JOURNAL_VERSION = 1
+_BLOCK_SIZE = 64 * 1024
+COMPACT_MIN_BYTES = 64 * 1024  # 이보다 작은 저널은 부가 레코드를 세지도 않음
+COMPACT_MAX_EXTRA = 500        # 작업 레코드 외 레코드(pending/abort/rollback)가 이보다 많으면 압축
+
+
+class EditJournal:
+    """edit_journal.jsonl 읽기/쓰기"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def append(self, record: Dict, sync: bool = False):
+        """레코드 한 줄 추가 (sync=True면 디스크에 기록될 때까지 대기)"""
+        line = json.dumps({'v': JOURNAL_VERSION, **record}, ensure_ascii=False, separators=(',', ':'))
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _reverse_lines(self) -> Iterator[bytes]:
+        """파일 끝에서부터 한 줄씩 (블록 단위로 읽어 전체를 메모리에 올리지 않음)"""
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            position = f.seek(0, os.SEEK_END)
+            remainder = b''
+            while position > 0:
+                size = min(_BLOCK_SIZE, position)
+                position -= size
+                f.seek(position)
+                block = f.read(size) + remainder
+                lines = block.split(b'\n')
+                remainder = lines[0]  # 블록 경계에서 잘린 줄은 다음 블록과 합침
+                for line in reversed(lines[1:]):
+                    if line.strip():
+                        yield line
+            if remainder.strip():
+                yield remainder
+
+    def iter_reverse(self) -> Iterator[Dict]:
+        """최신 레코드부터 순회 (손상된 줄은 건너뜀 - 기록 중 중단된 마지막 줄 등)"""
+        for line in self._reverse_lines():
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+    def iter_forward(self) -> Iterator[Dict]:
+        """오래된 레코드부터 순회"""
+        try:
+            f = open(self.path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    def recent_operations(self, limit: int) -> List[Dict]:
+        """최근 작업 레코드 limit개 (최신순, 롤백 표시 반영)"""
+        rolled_back = set()
+        operations = []
+        for record in self.iter_reverse():
+            if record.get('type') == 'rollback':
+                rolled_back.add(record['operation_id'])
+            elif record.get('type') == 'operation':
+                if record['operation_id'] in rolled_back:
+                    record = {**record, 'rolled_back': True}
+                operations.append(record)
+                if len(operations) >= limit:
+                    break
+        return operations
+
+    def find_operation(self, operation_id: str) -> Optional[Dict]:
+        """작업 ID로 레코드 검색 (최신 기록부터 역방향)"""
+        rolled_back = False
+        for record in self.iter_reverse():
+            if record.get('operation_id') != operation_id:
+                continue
+            if record.get('type') == 'rollback':
+                rolled_back = True
+            elif record.get('type') == 'operation':
+                return {**record, 'rolled_back': True} if rolled_back else record
+        return None
+
+    def compact_if_needed(self, max_extra: int = COMPACT_MAX_EXTRA, min_bytes: int = COMPACT_MIN_BYTES) -> bool:
+        """부가 레코드가 max_extra개를 넘으면 압축 (압축했으면 True)"""
+        try:
+            if self.path.stat().st_size < min_bytes:
+                return False
+        except FileNotFoundError:
+            return False
+        extra = sum(1 for record in self.iter_forward() if record.get('type') != 'operation')
+        if extra <= max_extra:
+            return False
+        self.compact()
+        return True
+
+    def compact(self, keep: Optional[Callable[[Dict], bool]] = None) -> int:
+        """부가 레코드를 작업 레코드에 합치고 keep(record)가 False인 작업을 제거 (남은 작업 수 반환)
+
+        commit/abort가 없는 pending 레코드(복구하지 못한 작업)는 그대로 남긴다.
+        임시 파일에 쓴 뒤 교체하므로 중간에 중단되어도 기존 저널이 유지된다.
+        """
+        rolled_back = set()
+        resolved = set()
+        for record in self.iter_forward():
+            if record.get('type') == 'rollback':
+                rolled_back.add(record['operation_id'])
+            elif record.get('type') in ('operation', 'abort'):
+                resolved.add(record['operation_id'])
+
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        kept = 0
+        with open(temp_path, 'w', encoding='utf-8') as out:
+            for record in self.iter_forward():
+                if record.get('type') == 'pending' and record['operation_id'] not in resolved:
+                    out.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+                    continue
+                if record.get('type') != 'operation':
+                    continue
+                if record['operation_id'] in rolled_back:
+                    record['rolled_back'] = True
+                if keep is not None and not keep(record):
+                    continue
+                out.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+                kept += 1
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(temp_path, self.path)
+        return kept
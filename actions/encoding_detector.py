@@ -0,0 +1,209 @@
+# actions/encoding_detector.py
+"""
+파일 인코딩 감지기 - 대용량 EUC-KR/CP949 소스를 위한 단계별(tiered) 감지
+
+1) 경로 + mtime 캐시 적중 시 감지 생략
+2) BOM / strict UTF-8 디코딩 (fast path)
+3) 앞/뒤 일부 구간만 샘플링하여 charset_normalizer로 후보 인코딩 감지
+4) 일반적으로 사용하는 인코딩 목록을 순차적으로 시도
+"""
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+# charset_normalizer는 선택 의존성 - import 비용이 커서(~30ms) 처음 감지할 때 로드
+_from_bytes = None
+
+
+def _load_from_bytes():
+    """charset_normalizer.from_bytes (없으면 False, 한 번만 시도)"""
+    global _from_bytes
+    if _from_bytes is None:
+        try:
+            from charset_normalizer import from_bytes
+            _from_bytes = from_bytes
+        except ImportError:
+            _from_bytes = False
+    return _from_bytes
+
+UTF8_BOM = b'\xef\xbb\xbf'
+
+# 비 ASCII 바이트가 포함된 줄 (레거시 인코딩 감지에 의미 있는 줄)
+NON_ASCII_LINE_PATTERN = re.compile(rb'[^\n]*[\x80-\xff][^\n]*\n?')
+
+
+class EncodingDetector:
+    """바이트 데이터를 디코딩하고 감지된 인코딩을 경로 + mtime 기준으로 캐시"""
+
+    # 감지 실패 시 순차적으로 시도할 인코딩 (한글 레거시 인코딩 포함)
+    FALLBACK_ENCODINGS = ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr', 'shift_jis']
+
+    def __init__(self, head_window: int = 64 * 1024, tail_window: int = 16 * 1024,
+                 max_cache_entries: int = 1024):
+        self.head_window = head_window
+        self.tail_window = tail_window
+        self.max_cache_entries = max_cache_entries
+        # path -> (mtime_ns, size, encoding)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def decode(self, raw_data: bytes, path: Optional[str] = None,
+               stat_result: Optional[os.stat_result] = None) -> Tuple[str, str]:
+        """raw 데이터를 디코딩하여 (내용, 사용된 인코딩)을 반환"""
+        cache_key = self._make_cache_key(path, stat_result)
+
+        # 1) 캐시 적중 시 감지 생략
+        cached_encoding = self.get_cached_encoding(path, stat_result)
+        if cached_encoding:
+            try:
+                return raw_data.decode(cached_encoding), cached_encoding
+            except (UnicodeDecodeError, LookupError):
+                pass
+
+        content, used_encoding = self._decode_uncached(raw_data)
+
+        # fallback(replace) 디코딩 결과는 캐시하지 않음
+        if cache_key and not used_encoding.endswith('(fallback with replace)'):
+            self._store(path, cache_key, used_encoding)
+
+        return content, used_encoding
+
+    def detect(self, raw_data: bytes) -> Optional[str]:
+        """raw 데이터의 인코딩만 감지 (디코딩 결과는 버림)"""
+        _, used_encoding = self._decode_uncached(raw_data)
+        if used_encoding.endswith('(fallback with replace)'):
+            return None
+        return used_encoding
+
+    def get_cached_encoding(self, path: Optional[str],
+                            stat_result: Optional[os.stat_result] = None) -> Optional[str]:
+        """캐시된 인코딩 조회 (파일이 변경되었으면 None)"""
+        cache_key = self._make_cache_key(path, stat_result)
+        if not cache_key:
+            return None
+
+        with self._lock:
+            entry = self._cache.get(path)
+            if entry and entry[:2] == cache_key:
+                self._cache.move_to_end(path)
+                return entry[2]
+        return None
+
+    def remember(self, path: str, stat_result: os.stat_result, encoding: str):
+        """다른 곳(워커 프로세스 등)에서 감지한 인코딩을 캐시에 기록"""
+        cache_key = self._make_cache_key(path, stat_result)
+        if cache_key and not encoding.endswith('(fallback with replace)'):
+            self._store(path, cache_key, encoding)
+
+    def invalidate(self, path: Optional[str] = None):
+        """특정 경로 (또는 전체) 캐시 무효화"""
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(path, None)
+
+    def _decode_uncached(self, raw_data: bytes) -> Tuple[str, str]:
+        """캐시 없이 단계별로 디코딩 시도"""
+        # 2) BOM이 있으면 utf-8-sig, 아니면 strict UTF-8 (fast path)
+        error_offset = 0
+        utf8_encoding = 'utf-8-sig' if raw_data.startswith(UTF8_BOM) else 'utf-8'
+        try:
+            return raw_data.decode(utf8_encoding), utf8_encoding
+        except UnicodeDecodeError as e:
+            # UTF-8이 깨지는 위치 주변이 레거시 인코딩 바이트가 있는 구간
+            error_offset = e.start
+
+        # 3) 샘플 구간에서 감지된 후보들을 먼저 시도하고, 그 다음 일반 인코딩 목록 시도
+        encodings_to_try = self._detect_candidates(raw_data, error_offset)
+        for enc in self.FALLBACK_ENCODINGS:
+            if enc not in encodings_to_try:
+                encodings_to_try.append(enc)
+
+        for enc in encodings_to_try:
+            try:
+                return raw_data.decode(enc), enc
+            except (UnicodeDecodeError, LookupError):
+                continue
+
+        # 4) 모든 시도가 실패한 경우 errors='replace'로 UTF-8 강제 디코딩
+        return raw_data.decode('utf-8', errors='replace'), 'utf-8 (fallback with replace)'
+
+    def _detect_candidates(self, raw_data: bytes, error_offset: int = 0) -> List[str]:
+        """앞/뒤 샘플 구간만으로 charset_normalizer 후보 인코딩 목록 생성"""
+        from_bytes = _load_from_bytes()
+        if not from_bytes:
+            return []
+
+        try:
+            matches = from_bytes(self._sample(raw_data, error_offset))
+        except Exception:
+            return []
+
+        candidates = []
+        for match in matches:
+            if match.encoding and match.encoding not in candidates:
+                candidates.append(match.encoding)
+        return candidates
+
+    def _sample(self, raw_data: bytes, error_offset: int = 0) -> bytes:
+        """감지용 샘플 생성 - 앞부분, UTF-8 디코딩 실패 지점 주변, 뒷부분
+
+        멀티바이트 문자가 잘리지 않도록 각 구간을 줄 경계에 맞추고,
+        ASCII 줄에 희석되지 않도록 비 ASCII 바이트가 있는 줄만 남긴다.
+        (CP949/EUC-KR/Shift_JIS 모두 두 번째 바이트로 0x0A를 사용하지 않음)
+        """
+        if len(raw_data) <= self.head_window + self.tail_window:
+            return self._non_ascii_lines(raw_data)
+
+        windows = [(0, self.head_window)]
+        if error_offset > self.head_window:
+            # 대부분 ASCII이고 일부 구간만 한글인 혼합 파일 대비
+            start = max(0, error_offset - self.tail_window // 2)
+            windows.append((start, start + self.head_window))
+        windows.append((len(raw_data) - self.tail_window, len(raw_data)))
+
+        sample = []
+        last_end = 0
+        for start, end in windows:
+            start = max(start, last_end)
+            if start >= end:
+                continue
+            chunk = raw_data[start:end]
+            if start > 0:
+                cut = chunk.find(b'\n')
+                chunk = chunk[cut + 1:] if cut >= 0 else chunk
+            if end < len(raw_data):
+                cut = chunk.rfind(b'\n')
+                chunk = chunk[:cut + 1] if cut >= 0 else chunk
+            sample.append(chunk)
+            last_end = end
+
+        return self._non_ascii_lines(b''.join(sample))
+
+    def _non_ascii_lines(self, data: bytes) -> bytes:
+        """비 ASCII 줄만 추출 (없으면 원본 유지)"""
+        lines = NON_ASCII_LINE_PATTERN.findall(data)
+        return b''.join(lines) if lines else data
+
+    def _make_cache_key(self, path: Optional[str],
+                        stat_result: Optional[os.stat_result]) -> Optional[Tuple[int, int]]:
+        """캐시 키 (mtime_ns, size) 생성"""
+        if not path:
+            return None
+        if stat_result is None:
+            try:
+                stat_result = os.stat(path)
+            except OSError:
+                return None
+        return (stat_result.st_mtime_ns, stat_result.st_size)
+
+    def _store(self, path: str, cache_key: Tuple[int, int], encoding: str):
+        """캐시에 저장 (LRU 방식으로 크기 제한)"""
+        with self._lock:
+            self._cache[path] = (cache_key[0], cache_key[1], encoding)
+            self._cache.move_to_end(path)
+            while len(self._cache) > self.max_cache_entries:
+                self._cache.popitem(last=False)
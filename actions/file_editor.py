@@ -4,30 +4,118 @@
 import os
 import json
 import shutil
-import difflib
 import hashlib
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-import re
+from .edit_journal import COMPACT_MAX_EXTRA, COMPACT_MIN_BYTES, EditJournal
+from .blob_store import BlobStore, fsync_path
+from .encoding_detector import EncodingDetector
+from .text_format import TextFormat
+from .line_diff import compute_diff
+from .response_parser import FencedBlock, parse_events
+
+try:
+    import fcntl
+except ImportError:  # Windows - 프로세스 간 잠금 없이 동작
+    fcntl = None
+
+# 적용 중 임시 파일 접미사 (대상 파일과 같은 디렉토리에 쓰고 rename)
+TEMP_SUFFIX = '.coe-tmp'
+# 저널을 쓰는 작업을 프로세스 간에 직렬화하는 잠금 파일 (백업 디렉토리 안)
+LOCK_FILE = '.lock'
 
 @dataclass
 class FileChange:
-    """파일 변경사항을 나타내는 데이터 클래스"""
+    """파일 변경사항을 나타내는 데이터 클래스
+
+    저널에서 읽은 변경은 original_content/new_content가 None이며,
+    필요할 때 get_original_content()/get_new_content()로 백업 저장소(blob)에서 읽는다.
+    blob에는 디스크에 있던/쓴 바이트 그대로 저장하고, 내용(텍스트)은 text_format으로 디코딩한다.
+    backup_path/new_backup_path는 이전 형식(UTF-8 텍스트)의 백업 파일 참조 (blob이 없을 때만 사용).
+    """
     file_path: str
-    original_content: str
-    new_content: str
+    original_content: Optional[str]
+    new_content: Optional[str]
     timestamp: str
     change_id: str
-    backup_path: str
+    backup_path: str = ''
+    new_backup_path: str = ''
+    is_new_file: Optional[bool] = None
+    original_blob: str = ''
+    new_blob: str = ''
+    text_format: TextFormat = field(default_factory=TextFormat)
+    store: Optional[BlobStore] = field(default=None, repr=False, compare=False)
     
     def to_dict(self):
-        return asdict(self)
+        data = {f.name: getattr(self, f.name) for f in fields(self) if f.name != 'store'}
+        data['text_format'] = self.text_format.to_record()
+        return data
     
     @classmethod
     def from_dict(cls, data):
-        return cls(**data)
+        data = dict(data)
+        text_format = TextFormat.from_record(data.pop('text_format', None))
+        return cls(text_format=text_format, **data)
+
+    def to_record(self) -> Dict[str, Any]:
+        """저널용 메타데이터 (내용은 blob digest 참조로만 저장)"""
+        record = {
+            'file_path': self.file_path,
+            'timestamp': self.timestamp,
+            'change_id': self.change_id,
+            'is_new_file': self.is_new,
+        }
+        for key in ('original_blob', 'new_blob', 'backup_path', 'new_backup_path'):
+            if getattr(self, key):
+                record[key] = getattr(self, key)
+        if self.text_format.to_record():
+            record['format'] = self.text_format.to_record()
+        return record
+
+    @classmethod
+    def from_record(cls, data: Dict[str, Any], store: Optional[BlobStore] = None) -> 'FileChange':
+        data = dict(data)
+        text_format = TextFormat.from_record(data.pop('format', None))
+        return cls(original_content=None, new_content=None, text_format=text_format, store=store, **data)
+
+    @property
+    def is_new(self) -> bool:
+        """새로 생성한 파일인지 (내용을 읽지 않고 판단)"""
+        if self.is_new_file is not None:
+            return self.is_new_file
+        return len(self.get_original_content()) == 0
+
+    def _read_backup(self, digest: str, path: str) -> bytes:
+        if digest and self.store is not None:
+            return self.store.get(digest)
+        if not path:
+            return b''
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def get_original_bytes(self) -> bytes:
+        """변경 전 파일 바이트 (롤백 시 그대로 씀)"""
+        return self._read_backup(self.original_blob, self.backup_path)
+
+    def get_original_content(self) -> str:
+        """변경 전 내용 (저널에서 읽은 변경이면 백업 저장소에서 로드)"""
+        if self.original_content is None:
+            self.original_content = self.text_format.decode(self.get_original_bytes())
+        return self.original_content
+
+    def get_new_content(self) -> str:
+        """변경 후 내용 (저널에서 읽은 변경이면 백업 저장소에서 로드)"""
+        if self.new_content is None:
+            self.new_content = self.text_format.decode(self._read_backup(self.new_blob, self.new_backup_path))
+        return self.new_content
+
+    def blob_refs(self) -> List[str]:
+        """이 변경이 참조하는 blob digest 목록"""
+        return [digest for digest in (self.original_blob, self.new_blob) if digest]
 
 @dataclass
 class EditOperation:
@@ -36,6 +124,7 @@ class EditOperation:
     timestamp: str
     changes: List[FileChange]
     description: str
+    rolled_back: bool = False
     
     def to_dict(self):
         return {
@@ -54,6 +143,26 @@ class EditOperation:
             changes=changes,
             description=data['description']
         )
+
+    def to_record(self) -> Dict[str, Any]:
+        """저널용 메타데이터 레코드"""
+        return {
+            'type': 'operation',
+            'operation_id': self.operation_id,
+            'timestamp': self.timestamp,
+            'description': self.description,
+            'changes': [change.to_record() for change in self.changes]
+        }
+
+    @classmethod
+    def from_record(cls, data: Dict[str, Any], store: Optional[BlobStore] = None) -> 'EditOperation':
+        return cls(
+            operation_id=data['operation_id'],
+            timestamp=data['timestamp'],
+            changes=[FileChange.from_record(change, store) for change in data['changes']],
+            description=data['description'],
+            rolled_back=data.get('rolled_back', False)
+        )
     
     def get_summary(self) -> Dict[str, Any]:
         """편집 작업 요약 생성"""
@@ -67,7 +176,7 @@ class EditOperation:
         for change in self.changes:
             file_detail = {
                 'file_path': change.file_path,
-                'is_new': len(change.original_content) == 0,
+                'is_new': change.is_new,
                 'change_description': self._analyze_changes(change)
             }
             
@@ -82,30 +191,28 @@ class EditOperation:
     
     def _analyze_changes(self, change: FileChange) -> str:
         """변경사항을 자연어로 분석"""
-        if len(change.original_content) == 0:
+        original_content = change.get_original_content()
+        new_content = change.get_new_content()
+        if len(original_content) == 0:
             # 새 파일
-            lines = len(change.new_content.splitlines())
-            content = change.new_content.lower()
+            lines = len(new_content.splitlines())
+            content = new_content.lower()
             
             if 'class ' in content:
-                classes = len([line for line in change.new_content.splitlines() if 'class ' in line.strip()])
+                classes = len([line for line in new_content.splitlines() if 'class ' in line.strip()])
                 return f"새로운 클래스 {classes}개를 포함한 파일 생성"
             elif 'def ' in content:
-                functions = len([line for line in change.new_content.splitlines() if 'def ' in line.strip()])
+                functions = len([line for line in new_content.splitlines() if 'def ' in line.strip()])
                 return f"새로운 함수 {functions}개를 포함한 파일 생성"
             elif content.strip().startswith('import') or content.strip().startswith('from'):
                 return "새로운 모듈 파일 생성"
             else:
                 return f"새 파일 생성 ({lines}줄)"
         
-        # 기존 파일 수정 분석
-        original_lines = change.original_content.splitlines()
-        new_lines = change.new_content.splitlines()
-        
-        # diff를 통한 변경사항 분석
-        diff = list(difflib.unified_diff(original_lines, new_lines, lineterm=''))
-        added_lines = [line[1:] for line in diff if line.startswith('+') and not line.startswith('+++')]
-        removed_lines = [line[1:] for line in diff if line.startswith('-') and not line.startswith('---')]
+        # diff를 통한 변경사항 분석 (미리보기에서 계산한 diff 재사용)
+        diff = compute_diff(original_content, new_content)
+        added_lines = diff.added_lines()
+        removed_lines = diff.removed_lines()
         
         # 패턴 분석
         changes = []
@@ -163,86 +270,224 @@ class EditOperation:
 class FileEditor:
     """파일 편집 및 버전 관리 시스템"""
     
-    def __init__(self, backup_dir: str = ".swing_backups"):
+    # 시작 시 메모리에 올리는 최근 작업 수 (오래된 작업은 저널에서 필요할 때 읽음)
+    RECENT_OPERATIONS = 50
+    # 저널 자동 압축: 부가 레코드(pending/abort/rollback)가 JOURNAL_MAX_EXTRA개를 넘으면 작업 레코드에 합침
+    # 시작할 때 한 번, 실행 중에는 부가 레코드를 JOURNAL_CHECK_INTERVAL개 쓸 때마다 검사
+    JOURNAL_MAX_EXTRA = COMPACT_MAX_EXTRA
+    JOURNAL_COMPACT_MIN_BYTES = COMPACT_MIN_BYTES
+    JOURNAL_CHECK_INTERVAL = 100
+
+    def __init__(self, backup_dir: str = ".swing_backups", encoding_detector: Optional[EncodingDetector] = None):
         self.backup_dir = Path(backup_dir)
         self.backup_dir.mkdir(exist_ok=True)
-        
-        # 히스토리 파일
-        self.history_file = self.backup_dir / "edit_history.json"
+
+        # 파일 형식(인코딩/BOM/줄바꿈): FileManager와 감지기를 공유하면 로드 시 감지한 인코딩을 재사용
+        self.encoding_detector = encoding_detector or EncodingDetector()
+        self._formats: Dict[str, Tuple[Tuple[int, int], TextFormat]] = {}  # 경로 -> ((mtime_ns, size), 형식)
+        
+        # 히스토리: 추가 전용 저널 (내용은 백업 저장소의 blob digest로만 참조)
+        self.history_file = self.backup_dir / "edit_history.json"  # 이전 형식 (최초 1회 저널로 변환)
+        self.journal = EditJournal(self.backup_dir / "edit_journal.jsonl")
+        self.blobs = BlobStore(self.backup_dir / "objects")
+        self._thread_lock = threading.RLock()
+        self._lock_file = None
+        self._lock_depth = 0
+        self._extra_records_written = 0
+        with self._journal_lock():
+            self._migrate_legacy_history()
+            self._recover_interrupted_operations()
+            self._compact_journal_if_needed()
         self.operations = self._load_history()
+
+    @contextmanager
+    def _journal_lock(self):
+        """저널을 쓰는 작업(적용/복구/롤백/정리)을 백업 디렉토리의 잠금 파일(flock)로 직렬화
+
+        같은 백업 디렉토리를 쓰는 다른 REPL이나 백그라운드에서 생성 중인 FileEditor가
+        진행 중인 적용의 pending 레코드를 중단된 작업으로 보고 복구하지 않도록 한다. 같은 스레드에서는 재진입 가능.
+        """
+        with self._thread_lock:
+            if self._lock_depth == 0 and fcntl is not None:
+                self._lock_file = open(self.backup_dir / LOCK_FILE, 'a')
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0 and self._lock_file is not None:
+                    self._lock_file.close()  # 닫으면 잠금도 해제됨
+                    self._lock_file = None
         
     def _load_history(self) -> List[EditOperation]:
-        """편집 히스토리를 로드"""
-        if not self.history_file.exists():
-            return []
-        
+        """최근 편집 히스토리를 로드 (저널 끝에서 RECENT_OPERATIONS개만 읽음)"""
         try:
-            with open(self.history_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return [EditOperation.from_dict(op) for op in data]
+            records = self.journal.recent_operations(self.RECENT_OPERATIONS)
+            return [EditOperation.from_record(record, self.blobs) for record in reversed(records)]
         except Exception as e:
             print(f"히스토리 로드 실패: {e}")
             return []
     
-    def _save_history(self):
-        """편집 히스토리를 저장"""
+    def _compact_journal_if_needed(self):
+        """부가 레코드가 쌓였으면 저널 압축 (잠금 안에서 호출, 실패해도 기존 저널은 그대로)"""
+        self._extra_records_written = 0
         try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump([op.to_dict() for op in self.operations], f, 
-                         ensure_ascii=False, indent=2)
+            if self.journal.compact_if_needed(self.JOURNAL_MAX_EXTRA, self.JOURNAL_COMPACT_MIN_BYTES):
+                self.operations = self._load_history()
+        except OSError as e:
+            print(f"히스토리 압축 실패: {e}")
+
+    def _count_extra_record(self):
+        """pending/abort/rollback 레코드를 쓴 뒤 호출 - 일정 개수마다 압축 검사"""
+        self._extra_records_written += 1
+        if self._extra_records_written >= self.JOURNAL_CHECK_INTERVAL:
+            self._compact_journal_if_needed()
+
+    def _record_operation(self, operation: EditOperation):
+        """편집 작업(commit)을 저널에 한 줄 추가 (실패하면 예외 - 적용한 쪽에서 파일을 되돌림)"""
+        self.journal.append(operation.to_record(), sync=True)
+        self.operations.append(operation)
+        if len(self.operations) > self.RECENT_OPERATIONS:
+            del self.operations[:-self.RECENT_OPERATIONS]
+
+    def _migrate_legacy_history(self):
+        """이전 edit_history.json을 저널로 변환 (기록에 들어 있던 변경 전/후 내용은 백업 저장소로 옮김)
+
+        임시 저널에 모두 쓴 뒤 rename으로 한 번에 교체하므로, 도중에 중단되면 다음 시작 시 처음부터 다시 변환한다.
+        """
+        if not self.history_file.exists() or self.journal.exists():
+            return
+        temp_journal = EditJournal(self.journal.path.with_name(self.journal.path.name + '.migrating'))
+        try:
+            with open(self.history_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            temp_journal.path.write_bytes(b'')  # 이전에 중단된 변환 결과는 버림
+            for op_data in data:
+                operation = EditOperation.from_dict(op_data)
+                for change in operation.changes:
+                    # 이전 백업 파일이 지워졌어도 롤백할 수 있도록 기록에 있던 내용을 그대로 보관
+                    change.is_new_file = len(change.original_content) == 0
+                    change.original_blob = self.blobs.put_text(change.original_content)
+                    change.new_blob = self.blobs.put_text(change.new_content, change.original_blob,
+                                                          base_text=change.original_content)
+                    change.store = self.blobs
+                temp_journal.append(operation.to_record())
+            self.blobs.sync()
+            fsync_path(temp_journal.path)
+            os.replace(temp_journal.path, self.journal.path)
+            self.history_file.rename(self.history_file.with_name(self.history_file.name + '.migrated'))
         except Exception as e:
-            print(f"히스토리 저장 실패: {e}")
+            print(f"히스토리 변환 실패: {e}")
 
     def get_operation_history(self) -> List[EditOperation]:
-        """편집 작업 히스토리 반환"""
+        """편집 작업 히스토리 반환 (메모리에 있는 최근 작업)"""
         return self.operations.copy()
 
+    def find_operation(self, operation_id: str) -> Optional[EditOperation]:
+        """작업 ID로 편집 작업 검색 (최근 작업에 없으면 저널을 역방향으로 검색)"""
+        for operation in reversed(self.operations):
+            if operation.operation_id == operation_id:
+                return operation
+        record = self.journal.find_operation(operation_id)
+        return EditOperation.from_record(record, self.blobs) if record else None
+
     def _generate_change_id(self) -> str:
         """고유한 변경 ID 생성"""
         timestamp = datetime.now().isoformat()
         return hashlib.md5(timestamp.encode()).hexdigest()[:8]
     
-    def _create_backup(self, file_path: str, content: str) -> str:
-        """파일 백업 생성"""
-        change_id = self._generate_change_id()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # 백업 파일명 생성
-        file_name = os.path.basename(file_path)
-        backup_name = f"{timestamp}_{change_id}_{file_name}"
-        backup_path = self.backup_dir / backup_name
-        
-        # 백업 저장
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        return str(backup_path)
+    def _latest_blob(self, file_path: str) -> Optional[str]:
+        """같은 경로의 가장 최근 백업 blob (델타 인코딩 기준)"""
+        for operation in reversed(self.operations):
+            for change in operation.changes:
+                if change.file_path == file_path and change.new_blob:
+                    return change.new_blob
+        return None
+
+    def _create_change(self, file_path: str, original_raw: bytes, original_content: str,
+                       new_content: str, new_raw: bytes, text_format: TextFormat, timestamp: str) -> FileChange:
+        """변경 전/후 바이트를 백업 저장소에 넣고 FileChange 생성 (저널에는 digest만 기록)
+
+        같은 내용은 한 번만 저장되고, 변경 후 내용은 변경 전 내용에 대한 델타로 저장된다.
+        """
+        original_blob = self.blobs.put(original_raw, self._latest_blob(file_path))
+        new_blob = self.blobs.put(new_raw, original_blob, base_data=original_raw)
+        return FileChange(
+            file_path=file_path,
+            original_content=original_content,
+            new_content=new_content,
+            timestamp=timestamp,
+            change_id=self._generate_change_id(),
+            is_new_file=len(original_content) == 0,
+            original_blob=original_blob,
+            new_blob=new_blob,
+            text_format=text_format,
+            store=self.blobs
+        )
+
+    def read_file(self, file_path: str) -> Tuple[bytes, str, TextFormat]:
+        """파일을 읽어 (바이트, 편집용 텍스트, 형식) 반환
+
+        형식은 경로 + (mtime, 크기) 기준으로 기억하고, 인코딩은 EncodingDetector 캐시를 먼저 확인하므로
+        FileManager가 로드한 파일은 미리보기/적용 때마다 인코딩을 다시 감지하지 않는다.
+        """
+        with open(file_path, 'rb') as f:
+            stat_result = os.fstat(f.fileno())
+            raw_data = f.read()
+
+        cache_key = (stat_result.st_mtime_ns, stat_result.st_size)
+        cached = self._formats.get(file_path)
+        if cached and cached[0] == cache_key:
+            text_format = cached[1]
+        else:
+            used_encoding = self.encoding_detector.get_cached_encoding(file_path, stat_result)
+            if used_encoding is None:
+                _, used_encoding = self.encoding_detector.decode(raw_data, file_path, stat_result)
+            text_format = TextFormat.detect(raw_data, used_encoding)
+            self._formats[file_path] = (cache_key, text_format)
+        return raw_data, text_format.decode(raw_data), text_format
+
+    def _read_original(self, file_path: str) -> Tuple[bytes, str, TextFormat]:
+        """변경 전 파일 (없는 파일은 빈 UTF-8 파일로 취급)"""
+        if os.path.exists(file_path):
+            return self.read_file(file_path)
+        return b'', '', TextFormat()
+
+    def _remember_format(self, file_path: str, text_format: TextFormat):
+        """직접 쓴 파일의 형식을 기억 (다음 미리보기와 FileManager 재분석에서 감지 생략)"""
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return
+        self._formats[file_path] = ((stat_result.st_mtime_ns, stat_result.st_size), text_format)
+        encoding = 'utf-8-sig' if text_format.bom and text_format.encoding == 'utf-8' else text_format.encoding
+        if not text_format.lossy:
+            self.encoding_detector.remember(file_path, stat_result, encoding)
+
+    @staticmethod
+    def _encode_for_write(file_path: str, content: str, text_format: TextFormat) -> bytes:
+        """새 내용을 원래 파일 형식으로 인코딩 (원래 형식으로 표현할 수 없으면 ValueError)"""
+        if text_format.lossy:
+            raise ValueError(f"인코딩을 확인할 수 없는 파일은 수정할 수 없습니다: {file_path}")
+        try:
+            return text_format.encode(content)
+        except UnicodeEncodeError as e:
+            raise ValueError(
+                f"{file_path}: {text_format.encoding}로 저장할 수 없는 문자가 있습니다 ({e.object[e.start:e.end]!r})"
+            ) from e
     
     def parse_edit_response(self, response: str) -> Dict[str, str]:
         """EditPrompts 응답을 파싱해서 파일별 내용 추출"""
         files = {}
         
-        # 더 정확한 파일 패턴 매칭
-        # 1. 파일 경로 (확장자 포함, 경로 구분자 포함)
-        # 2. 코드 블록 (언어 지정 가능)
-        patterns = [
-            # 표준 형식: path/file.ext\n```lang\ncontent\n```
-            r'^([^\s\n`]+\.[a-zA-Z0-9]+)\s*\n```[a-zA-Z0-9]*\s*\n(.*?)\n```',
-            # 확장자 없는 파일: path/filename\n```lang\ncontent\n```
-            r'^([^\s\n`]+/[^\s\n`./]+)\s*\n```[a-zA-Z0-9]*\s*\n(.*?)\n```',
-            # 단순 파일명: filename.ext\n```lang\ncontent\n```
-            r'^([a-zA-Z0-9_.-]+\.[a-zA-Z0-9]+)\s*\n```[a-zA-Z0-9]*\s*\n(.*?)\n```'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, response, re.MULTILINE | re.DOTALL)
-            for file_path, content in matches:
-                # 파일 경로 정리
-                file_path = file_path.strip()
-                content = content.strip()
-                
-                if file_path and content:
-                    files[file_path] = content
+        # 파일 경로(확장자 포함 또는 경로 구분자 포함) 다음 줄의 코드 블록
+        events = parse_events(response)
+        fences = [event for event in events if isinstance(event, FencedBlock)]
+        for fence in fences:
+            content = fence.content.strip()
+            if fence.path and content:
+                files[fence.path] = content
         
         # 디버깅을 위한 로깅
         if not files:
@@ -250,38 +495,29 @@ class FileEditor:
             preview = response[:500] + ("..." if len(response) > 500 else "")
             print(f"[DEBUG] '{preview}'")
             
-            # 간단한 패턴도 시도
-            simple_pattern = r'```[a-zA-Z0-9]*\s*\n(.*?)\n```'
-            simple_matches = re.findall(simple_pattern, response, re.DOTALL)
-            if simple_matches:
+            if fences:
                 # 첫 번째 코드 블록을 임시 파일로 사용
                 print("[DEBUG] 간단한 패턴으로 코드 블록 발견, temp.py로 저장")
-                files['temp.py'] = simple_matches[0].strip()
+                files['temp.py'] = fences[0].content.strip()
         
         return files
     
     def generate_diff(self, file_path: str, original: str, new: str) -> str:
         """두 파일 버전 간의 diff 생성"""
-        diff_lines = list(difflib.unified_diff(
-            original.splitlines(keepends=True),
-            new.splitlines(keepends=True),
+        diff_lines = compute_diff(original, new).unified(
             fromfile=f"{file_path} (original)",
-            tofile=f"{file_path} (modified)",
-            lineterm=""
-        ))
+            tofile=f"{file_path} (modified)"
+        )
         
         return ''.join(diff_lines)
     
     def generate_visual_diff(self, file_path: str, original: str, new: str) -> List[Tuple[str, str]]:
         """시각적 diff 생성 (Rich 스타일링을 위한 튜플 리스트 반환)"""
-        diff_lines = list(difflib.unified_diff(
-            original.splitlines(keepends=True),
-            new.splitlines(keepends=True),
+        diff_lines = compute_diff(original, new).unified(
             fromfile=f"{file_path} (original)",
             tofile=f"{file_path} (modified)",
-            lineterm="",
             n=3  # 컨텍스트 라인 수
-        ))
+        )
         
         visual_diff = []
         
@@ -315,11 +551,7 @@ class FileEditor:
         preview = {}
         
         for file_path, new_content in files_to_change.items():
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    original_content = f.read()
-            else:
-                original_content = ""
+            _, original_content, _ = self._read_original(file_path)
             
             diff = self.generate_diff(file_path, original_content, new_content)
             visual_diff = self.generate_visual_diff(file_path, original_content, new_content)
@@ -339,11 +571,9 @@ class FileEditor:
         preview = {}
         
         for file_path, new_content in files_dict.items():
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    original_content = f.read()
-            else:
-                original_content = ""
+            _, original_content, text_format = self._read_original(file_path)
+            # 코더는 FileManager 내용(원래 줄바꿈 유지)으로 새 내용을 만들므로 원본과 같은 줄바꿈으로 맞춰 비교
+            new_content = text_format.normalize(new_content)
             
             diff = self.generate_diff(file_path, original_content, new_content)
             visual_diff = self.generate_visual_diff(file_path, original_content, new_content)
@@ -359,137 +589,247 @@ class FileEditor:
         return preview
     
     def apply_changes_from_dict(self, files_dict: Dict[str, str], description: str = "") -> EditOperation:
-        """딕셔너리로부터 변경사항을 실제 파일에 적용"""
+        """딕셔너리로부터 변경사항을 실제 파일에 적용 (모든 파일이 바뀌거나 하나도 바뀌지 않음)"""
         changes = []
+        existed = set()
+        payloads = {}
         operation_id = self._generate_change_id()
         timestamp = datetime.now().isoformat()
         
-        # 각 파일에 대해 변경사항 적용
-        for file_path, new_content in files_dict.items():
-            # 기존 내용 읽기
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    original_content = f.read()
-            else:
-                original_content = ""
-                # 디렉토리 생성
-                os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            
-            # 백업 생성
-            backup_path = self._create_backup(file_path, original_content)
-            
-            # 파일 변경사항 기록
-            change = FileChange(
-                file_path=file_path,
-                original_content=original_content,
-                new_content=new_content,
+        with self._journal_lock():
+            # 기존 내용 읽고 원래 형식(인코딩/BOM/줄바꿈)으로 인코딩한 뒤 변경 전/후 바이트 백업
+            for file_path, new_content in files_dict.items():
+                if os.path.exists(file_path):
+                    existed.add(file_path)
+                original_raw, original_content, text_format = self._read_original(file_path)
+                new_content = text_format.normalize(new_content)
+                payloads[file_path] = self._encode_for_write(file_path, new_content, text_format)
+                changes.append(self._create_change(file_path, original_raw, original_content, new_content,
+                                                   payloads[file_path], text_format, timestamp))
+
+            # 편집 작업 기록
+            operation = EditOperation(
+                operation_id=operation_id,
                 timestamp=timestamp,
-                change_id=self._generate_change_id(),
-                backup_path=backup_path
+                changes=changes,
+                description=description or f"{len(changes)}개 파일 수정"
             )
-            changes.append(change)
-            
-            # 새 내용으로 파일 쓰기
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-        
-        # 편집 작업 기록
-        operation = EditOperation(
-            operation_id=operation_id,
-            timestamp=timestamp,
-            changes=changes,
-            description=description or f"{len(changes)}개 파일 수정"
-        )
-        
-        self.operations.append(operation)
-        self._save_history()
-        
+
+            self._write_operation(operation, existed, payloads)
+            self._count_extra_record()  # pending 레코드
+
         return operation
     
     def apply_changes(self, edit_response: str, description: str = "") -> EditOperation:
         """변경사항을 실제 파일에 적용"""
-        files_to_change = self.parse_edit_response(edit_response)
-        changes = []
-        operation_id = self._generate_change_id()
-        timestamp = datetime.now().isoformat()
-        
-        # 각 파일에 대해 변경사항 적용
-        for file_path, new_content in files_to_change.items():
-            # 기존 내용 읽기
+        return self.apply_changes_from_dict(self.parse_edit_response(edit_response), description)
+
+    @staticmethod
+    def _temp_path(file_path: str, operation_id: str) -> str:
+        """대상 파일과 같은 디렉토리의 임시 파일 경로 (rename이 원자적이도록)"""
+        directory, name = os.path.split(file_path)
+        return os.path.join(directory, f".{name}.{operation_id}{TEMP_SUFFIX}")
+
+    def _write_operation(self, operation: EditOperation, existed: set, payloads: Dict[str, bytes]):
+        """작업의 모든 파일을 트랜잭션으로 교체
+
+        1. 같은 디렉토리에 임시 파일을 모두 쓴 뒤 백업 blob과 함께 한 번에 fsync
+        2. 저널에 pending 레코드 기록 (프로세스가 죽으면 다음 시작 시 이 레코드로 복구)
+        3. rename으로 교체하고 디렉토리별로 한 번씩 fsync
+        4. 작업 레코드(commit)를 _record_operation으로 기록
+        commit까지 도중에 예외가 나면 이미 교체한 파일을 원래대로 되돌리고 abort 레코드를 남긴다.
+        """
+        temp_paths = {}
+        replaced = []
+        pending_written = False
+        try:
+            for change in operation.changes:
+                directory = os.path.dirname(change.file_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                temp_path = self._temp_path(change.file_path, operation.operation_id)
+                temp_paths[change.file_path] = temp_path
+                with open(temp_path, 'wb') as f:
+                    f.write(payloads[change.file_path])
+                if change.file_path in existed:
+                    shutil.copymode(change.file_path, temp_path)
+
+            # 쓰기를 모두 끝낸 뒤 fsync를 모아서 처리 (파일마다 쓰기/fsync를 번갈아 하지 않음)
+            self.blobs.sync()
+            for temp_path in temp_paths.values():
+                fsync_path(temp_path)
+
+            self.journal.append({
+                'type': 'pending',
+                'operation_id': operation.operation_id,
+                'timestamp': operation.timestamp,
+                'changes': [{'file_path': change.file_path,
+                             'temp_path': temp_paths[change.file_path],
+                             'original_blob': change.original_blob,
+                             'new_blob': change.new_blob,
+                             'existed': change.file_path in existed} for change in operation.changes]
+            }, sync=True)
+            pending_written = True
+
+            for change in operation.changes:
+                os.replace(temp_paths[change.file_path], change.file_path)
+                replaced.append(change)
+            for directory in {os.path.dirname(os.path.abspath(change.file_path)) for change in operation.changes}:
+                fsync_path(directory)
+            self._record_operation(operation)
+        except BaseException:
+            for change in replaced:
+                try:
+                    self._restore_file(change.file_path, change.get_original_bytes(), change.file_path in existed)
+                except OSError as e:
+                    print(f"원복 실패 ({change.file_path}): {e}")
+            for temp_path in temp_paths.values():
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            if pending_written:
+                try:
+                    self.journal.append({'type': 'abort', 'operation_id': operation.operation_id}, sync=True)
+                except OSError:
+                    pass  # 기록하지 못하면 다음 시작 시 복구 단계에서 처리 (이미 원복한 파일은 건드리지 않음)
+            raise
+
+        for change in operation.changes:
+            self._remember_format(change.file_path, change.text_format)
+
+    def _write_atomically(self, file_path: str, data: bytes):
+        """임시 파일에 쓰고 fsync 후 rename으로 교체"""
+        temp_path = self._temp_path(file_path, self._generate_change_id())
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
             if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    original_content = f.read()
-            else:
-                original_content = ""
-                # 디렉토리 생성
-                os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            
-            # 백업 생성
-            backup_path = self._create_backup(file_path, original_content)
-            
-            # 파일 변경사항 기록
-            change = FileChange(
-                file_path=file_path,
-                original_content=original_content,
-                new_content=new_content,
-                timestamp=timestamp,
-                change_id=self._generate_change_id(),
-                backup_path=backup_path
-            )
-            changes.append(change)
-            
-            # 새 내용으로 파일 쓰기
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-        
-        # 편집 작업 기록
-        operation = EditOperation(
-            operation_id=operation_id,
-            timestamp=timestamp,
-            changes=changes,
-            description=description or f"{len(changes)}개 파일 수정"
-        )
-        
-        self.operations.append(operation)
-        self._save_history()
-        
-        return operation
+                shutil.copymode(file_path, temp_path)
+            os.replace(temp_path, file_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _restore_file(self, file_path: str, original_raw: bytes, existed: bool):
+        """중단된 작업의 파일을 적용 전 상태로 (새로 만든 파일이면 삭제)"""
+        if existed:
+            self._write_atomically(file_path, original_raw)
+        elif os.path.exists(file_path):
+            os.remove(file_path)
+
+    def _recover_interrupted_operations(self):
+        """commit/abort 없이 끝난 pending 작업을 적용 전 상태로 복구 (이전 실행이 적용 중 종료된 경우)
+
+        중단된 작업은 다음 시작 시 바로 복구되므로 최근 RECENT_OPERATIONS개 작업 범위만 확인한다.
+        """
+        resolved = set()
+        interrupted = []
+        seen_operations = 0
+        for record in self.journal.iter_reverse():
+            kind = record.get('type')
+            if kind in ('operation', 'abort'):
+                resolved.add(record['operation_id'])
+                seen_operations += kind == 'operation'
+                if seen_operations >= self.RECENT_OPERATIONS:
+                    break
+            elif kind == 'pending' and record['operation_id'] not in resolved:
+                interrupted.append(record)
+
+        for record in interrupted:
+            restored = 0
+            try:
+                for change in record['changes']:
+                    if os.path.exists(change['temp_path']):
+                        os.remove(change['temp_path'])
+                    if not os.path.exists(change['file_path']):
+                        continue
+                    with open(change['file_path'], 'rb') as f:
+                        current = hashlib.sha256(f.read()).hexdigest()
+                    if current == change['new_blob']:  # 교체까지 끝난 파일만 되돌림
+                        original = self.blobs.get(change['original_blob'])
+                        self._restore_file(change['file_path'], original, change['existed'])
+                        restored += 1
+                self.journal.append({'type': 'abort', 'operation_id': record['operation_id'],
+                                     'timestamp': datetime.now().isoformat()}, sync=True)
+                print(f"중단된 편집 작업 복구: {record['operation_id']} ({restored}개 파일 원복)")
+            except Exception as e:
+                print(f"중단된 편집 작업 복구 실패 ({record['operation_id']}): {e}")
     
     def rollback_operation(self, operation_id: str) -> bool:
         """특정 편집 작업을 롤백"""
-        # 해당 작업 찾기
-        operation = None
-        for op in self.operations:
-            if op.operation_id == operation_id:
-                operation = op
-                break
-        
-        if not operation:
-            return False
-        
-        # 각 변경사항을 원래대로 되돌리기
-        for change in operation.changes:
+        with self._journal_lock():
+            # 해당 작업 찾기
+            operation = self.find_operation(operation_id)
+
+            if not operation:
+                return False
+
+            # 각 변경사항을 원래대로 되돌리기
+            for change in operation.changes:
+                try:
+                    self._write_atomically(change.file_path, change.get_original_bytes())
+                    self._remember_format(change.file_path, change.text_format)
+                except Exception as e:
+                    print(f"롤백 실패 ({change.file_path}): {e}")
+                    return False
+
+            operation.rolled_back = True
             try:
-                with open(change.file_path, 'w', encoding='utf-8') as f:
-                    f.write(change.original_content)
+                self.journal.append({'type': 'rollback', 'operation_id': operation_id,
+                                     'timestamp': datetime.now().isoformat()})
             except Exception as e:
-                print(f"롤백 실패 ({change.file_path}): {e}")
-                return False
-        
-        return True
+                print(f"히스토리 저장 실패: {e}")
+            self._count_extra_record()
+            return True
     
     def get_history(self, limit: int = 10) -> List[EditOperation]:
         """편집 히스토리 반환 (최신순)"""
-        return sorted(self.operations, key=lambda x: x.timestamp, reverse=True)[:limit]
+        if limit <= len(self.operations):
+            return sorted(self.operations, key=lambda x: x.timestamp, reverse=True)[:limit]
+        # 메모리에 올린 최근 작업보다 많이 요청하면 저널에서 읽음
+        return [EditOperation.from_record(record, self.blobs) for record in self.journal.recent_operations(limit)]
     
-    def cleanup_backups(self, days: int = 7):
-        """오래된 백업 파일 정리"""
-        cutoff_date = datetime.now().timestamp() - (days * 24 * 60 * 60)
-        
-        for backup_file in self.backup_dir.glob("*"):
-            if backup_file.is_file() and backup_file.name != "edit_history.json":
-                if backup_file.stat().st_mtime < cutoff_date:
-                    try:
-                        backup_file.unlink()
-                    except Exception as e:
-                        print(f"백업 파일 삭제 실패: {e}")
\ No newline at end of file
+    def prune_history(self, keep: int, dry_run: bool = False) -> Dict[str, int]:
+        """최근 keep개 작업만 남기고 히스토리 정리 (/history prune), 더 이상 참조되지 않는 백업만 삭제
+
+        - 저널: 작성 시각과 관계없이 최근 keep개 작업을 남기고 나머지 작업 레코드 제거
+        - blob: 남은 작업이 참조하는 blob(델타 base 포함)의 참조 수를 세어 0인 것만 삭제
+        - 이전 형식 백업 파일: 제거한 작업만 참조하던 파일만 삭제
+        dry_run이면 아무것도 지우지 않고 제거될 작업 수만 계산한다.
+        """
+        if keep < 0:
+            raise ValueError("남길 작업 수는 0 이상이어야 합니다.")
+        with self._journal_lock():  # 압축은 다른 프로세스가 적용 중인 pending 레코드도 다시 쓰므로
+            return self._prune_history(keep, dry_run)
+
+    def _prune_history(self, keep: int, dry_run: bool) -> Dict[str, int]:
+        operation_ids = [record['operation_id'] for record in self.journal.iter_forward()
+                         if record.get('type') == 'operation']
+        kept_ids = set(operation_ids[len(operation_ids) - keep:]) if keep else set()
+        result = {'kept': len(kept_ids), 'removed_operations': len(operation_ids) - len(kept_ids),
+                  'removed_blobs': 0, 'removed_files': 0}
+        if dry_run or not result['removed_operations']:
+            return result
+
+        live_files, dropped_files = set(), set()
+        for record in self.journal.iter_forward():
+            if record.get('type') != 'operation':
+                continue
+            target = live_files if record['operation_id'] in kept_ids else dropped_files
+            for change in record['changes']:
+                target.update(path for path in (change.get('backup_path'), change.get('new_backup_path')) if path)
+
+        self.journal.compact(keep=lambda record: record['operation_id'] in kept_ids)
+        self.operations = self._load_history()
+        live = [digest for record in self.journal.iter_forward() if record.get('type') == 'operation'
+                for change in record['changes']
+                for digest in (change.get('original_blob'), change.get('new_blob')) if digest]
+        result['removed_blobs'] = self.blobs.gc(live)
+        for path in dropped_files - live_files:
+            try:
+                os.remove(path)
+                result['removed_files'] += 1
+            except OSError:
+                pass
+        return result
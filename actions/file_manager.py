@@ -1,38 +1,41 @@
 # actions/file_manager.py
+import glob
 import os
 import re
-from typing import List, Optional, Dict
+import threading
+from typing import Callable, List, Optional, Dict
 from .file_tree_analyzer import FileTreeAnalyzer
-
-# 새로 추가: charset_normalizer로 인코딩 감지
-try:
-    from charset_normalizer import from_bytes
-except ImportError:
-    from_bytes = None
+from .encoding_detector import EncodingDetector
+from .c_scanner import STANDARD_FUNCTIONS, CScanResult, scan_c_source
+from .sql_tokenizer import extract_sql_features
+from .xml_scanner import scan_xml
+from .lazy_file import FileContentStore, LazyFileContent
+from .bulk_loader import BulkLoader, ProgressCallback
 
 class FileManager:
     def __init__(self):
-        self.files = {}
+        self.files = FileContentStore()  # 경로 -> 내용 (mmap 기반 지연 디코딩, dict 호환)
         self.c_file_info = {}  # C 파일의 구조 정보를 저장
         self.sql_file_info = {}  # SQL 파일의 구조 정보를 저장
         self.tree_analyzer = FileTreeAnalyzer()  # 파일 트리 분석기
+        self.encoding_detector = EncodingDetector()  # 인코딩 감지기 (경로 + mtime 캐시)
+        self.bulk_loader = BulkLoader(self)  # 디렉토리/글롭 추가 시 병렬 로더
+        self._analyzed_stat = {}  # 경로 -> 마지막으로 분석한 파일의 (ino, mtime_ns, size)
+        self._change_listeners = []  # reload_file/remove_file 후 호출할 콜백 (캐시 무효화 등)
+        self._reload_lock = threading.Lock()
 
-    def add(self, file_paths):
-        """파일 또는 디렉토리를 컨텍스트에 추가"""
+    def add(self, file_paths, progress_callback: Optional[ProgressCallback] = None):
+        """파일, 디렉토리 또는 글롭 패턴을 컨텍스트에 추가"""
         messages = []
         file_analyses = []
-        
-        for file_path in file_paths:
-            if os.path.isdir(file_path):
-                # 디렉토리인 경우 재귀적으로 파일들을 추가
-                dir_messages = self.add_directory(file_path)
-                messages.extend(dir_messages)
-            else:
-                # 개별 파일 처리
-                result = self.add_single_file(file_path)
+        pending_files = []  # 연속된 개별 파일은 한 번에 병렬 로드
+
+        def flush_pending():
+            results = self.bulk_loader.load(pending_files, progress_callback)
+            for file_path, result in zip(pending_files, results):
                 if result['message']:
                     messages.append(result['message'])
-                    
+
                 # 분석 결과가 있으면 저장
                 if result['analysis']:
                     file_analyses.append({
@@ -40,14 +43,37 @@ class FileManager:
                         'file_type': result['file_type'],
                         'analysis': result['analysis']
                     })
-        
+            pending_files.clear()
+
+        for file_path in file_paths:
+            if os.path.isdir(file_path):
+                # 디렉토리인 경우 재귀적으로 파일들을 추가
+                if pending_files:
+                    flush_pending()
+                dir_messages = self.add_directory(file_path, progress_callback=progress_callback)
+                messages.extend(dir_messages)
+            elif any(ch in file_path for ch in '*?[') and not os.path.exists(file_path):
+                # 글롭 패턴 (예: src/**/*.c)
+                matches = sorted(p for p in glob.glob(file_path, recursive=True) if os.path.isfile(p))
+                if matches:
+                    pending_files.extend(matches)
+                else:
+                    messages.append(f"No files match pattern: {file_path}")
+            else:
+                # 개별 파일 처리
+                pending_files.append(file_path)
+
+        if pending_files:
+            flush_pending()
+
         # 파일 분석 결과를 포함한 전체 결과 반환
         return {
             'messages': messages,
             'analyses': file_analyses
         }
 
-    def add_directory(self, directory_path: str, max_files: int = 50) -> List[str]:
+    def add_directory(self, directory_path: str, max_files: int = 50,
+                      progress_callback: Optional[ProgressCallback] = None) -> List[str]:
         """디렉토리의 파일들을 재귀적으로 추가"""
         messages = []
         
@@ -75,21 +101,10 @@ class FileManager:
                 for file_info in files:
                     other_files.append(file_info['full_path'])
         
-        # 주요 파일들 먼저 추가
+        # 주요 파일들 먼저, 남은 용량이 있으면 기타 파일들도 추가 (병렬 로드, 순서 유지)
+        selected_files = (primary_files + other_files)[:max_files]
         added_count = 0
-        for file_path in primary_files:
-            if added_count >= max_files:
-                break
-            result = self.add_single_file(file_path)
-            if result['message']:
-                messages.append(result['message'])
-                added_count += 1
-        
-        # 남은 용량이 있으면 기타 파일들도 추가
-        for file_path in other_files:
-            if added_count >= max_files:
-                break
-            result = self.add_single_file(file_path)
+        for result in self.bulk_loader.load(selected_files, progress_callback):
             if result['message']:
                 messages.append(result['message'])
                 added_count += 1
@@ -155,72 +170,15 @@ class FileManager:
             try:
                 # 바이너리 모드로 먼저 읽어 raw 데이터를 확보
                 with open(resolved_path, 'rb') as f:
+                    stat_result = os.fstat(f.fileno())
                     raw_data = f.read()
 
-                # 1) 기본적으로 raw 데이터를 대상으로 인코딩 감지 시도
-                detected_encoding = None
-                if from_bytes:
-                    try:
-                        best_match = from_bytes(raw_data).best()
-                        if best_match and best_match.encoding:
-                            detected_encoding = best_match.encoding
-                    except Exception:
-                        pass
-
-                # 2) 감지된 인코딩을 먼저 시도하고, 그 밖에 일반적으로 사용하는 인코딩 목록을 순차적으로 시도
-                encodings_to_try = []
-                if detected_encoding:
-                    encodings_to_try.append(detected_encoding)
-                # EUC-KR, CP949 같은 한글 인코딩과 UTF-8 BOM 등을 포함해 시도
-                encodings_to_try += ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr', 'shift_jis']
-
-                content = None
-                used_encoding = None
-                for enc in encodings_to_try:
-                    try:
-                        content = raw_data.decode(enc)
-                        used_encoding = enc
-                        break
-                    except Exception:
-                        continue
-
-                # 3) 모든 시도가 실패한 경우에는 errors='replace' 옵션을 사용해 UTF-8로 강제 디코딩
-                if content is None:
-                    content = raw_data.decode('utf-8', errors='replace')
-                    used_encoding = 'utf-8 (fallback with replace)'
-
-                # 읽은 내용과 인코딩 정보를 저장 (resolved_path를 키로 사용)
-                self.files[resolved_path] = content
-                line_count = len(content.splitlines())
-                char_count = len(content)
-
-                # .c 파일인 경우 구조 정보 추가
-                if resolved_path.endswith('.c'):
-                    result['file_type'] = 'c_file'
-                    analysis = self._analyze_c_file_structure(content)
-                    self.c_file_info[resolved_path] = analysis
-                    result['analysis'] = self._enhance_c_file_analysis(content, analysis)
-                    result['message'] = f"Read {resolved_path}, {line_count} lines"
-                # .sql 파일인 경우 구조 정보 추가
-                elif resolved_path.endswith('.sql'):
-                    result['file_type'] = 'sql_file'
-                    analysis = self._analyze_sql_file_structure(content)
-                    self.sql_file_info[resolved_path] = analysis
-                    result['analysis'] = analysis
-                    result['message'] = f"Read {resolved_path}, {line_count} lines"
-                # .h 파일인 경우 헤더 구조 분석
-                elif resolved_path.endswith('.h'):
-                    result['file_type'] = 'header_file'
-                    result['analysis'] = self._analyze_header_file_structure(content, resolved_path)
-                    result['message'] = f"Read {resolved_path}, {line_count} lines"
-                # .xml 파일인 경우 UI 구조 분석
-                elif resolved_path.lower().endswith('.xml'):
-                    result['file_type'] = 'xml_file'
-                    result['analysis'] = self._analyze_xml_file_structure(content)
-                    result['message'] = f"Read {resolved_path}, {line_count} lines"
-                else:
-                    result['message'] = f"Read {resolved_path}, {line_count} lines"
-                    
+                # 단계별 인코딩 감지: 캐시 -> strict UTF-8 -> 샘플 구간 감지 -> 일반 인코딩 목록
+                content, used_encoding = self.encoding_detector.decode(raw_data, resolved_path, stat_result)
+
+                summary = self.analyze_content(resolved_path, content)
+                result = self.register_file(resolved_path, used_encoding, stat_result, summary, content)
+
             except Exception as e:
                 result['message'] = f"Error reading file {resolved_path}: {e}"
         else:
@@ -228,33 +186,120 @@ class FileManager:
             
         return result
 
-    def _analyze_c_file_structure(self, content):
-        """C 파일의 표준 함수 구조를 분석"""
-        standard_functions = {
-            'a000_init_proc': '프로그램 초기화 함수',
-            'b000_input_validation': '입력 데이터 검증 수행',
-            'b999_output_setting': '출력 전문의 순서 설정',
-            'c000_main_proc': '실제 프로그램의 주요 로직 처리',
-            'c300_get_svc_info': '서비스 정보 조회 함수',
-            'x000_mpfmoutq_proc': '출력 처리 수행 함수',
-            'z000_norm_exit_proc': '프로그램 정상 종료 처리',
-            'z999_err_exit_proc': '프로그램 에러 종료 처리'
+    def analyze_content(self, resolved_path: str, content: str) -> Dict:
+        """파일 유형별 구조 분석 (인스턴스 상태를 변경하지 않으므로 워커 프로세스에서도 사용 가능)"""
+        summary = {
+            'file_type': 'unknown',
+            'analysis': None,
+            'structure': None,  # c_file_info / sql_file_info에 저장할 기본 구조 정보
+            'line_count': len(content.splitlines()),
+            'char_count': len(content)
         }
-        
-        found_functions = {}
-        lines = content.splitlines()
-        
-        for i, line in enumerate(lines):
-            for func_name, description in standard_functions.items():
-                if func_name in line and ('(' in line or 'void' in line or 'int' in line):
-                    found_functions[func_name] = {
-                        'description': description,
-                        'line_number': i + 1
-                    }
-        
+
+        # .c 파일인 경우 구조 정보 추가
+        if resolved_path.endswith('.c'):
+            summary['file_type'] = 'c_file'
+            scan = scan_c_source(content)  # 함수/include/ctx 구조체를 한 번에 수집
+            analysis = self._analyze_c_file_structure(scan)
+            summary['structure'] = analysis
+            summary['analysis'] = self._enhance_c_file_analysis(scan, analysis)
+        # .sql 파일인 경우 구조 정보 추가
+        elif resolved_path.endswith('.sql'):
+            summary['file_type'] = 'sql_file'
+            analysis = self._analyze_sql_file_structure(content)
+            summary['structure'] = analysis
+            summary['analysis'] = analysis
+        # .h 파일인 경우 헤더 구조 분석
+        elif resolved_path.endswith('.h'):
+            summary['file_type'] = 'header_file'
+            summary['analysis'] = self._analyze_header_file_structure(content, resolved_path)
+        # .xml 파일인 경우 UI 구조 분석
+        elif resolved_path.lower().endswith('.xml'):
+            summary['file_type'] = 'xml_file'
+            summary['analysis'] = self._analyze_xml_file_structure(content)
+
+        return summary
+
+    def register_file(self, resolved_path: str, used_encoding: str, stat_result: os.stat_result,
+                      summary: Dict, content: Optional[str] = None) -> Dict:
+        """분석이 끝난 파일을 컨텍스트에 등록하고 add_single_file 형식의 결과 반환"""
+        # 읽은 내용은 mmap 핸들로 저장하고 디코딩 결과는 LRU에만 보관 (resolved_path를 키로 사용)
+        try:
+            handle = LazyFileContent(resolved_path, used_encoding, stat_result, char_count=summary['char_count'],
+                                     detector=self.encoding_detector)
+            self.files.set_lazy(resolved_path, handle, content)
+        except (OSError, ValueError):
+            # mmap을 지원하지 않는 파일은 문자열로 보관
+            if content is None:
+                with open(resolved_path, 'rb') as f:
+                    content = f.read().decode(used_encoding.split(' ')[0], errors='replace')
+            self.files[resolved_path] = content
+
+        self.c_file_info.pop(resolved_path, None)
+        self.sql_file_info.pop(resolved_path, None)
+        if summary['file_type'] == 'c_file':
+            self.c_file_info[resolved_path] = summary['structure']
+        elif summary['file_type'] == 'sql_file':
+            self.sql_file_info[resolved_path] = summary['structure']
+        self._analyzed_stat[resolved_path] = (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+
         return {
-            'standard_functions': standard_functions,
-            'found_functions': found_functions
+            'message': f"Read {resolved_path}, {summary['line_count']} lines",
+            'analysis': summary['analysis'],
+            'file_type': summary['file_type']
+        }
+
+    def add_change_listener(self, callback: Callable[[str, Optional[Dict]], None]):
+        """컨텍스트 파일이 다시 분석되거나(결과 dict) 제거될 때(None) 호출할 콜백 등록"""
+        self._change_listeners.append(callback)
+
+    def _notify_change(self, path: str, result: Optional[Dict]):
+        for callback in list(self._change_listeners):
+            try:
+                callback(path, result)
+            except Exception:
+                pass  # 캐시 무효화 실패가 재분석을 막지 않도록 함
+
+    def reload_file(self, file_path: str, force: bool = False) -> Optional[Dict]:
+        """컨텍스트 파일을 다시 읽고 재분석 (마지막 분석 이후 바뀌지 않았으면 None)
+
+        파일이 삭제되었으면 컨텍스트에서 제거하고 {'removed': True, ...}를 반환한다.
+        """
+        with self._reload_lock:
+            path = file_path if file_path in self.files else self._resolve_file_path(file_path)
+            if path is None or path not in self.files:
+                return None
+
+            try:
+                stat_result = os.stat(path)
+            except FileNotFoundError:
+                self.remove_file(path)
+                return {'message': f"Removed {path} (deleted)", 'analysis': None, 'file_type': 'unknown', 'removed': True}
+
+            key = (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+            if not force and self._analyzed_stat.get(path) == key:
+                return None
+
+            result = self.add_single_file(path)
+            self._notify_change(path, result)
+            return result
+
+    def remove_file(self, file_path: str) -> bool:
+        """컨텍스트에서 파일과 분석 정보를 제거"""
+        if file_path not in self.files:
+            return False
+        del self.files[file_path]
+        self.c_file_info.pop(file_path, None)
+        self.sql_file_info.pop(file_path, None)
+        self._analyzed_stat.pop(file_path, None)
+        self._notify_change(file_path, None)
+        return True
+
+    def _analyze_c_file_structure(self, scan: CScanResult):
+        """C 파일의 표준 함수 구조 (단일 패스 스캔 결과 사용)"""
+        return {
+            'standard_functions': dict(STANDARD_FUNCTIONS),
+            'found_functions': scan.found_functions
         }
 
     def get_c_file_context(self, file_path):
@@ -264,66 +309,8 @@ class FileManager:
         return None
 
     def _analyze_sql_file_structure(self, content):
-        """SQL 파일의 오라클 구조를 분석"""
-        sql_features = {
-            'hints': [],
-            'bind_variables': [],
-            'table_aliases': [],
-            'outer_joins': [],
-            'oracle_functions': [],
-            'table_names': []
-        }
-        
-        lines = content.splitlines()
-        content_upper = content.upper()
-        
-        # 힌트 찾기 (/*+ ... */)
-        import re
-        hint_pattern = r'/\*\+([^*]+)\*/'
-        hints = re.findall(hint_pattern, content)
-        sql_features['hints'] = [hint.strip() for hint in hints]
-        
-        # 바인드 변수 찾기 (:variable) - 주석 제외
-        # 먼저 주석을 제거한 후 바인드 변수 찾기
-        # -- 주석 제거
-        content_no_line_comments = re.sub(r'--.*$', '', content, flags=re.MULTILINE)
-        # /* */ 주석 제거
-        content_no_comments = re.sub(r'/\*.*?\*/', '', content_no_line_comments, flags=re.DOTALL)
-        
-        bind_pattern = r':(\w+)'
-        binds = re.findall(bind_pattern, content_no_comments)
-        sql_features['bind_variables'] = list(set(binds))
-        
-        # 아우터 조인 찾기 ((+))
-        if '(+)' in content:
-            sql_features['outer_joins'] = ['Oracle outer join syntax detected']
-        
-        # 오라클 함수 찾기
-        oracle_functions = ['NVL', 'TO_CHAR', 'SYSDATE', 'TO_DATE', 'DECODE', 'CASE']
-        for func in oracle_functions:
-            if func in content_upper:
-                sql_features['oracle_functions'].append(func)
-        
-        # 유효성 체크 날짜 패턴 찾기
-        validity_patterns = []
-        if '99991231235959' in content:
-            validity_patterns.append('99991231235959 (timestamp format)')
-        if '99991231' in content:
-            validity_patterns.append('99991231 (date format)')
-        sql_features['validity_patterns'] = validity_patterns
-        
-        # 테이블 별칭 패턴 찾기 (단순한 방식으로)
-        for line in lines:
-            line_stripped = line.strip()
-            if 'from' in line_stripped.lower() or 'join' in line_stripped.lower():
-                # 간단한 별칭 패턴 매칭
-                alias_pattern = r'(\w+)\s+(\w+)(?:\s|$|,)'
-                matches = re.findall(alias_pattern, line_stripped, re.IGNORECASE)
-                for match in matches:
-                    if len(match[1]) <= 4:  # 짧은 별칭으로 가정
-                        sql_features['table_aliases'].append(f"{match[0]} as {match[1]}")
-        
-        return sql_features
+        """SQL 파일의 오라클 구조를 분석 (주석/문자열을 인식하는 단일 패스 토크나이저 사용)"""
+        return extract_sql_features(content)
 
     def get_sql_file_context(self, file_path):
         """SQL 파일의 컨텍스트 정보를 반환"""
@@ -343,12 +330,12 @@ class FileManager:
         """패턴에 맞는 파일들을 찾기"""
         return self.tree_analyzer.find_files_by_pattern(directory_path, pattern)
     
-    def _enhance_c_file_analysis(self, content: str, basic_analysis: Dict) -> Dict:
+    def _enhance_c_file_analysis(self, scan: CScanResult, basic_analysis: Dict) -> Dict:
         """C 파일에 대한 향상된 분석"""
         enhanced = basic_analysis.copy()
         
         # 헤더 파일 include 분석 (섹션별로 분류)
-        includes = self._categorize_includes(content)
+        includes = self._categorize_includes(scan)
         enhanced['includes'] = includes
         
         # IO 구조체 패턴 찾기
@@ -366,10 +353,8 @@ class FileManager:
             elif 'pio_' in include and '_out' in include:
                 io_patterns['output_structs'].append(include)
         
-        # Context 구조체 찾기
-        ctx_pattern = r'typedef\s+struct\s+(\w*ctx\w*)\s+(\w+);'
-        for match in re.finditer(ctx_pattern, content, re.IGNORECASE):
-            io_patterns['context_structs'].append(match.group(2))
+        # Context 구조체 찾기 (include 분류와 같은 스캔 결과 재사용)
+        io_patterns['context_structs'].extend(scan.context_structs)
         
         enhanced['io_structures'] = io_patterns
         
@@ -381,45 +366,9 @@ class FileManager:
         
         return enhanced
     
-    def _categorize_includes(self, content: str) -> Dict[str, List[str]]:
-        """헤더 파일들을 섹션별로 분류"""
-        categories = {
-            'system': [],           # 시스템 헤더 (<pfm*.h> 등)
-            'io_formatter': [],     # IO Formatter 섹션
-            'static_library': [],   # Static Library 섹션 (중요!)
-            'dbio_library': [],     # DBIO Library 섹션
-            'other': []
-        }
-        
-        lines = content.split('\n')
-        current_section = 'other'
-        
-        for line in lines:
-            line = line.strip()
-            
-            # 섹션 감지
-            if '--- IO Formatter   ---' in line or 'IO Formatter' in line:
-                current_section = 'io_formatter'
-                continue
-            elif '--- Static Library ---' in line or 'Static Library' in line:
-                current_section = 'static_library'
-                continue
-            elif '--- DBIO Library    ---' in line or 'DBIO Library' in line:
-                current_section = 'dbio_library'
-                continue
-            
-            # include 문 파싱
-            include_match = re.match(r'#include\s*[<"](.*?)[>"]', line)
-            if include_match:
-                include_file = include_match.group(1)
-                
-                # 시스템 헤더 분류
-                if include_file.startswith('pfm') or include_file.startswith('<'):
-                    categories['system'].append(include_file)
-                else:
-                    categories[current_section].append(include_file)
-        
-        return categories
+    def _categorize_includes(self, scan: CScanResult) -> Dict[str, List[str]]:
+        """헤더 파일들을 섹션별로 분류 (system / io_formatter / static_library / dbio_library / other)"""
+        return scan.includes
     
     def _analyze_header_file_structure(self, content: str, file_path: str = '') -> Dict:
         """헤더 파일 구조 분석"""
@@ -509,53 +458,5 @@ class FileManager:
         return self._analyze_header_file_structure(content, file_path)
     
     def _analyze_xml_file_structure(self, content: str) -> Dict:
-        """XML 파일 구조 분석 (UI 화면)"""
-        analysis = {
-            'form_id': '',
-            'form_description': '',
-            'datalist_ids': [],
-            'trx_codes': [],
-            'svc_combo_count': 0,
-            'functions': []
-        }
-        
-        # Form ID 찾기
-        form_id_pattern = r'FormID\(명\)\s*:\s*(\S+)'
-        match = re.search(form_id_pattern, content)
-        if match:
-            analysis['form_id'] = match.group(1).replace('.XML', '')  # .XML 확장자 제거
-        
-        # Form 설명 찾기
-        form_desc_pattern = r'Form\s+설명\s*:\s*(.+?)(?:\n|\*)'
-        match = re.search(form_desc_pattern, content)
-        if match:
-            analysis['form_description'] = match.group(1).strip()
-        
-        # dataList의 id들 찾기
-        datalist_pattern = r'<w2:dataList[^>]*id\s*=\s*["\'](\w+)["\']'
-        datalist_ids = set(re.findall(datalist_pattern, content, re.IGNORECASE))
-        analysis['datalist_ids'] = list(datalist_ids)
-        
-        # TrxCode 찾기 (다양한 패턴 지원)
-        trx_code_patterns = [
-            r'var\s+TrxCode\s*=\s*["\']([^"\']+)["\']',  # var TrxCode = "ZORDSS0340082_TR01"
-            r'TrxCode\s*:\s*["\']([^"\']+)["\']',        # TrxCode: "ZORDSS0340082_TR01" 
-            r'TP\s*:\s*["\']([^"\']+)["\']'              # TP: "ZORDSS0340082_TR01"
-        ]
-        trx_codes = set()
-        for pattern in trx_code_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            trx_codes.update(matches)
-        analysis['trx_codes'] = list(trx_codes)
-        
-        # svcCombo 개수 찾기
-        svc_combo_pattern = r'svcCombo'
-        svc_combo_matches = re.findall(svc_combo_pattern, content, re.IGNORECASE)
-        analysis['svc_combo_count'] = len(svc_combo_matches)
-        
-        # JavaScript 함수 찾기
-        js_func_pattern = r'scwin\.(\w+)\s*='
-        functions = set(re.findall(js_func_pattern, content))
-        analysis['functions'] = list(functions)
-        
-        return analysis
+        """XML 파일 구조 분석 (UI 화면, 스트리밍 스캐너 사용)"""
+        return scan_xml(content).to_analysis()
@@ -2,6 +2,7 @@
 import os
 import fnmatch
 from typing import Dict, List, Set, Tuple, Optional
+from .sql_tokenizer import tokenize_sql
 
 class FileTreeAnalyzer:
     """파일 트리를 분석하고 필요한 파일을 찾는 클래스"""
@@ -216,10 +217,9 @@ class FileTreeAnalyzer:
                     oracle_features.append(feature)
             analysis['oracle_features'] = oracle_features
             
-            # 바인드 변수 추출
-            import re
-            bind_vars = re.findall(r':(\w+)', content)
-            analysis['bind_variables'] = list(set(bind_vars))[:10]  # 최대 10개
+            # 바인드 변수 추출 (주석/문자열 안의 ':'는 제외)
+            bind_vars = [value for kind, value, _ in tokenize_sql(content) if kind == 'bind']
+            analysis['bind_variables'] = list(dict.fromkeys(bind_vars))[:10]  # 최대 10개
         
         elif category == 'xml_files':
             # XML UI 패턴 분석
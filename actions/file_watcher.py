@@ -0,0 +1,266 @@
+# actions/file_watcher.py
+"""
+컨텍스트 파일 감시 (Hot Reload)
+
+FileManager.files에 있는 파일이 CLI 밖에서 수정되면 백그라운드 스레드에서 감지하고,
+바뀐 파일은 FileManager를 쓰는 스레드(REPL 루프, 데몬 명령 처리)가 apply_pending()을
+호출할 때 다시 읽고 재분석한다 (FileManager.reload_file). 감시 스레드는 FileManager의
+분석 정보나 레포맵 캐시를 직접 바꾸지 않으므로 프롬프트 생성과 경쟁하지 않는다.
+
+- Linux에서는 inotify(ctypes)로 파일이 있는 디렉토리를 감시한다. 편집기가 임시 파일을
+  쓴 뒤 rename하는 경우에도 놓치지 않도록 파일이 아닌 디렉토리 단위로 감시한다.
+- inotify를 쓸 수 없으면 stat 폴링으로 대체한다.
+- 편집기는 한 번 저장할 때 여러 번 쓰므로 마지막 이벤트 후 debounce 시간 동안 조용해야 재분석한다.
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+# inotify 상수 (<sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+_EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+ReloadCallback = Callable[[List[Tuple[str, Optional[Dict]]]], None]
+
+
+class _InotifyBackend:
+    """inotify 기반 변경 감지 (디렉토리 단위 감시)"""
+
+    name = 'inotify'
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self._watches = {}      # 디렉토리 -> wd
+        self._directories = {}  # wd -> 디렉토리
+        self._paths = set()
+
+    def sync(self, paths: Set[str]):
+        """감시 대상 파일 목록을 반영 (필요한 디렉토리만 감시)"""
+        self._paths = paths
+        directories = {os.path.dirname(path) for path in paths}
+        for directory in directories - set(self._watches):
+            wd = self._add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+            if wd >= 0:
+                self._watches[directory] = wd
+                self._directories[wd] = directory
+        for directory in set(self._watches) - directories:
+            wd = self._watches.pop(directory)
+            self._directories.pop(wd, None)
+            self._rm_watch(self._fd, wd)
+
+    def wait(self, timeout: float) -> Set[str]:
+        """timeout 동안 이벤트를 기다려 바뀐 감시 대상 경로 반환"""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + _EVENT_HEADER.size:offset + _EVENT_HEADER.size + length].rstrip(b'\0')
+            offset += _EVENT_HEADER.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                return set(self._paths)  # 이벤트 유실 - 전체를 후보로 (reload_file이 stat으로 걸러냄)
+            if mask & IN_IGNORED:
+                directory = self._directories.pop(wd, None)
+                if directory is not None:
+                    self._watches.pop(directory, None)  # 디렉토리 삭제 등 - 다음 sync에서 다시 시도
+                continue
+            directory = self._directories.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, os.fsdecode(name))
+            if path in self._paths:
+                changed.add(path)
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class _PollingBackend:
+    """stat 폴링 기반 변경 감지 (inotify를 쓸 수 없는 환경용)"""
+
+    name = 'polling'
+
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self._snapshot = {}     # 경로 -> stat 키 (없으면 None)
+        self._last_poll = 0.0
+
+    @staticmethod
+    def _stat_key(path: str):
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return None
+        return (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+
+    def sync(self, paths: Set[str]):
+        for path in paths - set(self._snapshot):
+            self._snapshot[path] = self._stat_key(path)
+        for path in set(self._snapshot) - paths:
+            del self._snapshot[path]
+
+    def wait(self, timeout: float) -> Set[str]:
+        remaining = self._last_poll + self.interval - time.monotonic()
+        if remaining > 0:
+            time.sleep(min(timeout, remaining))
+            if self._last_poll + self.interval > time.monotonic():
+                return set()
+        self._last_poll = time.monotonic()
+
+        changed = set()
+        for path, key in list(self._snapshot.items()):
+            current = self._stat_key(path)
+            if current != key:
+                self._snapshot[path] = current
+                changed.add(path)
+        return changed
+
+    def close(self):
+        self._snapshot.clear()
+
+
+class FileWatcher:
+    """FileManager 컨텍스트 파일 감시 및 자동 재분석"""
+
+    def __init__(self, file_manager, debounce: float = 0.3, poll_interval: float = 1.0,
+                 use_inotify: bool = True, on_reload: Optional[ReloadCallback] = None):
+        self.file_manager = file_manager
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self.on_reload = on_reload
+        self.backend = None
+        self.last_error = None
+        self._pending = {}  # 경로 -> 마지막 이벤트 시각
+        self._ready = []  # debounce가 끝나 재분석을 기다리는 경로 (apply_pending에서 처리)
+        self._ready_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _create_backend(self):
+        if self.use_inotify and sys.platform.startswith('linux'):
+            try:
+                return _InotifyBackend()
+            except (OSError, AttributeError) as e:
+                self.last_error = f"inotify 사용 불가, 폴링으로 대체: {e}"
+        return _PollingBackend(self.poll_interval)
+
+    def start(self) -> 'FileWatcher':
+        """백그라운드 감시 시작 (이미 실행 중이면 무시)"""
+        if self.is_running:
+            return self
+        self.backend = self._create_backend()
+        self.backend.sync(set(self.file_manager.files))
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='coe-file-watcher', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 2.0):
+        """감시 중지"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self.backend is not None:
+            self.backend.close()
+            self.backend = None
+
+    @property
+    def has_pending(self) -> bool:
+        """재분석을 기다리는 파일이 있는지"""
+        return bool(self._ready)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self._queue(self._collect_due())
+            except Exception as e:  # 감시 스레드는 어떤 오류에도 멈추지 않음 (프롬프트 출력을 깨지 않도록 기록만)
+                self.last_error = f"파일 감시 오류: {e}"
+                self._stop.wait(self.poll_interval)
+
+    def poll_once(self, timeout: float = 0.25) -> List[Tuple[str, Optional[Dict]]]:
+        """이벤트를 한 번 기다리고, debounce가 끝난 파일을 호출한 스레드에서 재분석하여 (경로, 결과) 목록 반환"""
+        self._queue(self._collect_due(timeout))
+        return self.apply_pending()
+
+    def apply_pending(self) -> List[Tuple[str, Optional[Dict]]]:
+        """감시 스레드가 찾은 변경 파일을 재분석 (FileManager를 쓰는 스레드에서 호출)"""
+        with self._ready_lock:
+            ready, self._ready = self._ready, []
+        reloaded = []
+        for path in ready:
+            if path not in self.file_manager.files:
+                continue
+            result = self.file_manager.reload_file(path)
+            if result is not None:
+                reloaded.append((path, result))
+
+        if reloaded and self.on_reload:
+            self.on_reload(reloaded)
+        return reloaded
+
+    def _queue(self, paths: List[str]):
+        with self._ready_lock:
+            self._ready.extend(path for path in paths if path not in self._ready)
+
+    def _collect_due(self, timeout: float = 0.25) -> List[str]:
+        """이벤트를 한 번 기다리고 debounce가 끝난 감시 대상 경로 반환"""
+        watched = set(self.file_manager.files)
+        self.backend.sync(watched)
+
+        if self._pending:
+            # 가장 먼저 끝나는 debounce까지만 대기
+            next_due = min(self._pending.values()) + self.debounce - time.monotonic()
+            timeout = max(0.0, min(timeout, next_due))
+
+        for path in self.backend.wait(timeout):
+            self._pending[path] = time.monotonic()  # 연속 쓰기는 마지막 이벤트 기준으로 다시 대기
+
+        now = time.monotonic()
+        due = [path for path, last in self._pending.items() if now - last >= self.debounce]
+        for path in due:
+            del self._pending[path]
+        return [path for path in due if path in watched]
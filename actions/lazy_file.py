@@ -0,0 +1,290 @@
+# actions/lazy_file.py
+"""
+지연 로딩 파일 컨텐츠 - mmap으로 raw 바이트를 매핑하고 필요할 때만 디코딩
+
+FileManager.files는 FileContentStore를 사용하며, 기존 dict API(files[path],
+items(), keys(), in, len)는 그대로 동작한다. 디코딩된 문자열은 크기 제한이 있는
+LRU에만 보관되므로 상주 메모리는 실제로 사용하는 파일 크기에 비례한다.
+"""
+import mmap
+import os
+import re
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Iterator, List, Optional, Union
+
+NEWLINE_PATTERN = re.compile(rb'\n')
+
+
+class LazyFileContent:
+    """mmap 기반 파일 핸들 - 요청 시 디코딩, 줄 단위 오프셋 인덱싱 지원
+
+    mmap은 내용이 필요할 때만 열고 close()로 닫는다 (매핑마다 파일 디스크립터를 하나씩 사용).
+    """
+
+    def __init__(self, path: str, encoding: str = 'utf-8',
+                 stat_result: Optional[os.stat_result] = None,
+                 char_count: Optional[int] = None, detector=None):
+        self.path = path
+        self._set_encoding(encoding)
+        self._char_count = char_count
+        self._detector = detector
+        self._mmap = None
+        self._stat_key = None
+        self._line_offsets = None
+        self._encoding_stale = False  # 디스크에서 바뀐 뒤 인코딩을 다시 확인해야 하는지
+        self._lock = threading.RLock()
+        if stat_result is None:
+            stat_result = os.stat(path)
+        self._set_stat(stat_result)
+
+    def _set_encoding(self, encoding: str):
+        # 'utf-8 (fallback with replace)' 같은 표시용 인코딩 이름 처리
+        self.errors = 'replace' if 'fallback' in encoding else 'strict'
+        self.encoding = encoding.split(' ')[0]
+
+    def _set_stat(self, stat_result: os.stat_result):
+        self._stat_key = (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+        self._line_offsets = None
+
+    def _mapped(self) -> Optional[mmap.mmap]:
+        """읽기 전용 mmap (처음 접근할 때 열고, 빈 파일은 매핑하지 않음)"""
+        if self._mmap is None and self.size:
+            with open(self.path, 'rb') as f:
+                stat_result = os.fstat(f.fileno())
+                if (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size) != self._stat_key:
+                    self._changed(stat_result)  # 마지막 확인 이후 바뀐 파일
+                if stat_result.st_size:
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def _changed(self, stat_result: os.stat_result):
+        self._set_stat(stat_result)
+        self._char_count = None
+        self._encoding_stale = True
+
+    def _ensure_fresh(self) -> bool:
+        """디스크의 파일이 바뀌었으면 매핑을 닫음 (잘린 파일 접근으로 인한 SIGBUS 방지)"""
+        try:
+            stat_result = os.stat(self.path)
+        except OSError:
+            return False  # 삭제된 파일은 열려 있는 매핑(inode)이 있으면 그대로 사용
+        if (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size) == self._stat_key:
+            return False
+        self.close()
+        self._changed(stat_result)
+        return True
+
+    def refresh(self) -> bool:
+        """파일 변경 여부 확인 (변경되었으면 True, 다음 접근 시 다시 매핑하고 인코딩도 다시 감지)"""
+        with self._lock:
+            return self._ensure_fresh()
+
+    @property
+    def size(self) -> int:
+        """raw 바이트 크기"""
+        return self._stat_key[2]
+
+    def raw(self) -> bytes:
+        """raw 바이트 전체"""
+        with self._lock:
+            self._ensure_fresh()
+            mapped = self._mapped()
+            return mapped[:] if mapped is not None else b''
+
+    def text(self) -> str:
+        """전체 내용을 디코딩하여 반환 (결과는 캐시하지 않음)"""
+        with self._lock:
+            raw_data = self.raw()
+            if self._encoding_stale:
+                content = self._redetect(raw_data)
+            else:
+                content = raw_data.decode(self.encoding, errors=self.errors)
+            self._char_count = len(content)
+            return content
+
+    def _redetect(self, raw_data: bytes) -> str:
+        """바뀐 파일은 다른 인코딩으로 저장되었을 수 있으므로 인코딩을 다시 감지하여 디코딩"""
+        if self._detector is None:
+            from .encoding_detector import EncodingDetector
+            self._detector = EncodingDetector()
+        content, used_encoding = self._detector.decode(raw_data)
+        self._set_encoding(used_encoding)
+        self._encoding_stale = False
+        return content
+
+    def char_count(self) -> Optional[int]:
+        """디코딩 없이 알 수 있는 문자 수 (모르면 None)"""
+        return self._char_count
+
+    def _offsets(self) -> array:
+        """각 줄의 시작 바이트 오프셋 인덱스 (최초 접근 시 생성)"""
+        if self._line_offsets is None:
+            offsets = array('Q', [0])
+            mapped = self._mapped()
+            if mapped is not None:
+                offsets.extend(m.end() for m in NEWLINE_PATTERN.finditer(mapped))
+                if offsets[-1] == len(mapped):
+                    offsets.pop()  # 마지막 줄바꿈 뒤는 새 줄이 아님
+            self._line_offsets = offsets
+        return self._line_offsets
+
+    def line_count(self) -> int:
+        """줄 수 (내용 전체를 디코딩하지 않음)"""
+        with self._lock:
+            self._ensure_fresh()
+            return len(self._offsets()) if self.size else 0
+
+    def lines(self, start: int, stop: Optional[int] = None) -> List[str]:
+        """[start, stop) 범위의 줄들만 디코딩하여 반환 (0부터 시작, 줄바꿈 제외)"""
+        with self._lock:
+            self._ensure_fresh()
+            if not self.size:
+                return []
+            if self._encoding_stale:
+                self._redetect(self.raw())
+            offsets = self._offsets()
+            total = len(offsets)
+            stop = total if stop is None else min(stop, total)
+            start = max(0, start)
+            if start >= stop:
+                return []
+            begin = offsets[start]
+            mapped = self._mapped()
+            end = offsets[stop] if stop < total else len(mapped)
+            chunk = mapped[begin:end].decode(self.encoding, errors=self.errors)
+            return chunk.splitlines()
+
+    def line(self, index: int) -> str:
+        """특정 줄 하나만 디코딩"""
+        result = self.lines(index, index + 1)
+        if not result:
+            raise IndexError(f"line index out of range: {index}")
+        return result[0]
+
+    def close(self):
+        """mmap과 파일 디스크립터 해제 (다시 접근하면 새로 매핑)"""
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+
+    def __repr__(self):
+        return f"LazyFileContent({self.path!r}, encoding={self.encoding!r}, size={self.size})"
+
+
+class FileContentStore(MutableMapping):
+    """파일 경로 -> 내용 매핑 (dict 호환)
+
+    값으로 str 또는 LazyFileContent를 저장할 수 있으며, 조회 시 항상 str을 반환한다.
+    LazyFileContent는 디코딩 결과를 max_resident_chars 한도의 LRU에만 보관한다.
+    """
+
+    def __init__(self, max_resident_chars: int = 8 * 1024 * 1024):
+        self.max_resident_chars = max_resident_chars
+        self._entries = {}
+        self._resident = OrderedDict()
+        self._resident_chars = 0
+        self._lock = threading.RLock()
+
+    def __getitem__(self, path: str) -> str:
+        with self._lock:
+            entry = self._entries[path]
+            if isinstance(entry, str):
+                return entry
+
+            # 디스크에서 파일이 변경되었으면 상주 내용을 버리고 다시 디코딩
+            if entry.refresh():
+                self._forget(path)
+
+            content = self._resident.get(path)
+            if content is not None:
+                self._resident.move_to_end(path)
+                return content
+
+            try:
+                content = entry.text()
+            except FileNotFoundError:
+                return ''  # 매핑 전에 삭제된 파일 (파일 감시기가 컨텍스트에서 제거)
+            finally:
+                entry.close()  # 디코딩한 내용은 LRU가 보관하므로 디스크립터를 붙잡지 않음
+            self._remember(path, content)
+            return content
+
+    def __setitem__(self, path: str, value: Union[str, LazyFileContent]):
+        with self._lock:
+            self._discard(path)
+            self._entries[path] = value
+
+    def __delitem__(self, path: str):
+        with self._lock:
+            if path not in self._entries:
+                raise KeyError(path)
+            self._discard(path)
+            del self._entries[path]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path) -> bool:
+        return path in self._entries
+
+    def __repr__(self):
+        return f"FileContentStore({len(self._entries)} files, {self._resident_chars:,} chars resident)"
+
+    def set_lazy(self, path: str, handle: LazyFileContent, content: Optional[str] = None):
+        """지연 핸들 등록 (이미 디코딩한 내용이 있으면 LRU에 미리 적재)"""
+        with self._lock:
+            self[path] = handle
+            if content is not None:
+                self._remember(path, content)
+
+    def get_handle(self, path: str) -> Optional[LazyFileContent]:
+        """경로의 LazyFileContent 반환 (일반 문자열로 저장된 경우 None)"""
+        entry = self._entries.get(path)
+        return entry if isinstance(entry, LazyFileContent) else None
+
+    def char_count(self, path: str) -> int:
+        """가능하면 디코딩 없이 문자 수 반환"""
+        entry = self._entries[path]
+        if isinstance(entry, str):
+            return len(entry)
+        resident = self._resident.get(path)
+        if resident is not None:
+            return len(resident)
+        count = entry.char_count()
+        return count if count is not None else len(self[path])
+
+    def resident_chars(self) -> int:
+        """현재 메모리에 상주하는 디코딩된 문자 수"""
+        return self._resident_chars
+
+    def _remember(self, path: str, content: str):
+        """LRU에 디코딩 결과 보관, 한도 초과 시 오래된 항목부터 제거"""
+        self._forget(path)
+        self._resident[path] = content
+        self._resident_chars += len(content)
+        while self._resident_chars > self.max_resident_chars and len(self._resident) > 1:
+            evicted_path, evicted = self._resident.popitem(last=False)
+            self._resident_chars -= len(evicted)
+            entry = self._entries.get(evicted_path)
+            if isinstance(entry, LazyFileContent):
+                entry.close()
+
+    def _forget(self, path: str):
+        """LRU에서 상주 내용 제거"""
+        resident = self._resident.pop(path, None)
+        if resident is not None:
+            self._resident_chars -= len(resident)
+
+    def _discard(self, path: str):
+        """기존 항목의 상주 내용과 mmap 정리"""
+        self._forget(path)
+        entry = self._entries.get(path)
+        if isinstance(entry, LazyFileContent):
+            entry.close()
@@ -0,0 +1,254 @@
+# actions/line_diff.py
+"""
+줄 단위 diff 엔진 - 대용량 레거시 소스 미리보기용
+
+difflib.SequenceMatcher는 반복되는 줄이 많은 큰 C 파일에서 급격히 느려지므로 다음 순서로 계산한다.
+1) 줄을 정수 ID로 바꾸고 공통 앞/뒤 구간을 잘라냄
+2) histogram diff: 남은 구간에서 가장 드물게 나오는 줄을 기준으로 가장 긴 일치 구간을 찾아 좌/우로 분할
+3) 드문 줄이 없는 구간(같은 줄만 반복)은 비용 상한이 있는 Myers O(ND) diff로 처리
+
+결과는 SequenceMatcher.get_opcodes()와 같은 형식의 opcode이고, unified diff 출력은 difflib.unified_diff와
+같은 형식이다. compute_diff()는 최근 결과를 캐시하므로 미리보기의 텍스트 diff, 시각적 diff,
+변경 요약이 같은 입력에 대해 diff를 한 번만 계산한다.
+"""
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+Opcode = Tuple[str, int, int, int, int]
+Match = Tuple[int, int, int]  # (a 시작, b 시작, 길이)
+
+MAX_CHAIN = 64          # 이보다 자주 나오는 줄은 histogram 기준 줄로 쓰지 않음
+MAX_MYERS_COST = 512    # Myers 편집 거리 상한 (넘으면 해당 구간을 통째로 replace 처리)
+
+
+def _find_region(a: List[int], b: List[int], alo: int, ahi: int, blo: int, bhi: int) -> Tuple[Optional[Match], bool]:
+    """histogram 방식으로 기준 일치 구간 탐색 → (구간, 공통 줄 존재 여부)"""
+    positions: Dict[int, List[int]] = {}
+    for i in range(alo, ahi):
+        positions.setdefault(a[i], []).append(i)
+    counts = {line: len(occurrences) for line, occurrences in positions.items()}
+
+    best = None
+    best_count = MAX_CHAIN + 1
+    best_size = 0
+    has_common = False
+    j = blo
+    while j < bhi:
+        occurrences = positions.get(b[j])
+        next_j = j + 1
+        if occurrences is not None:
+            has_common = True
+            count = len(occurrences)
+            if count <= best_count:
+                for i in occurrences:
+                    # 기준 줄에서 앞/뒤로 일치 구간 확장 (구간의 빈도는 구간 안에서 가장 드문 줄의 빈도)
+                    region_count = count
+                    start_a, start_b = i, j
+                    while start_a > alo and start_b > blo and a[start_a - 1] == b[start_b - 1]:
+                        start_a -= 1
+                        start_b -= 1
+                        if counts[a[start_a]] < region_count:
+                            region_count = counts[a[start_a]]
+                    end_a, end_b = i + 1, j + 1
+                    while end_a < ahi and end_b < bhi and a[end_a] == b[end_b]:
+                        if counts[a[end_a]] < region_count:
+                            region_count = counts[a[end_a]]
+                        end_a += 1
+                        end_b += 1
+                    size = end_a - start_a
+                    if region_count < best_count or (region_count == best_count and size > best_size):
+                        best = (start_a, start_b, size)
+                        best_count = region_count
+                        best_size = size
+                    next_j = max(next_j, end_b)  # 이미 확장한 구간 안의 줄은 다시 보지 않음
+        j = next_j
+    return best, has_common
+
+
+def _myers(a: List[int], b: List[int], alo: int, ahi: int, blo: int, bhi: int) -> List[Match]:
+    """구간에 대한 Myers diff 일치 구간 (편집 거리가 MAX_MYERS_COST를 넘으면 빈 목록)"""
+    n = ahi - alo
+    m = bhi - blo
+    v = {1: 0}
+    trace = []
+    for d in range(min(n + m, MAX_MYERS_COST) + 1):
+        trace.append(v.copy())
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                return _myers_backtrack(trace, n, m, alo, blo)
+    return []
+
+
+def _myers_backtrack(trace: List[Dict[int, int]], n: int, m: int, alo: int, blo: int) -> List[Match]:
+    matches = []
+    x, y = n, m
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v.get(k - 1, -1) < v.get(k + 1, -1)):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[prev_k]
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            x -= 1
+            y -= 1
+            matches.append((alo + x, blo + y, 1))
+        x, y = prev_x, prev_y
+    return matches
+
+
+def diff_opcodes(a: Sequence[str], b: Sequence[str]) -> List[Opcode]:
+    """두 줄 목록의 opcode 목록 (SequenceMatcher.get_opcodes()와 같은 형식)"""
+    ids: Dict[str, int] = {}
+    a_ids = [ids.setdefault(line, len(ids)) for line in a]
+    b_ids = [ids.setdefault(line, len(ids)) for line in b]
+
+    matches: List[Match] = []
+    stack = [(0, len(a_ids), 0, len(b_ids))]
+    while stack:
+        alo, ahi, blo, bhi = stack.pop()
+        # 공통 앞/뒤 구간
+        start = 0
+        while alo + start < ahi and blo + start < bhi and a_ids[alo + start] == b_ids[blo + start]:
+            start += 1
+        if start:
+            matches.append((alo, blo, start))
+            alo += start
+            blo += start
+        end = 0
+        while ahi - end > alo and bhi - end > blo and a_ids[ahi - end - 1] == b_ids[bhi - end - 1]:
+            end += 1
+        if end:
+            ahi -= end
+            bhi -= end
+            matches.append((ahi, bhi, end))
+        if alo == ahi or blo == bhi:
+            continue
+
+        region, has_common = _find_region(a_ids, b_ids, alo, ahi, blo, bhi)
+        if region is not None:
+            i, j, size = region
+            matches.append(region)
+            stack.append((alo, i, blo, j))
+            stack.append((i + size, ahi, j + size, bhi))
+        elif has_common:
+            matches.extend(_myers(a_ids, b_ids, alo, ahi, blo, bhi))
+
+    return _matches_to_opcodes(sorted(matches), len(a_ids), len(b_ids))
+
+
+def _matches_to_opcodes(matches: List[Match], n: int, m: int) -> List[Opcode]:
+    opcodes = []
+    i = j = 0
+    merged: List[List[int]] = []
+    for ai, bj, size in matches:
+        if merged and merged[-1][0] + merged[-1][2] == ai and merged[-1][1] + merged[-1][2] == bj:
+            merged[-1][2] += size
+        else:
+            merged.append([ai, bj, size])
+
+    for ai, bj, size in merged + [[n, m, 0]]:
+        if i < ai and j < bj:
+            opcodes.append(('replace', i, ai, j, bj))
+        elif i < ai:
+            opcodes.append(('delete', i, ai, j, bj))
+        elif j < bj:
+            opcodes.append(('insert', i, ai, j, bj))
+        i, j = ai + size, bj + size
+        if size:
+            opcodes.append(('equal', ai, i, bj, j))
+    return opcodes
+
+
+def group_opcodes(opcodes: List[Opcode], n: int = 3) -> Iterator[List[Opcode]]:
+    """앞뒤 n줄 컨텍스트를 포함한 hunk 단위로 묶기 (SequenceMatcher.get_grouped_opcodes와 동일)"""
+    codes = list(opcodes) or [('equal', 0, 1, 0, 1)]
+    if codes[0][0] == 'equal':
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == 'equal':
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    group = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == 'equal' and i2 - i1 > n + n:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == 'equal'):
+        yield group
+
+
+def _format_range(start: int, stop: int) -> str:
+    """unified diff 범위 표기 (difflib과 동일)"""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f'{beginning}'
+    if not length:
+        beginning -= 1
+    return f'{beginning},{length}'
+
+
+class FileDiff:
+    """파일 하나의 diff 결과 (텍스트 diff / 시각적 diff / 변경 요약이 공유)"""
+
+    def __init__(self, original: str, new: str):
+        self.original_lines = original.splitlines(keepends=True)
+        self.new_lines = new.splitlines(keepends=True)
+        self.opcodes = diff_opcodes(self.original_lines, self.new_lines)
+        self._unified_cache: Dict[Tuple[str, str, int], List[str]] = {}
+
+    def unified(self, fromfile: str = '', tofile: str = '', n: int = 3) -> List[str]:
+        """difflib.unified_diff(..., lineterm='')와 같은 형식의 줄 목록"""
+        key = (fromfile, tofile, n)
+        if key in self._unified_cache:
+            return self._unified_cache[key]
+
+        lines = []
+        for group in group_opcodes(self.opcodes, n):
+            if not lines:
+                lines.append(f'--- {fromfile}')
+                lines.append(f'+++ {tofile}')
+            first, last = group[0], group[-1]
+            lines.append(f'@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@')
+            for tag, i1, i2, j1, j2 in group:
+                if tag == 'equal':
+                    lines.extend(' ' + line for line in self.original_lines[i1:i2])
+                    continue
+                if tag in ('replace', 'delete'):
+                    lines.extend('-' + line for line in self.original_lines[i1:i2])
+                if tag in ('replace', 'insert'):
+                    lines.extend('+' + line for line in self.new_lines[j1:j2])
+        self._unified_cache[key] = lines
+        return lines
+
+    def removed_lines(self) -> List[str]:
+        """삭제(또는 교체)된 원본 줄 (줄바꿈 제외)"""
+        return [line.rstrip('\r\n') for tag, i1, i2, _, _ in self.opcodes if tag in ('replace', 'delete')
+                for line in self.original_lines[i1:i2]]
+
+    def added_lines(self) -> List[str]:
+        """추가(또는 교체)된 새 줄 (줄바꿈 제외)"""
+        return [line.rstrip('\r\n') for tag, _, _, j1, j2 in self.opcodes if tag in ('replace', 'insert')
+                for line in self.new_lines[j1:j2]]
+
+
+@lru_cache(maxsize=16)
+def compute_diff(original: str, new: str) -> FileDiff:
+    """같은 (원본, 새 내용)에 대한 diff는 한 번만 계산"""
+    return FileDiff(original, new)
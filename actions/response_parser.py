@@ -0,0 +1,200 @@
+# actions/response_parser.py
+"""
+LLM 편집 응답 증분 파서 - 모든 코더와 FileEditor가 공유
+
+응답을 조각(chunk) 단위로 받아 줄 단위 상태 기계로 처리하므로 스트리밍 출력에도 그대로 쓸 수 있고,
+응답 길이에 선형 시간이다 (DOTALL 정규식을 패턴별로 반복 적용하지 않음). 블록이 닫히는 즉시 이벤트를 낸다.
+- FencedBlock: ``` 코드 블록 (바로 앞의 비어 있지 않은 줄이 파일 경로면 path 포함)
+- EditBlock: <<<<<<< SEARCH / ======= / >>>>>>> REPLACE 블록 (코드 블록 안에 있어도 인식)
+- DiffBlock: ```diff 블록 또는 코드 블록 밖의 '--- / +++' 또는 '@@'로 시작하는 unified diff
+닫히지 않은 코드 블록과 SEARCH 블록은 잘린 응답일 수 있으므로 이벤트를 내지 않는다.
+"""
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Union
+
+SEARCH_MARKER = '<<<<<<< SEARCH'
+DIVIDER_MARKER = '======='
+REPLACE_MARKER = '>>>>>>> REPLACE'
+FENCE = '```'
+DIFF_LANGUAGES = ('diff', 'patch', 'udiff')
+DIFF_LINE_PREFIXES = (' ', '+', '-', '@@', '\\', 'diff ', 'index ')
+
+
+@dataclass
+class FencedBlock:
+    """``` 코드 블록"""
+    path: Optional[str]
+    language: str
+    content: str
+
+
+@dataclass
+class EditBlock:
+    """SEARCH/REPLACE 블록 (path는 블록 바로 앞 또는 마지막으로 나온 파일 경로)"""
+    path: Optional[str]
+    search: str
+    replace: str
+
+
+@dataclass
+class DiffBlock:
+    """unified diff 텍스트"""
+    text: str
+
+
+ResponseEvent = Union[FencedBlock, EditBlock, DiffBlock]
+
+
+def path_from_line(line: str) -> Optional[str]:
+    """파일 경로만 있는 줄이면 경로 반환 ('@path', './path', 'dir/name', 'name.ext')"""
+    candidate = line.strip().rstrip(':,')
+    if candidate.startswith('@'):
+        candidate = candidate[1:]
+    if not candidate or len(candidate) > 260 or any(c.isspace() or c in '`<>*' for c in candidate):
+        return None
+    name = candidate.rsplit('/', 1)[-1]
+    stem, dot, extension = name.rpartition('.')
+    if dot and stem and extension.isalnum():
+        return candidate
+    if '/' in candidate.strip('./') and name and '.' not in name:
+        return candidate  # 확장자 없는 파일 (path/filename)
+    return None
+
+
+class ResponseParser:
+    """응답 조각을 받아 이벤트를 내는 상태 기계
+
+    parser = ResponseParser()
+    for chunk in stream:
+        for event in parser.feed(chunk): ...
+    events = parser.close()
+    """
+
+    def __init__(self):
+        self._buffer = ''
+        self._events: List[ResponseEvent] = []
+        self._fence: Optional[List[str]] = None          # 열린 코드 블록의 줄
+        self._fence_path: Optional[str] = None
+        self._fence_language = ''
+        self._fence_has_edits = False                    # SEARCH 블록을 감싼 코드 블록은 FencedBlock으로 내지 않음
+        self._search: Optional[List[str]] = None         # SEARCH 블록의 검색 줄
+        self._replace: Optional[List[str]] = None        # ======= 이후 치환 줄
+        self._edit_path: Optional[str] = None
+        self._diff: Optional[List[str]] = None           # 코드 블록 밖의 diff
+        self._pending_header: Optional[str] = None       # '+++' 줄을 기다리는 '--- ' 줄
+        self._recent_path: Optional[str] = None          # 바로 앞의 비어 있지 않은 줄이 경로면 그 경로
+
+    def feed(self, chunk: str) -> List[ResponseEvent]:
+        """응답 조각 처리 → 이번 조각에서 완성된 이벤트 목록"""
+        if '\n' not in chunk:
+            self._buffer += chunk  # 긴 줄이 잘게 나뉘어 와도 버퍼를 다시 나누지 않음
+            return []
+        lines = (self._buffer + chunk).split('\n')
+        self._buffer = lines.pop()
+        for line in lines:
+            self._line(line[:-1] if line.endswith('\r') else line)
+        return self._take()
+
+    def close(self) -> List[ResponseEvent]:
+        """남은 줄을 처리하고 열린 diff를 마무리"""
+        if self._buffer:
+            self._line(self._buffer.rstrip('\r'))
+            self._buffer = ''
+        self._pending_header = None
+        self._end_diff()
+        return self._take()
+
+    def _take(self) -> List[ResponseEvent]:
+        events, self._events = self._events, []
+        return events
+
+    # --- 상태별 처리 ---
+
+    def _line(self, line: str):
+        stripped = line.strip()
+
+        # SEARCH/REPLACE 블록 안 (코드 블록 표시보다 우선)
+        if self._search is not None:
+            if self._replace is None and stripped == DIVIDER_MARKER:
+                self._replace = []
+            elif self._replace is not None and stripped.startswith(REPLACE_MARKER):
+                self._events.append(EditBlock(self._edit_path, '\n'.join(self._search), '\n'.join(self._replace)))
+                self._search = self._replace = None
+            elif self._replace is not None:
+                self._replace.append(line)
+            else:
+                self._search.append(line)
+            return
+        if stripped.startswith(SEARCH_MARKER):
+            self._end_diff()
+            self._edit_path = self._recent_path or self._edit_path
+            self._fence_has_edits = self._fence is not None
+            self._search = []
+            self._recent_path = None
+            return
+
+        if self._fence is not None:
+            if stripped.startswith(FENCE):
+                self._end_fence()
+            else:
+                self._fence.append(line)
+                self._remember_path(stripped)
+            return
+
+        if self._diff is not None:
+            if not stripped.startswith(FENCE) and (line == '' or line.startswith(DIFF_LINE_PREFIXES)):
+                self._diff.append(line)
+                return
+            self._end_diff()
+
+        if self._pending_header is not None:
+            header, self._pending_header = self._pending_header, None
+            if line.startswith('+++ '):
+                self._diff = [header, line]
+                return
+            self._remember_path(header.strip())
+
+        if stripped.startswith(FENCE):
+            self._fence = []
+            self._fence_path = self._recent_path
+            self._fence_language = stripped[len(FENCE):].strip()
+            self._fence_has_edits = False
+            # 경로는 코드 블록 안의 첫 SEARCH 블록에도 쓰일 수 있으므로 유지
+        elif line.startswith('--- '):
+            self._pending_header = line
+        elif line.startswith('@@') or line.startswith('diff --git'):
+            self._diff = [line]
+        else:
+            self._remember_path(stripped)
+
+    def _remember_path(self, stripped: str):
+        if stripped:
+            self._recent_path = path_from_line(stripped)
+
+    def _end_fence(self):
+        lines = self._fence
+        self._fence = None
+        self._recent_path = None
+        if self._fence_has_edits:
+            return
+        if self._fence_language.lower() in DIFF_LANGUAGES or (lines and lines[0].startswith(('--- ', '@@'))):
+            self._events.append(DiffBlock('\n'.join(lines)))
+        else:
+            self._events.append(FencedBlock(self._fence_path, self._fence_language, '\n'.join(lines)))
+
+    def _end_diff(self):
+        if self._diff is not None:
+            self._events.append(DiffBlock('\n'.join(self._diff)))
+            self._diff = None
+            self._recent_path = None
+
+
+def parse_events(response: Union[str, Iterable[str]]) -> List[ResponseEvent]:
+    """응답 전체(또는 조각 목록)를 파싱한 이벤트 목록"""
+    parser = ResponseParser()
+    chunks = [response] if isinstance(response, str) else response
+    events = []
+    for chunk in chunks:
+        events.extend(parser.feed(chunk))
+    events.extend(parser.close())
+    return events
@@ -0,0 +1,245 @@
+# actions/sql_tokenizer.py
+"""
+오라클 SQL / PL/SQL 토크나이저 - 내용을 한 번만 훑으며 구조 특징 추출
+
+- 주석, 문자열('...', q'[...]', N'...'), 따옴표 식별자를 먼저 토큰으로 소비하므로
+  그 안의 ':' (예: TO_CHAR(x, 'HH24:MI'))는 바인드 변수로 오인하지 않는다
+- content.upper()나 주석 제거용 re.sub 같은 전체 복사 없이 앞에서부터 한 번만 진행
+- 모든 최상위 분기가 리터럴 문자로 시작하므로 정규식 엔진이 후보 문자까지 빠르게 건너뛰고,
+  파이썬 루프는 관심 토큰(주석, 문자열, 바인드, 키워드 등)에서만 돈다
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple
+
+# 추출 대상 오라클 함수 (결과 순서 유지)
+ORACLE_FUNCTIONS = ['NVL', 'TO_CHAR', 'SYSDATE', 'TO_DATE', 'DECODE', 'CASE']
+
+# 유효 종료일 패턴 (문자열/숫자 리터럴에서 검사)
+VALIDITY_PATTERNS = [
+    ('99991231235959', '99991231235959 (timestamp format)'),
+    ('99991231', '99991231 (date format)'),
+]
+
+
+def _keyword(word: str, rest: str = '') -> str:
+    """대소문자 무관 키워드 분기 - 첫 글자를 리터럴로 두어 빠른 건너뛰기를 유지하고 식별자 경계 확인"""
+    tail = '(?i:' + re.escape(word[1:]) + rest + r')(?![\w$#])'
+    return '|'.join(first + r'(?<![\w$#].)' + tail for first in (word[0].upper(), word[0].lower()))
+
+
+_BASE_BRANCHES = [
+    r"/\*(?:\+(?P<hint>.*?)\*/|(?P<comment>.*?)(?:\*/|\Z))",      # 힌트 /*+ */ 또는 주석
+    r"--(?:\+(?P<line_hint>[^\n]*)|(?P<line_comment>[^\n]*))",     # 힌트 --+ 또는 주석
+    r"'(?P<string>[^']*(?:''[^']*)*)(?:'|\Z)",                     # 문자열 ('' 이스케이프, N'' 포함)
+    r"q'(?P<qstring>\[.*?\]|\{.*?\}|\(.*?\)|<.*?>|(?P<qdelim>\S).*?(?P=qdelim))(?:'|\Z)",
+    r"Q'(?P<qstring_upper>\[.*?\]|\{.*?\}|\(.*?\)|<.*?>|(?P<qdelim_upper>\S).*?(?P=qdelim_upper))(?:'|\Z)",
+    r'"(?P<quoted>[^"]*)"?',                                       # 따옴표 식별자
+    r":(?P<bind>\w+)",                                             # 바인드 변수 (:= 제외)
+    r"\+(?:(?<=\(\+)|(?<=\( \+))(?=\s*\))(?P<outer>)",             # 오라클 아우터 조인 (+)
+    r"9(?P<validity>9991231\d*)",                                  # 숫자 리터럴 99991231...
+    _keyword('EXTRACT', r'\s*\(\s*\w+\s+FROM'),                    # 함수 인자의 FROM (테이블 아님)
+    _keyword('TRIM', r"\s*\([^()';]*?\s+FROM"),
+    _keyword('FROM'),
+    _keyword('JOIN'),
+]
+_PAREN_BRANCHES = [r'\((?P<open>)', r'\)(?P<close>)']
+
+
+@lru_cache(maxsize=None)
+def _token_pattern(functions: Tuple[str, ...], parens: bool) -> re.Pattern:
+    """아직 찾지 못한 함수만 포함한 토큰 패턴 (이미 찾은 함수는 다시 매칭할 필요 없음)"""
+    branches = _BASE_BRANCHES + [_keyword(func) for func in functions]
+    if parens:
+        branches += _PAREN_BRANCHES  # FROM 절 서브쿼리 안에서만 괄호 깊이를 추적
+    return re.compile('|'.join(branches), re.DOTALL)
+
+
+SQL_TOKEN_PATTERN = _token_pattern(tuple(ORACLE_FUNCTIONS), False)
+
+_IDENT = r'[^\W\d][\w$#]*'
+
+# FROM/JOIN 뒤의 테이블 참조: [schema.]table[@dblink] [[AS] alias]
+TABLE_REF_PATTERN = re.compile(
+    r'\s*(?P<table>' + _IDENT + r'(?:\s*\.\s*' + _IDENT + r')?(?:\s*@\s*' + _IDENT + r'(?:\.' + _IDENT + r')*)?)'
+    r'(?:\s+(?:(?i:AS)\s+)?(?P<alias>' + _IDENT + r'))?'
+)
+# 서브쿼리 뒤: ) [[AS] alias]
+AFTER_SUBQUERY_PATTERN = re.compile(r'\s*(?:(?:(?i:AS)\s+)?(?P<alias>' + _IDENT + r'))?')
+COMMA_PATTERN = re.compile(r'\s*,')
+OPEN_PAREN_PATTERN = re.compile(r'\s*\(')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# 테이블/별칭이 될 수 없는 키워드 (테이블 참조 뒤에 오면 테이블 목록 종료)
+CLAUSE_KEYWORDS = {
+    'WHERE', 'ON', 'USING', 'GROUP', 'ORDER', 'HAVING', 'CONNECT', 'START', 'UNION', 'INTERSECT',
+    'MINUS', 'EXCEPT', 'JOIN', 'INNER', 'LEFT', 'RIGHT', 'FULL', 'OUTER', 'CROSS', 'NATURAL',
+    'PARTITION', 'SAMPLE', 'FOR', 'WITH', 'MODEL', 'PIVOT', 'UNPIVOT', 'FETCH', 'OFFSET', 'RETURNING',
+    'LOG', 'SET', 'VALUES', 'SELECT', 'INTO', 'WHEN', 'THEN', 'ELSE', 'END', 'AND', 'OR', 'BULK',
+    'LIMIT', 'LOOP', 'IS', 'AS', 'BEGIN', 'DECLARE', 'EXCEPTION', 'IF', 'MERGE', 'UPDATE', 'DELETE',
+    'INSERT', 'CURSOR', 'OPEN', 'CLOSE', 'RETURN', 'NOWAIT', 'WAIT', 'SKIP', 'OF', 'LATERAL', 'APPLY',
+    'TABLE', 'ONLY', 'ASOF', 'VERSIONS', 'SEED', 'FROM'
+}
+
+# 그룹 이름 -> 토큰 종류
+_GROUP_KINDS = {
+    'line_hint': 'hint', 'line_comment': 'comment', 'qstring_upper': 'qstring',
+    'qdelim': 'qstring', 'qdelim_upper': 'qstring',
+}
+
+
+def _classify(match: re.Match) -> Tuple[str, str]:
+    """매칭을 (종류, 값)으로 변환 - 그룹이 없는 분기는 키워드/함수"""
+    group = match.lastgroup
+    if group is None:
+        word = match.group().upper()
+        if word in ('FROM', 'JOIN'):
+            return 'keyword', word
+        if word.startswith(('EXTRACT', 'TRIM')):
+            return 'from_arg', match.group()
+        return 'function', word
+    kind = _GROUP_KINDS.get(group, group)
+    if kind == 'qstring':
+        return kind, match.group('qstring') if match.group('qstring') is not None else match.group('qstring_upper')
+    return kind, match.group(group)
+
+
+def tokenize_sql(content: str) -> Iterator[Tuple[str, str, int]]:
+    """(종류, 값, 시작 위치) 관심 토큰 스트림 - 공백, 연산자, 일반 식별자, 괄호는 건너뜀"""
+    for match in SQL_TOKEN_PATTERN.finditer(content):
+        kind, value = _classify(match)
+        yield kind, value, match.start()
+
+
+def _read_table_refs(content: str, pos: int, tables: Dict, aliases: Dict, allow_list: bool) -> Tuple[int, bool]:
+    """pos 위치부터 테이블 참조(목록)를 읽고 (다음 위치, 서브쿼리 시작 여부) 반환"""
+    while True:
+        if OPEN_PAREN_PATTERN.match(content, pos):
+            return pos, True  # 서브쿼리 / TABLE(...) - 괄호는 메인 루프에서 처리
+
+        match = TABLE_REF_PATTERN.match(content, pos)
+        if not match or match.group('table').upper() in CLAUSE_KEYWORDS:
+            return pos, False
+
+        table = WHITESPACE_PATTERN.sub('', match.group('table'))
+        tables.setdefault(table, None)
+        pos = match.end('table')
+
+        alias = match.group('alias')
+        if alias and alias.upper() not in CLAUSE_KEYWORDS:
+            aliases.setdefault(f"{table} as {alias}", None)
+            pos = match.end()
+
+        comma = COMMA_PATTERN.match(content, pos) if allow_list else None
+        if not comma:
+            return pos, False
+        pos = comma.end()
+
+
+def extract_sql_features(content: str) -> Dict[str, List[str]]:
+    """힌트, 바인드 변수, 테이블, 별칭, 아우터 조인, 오라클 함수, 유효성 패턴 추출"""
+    hints = []
+    binds = {}      # 순서를 유지하는 중복 제거용 dict
+    tables = {}
+    aliases = {}
+    functions = set()
+    literals = []   # 99991231이 들어 있는 리터럴
+    outer_join = False
+
+    depth = 0
+    subquery_depths = []    # FROM 목록에서 시작된 서브쿼리의 괄호 깊이 (닫힌 뒤 목록이 이어질 수 있음)
+
+    # 토큰 처리는 이 루프에서 직접 분기한다 (토큰마다 함수 호출을 하지 않도록 _classify 미사용).
+    # 테이블 목록을 읽어 위치가 바뀌거나, 괄호 추적 여부가 바뀌거나, 새 함수를 찾아 패턴에서
+    # 빼야 할 때만 finditer를 다시 시작한다.
+    pos = 0
+    while pos is not None:
+        remaining = tuple(func for func in ORACLE_FUNCTIONS if func not in functions)
+        pattern = _token_pattern(remaining, bool(subquery_depths))
+        restart = None
+        for match in pattern.finditer(content, pos):
+            group = match.lastgroup
+            if group is None:
+                word = match.group().upper()
+                if word == 'FROM' or word == 'JOIN':
+                    restart, subquery = _read_table_refs(content, match.end(), tables, aliases, word == 'FROM')
+                    if subquery:
+                        subquery_depths.append(depth)
+                    break
+                if word.startswith(('EXTRACT', 'TRIM')):
+                    depth += 1  # EXTRACT( / TRIM( 의 여는 괄호를 함께 소비
+                else:
+                    functions.add(word)
+                    restart = match.end()
+                    break
+            elif group == 'string' or group == 'validity' or group.startswith('q'):
+                if '99991231' in match.group():
+                    literals.append(match.group())
+            elif group == 'bind':
+                binds.setdefault(match.group(group), None)
+            elif group == 'open':
+                depth += 1
+            elif group == 'close':
+                depth -= 1
+                if subquery_depths[-1] == depth:
+                    # FROM (서브쿼리) [alias] [, 다음 테이블 ...]
+                    subquery_depths.pop()
+                    restart = match.end()
+                    after = AFTER_SUBQUERY_PATTERN.match(content, restart)
+                    alias = after.group('alias')
+                    if alias and alias.upper() not in CLAUSE_KEYWORDS:
+                        restart = after.end()
+                    comma = COMMA_PATTERN.match(content, restart)
+                    if comma:
+                        restart, subquery = _read_table_refs(content, comma.end(), tables, aliases, True)
+                        if subquery:
+                            subquery_depths.append(depth)
+                    if not subquery_depths:
+                        depth = 0
+                    break
+            elif group == 'hint' or group == 'line_hint':
+                hints.append(match.group(group).strip())
+            elif group == 'outer':
+                outer_join = True
+            # comment, quoted: 건너뜀
+        pos = restart
+
+    return {
+        'hints': hints,
+        'bind_variables': list(binds),
+        'table_aliases': list(aliases),
+        'outer_joins': ['Oracle outer join syntax detected'] if outer_join else [],
+        'oracle_functions': [func for func in ORACLE_FUNCTIONS if func in functions],
+        'table_names': list(tables),
+        'validity_patterns': [label for literal, label in VALIDITY_PATTERNS
+                              if any(literal in text for text in literals)]
+    }
+
+
+SQL_STRUCTURE_PATTERN = _token_pattern((), True)
+
+
+def find_sql_syntax_issues(content: str) -> List[str]:
+    """괄호 짝, 닫히지 않은 문자열/주석/따옴표 식별자 (편집 결과의 간단한 구문 검사용)"""
+    issues = []
+    opened = []
+    for match in SQL_STRUCTURE_PATTERN.finditer(content):
+        text = match.group()
+        group = match.lastgroup
+        if group == 'open':
+            opened.append(match.start())
+        elif group == 'close':
+            if opened:
+                opened.pop()
+            else:
+                issues.append(f"{content.count(chr(10), 0, match.start()) + 1}행: 짝이 맞지 않는 ')'")
+        elif text.startswith('/*') and not (len(text) >= 4 and text.endswith('*/')):
+            issues.append(f"{content.count(chr(10), 0, match.start()) + 1}행: 닫히지 않은 주석")
+        elif text[:1] in ("'", '"') or text[:2].upper() == "Q'":
+            prefix = 2 if text[0] in 'qQ' else 1  # 여는 따옴표까지의 길이
+            closing = '"' if text[0] == '"' else "'"
+            if len(text) <= prefix or not text.endswith(closing):
+                issues.append(f"{content.count(chr(10), 0, match.start()) + 1}행: 닫히지 않은 문자열")
+    for position in opened:
+        issues.append(f"{content.count(chr(10), 0, position) + 1}행: 닫히지 않은 '('")
+    return issues
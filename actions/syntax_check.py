@@ -0,0 +1,157 @@
+# actions/syntax_check.py
+"""
+편집 결과 로컬 구문 검사 - 후보 편집(/edit --candidates) 검증용
+
+레거시 소스는 헤더나 매크로가 로컬에 없어 원본부터 오류가 나는 경우가 많으므로, 원본을 함께 검사해서
+편집으로 새로 생긴 문제만 실패로 본다.
+- C(.c, .h): 괄호 짝 검사 + gcc -fsyntax-only (헤더 없이 검사하도록 #include 줄은 비움, gcc가 있을 때)
+- Pro*C(.pc) 등 gcc로 볼 수 없는 C 계열: 주석/문자열을 제외한 괄호 짝 검사
+- SQL: sql_tokenizer 기준 괄호 짝, 닫히지 않은 문자열/주석
+- XML: ElementTree 파싱
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+import xml.etree.ElementTree as ET
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Optional
+
+from .sql_tokenizer import find_sql_syntax_issues
+
+GCC_TIMEOUT = 10  # 초
+GCC_EXTENSIONS = ('.c', '.h')
+BRACKET_EXTENSIONS = ('.pc', '.cpp', '.cc', '.hpp', '.java', '.js', '.ts')
+BRACKET_PAIRS = {')': '(', ']': '[', '}': '{'}
+
+
+@dataclass
+class SyntaxCheckResult:
+    """검사 결과 (checker가 빈 문자열이면 검사 대상이 아닌 파일)"""
+    ok: bool
+    checker: str = ''
+    issues: List[str] = field(default_factory=list)
+
+
+def _line_of(content: str, position: int) -> int:
+    return content.count('\n', 0, position) + 1
+
+
+def find_bracket_issues(content: str) -> List[str]:
+    """C 계열 괄호 짝 검사 (주석, 문자열, 문자 리터럴 제외)"""
+    issues = []
+    stack = []
+    i = 0
+    length = len(content)
+    while i < length:
+        char = content[i]
+        if char == '/' and content.startswith('/*', i):
+            end = content.find('*/', i + 2)
+            if end < 0:
+                issues.append(f"{_line_of(content, i)}행: 닫히지 않은 주석")
+                break
+            i = end + 2
+            continue
+        if char == '/' and content.startswith('//', i):
+            end = content.find('\n', i)
+            i = length if end < 0 else end
+            continue
+        if char in '"\'':
+            j = i + 1
+            while j < length and content[j] != char and content[j] != '\n':
+                j += 2 if content[j] == '\\' else 1
+            if j >= length or content[j] != char:
+                kind = '문자열' if char == '"' else '문자 리터럴'
+                issues.append(f"{_line_of(content, i)}행: 닫히지 않은 {kind}")
+                i = j
+                continue
+            i = j + 1
+            continue
+        if char in '([{':
+            stack.append((char, i))
+        elif char in BRACKET_PAIRS:
+            if stack and stack[-1][0] == BRACKET_PAIRS[char]:
+                stack.pop()
+            else:
+                issues.append(f"{_line_of(content, i)}행: 짝이 맞지 않는 '{char}'")
+        i += 1
+    for char, position in stack:
+        issues.append(f"{_line_of(content, position)}행: 닫히지 않은 '{char}'")
+    return issues
+
+
+@lru_cache(maxsize=32)
+def _gcc_errors(content: str) -> Optional[tuple]:
+    """gcc -fsyntax-only 오류 메시지 목록 (줄 번호 제외), gcc를 쓸 수 없으면 None"""
+    gcc = shutil.which('gcc') or shutil.which('cc')
+    if gcc is None:
+        return None
+    # #include 줄은 빈 줄로 바꿔 줄 번호를 유지하면서 없는 헤더 때문에 검사가 멈추지 않게 함
+    source = '\n'.join('' if line.lstrip().startswith('#include') else line for line in content.split('\n'))
+    fd, path = tempfile.mkstemp(suffix='.c', prefix='coe-syntax-')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', errors='replace') as f:
+            f.write(source)
+        completed = subprocess.run([gcc, '-fsyntax-only', '-w', '-x', 'c', path],
+                                   capture_output=True, text=True, timeout=GCC_TIMEOUT)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    finally:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    return tuple(line.split(' error: ', 1)[1] for line in completed.stderr.splitlines() if ' error: ' in line)
+
+
+def _new_issues(issues: List[str], original_issues: List[str], strip_location: bool = True) -> List[str]:
+    """원본에 없던 문제만 (같은 메시지는 개수로 비교)"""
+    def key(issue: str) -> str:
+        return issue.split('행: ', 1)[-1] if strip_location else issue
+    remaining = Counter(key(issue) for issue in original_issues)
+    result = []
+    for issue in issues:
+        if remaining[key(issue)] > 0:
+            remaining[key(issue)] -= 1
+        else:
+            result.append(issue)
+    return result
+
+
+def check_syntax(file_path: str, content: str, original: Optional[str] = None) -> SyntaxCheckResult:
+    """파일 확장자에 맞는 구문 검사 (original이 있으면 원본에도 있던 문제는 무시)"""
+    extension = os.path.splitext(file_path)[1].lower()
+
+    if extension in GCC_EXTENSIONS or extension in BRACKET_EXTENSIONS:
+        # gcc는 모르는 타입(헤더에 정의된 ctx_t 등)이 나오면 그 선언 전체를 건너뛰므로 괄호 검사도 함께 수행
+        issues = find_bracket_issues(content)
+        if original is not None:
+            issues = _new_issues(issues, find_bracket_issues(original))
+        errors = _gcc_errors(content) if extension in GCC_EXTENSIONS else None
+        if errors is None:
+            return SyntaxCheckResult(not issues, 'brackets', issues)
+        original_errors = list(_gcc_errors(original) or ()) if original is not None else []
+        issues += _new_issues(list(errors), original_errors, strip_location=False)
+        return SyntaxCheckResult(not issues, 'gcc', issues)
+
+    if extension == '.sql':
+        issues = find_sql_syntax_issues(content)
+        if original is not None:
+            issues = _new_issues(issues, find_sql_syntax_issues(original))
+        return SyntaxCheckResult(not issues, 'sql', issues)
+
+    if extension == '.xml':
+        try:
+            ET.fromstring(content.encode('utf-8'))
+            return SyntaxCheckResult(True, 'xml')
+        except ET.ParseError as e:
+            if original is not None:
+                try:
+                    ET.fromstring(original.encode('utf-8'))
+                except ET.ParseError:
+                    return SyntaxCheckResult(True, 'xml')  # 원본부터 파싱되지 않는 파일
+            return SyntaxCheckResult(False, 'xml', [str(e)])
+
+    return SyntaxCheckResult(True)
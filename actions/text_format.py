@@ -0,0 +1,79 @@
+# actions/text_format.py
+"""
+텍스트 파일 형식 (인코딩 / BOM / 줄바꿈) 보존
+
+레거시 소스(CP949/EUC-KR, CRLF 등)를 수정할 때 읽을 때의 형식 그대로 다시 쓰기 위한 정보.
+- 편집/diff용 내용은 항상 '\\n' 줄바꿈으로 정규화하고, 쓸 때 원래 줄바꿈으로 되돌린다.
+- 줄바꿈이 섞여 있는 파일은 정규화하지 않고 그대로 둔다 (newline='').
+"""
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from .encoding_detector import UTF8_BOM
+
+# 인코딩 감지 실패 표시 (EncodingDetector의 fallback 결과)
+FALLBACK_MARK = '(fallback with replace)'
+
+
+@dataclass(frozen=True)
+class TextFormat:
+    """파일 하나의 인코딩/BOM/줄바꿈 형식"""
+    encoding: str = 'utf-8'
+    bom: bool = False
+    newline: str = '\n'     # '\n', '\r\n', '\r' 또는 섞여 있으면 ''
+    lossy: bool = False     # 인코딩 감지에 실패하여 replace로 읽은 파일 (다시 쓰면 내용이 손상됨)
+
+    @classmethod
+    def detect(cls, raw_data: bytes, used_encoding: str) -> 'TextFormat':
+        """raw 데이터와 EncodingDetector가 알려준 인코딩으로 형식 결정 (인코딩은 다시 감지하지 않음)"""
+        lossy = used_encoding.endswith(FALLBACK_MARK)
+        encoding = used_encoding.split(' ')[0]
+        bom = raw_data.startswith(UTF8_BOM)
+        if encoding == 'utf-8-sig':
+            encoding = 'utf-8'
+
+        crlf = raw_data.count(b'\r\n')
+        lf = raw_data.count(b'\n') - crlf
+        cr = raw_data.count(b'\r') - crlf
+        kinds = [newline for newline, count in (('\r\n', crlf), ('\n', lf), ('\r', cr)) if count]
+        if not kinds:
+            newline = '\n'
+        elif len(kinds) == 1:
+            newline = kinds[0]
+        else:
+            newline = ''
+        return cls(encoding=encoding, bom=bom, newline=newline, lossy=lossy)
+
+    def decode(self, raw_data: bytes) -> str:
+        """raw 데이터를 편집용 텍스트로 ('\\n' 줄바꿈)"""
+        if self.bom and raw_data.startswith(UTF8_BOM):
+            raw_data = raw_data[len(UTF8_BOM):]
+        text = raw_data.decode(self.encoding, errors='replace' if self.lossy else 'strict')
+        if self.newline not in ('', '\n'):
+            text = text.replace(self.newline, '\n')
+        return text
+
+    def normalize(self, text: str) -> str:
+        """원래 줄바꿈이 남아 있는 텍스트를 decode()와 같은 '\\n' 줄바꿈으로 (미리보기/요약 diff 비교용)"""
+        if self.newline not in ('', '\n'):
+            text = text.replace('\r\n', '\n')
+            if self.newline == '\r':
+                text = text.replace('\r', '\n')
+        return text
+
+    def encode(self, text: str) -> bytes:
+        """편집한 텍스트를 원래 형식의 바이트로 (표현할 수 없는 문자가 있으면 UnicodeEncodeError)"""
+        if self.newline not in ('', '\n'):
+            text = text.replace('\r\n', '\n').replace('\n', self.newline)
+        data = text.encode(self.encoding)
+        return UTF8_BOM + data if self.bom else data
+
+    def to_record(self) -> Optional[Dict]:
+        """저널 기록용 (기본 형식이면 None)"""
+        if self == TextFormat():
+            return None
+        return {'encoding': self.encoding, 'bom': self.bom, 'newline': self.newline, 'lossy': self.lossy}
+
+    @classmethod
+    def from_record(cls, data: Optional[Dict]) -> 'TextFormat':
+        return cls(**data) if data else cls()
@@ -0,0 +1,267 @@
+# actions/xml_scanner.py
+"""
+WebSquare UI 화면(.XML) 스트리밍 스캐너
+
+expat(SAX 방식)에 내용을 청크 단위로 넣으면서 Form ID, 설명, dataList, TrxCode,
+scwin.* 함수, svcCombo 개수를 한 번에 수집한다. 텍스트/CDATA 스크립트는 일정 크기
+단위로만 검사하므로 큰 스크립트 블록이 있어도 작업 메모리가 늘어나지 않는다.
+
+레거시 화면에 흔한 잘못된 마크업(&nbsp; 같은 미정의 엔티티, CDATA 없는 스크립트의
+'<', '&' 등)으로 expat가 실패하면 같은 핸들러를 쓰는 관대한 정규식 스캐너로 다시 읽는다.
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from xml.parsers import expat
+
+CHUNK_SIZE = 64 * 1024      # expat에 넣는 청크 크기 (문자)
+TEXT_TAIL = 1024            # 청크 경계에 걸친 매칭을 위해 다음 검사로 넘기는 텍스트 길이
+MAX_SYMBOLS = 10            # elements / scripts 보관 개수 (RepoMapper용)
+
+# 주석 및 스크립트 머리말의 화면 정보
+FORM_ID_PATTERN = re.compile(r'FormID\(명\)\s*:\s*(\S+)')
+FORM_DESC_PATTERN = re.compile(r'Form\s+설명\s*:\s*(.+?)(?:\n|\*)')
+
+# 스크립트/속성 값에서 찾는 패턴 - 큰 스크립트 블록을 빠르게 건너뛰도록 모든 분기가 리터럴로 시작
+#   var TrxCode = "ZORDSS0340082_TR01" / TrxCode: "ZORDSS0340082_TR01" / TP: "ZORDSS0340082_TR01"
+#   (대소문자 무관, '=' 형식은 앞에 var가 있어야 함)
+_TRX_VALUE = r'\s*(?P<sep>[:=])\s*["\'](?P<code>[^"\']+)["\']'
+TRX_CODE_PATTERN = re.compile(
+    r't(?i:rxcode)' + _TRX_VALUE + '|T(?i:rxcode)' + _TRX_VALUE.replace('?P<', '?P<u_')
+    + r'|t(?i:p)\s*:\s*["\'](?P<tp>[^"\']+)["\']|T(?i:p)\s*:\s*["\'](?P<tp_upper>[^"\']+)["\']'
+)
+VAR_BEFORE_PATTERN = re.compile(r'(?i:var)\s+$')
+SCWIN_FUNCTION_PATTERN = re.compile(r'scwin\.(\w+)\s*=')
+SCRIPT_CALL_PATTERN = re.compile(r'\.(\w+)\s*\(')     # obj.method( - obj는 '.' 앞에서 역으로 읽음
+# svcCombo 개수는 기존 분석과 같이 내용 전체의 출현 횟수 (태그 이름, 닫는 태그, 속성, 스크립트 참조 모두 포함)
+SVC_COMBO_PATTERN = re.compile(r'svcCombo', re.IGNORECASE)
+
+# 정규식 대체 스캐너용 토큰
+_XML_TOKEN_PATTERN = re.compile(
+    r'<!--(?P<comment>.*?)(?:-->|\Z)'
+    r'|<!\[CDATA\[(?P<cdata>.*?)(?:\]\]>|\Z)'
+    r'|<\?.*?(?:\?>|\Z)'
+    r'|<!(?:[^>"\']|"[^"]*"|\'[^\']*\')*>?'
+    r'|</(?P<end>[^\s>]+)\s*>?'
+    r'|<(?P<start>[A-Za-z_][\w:.\-]*)(?P<attrs>(?:[^>"\']|"[^"]*"|\'[^\']*\')*)>?',
+    re.DOTALL
+)
+_ATTRIBUTE_PATTERN = re.compile(r'([\w:.\-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))')
+_ENTITIES = {'&lt;': '<', '&gt;': '>', '&amp;': '&', '&quot;': '"', '&apos;': "'"}
+_ENTITY_PATTERN = re.compile(r'&(?:lt|gt|amp|quot|apos);')
+
+
+@dataclass
+class XmlScanResult:
+    """XML 화면 스캔 결과"""
+    form_id: str = ''
+    form_description: str = ''
+    datalist_ids: List[str] = field(default_factory=list)
+    trx_codes: List[str] = field(default_factory=list)
+    svc_combo_count: int = 0
+    functions: List[str] = field(default_factory=list)     # scwin.* 함수
+    elements: List[str] = field(default_factory=list)      # 처음 나온 요소 이름 MAX_SYMBOLS개
+    scripts: List[str] = field(default_factory=list)       # 처음 나온 obj.method( 호출 MAX_SYMBOLS개
+    well_formed: bool = True                               # False면 정규식 대체 스캐너 결과
+
+    def to_analysis(self) -> Dict:
+        """FileManager 분석 결과 형식"""
+        return {
+            'form_id': self.form_id,
+            'form_description': self.form_description,
+            'datalist_ids': list(self.datalist_ids),
+            'trx_codes': list(self.trx_codes),
+            'svc_combo_count': self.svc_combo_count,
+            'functions': list(self.functions)
+        }
+
+
+class _ScanState:
+    """expat/정규식 스캐너가 공유하는 이벤트 처리기"""
+
+    def __init__(self):
+        self.result = XmlScanResult()
+        self._datalists = {}     # 순서를 유지하는 중복 제거용 dict
+        self._trx_codes = {}
+        self._functions = {}
+        self._elements = {}
+        self._scripts = {}
+        self._text = []          # 아직 검사하지 않은 텍스트 조각
+        self._text_size = 0
+
+    # --- 요소/주석 이벤트 ---
+
+    def start_element(self, name: str, attrs: Dict[str, str]):
+        self.flush_text()
+        if len(self._elements) < MAX_SYMBOLS:
+            self._elements.setdefault(name, None)
+
+        local_name = name.rsplit(':', 1)[-1].lower()
+        if local_name == 'datalist' and attrs.get('id'):
+            self._datalists.setdefault(attrs['id'], None)
+
+        for value in attrs.values():
+            if '.' in value or ':' in value:
+                self._scan_script(value)   # ev:onclick="scwin.btn_onclick()" 등
+
+    def end_element(self, name: str):
+        self.flush_text()
+
+    def comment(self, text: str):
+        self.flush_text()
+        self._scan_header(text)
+
+    # --- 텍스트/CDATA ---
+
+    def text(self, data: str):
+        self._text.append(data)
+        self._text_size += len(data)
+        if self._text_size >= CHUNK_SIZE:
+            self.flush_text(final=False)
+
+    def flush_text(self, final: bool = True):
+        """모인 텍스트를 검사 (final이 아니면 마지막 TEXT_TAIL 글자는 다음 조각과 함께 검사)"""
+        if not self._text:
+            return
+        text = ''.join(self._text)
+        if final or len(text) <= TEXT_TAIL:
+            limit = len(text)
+        else:
+            limit = len(text) - TEXT_TAIL
+        self._scan_header(text, limit)
+        self._scan_script(text, limit)
+        if limit < len(text):
+            self._text = [text[limit:]]
+            self._text_size = len(text) - limit
+        else:
+            self._text = []
+            self._text_size = 0
+
+    # --- 패턴 검사 ---
+
+    def _scan_header(self, text: str, limit: Optional[int] = None):
+        """FormID / Form 설명 (처음 나온 것만)"""
+        if self.result.form_id and self.result.form_description:
+            return
+        limit = len(text) if limit is None else limit
+        if not self.result.form_id and 'FormID' in text:
+            match = FORM_ID_PATTERN.search(text)
+            if match and match.start() < limit:
+                self.result.form_id = match.group(1).replace('.XML', '')  # .XML 확장자 제거
+        if not self.result.form_description and '설명' in text:
+            match = FORM_DESC_PATTERN.search(text)
+            if match and match.start() < limit:
+                self.result.form_description = match.group(1).strip()
+
+    def _scan_script(self, text: str, limit: Optional[int] = None):
+        """TrxCode, scwin.* 함수, obj.method( 호출"""
+        limit = len(text) if limit is None else limit
+        for match in TRX_CODE_PATTERN.finditer(text):
+            if match.start() >= limit:
+                break
+            self._add_trx_code(text, match)
+        for match in SCWIN_FUNCTION_PATTERN.finditer(text):
+            if match.start() >= limit:
+                break
+            self._functions.setdefault(match.group(1), None)
+        if len(self._scripts) < MAX_SYMBOLS:
+            for match in SCRIPT_CALL_PATTERN.finditer(text):
+                if match.start() >= limit or len(self._scripts) >= MAX_SYMBOLS:
+                    break
+                begin = match.start()
+                while begin > 0 and (text[begin - 1].isalnum() or text[begin - 1] == '_'):
+                    begin -= 1
+                if begin < match.start():
+                    self._scripts.setdefault(text[begin:match.start(1) + len(match.group(1))], None)
+
+    def _add_trx_code(self, text: str, match: re.Match):
+        if match.group('tp') or match.group('tp_upper'):
+            self._trx_codes.setdefault(match.group('tp') or match.group('tp_upper'), None)
+            return
+        upper = match.group('sep') is None
+        sep = match.group('u_sep' if upper else 'sep')
+        if sep == '=' and not VAR_BEFORE_PATTERN.search(text, max(0, match.start() - 32), match.start()):
+            return
+        self._trx_codes.setdefault(match.group('u_code' if upper else 'code'), None)
+
+    def finish(self, well_formed: bool) -> XmlScanResult:
+        self.flush_text()
+        result = self.result
+        result.datalist_ids = list(self._datalists)
+        result.trx_codes = list(self._trx_codes)
+        result.functions = list(self._functions)
+        result.elements = list(self._elements)
+        result.scripts = list(self._scripts)
+        result.well_formed = well_formed
+        return result
+
+
+def scan_xml(content: str, chunk_size: int = CHUNK_SIZE) -> XmlScanResult:
+    """XML 화면을 한 번 훑어 구조 정보 수집 (잘못된 마크업이면 정규식 스캐너로 대체)"""
+    state = _ScanState()
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = state.start_element
+    parser.EndElementHandler = state.end_element
+    parser.CharacterDataHandler = state.text
+    parser.CommentHandler = state.comment
+
+    try:
+        for offset in range(0, len(content), chunk_size):
+            parser.Parse(content[offset:offset + chunk_size], False)
+        parser.Parse('', True)
+    except expat.ExpatError:
+        result = _scan_lexical(content)
+    else:
+        result = state.finish(well_formed=True)
+    result.svc_combo_count = sum(1 for _ in SVC_COMBO_PATTERN.finditer(content))
+    return result
+
+
+def _unescape(text: str) -> str:
+    return _ENTITY_PATTERN.sub(lambda match: _ENTITIES[match.group()], text) if '&' in text else text
+
+
+def _feed_text(state: _ScanState, content: str, start: int, end: int, unescape: bool = True):
+    """content[start:end]를 청크 단위로 잘라 텍스트 이벤트로 전달 (큰 스크립트도 한 번에 복사하지 않음)"""
+    for offset in range(start, end, CHUNK_SIZE):
+        piece = content[offset:min(offset + CHUNK_SIZE, end)]
+        state.text(_unescape(piece) if unescape else piece)
+
+
+def _scan_lexical(content: str) -> XmlScanResult:
+    """관대한 정규식 스캐너 - 닫히지 않은 태그/주석, 미정의 엔티티, 스크립트 안의 '<'를 허용"""
+    state = _ScanState()
+    pos = 0
+    length = len(content)
+    while pos < length:
+        match = _XML_TOKEN_PATTERN.search(content, pos)
+        if not match:
+            _feed_text(state, content, pos, length)
+            break
+        _feed_text(state, content, pos, match.start())
+        pos = match.end()
+
+        kind = match.lastgroup
+        name = match.group('start')
+        if name is not None:
+            attrs = {}
+            for attr in _ATTRIBUTE_PATTERN.finditer(match.group('attrs')):
+                value = next(v for v in attr.groups()[1:] if v is not None)
+                attrs[attr.group(1)] = _unescape(value)
+            state.start_element(name, attrs)
+
+            self_closing = match.group('attrs').rstrip().endswith('/')
+            if name.rsplit(':', 1)[-1].lower() == 'script' and not self_closing:
+                # CDATA 없는 스크립트: 닫는 태그까지 전부 텍스트 (주석/CDATA 표시는 그대로 검사)
+                end = re.compile(r'</' + re.escape(name) + r'\s*>', re.IGNORECASE).search(content, pos)
+                script_end = end.start() if end else length
+                _feed_text(state, content, pos, script_end, unescape=False)
+                pos = script_end
+        elif kind == 'end':
+            state.end_element(match.group('end'))
+        elif kind == 'comment':
+            state.comment(match.group('comment'))
+        elif kind == 'cdata':
+            state.text(match.group('cdata'))
+    return state.finish(well_formed=False)
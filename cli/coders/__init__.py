@@ -1 +1,8 @@
-# Swing CLI Coders - Aider에서 영감을 받은 다양한 편집 전략
\ No newline at end of file
+# Swing CLI Coders - Aider에서 영감을 받은 다양한 편집 전략
+
+
+def load_registry():
+    """모든 코더 모듈을 import 하여 등록한 뒤 레지스트리를 반환 (CLI 시작 시가 아니라 처음 사용할 때 호출)"""
+    from .base_coder import registry
+    from . import wholefile_coder, editblock_coder, udiff_coder  # noqa: F401 (import 시 레지스트리에 등록)
+    return registry
@@ -7,10 +7,13 @@ from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 import os
 import json
+import time
 from pathlib import Path
 
 from actions.file_editor import FileEditor, EditOperation
 from cli.core.base_prompts import BasePrompts
+from cli.core import tracing
+from cli.core.edit_metrics import get_edit_metrics, response_key
 
 class BaseCoder(ABC):
     """모든 편집 전략의 기본 클래스"""
@@ -18,7 +21,11 @@ class BaseCoder(ABC):
     def __init__(self, file_editor: FileEditor):
         self.file_editor = file_editor
         self.strategy_name = self.__class__.__name__.replace('Coder', '').lower()
+        # 레지스트리 등록 이름 (whole/block/udiff) - /edit, 전략 선택기, 편집 지표가 같은 키를 쓰도록
+        self.strategy_key = registry.key_for(type(self)) or self.strategy_name
         self.prompts = self.get_prompts_class()
+        self.block_stats = {'matched': 0, 'missed': 0}  # 마지막 파싱의 블록/헝크 매칭 수
+        self.edit_failures: List[Dict[str, Any]] = []  # 마지막 파싱에서 적용하지 못한 블록/헝크 (미리보기/적용 확인용)
         
     @abstractmethod
     def get_prompts_class(self) -> BasePrompts:
@@ -60,11 +67,34 @@ class BaseCoder(ABC):
         """이 전략이 가장 적합한 사용 사례들"""
         pass
     
-    def preview_changes(self, response: str, context_files: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
-        """변경사항 미리보기 생성"""
+    def _parse_and_validate(self, response: str, context_files: Dict[str, str]) -> Tuple[Dict[str, str], bool, str]:
+        """parse_response + validate_response (편집 지표가 설정되어 있으면 파싱 시간/블록 매칭 수 기록)"""
+        self.block_stats = {'matched': 0, 'missed': 0}  # 블록/헝크 기반 코더가 파싱 중에 갱신
+        self.edit_failures = []
+        started = time.perf_counter()
+        parsed_files, is_valid, error_msg = {}, False, ''
+        parse_span = tracing.start_span('response.parse', strategy=self.strategy_key, chars=len(response))
         try:
             parsed_files = self.parse_response(response, context_files)
             is_valid, error_msg = self.validate_response(parsed_files)
+            return parsed_files, is_valid, error_msg
+        except Exception as e:
+            error_msg = str(e)
+            raise
+        finally:
+            parse_span.set(valid=is_valid, files=len(parsed_files), **self.block_stats).end()
+            metrics = get_edit_metrics()
+            if metrics is not None:
+                metrics.record('parse', strategy=self.strategy_key, response=response_key(response),
+                               chars=len(response), parse_ms=round((time.perf_counter() - started) * 1000, 2),
+                               valid=is_valid, files=len(parsed_files),
+                               blocks_matched=self.block_stats['matched'], blocks_missed=self.block_stats['missed'],
+                               error=None if is_valid else error_msg[:200])
+
+    def preview_changes(self, response: str, context_files: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """변경사항 미리보기 생성"""
+        try:
+            parsed_files, is_valid, error_msg = self._parse_and_validate(response, context_files)
             
             if not is_valid:
                 return {
@@ -84,18 +114,40 @@ class BaseCoder(ABC):
                 }
             }
     
-    def apply_changes(self, response: str, context_files: Dict[str, str], description: str = "") -> EditOperation:
-        """변경사항을 실제 파일에 적용"""
-        parsed_files = self.parse_response(response, context_files)
-        is_valid, error_msg = self.validate_response(parsed_files)
+    def _record_failure(self, file_path: str, index: int, kind: str, search: str,
+                        line: Optional[int] = None, score: Optional[float] = None):
+        """적용하지 못한 블록/헝크 기록 (검색 내용 첫 줄과 가장 유사한 위치)"""
+        first_line = next((text.strip() for text in search.split('\n') if text.strip()), '')
+        self.edit_failures.append({'file': file_path, 'index': index, 'kind': kind,
+                                   'search': first_line[:80], 'line': line, 'score': score})
+
+    def apply_changes(self, response: str, context_files: Dict[str, str], description: str = "",
+                      allow_partial: bool = False) -> EditOperation:
+        """변경사항을 실제 파일에 적용 (적용하지 못한 블록/헝크가 있으면 allow_partial일 때만)"""
+        parsed_files, is_valid, error_msg = self._parse_and_validate(response, context_files)
         
         if not is_valid:
             raise ValueError(f"{self.strategy_name} 전략 오류: {error_msg}")
+        if self.edit_failures and not allow_partial:
+            raise ValueError(f"{self.strategy_name} 전략: 블록/헝크 {len(self.edit_failures)}개를 찾지 못해 "
+                             f"일부만 적용됩니다. 확인 후 '/apply partial'로 적용하세요.")
         
         # 설명에 전략 정보 추가
         full_description = f"[{self.strategy_name}] {description or '사용자 요청으로 적용'}"
         
-        return self.file_editor.apply_changes_from_dict(parsed_files, full_description)
+        started = time.perf_counter()
+        operation = None
+        try:
+            with tracing.span('apply', strategy=self.strategy_key, files=len(parsed_files)):
+                operation = self.file_editor.apply_changes_from_dict(parsed_files, full_description)
+            return operation
+        finally:
+            metrics = get_edit_metrics()
+            if metrics is not None:
+                metrics.record('apply', strategy=self.strategy_key,
+                               operation_id=operation.operation_id if operation else None,
+                               apply_ms=round((time.perf_counter() - started) * 1000, 2),
+                               success=operation is not None, files=len(parsed_files))
     
     def get_system_prompt(self, context_files: Dict[str, str]) -> str:
         """시스템 프롬프트 생성 (컨텍스트 파일 정보 포함)"""
@@ -157,13 +209,21 @@ class CoderRegistry:
         """코더 클래스 등록"""
         self._coders[name] = coder_class
     
+    def key_for(self, coder_class: type) -> Optional[str]:
+        """코더 클래스의 등록 이름 (등록되지 않았으면 None)"""
+        return next((name for name, registered in self._coders.items() if registered is coder_class), None)
+
     def get_coder(self, name: str, file_editor: FileEditor) -> BaseCoder:
-        """코더 인스턴스 반환 (싱글톤)"""
+        """코더 인스턴스 반환 (싱글톤 - REPL 스레드 전용)"""
         if name not in self._instances:
-            if name not in self._coders:
-                raise ValueError(f"Unknown coder: {name}")
-            self._instances[name] = self._coders[name](file_editor)
+            self._instances[name] = self.create_coder(name, file_editor)
         return self._instances[name]
+
+    def create_coder(self, name: str, file_editor: FileEditor) -> BaseCoder:
+        """공유하지 않는 새 코더 인스턴스 (파싱 상태가 인스턴스에 남으므로 다른 스레드에서 쓸 때 사용)"""
+        if name not in self._coders:
+            raise ValueError(f"Unknown coder: {name}")
+        return self._coders[name](file_editor)
     
     def list_coders(self) -> Dict[str, Dict[str, Any]]:
         """사용 가능한 모든 코더 정보 반환"""
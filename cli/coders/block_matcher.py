@@ -0,0 +1,251 @@
+"""
+Block Matcher - SEARCH 블록을 파일 안에서 찾는 색인 기반 매칭 엔진
+
+대상 파일의 줄을 공백 정규화한 키(연속 공백 → 한 칸, 앞뒤 공백 제거)로 색인해 두고,
+검색 블록에서 가장 드물게 나오는 줄을 기준(anchor)으로 후보 위치를 O(1)에 찾는다.
+1) exact: 원문 그대로 일치
+2) whitespace: 들여쓰기/공백만 다른 일치 (치환 시 파일의 들여쓰기로 맞춤)
+3) fuzzy: 몇 줄이 빠지거나 오타가 있는 근사 일치 - 후보 위치 주변의 제한된 창(줄 수 ±FUZZY_WINDOW)만
+   채점하므로 파일 크기와 무관하게 블록당 비용이 일정하다
+"""
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Sequence, Tuple
+
+MAX_ANCHOR_POSITIONS = 32   # 이보다 자주 나오는 줄(빈 줄, '}' 등)은 후보 투표에 쓰지 않음
+MAX_CANDIDATES = 8          # fuzzy 채점할 후보 시작 위치 수
+FUZZY_WINDOW = 3            # 검색 블록 대비 허용하는 줄 수 차이
+FUZZY_THRESHOLD = 0.9       # 이 점수 이상이고 다른 후보와 구분될 때만 fuzzy 매치 적용
+AMBIGUITY_MARGIN = 0.02     # 1, 2위 후보 점수 차이가 이보다 작으면 위치를 확정하지 않음
+
+
+def normalize_line(line: str) -> str:
+    """공백 차이를 무시하기 위한 줄 키"""
+    return ' '.join(line.split())
+
+
+def leading_whitespace(line: str) -> str:
+    return line[:len(line) - len(line.lstrip())]
+
+
+@dataclass
+class BlockMatch:
+    """검색 블록이 일치한 줄 구간 [start, end)"""
+    start: int
+    end: int
+    score: float
+    kind: str               # 'exact' | 'whitespace' | 'fuzzy'
+    ambiguous: bool = False
+
+    @property
+    def confident(self) -> bool:
+        """치환에 써도 되는 매치인지 (exact/whitespace이거나 점수가 높고 후보가 하나로 좁혀진 fuzzy)"""
+        return self.kind != 'fuzzy' or (self.score >= FUZZY_THRESHOLD and not self.ambiguous)
+
+
+class BlockMatcher:
+    """파일 줄 목록에 대한 정규화 줄 색인"""
+
+    def __init__(self, content: str):
+        self.lines = content.split('\n')
+        self.keys = [normalize_line(line) for line in self.lines]
+        self.index: Dict[str, List[int]] = {}
+        for position, key in enumerate(self.keys):
+            self.index.setdefault(key, []).append(position)
+
+    def find(self, search: str, hint: Optional[int] = None, allow_fuzzy: bool = True) -> Optional[BlockMatch]:
+        """검색 블록의 위치 (exact > whitespace > fuzzy 순, 같은 종류면 hint에 가까운/앞쪽 위치)
+
+        fuzzy 매치는 점수가 낮아도 가장 유사한 위치를 돌려주므로 confident로 적용 여부를 판단한다.
+        """
+        search_lines = search.split('\n')
+        search_keys = [normalize_line(line) for line in search_lines]
+        if not any(search_keys):
+            return None
+
+        match = self._find_normalized(search_lines, search_keys, hint)
+        if match is not None or not allow_fuzzy:
+            return match
+        return self._find_fuzzy(search_keys, hint)
+
+    def _order(self, positions: Sequence[int], hint: Optional[int]) -> List[int]:
+        if hint is None:
+            return sorted(positions)
+        return sorted(positions, key=lambda position: (abs(position - hint), position))
+
+    def _find_normalized(self, search_lines: List[str], search_keys: List[str],
+                         hint: Optional[int]) -> Optional[BlockMatch]:
+        """공백 정규화 키가 모두 같은 구간 중 exact 우선, 그다음 hint에 가까운/앞쪽 위치"""
+        matches = self._normalized_matches(search_lines, search_keys, hint)
+        return next((match for match in matches if match.kind == 'exact'), matches[0] if matches else None)
+
+    def _normalized_matches(self, search_lines: List[str], search_keys: List[str],
+                            hint: Optional[int]) -> List[BlockMatch]:
+        """가장 드문 줄을 기준으로 후보를 만들고 검증 (hint에 가까운/앞쪽 순)"""
+        anchor = None
+        for offset, key in enumerate(search_keys):
+            positions = self.index.get(key)
+            if positions is None:
+                return []  # 파일에 없는 줄이 있으면 정규화 일치도 불가능
+            if key and (anchor is None or len(positions) < len(self.index[search_keys[anchor]])):
+                anchor = offset
+
+        size = len(search_keys)
+        starts = [position - anchor for position in self.index[search_keys[anchor]]
+                  if 0 <= position - anchor <= len(self.lines) - size]
+        matches = []
+        for start in self._order(starts, hint):
+            if self.keys[start:start + size] != search_keys:
+                continue
+            kind = 'exact' if self.lines[start:start + size] == search_lines else 'whitespace'
+            matches.append(BlockMatch(start, start + size, 1.0, kind))
+        return matches
+
+    def find_all(self, search: str, hint: Optional[int] = None) -> List[BlockMatch]:
+        """공백만 다른 경우까지 포함한 모든 일치 위치 (hint에 가까운/앞쪽 순)"""
+        search_lines = search.split('\n')
+        search_keys = [normalize_line(line) for line in search_lines]
+        if not any(search_keys):
+            return []
+        return self._normalized_matches(search_lines, search_keys, hint)
+
+    def _find_fuzzy(self, search_keys: List[str], hint: Optional[int]) -> Optional[BlockMatch]:
+        """드문 줄들의 위치로 시작 위치를 투표하고, 상위 후보 주변 창만 채점"""
+        votes: Dict[int, int] = {}
+        for offset, key in enumerate(search_keys):
+            positions = self.index.get(key) if key else None
+            if not positions or len(positions) > MAX_ANCHOR_POSITIONS:
+                continue
+            for position in positions:
+                votes[position - offset] = votes.get(position - offset, 0) + 1
+        if not votes:
+            return None
+
+        size = len(search_keys)
+        ranked = sorted(votes, key=lambda start: (-votes[start], abs(start - hint) if hint is not None else 0, start))
+        scored: Dict[Tuple[int, int], float] = {}
+        for candidate in ranked[:MAX_CANDIDATES]:
+            window = self._best_window(search_keys, candidate, size)
+            if window is not None:
+                scored.setdefault(window[:2], window[2])
+        if not scored:
+            return None
+
+        ordered = sorted(scored.items(), key=lambda item: -item[1])
+        (start, end), score = ordered[0]
+        # 겹치지 않는 다른 위치가 비슷한 점수면 어느 쪽인지 확정할 수 없음
+        ambiguous = any(score - other < AMBIGUITY_MARGIN for (other_start, other_end), other in ordered[1:]
+                        if other_end <= start or other_start >= end)
+        return BlockMatch(start, end, score, 'fuzzy', ambiguous)
+
+    def _best_window(self, search_keys: List[str], candidate: int, size: int) -> Optional[Tuple[int, int, float]]:
+        """후보 시작 위치 주변에서 줄 단위 유사도가 가장 높은 창을 고른 뒤 글자 단위 점수 계산"""
+        matcher = SequenceMatcher(None, autojunk=False)
+        matcher.set_seq2(search_keys)
+        best = None
+        slack = min(FUZZY_WINDOW, max(1, size // 5))
+        # 같은 점수면 후보 위치/검색 블록 길이에 가까운 창 우선
+        starts = sorted(range(max(0, candidate - slack), min(len(self.lines), candidate + slack + 1)),
+                        key=lambda start: abs(start - candidate))
+        lengths = sorted(range(max(1, size - slack), size + slack + 1), key=lambda length: abs(length - size))
+        for start in starts:
+            for length in lengths:
+                end = min(len(self.lines), start + length)
+                matcher.set_seq1(self.keys[start:end])
+                ratio = matcher.ratio()
+                if best is None or ratio > best[2]:
+                    best = (start, end, ratio)
+        if best is None or best[2] == 0:
+            return None
+
+        start, end, _ = best
+        score = SequenceMatcher(None, '\n'.join(self.keys[start:end]), '\n'.join(search_keys), autojunk=False).ratio()
+        return start, end, score
+
+
+def reindent(replace_lines: List[str], search_lines: List[str], matched_lines: List[str]) -> List[str]:
+    """검색 블록과 파일의 들여쓰기가 다르면 치환 블록을 파일 쪽 들여쓰기로 옮김"""
+    search_first = next((line for line in search_lines if line.strip()), None)
+    matched_first = next((line for line in matched_lines if line.strip()), None)
+    if search_first is None or matched_first is None:
+        return replace_lines
+    search_indent = leading_whitespace(search_first)
+    file_indent = leading_whitespace(matched_first)
+    if search_indent == file_indent:
+        return replace_lines
+
+    result = []
+    for line in replace_lines:
+        if line.strip() and line.startswith(search_indent):
+            result.append(file_indent + line[len(search_indent):])
+        else:
+            result.append(line)
+    return result
+
+
+@dataclass
+class BlockResult:
+    """블록 하나의 적용 결과"""
+    index: int
+    applied: bool
+    kind: str = ''          # 'exact' | 'whitespace' | 'fuzzy' | 'substring' (적용 실패 시 '')
+    line: int = 0           # 일치(또는 가장 유사한) 위치, 1부터
+    score: float = 0.0
+
+
+def apply_blocks(content: str, blocks: List[Tuple[str, str]]) -> Tuple[str, List[BlockResult]]:
+    """SEARCH/REPLACE 블록 목록을 적용
+
+    현재 내용을 한 번 색인해서 찾을 수 있는 블록을 모두 찾고, 서로 겹치지 않는 것들을 한 번에 치환한다.
+    앞 블록의 결과를 찾는 블록이나 앞 블록과 겹치는 블록은 다음 라운드에서 바뀐 내용으로 다시 찾으므로
+    블록마다 색인을 다시 만들지 않으면서 순서대로 적용한 것과 같은 결과가 된다.
+    줄 단위로 찾지 못하고 줄 일부만 적은 블록은 기존처럼 부분 문자열의 첫 위치를 치환하며,
+    fuzzy 매치보다 부분 문자열 일치가 우선이다.
+    """
+    results: List[Optional[BlockResult]] = [None] * len(blocks)
+    remaining = list(range(len(blocks)))
+    while remaining:
+        matcher = BlockMatcher(content)
+        edits = []
+        deferred = []
+        for index in remaining:
+            search, replace = blocks[index]
+            match = matcher.find(search)
+            usable = (match is not None and match.confident
+                      and (match.kind != 'fuzzy' or search not in content)
+                      and all(match.end <= start or match.start >= end for start, end, _ in edits))
+            if not usable:
+                deferred.append(index)
+                continue
+            new_lines = replace.split('\n')
+            if match.kind != 'exact':
+                new_lines = reindent(new_lines, search.split('\n'), matcher.lines[match.start:match.end])
+            edits.append((match.start, match.end, new_lines))
+            results[index] = BlockResult(index, True, match.kind, match.start + 1, match.score)
+        if not edits:
+            break
+        lines = matcher.lines
+        for start, end, new_lines in sorted(edits, key=lambda edit: edit[0], reverse=True):
+            lines[start:end] = new_lines
+        content = '\n'.join(lines)
+        remaining = deferred
+
+    # 줄 단위로 찾지 못한 블록: 부분 문자열 치환, 그것도 안 되면 가장 유사한 위치만 기록
+    matcher = None
+    for index in remaining:
+        search, replace = blocks[index]
+        if search and search in content:
+            line = content.count('\n', 0, content.index(search)) + 1
+            content = content.replace(search, replace, 1)
+            results[index] = BlockResult(index, True, 'substring', line, 1.0)
+            matcher = None
+            continue
+        if matcher is None:
+            matcher = BlockMatcher(content)
+        match = matcher.find(search)
+        if match is None:
+            results[index] = BlockResult(index, False)
+        else:
+            results[index] = BlockResult(index, False, '', match.start + 1, match.score)
+
+    return content, results
@@ -0,0 +1,107 @@
+"""
+Edit Candidates - 여러 편집 후보를 동시에 생성하고 먼저 검증을 통과한 후보를 선택 (/edit --candidates N)
+
+후보마다 (전략이 다를 수 있는) 코더의 시스템 프롬프트로 LLM을 동시에 호출하고, 응답이 오는 순서대로
+1) 코더의 parse_response / validate_response
+2) 변경된 파일의 로컬 구문 검사 (actions.syntax_check - 원본에도 있던 오류는 무시)
+를 거쳐 처음 통과한 후보를 바로 돌려준다. 손으로 /edit를 반복하던 재시도를 병렬로 처리하는 용도.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from actions.file_editor import FileEditor
+from actions.syntax_check import check_syntax
+from .base_coder import registry
+from ..core.debug_manager import DebugManager
+from ..core import tracing
+from ..core.edit_metrics import get_edit_metrics
+
+MAX_CANDIDATES = 5
+
+
+@dataclass
+class EditCandidate:
+    """후보 하나의 생성/검증 결과"""
+    index: int
+    strategy: str
+    response: str = ''
+    files: Dict[str, str] = field(default_factory=dict)
+    valid: bool = False
+    message: str = ''
+    elapsed: float = 0.0
+
+
+def candidate_strategies(count: int, preferred: str, requested: Optional[List[str]] = None) -> List[str]:
+    """후보별 전략 (지정하지 않으면 현재 전략부터 등록된 전략을 번갈아 사용)"""
+    pool = requested or [preferred] + [name for name in registry._coders if name != preferred]
+    return [pool[i % len(pool)] for i in range(count)]
+
+
+class CandidateRunner:
+    """후보 생성기 - LLM 호출은 스레드 풀에서 동시에 실행 (I/O 대기가 대부분)"""
+
+    def __init__(self, llm_service, file_editor: FileEditor):
+        self.llm_service = llm_service
+        self.file_editor = file_editor
+
+    def run(self, messages: List[Dict[str, str]], context_files: Dict[str, str], strategies: List[str],
+            on_result: Optional[Callable[[EditCandidate], None]] = None) -> Tuple[Optional[EditCandidate], List[EditCandidate]]:
+        """(처음 검증을 통과한 후보, 그때까지 끝난 후보 목록) - 통과한 후보가 나오면 나머지는 기다리지 않음"""
+        results: List[EditCandidate] = []
+        executor = ThreadPoolExecutor(max_workers=len(strategies), thread_name_prefix='coe-candidate')
+        try:
+            futures = [executor.submit(self._generate, index, strategy, messages, context_files)
+                       for index, strategy in enumerate(strategies)]
+            for future in as_completed(futures):
+                candidate = future.result()
+                results.append(candidate)
+                if on_result:
+                    on_result(candidate)
+                if candidate.valid:
+                    return candidate, results
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return None, results
+
+    def _generate(self, index: int, strategy: str, messages: List[Dict[str, str]],
+                  context_files: Dict[str, str]) -> EditCandidate:
+        candidate = EditCandidate(index, strategy)
+        started = time.perf_counter()
+        try:
+            coder = registry.create_coder(strategy, self.file_editor)  # 후보마다 별도 인스턴스 (block_stats 등 경합 방지)
+            # 전략별 응답 형식을 따르도록 첫 시스템 프롬프트만 코더의 것으로 교체
+            coder_messages = [{'role': 'system', 'content': coder.get_system_prompt(context_files)}] + messages[1:]
+            with tracing.span('llm.request', candidate=index, strategy=strategy) as llm_span:
+                llm_response = self.llm_service.chat_completion(coder_messages, use_session=False)
+                llm_span.set(**tracing.llm_response_attrs(llm_response))
+            if not llm_response or 'choices' not in llm_response:
+                candidate.message = 'LLM 응답 없음'
+                return candidate
+            candidate.response = llm_response['choices'][0]['message']['content']
+            metrics = get_edit_metrics()
+            if metrics is not None:
+                metrics.record('response', strategy=strategy, chars=len(candidate.response or ''),
+                               completion_tokens=(llm_response.get('usage') or {}).get('completion_tokens'),
+                               seconds=round(time.perf_counter() - started, 3), candidate=True)
+
+            candidate.files = coder.parse_response(candidate.response, context_files)
+            is_valid, message = coder.validate_response(candidate.files)
+            if not is_valid:
+                candidate.message = message
+                return candidate
+
+            for file_path, content in candidate.files.items():
+                result = check_syntax(file_path, content, context_files.get(file_path))
+                if not result.ok:
+                    candidate.message = f"{file_path} 구문 검사 실패 ({result.checker}): {'; '.join(result.issues[:3])}"
+                    return candidate
+            candidate.valid = True
+            candidate.message = '검증 통과'
+        except Exception as e:
+            candidate.message = f'후보 생성 중 오류: {e}'
+        finally:
+            candidate.elapsed = time.perf_counter() - started
+            DebugManager.info("[Candidates] #%s (%s) %s - %.1f초", index + 1, strategy, candidate.message, candidate.elapsed)
+        return candidate
@@ -0,0 +1,221 @@
+"""
+Patch Engine - unified diff를 줄 번호가 아닌 내용 기준으로 적용
+
+LLM이 만든 diff는 @@ 헤더의 줄 번호가 자주 틀리므로 GNU patch처럼 동작한다.
+1) hunk의 컨텍스트/삭제 줄로 위치를 찾는다 (헤더 줄 번호 + 앞 hunk의 offset에 가장 가까운 위치 우선)
+2) 못 찾으면 fuzz factor만큼 hunk 앞뒤의 컨텍스트 줄을 줄여 가며 다시 찾는다
+3) 그래도 못 찾은 hunk는 줄 번호로 끼워 넣지 않고 실패로 보고한다 (파일 손상 방지)
+위치 탐색은 block_matcher의 줄 색인을 파일당 한 번만 만들어 쓰므로 파일 크기에 거의 선형이다.
+"""
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from .block_matcher import BlockMatcher, normalize_line, reindent
+
+HUNK_HEADER_PATTERN = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+MAX_FUZZ = 2                # 앞뒤에서 줄여 볼 수 있는 컨텍스트 줄 수 (GNU patch 기본값과 동일)
+NULL_PATHS = ('/dev/null', 'dev/null')
+
+
+@dataclass
+class Hunk:
+    """diff hunk 하나 - lines는 (' ' | '-' | '+', 내용) 목록"""
+    old_start: Optional[int] = None     # 헤더가 없거나 '@@ ... @@'처럼 줄 번호가 없으면 None
+    old_count: Optional[int] = None
+    lines: List[Tuple[str, str]] = field(default_factory=list)
+
+    def before(self) -> List[str]:
+        return [text for tag, text in self.lines if tag != '+']
+
+    def trimmed(self, fuzz: int) -> Tuple['Hunk', int]:
+        """앞뒤 컨텍스트 줄을 최대 fuzz개씩 뺀 hunk와 앞에서 뺀 줄 수"""
+        lines = self.lines
+        leading = 0
+        while leading < fuzz and leading < len(lines) and lines[leading][0] == ' ':
+            leading += 1
+        trailing = 0
+        while trailing < fuzz and len(lines) - trailing > leading and lines[len(lines) - trailing - 1][0] == ' ':
+            trailing += 1
+        return Hunk(self.old_start, self.old_count, lines[leading:len(lines) - trailing]), leading
+
+
+@dataclass
+class FilePatch:
+    """파일 하나에 대한 hunk 목록 (파일 헤더 없이 시작한 hunk는 path가 None)"""
+    old_path: Optional[str] = None
+    new_path: Optional[str] = None
+    hunks: List[Hunk] = field(default_factory=list)
+
+    @property
+    def path(self) -> Optional[str]:
+        if self.new_path and self.new_path not in NULL_PATHS:
+            return self.new_path
+        return self.old_path
+
+    @property
+    def is_new_file(self) -> bool:
+        return self.old_path in NULL_PATHS
+
+    @property
+    def is_deletion(self) -> bool:
+        return self.new_path in NULL_PATHS
+
+
+@dataclass
+class HunkResult:
+    """hunk 하나의 적용 결과"""
+    index: int
+    applied: bool
+    line: int = 0           # 실제로 적용한 위치 (1부터)
+    offset: int = 0         # 헤더 줄 번호와의 차이
+    fuzz: int = 0
+    kind: str = ''          # 'exact' | 'whitespace' | 'insert'
+
+
+def _clean_path(path: str) -> str:
+    """'a/src/x.c\\t2024-01-01 ...' → 'src/x.c'"""
+    path = path.split('\t')[0].strip()
+    if path.startswith(('a/', 'b/')) and path not in NULL_PATHS:
+        path = path[2:]
+    return path
+
+
+def parse_patch(diff_text: str) -> List[FilePatch]:
+    """unified diff 텍스트를 파일별 hunk로 파싱
+
+    - 한 diff 블록 안의 여러 파일 지원
+    - '@@ -3 +3 @@'처럼 줄 수가 생략된 헤더와 줄 번호 없는 '@@ ... @@' 헤더 허용
+    - hunk 끝은 줄 수를 믿지 않고 다음 '@@'/파일 헤더/diff 형식이 아닌 줄로 판단
+      (SQL 주석 '-- ...'을 지운 줄 '--- ...'은 다음 줄이 '+++ '가 아니면 삭제 줄로 처리)
+    """
+    patches: List[FilePatch] = []
+    current: Optional[FilePatch] = None
+    hunk: Optional[Hunk] = None
+    lines = diff_text.split('\n')
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if line.startswith('--- ') and i + 1 < len(lines) and lines[i + 1].startswith('+++ '):
+            current = FilePatch(_clean_path(line[4:]), _clean_path(lines[i + 1][4:]))
+            patches.append(current)
+            hunk = None
+            i += 2
+            continue
+        if line.startswith('@@'):
+            if current is None:
+                current = FilePatch()
+                patches.append(current)
+            match = HUNK_HEADER_PATTERN.match(line)
+            if match:
+                hunk = Hunk(int(match.group(1)), int(match.group(2) or 1))
+            else:
+                hunk = Hunk()
+            current.hunks.append(hunk)
+        elif line.startswith('diff ') or line.startswith('index '):
+            hunk = None
+        elif hunk is not None:
+            if line[:1] in (' ', '-', '+'):
+                hunk.lines.append((line[0], line[1:]))
+            elif line == '':
+                hunk.lines.append((' ', ''))  # 앞 공백이 빠진 빈 컨텍스트 줄
+            elif not line.startswith('\\'):     # '\ No newline at end of file'은 무시
+                hunk = None
+        i += 1
+
+    for patch in patches:
+        for hunk in patch.hunks:
+            while hunk.lines and hunk.lines[-1] == (' ', ''):
+                hunk.lines.pop()  # diff 블록 끝의 빈 줄
+        patch.hunks = [hunk for hunk in patch.hunks if hunk.lines]
+    return [patch for patch in patches if patch.hunks]
+
+
+def _locate(matcher: BlockMatcher, hunk: Hunk, expected: Optional[int]) -> Optional[Tuple[int, int, int, int, Hunk, str]]:
+    """hunk 위치 탐색 → (시작, 끝, fuzz, 앞에서 뺀 컨텍스트 줄 수, 실제 적용할 hunk, 일치 종류)
+
+    fuzz로 컨텍스트를 줄이면 흔한 줄만 남아 여러 곳에 일치할 수 있으므로, 뺀 컨텍스트 줄이
+    제자리에 더 많이 남아 있는 위치를 우선하고 그다음 예상 위치에 가까운 곳을 고른다.
+    """
+    match = matcher.find('\n'.join(hunk.before()), hint=expected, allow_fuzzy=False)
+    if match is not None:
+        return match.start, match.end, 0, 0, hunk, match.kind
+
+    before = hunk.before()
+    previous_size = len(hunk.lines)
+    for fuzz in range(1, MAX_FUZZ + 1):
+        trimmed, leading = hunk.trimmed(fuzz)
+        if len(trimmed.lines) == previous_size:
+            break  # 더 줄일 컨텍스트가 없음
+        previous_size = len(trimmed.lines)
+        trimmed_before = trimmed.before()
+        if not trimmed_before:
+            return None
+        trailing = len(before) - leading - len(trimmed_before)
+        hint = expected + leading if expected is not None else None
+        matches = matcher.find_all('\n'.join(trimmed_before), hint=hint)
+        if matches:
+            def kept_context(match):
+                dropped = [(match.start - leading + offset, before[offset]) for offset in range(leading)]
+                dropped += [(match.end + offset, before[len(before) - trailing + offset]) for offset in range(trailing)]
+                return sum(1 for position, line in dropped
+                           if 0 <= position < len(matcher.keys) and matcher.keys[position] == normalize_line(line))
+            best = max(matches, key=kept_context)  # 같은 점수면 hint에 가까운 쪽 (find_all 순서)
+            return best.start, best.end, fuzz, leading, trimmed, best.kind
+    return None
+
+
+def apply_patch(content: str, hunks: List[Hunk]) -> Tuple[str, List[HunkResult]]:
+    """hunk들을 원본 내용 기준으로 찾아 한 번에 적용 (찾지 못하거나 겹치는 hunk는 적용하지 않음)"""
+    matcher = BlockMatcher(content)
+    lines = matcher.lines
+    results = []
+    edits = []
+    offset = 0
+    previous_end = None
+    for index, hunk in enumerate(hunks):
+        expected = hunk.old_start - 1 + offset if hunk.old_start is not None else previous_end
+        if not hunk.before():
+            # 컨텍스트 없는 순수 추가 hunk는 헤더 줄 번호를 쓸 수밖에 없음 (-N,0 → N번째 줄 다음)
+            if hunk.old_start is None:
+                results.append(HunkResult(index, False))
+                continue
+            position = min(max(hunk.old_start if hunk.old_count == 0 else hunk.old_start - 1, 0) + offset, len(lines))
+            edits.append((position, position, [text for _, text in hunk.lines]))
+            results.append(HunkResult(index, True, position + 1, offset, 0, 'insert'))
+            continue
+
+        located = _locate(matcher, hunk, expected)
+        if located is None:
+            results.append(HunkResult(index, False))
+            continue
+        start, end, fuzz, leading, applied_hunk, kind = located
+        if any(start < edit_end and end > edit_start for edit_start, edit_end, _ in edits):
+            results.append(HunkResult(index, False))
+            continue
+
+        # 컨텍스트 줄은 파일의 원래 줄을 유지하고, 추가 줄은 파일의 들여쓰기에 맞춤
+        added = [text for tag, text in applied_hunk.lines if tag == '+']
+        if kind != 'exact':
+            added = reindent(added, applied_hunk.before(), lines[start:end])
+        added_lines = iter(added)
+        new_lines = []
+        position = start
+        for tag, _ in applied_hunk.lines:
+            if tag == '+':
+                new_lines.append(next(added_lines))
+                continue
+            if tag == ' ':
+                new_lines.append(lines[position])
+            position += 1
+        edits.append((start, end, new_lines))
+
+        if hunk.old_start is not None:
+            offset = start - leading - (hunk.old_start - 1)
+        previous_end = end
+        results.append(HunkResult(index, True, start + 1, offset, fuzz, kind))
+
+    for start, end, new_lines in sorted(edits, key=lambda edit: (edit[0], edit[1]), reverse=True):
+        lines[start:end] = new_lines
+    return '\n'.join(lines), results
+
@@ -8,6 +8,8 @@ from pathlib import Path
 from typing import Dict, List, Set, Optional, Tuple
 from collections import defaultdict, Counter
 from ..core.debug_manager import DebugManager
+from actions.sql_tokenizer import extract_sql_features
+from actions.xml_scanner import scan_xml
 
 
 class RepoMapper:
@@ -36,10 +38,10 @@ class RepoMapper:
         """레포지토리 맵 생성"""
 
         DebugManager.repo_map("레포맵 생성 시작")
-        DebugManager.repo_map(f"- chat_files: {chat_files}")
-        DebugManager.repo_map(f"- other_files: {other_files[:5] if other_files else None}{'...' if other_files and len(other_files) > 5 else ''}")
-        DebugManager.repo_map(f"- mentioned_fnames: {mentioned_fnames}")
-        DebugManager.repo_map(f"- mentioned_idents: {mentioned_idents}")
+        DebugManager.repo_map("- chat_files: %s", chat_files)
+        DebugManager.repo_map("- other_files: %s%s", other_files[:5] if other_files else None, '...' if other_files and len(other_files) > 5 else '')
+        DebugManager.repo_map("- mentioned_fnames: %s", mentioned_fnames)
+        DebugManager.repo_map("- mentioned_idents: %s", mentioned_idents)
 
         if force_refresh:
             self._clear_cache()
@@ -48,21 +50,21 @@ class RepoMapper:
         priority_files = self._collect_priority_files(
             chat_files, other_files, mentioned_fnames
         )
-        DebugManager.repo_map(f"우선순위 파일 {len(priority_files)}개 수집: {priority_files[:3]}{'...' if len(priority_files) > 3 else ''}")
+        DebugManager.repo_map("우선순위 파일 %s개 수집: %s%s", len(priority_files), priority_files[:3], '...' if len(priority_files) > 3 else '')
 
         # 파일 분석
         file_symbols = self._analyze_files(priority_files)
-        DebugManager.repo_map(f"{len(file_symbols)}개 파일 분석 완료")
+        DebugManager.repo_map("%s개 파일 분석 완료", len(file_symbols))
 
         # 중요 심볼 추출
         important_symbols = self._extract_important_symbols(
             file_symbols, mentioned_idents
         )
-        DebugManager.repo_map(f"중요 심볼 {len(important_symbols)}개 추출: {important_symbols[:5]}{'...' if len(important_symbols) > 5 else ''}")
+        DebugManager.repo_map("중요 심볼 %s개 추출: %s%s", len(important_symbols), important_symbols[:5], '...' if len(important_symbols) > 5 else '')
 
         # 컴팩트 맵 생성
         repo_map = self._build_compact_map(file_symbols, important_symbols)
-        DebugManager.repo_map(f"레포맵 생성 완료 ({len(repo_map)} chars)")
+        DebugManager.repo_map("레포맵 생성 완료 (%s chars)", len(repo_map))
 
         return repo_map
 
@@ -109,7 +111,7 @@ class RepoMapper:
             DebugManager.repo_map("tests/fixtures 디렉토리를 찾을 수 없음")
             return []
 
-        DebugManager.repo_map(f"tests/fixtures 디렉토리 스캔: {fixtures_path}")
+        DebugManager.repo_map("tests/fixtures 디렉토리 스캔: %s", fixtures_path)
 
         for root, dirs, filenames in os.walk(fixtures_path):
             # 제외 디렉토리 필터링
@@ -127,7 +129,7 @@ class RepoMapper:
                 if self._is_code_file(file_path):
                     key_files.append(str(rel_path))
 
-        DebugManager.repo_map(f"fixtures에서 {len(key_files)}개 파일 발견")
+        DebugManager.repo_map("fixtures에서 %s개 파일 발견", len(key_files))
         return sorted(key_files)[:50]  # 최대 50개
 
     def _is_code_file(self, file_path: Path) -> bool:
@@ -145,14 +147,14 @@ class RepoMapper:
         for file_path in files:
             full_path = self.root_path / file_path
             if not full_path.exists():
-                DebugManager.repo_map(f"파일 없음: {file_path}")
+                DebugManager.repo_map("파일 없음: %s", file_path)
                 continue
 
             # 캐시 확인
             cache_key = f"{file_path}:{full_path.stat().st_mtime}"
             if cache_key in self._file_cache:
                 file_symbols[file_path] = self._file_cache[cache_key]
-                DebugManager.repo_map(f"캐시에서 로드: {file_path}")
+                DebugManager.repo_map("캐시에서 로드: %s", file_path)
                 continue
 
             # 파일 내용 head 미리보기 (디버그용)
@@ -163,10 +165,10 @@ class RepoMapper:
                 head_preview = '\n'.join(head_lines)
                 if len(head_preview) > 150:
                     head_preview = head_preview[:150] + "..."
-                DebugManager.repo_map(f"분석 중: {file_path} ({len(content)} chars)")
-                DebugManager.repo_map(f"Head: {repr(head_preview)}")
+                DebugManager.repo_map("분석 중: %s (%s chars)", file_path, len(content))
+                DebugManager.repo_map("Head: %r", head_preview)
             except Exception as e:
-                DebugManager.error(f"파일 읽기 실패: {file_path} - {e}")
+                DebugManager.error("파일 읽기 실패: %s - %s", file_path, e)
                 continue
 
             # 파일 타입별 분석
@@ -174,7 +176,7 @@ class RepoMapper:
             if symbols:
                 file_symbols[file_path] = symbols
                 self._file_cache[cache_key] = symbols
-                DebugManager.repo_map(f"분석 완료: {file_path} - {sum(len(v) if isinstance(v, list) else 0 for v in symbols.values())}개 심볼")
+                DebugManager.repo_map("분석 완료: %s - %s개 심볼", file_path, sum(len(v) if isinstance(v, list) else 0 for v in symbols.values()))
 
         return file_symbols
 
@@ -287,46 +289,14 @@ class RepoMapper:
         return symbols
 
     def _analyze_xml(self, content: str) -> Dict:
-        """XML 파일 분석"""
-        symbols = {'elements': [], 'scripts': []}
-
-        # 주요 XML 요소
-        element_pattern = r'<(\w+)(?:\s+[^>]*)?>'
-        elements = set()
-        for match in re.finditer(element_pattern, content):
-            elements.add(match.group(1))
-        symbols['elements'] = list(elements)[:10]  # 상위 10개만
-
-        # 스크립트 함수 (scwin 등)
-        script_pattern = r'(\w+\.\w+)\s*\('
-        scripts = set()
-        for match in re.finditer(script_pattern, content):
-            scripts.add(match.group(1))
-        symbols['scripts'] = list(scripts)[:10]
-
-        return symbols
+        """XML 파일 분석 (스트리밍 스캐너 사용)"""
+        result = scan_xml(content)
+        return {'elements': result.elements, 'scripts': result.scripts}
 
     def _analyze_sql(self, content: str) -> Dict:
-        """SQL 파일 분석"""
-        symbols = {'tables': [], 'bind_vars': []}
-
-        # 테이블 찾기
-        table_pattern = r'FROM\s+(\w+)|JOIN\s+(\w+)'
-        tables = set()
-        for match in re.finditer(table_pattern, content, re.IGNORECASE):
-            table = match.group(1) or match.group(2)
-            if table:
-                tables.add(table)
-        symbols['tables'] = list(tables)
-
-        # 바인드 변수
-        bind_pattern = r':(\w+)'
-        bind_vars = set()
-        for match in re.finditer(bind_pattern, content):
-            bind_vars.add(match.group(1))
-        symbols['bind_vars'] = list(bind_vars)
-
-        return symbols
+        """SQL 파일 분석 (주석/문자열을 인식하는 토크나이저 사용)"""
+        features = extract_sql_features(content)
+        return {'tables': features['table_names'], 'bind_vars': features['bind_variables']}
 
     def _analyze_generic(self, content: str) -> Dict:
         """일반 텍스트 파일 분석"""
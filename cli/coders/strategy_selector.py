@@ -0,0 +1,172 @@
+"""
+Strategy Selector - 편집 전략 자동 선택 (/edit auto)
+
+요청마다 예상 출력 토큰이 가장 적은 전략을 고른다. 파싱 실패 시 다시 요청해야 하므로
+예상 비용 = 예상 출력 토큰 / 파싱 성공률 로 비교한다.
+- 예상 출력 토큰: 대상 파일 크기(FileManager.files)와 요청 유형(부분 수정/광범위 수정/전체 재작성)으로 추정
+  - whole: 파일 전체를 다시 출력
+  - block: 바뀌는 부분을 SEARCH와 REPLACE로 두 번 출력
+  - udiff: 바뀌는 줄 + 헝크마다 앞뒤 문맥 줄
+- 파싱 성공률: 전략별 기본값에 최근 결과(결정 로그)를 더한 추정치, 최근 성공률이 MIN_SUCCESS_RATE 미만인
+  전략은 표본이 충분하면 후보에서 제외
+결정과 결과는 .coe/strategy_decisions.jsonl 에 추가 전용으로 기록해서 나중에 분석할 수 있게 한다.
+(.swing_backups 는 편집 백업/저널 전용 - 예전 위치의 로그는 처음 열 때 옮긴다)
+"""
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from actions.edit_journal import EditJournal
+from .base_coder import registry
+from ..core.debug_manager import DebugManager
+
+CHARS_PER_TOKEN = 4
+PRIOR_WEIGHT = 10                  # 기본 성공률을 몇 번의 시도로 볼지
+STATS_WINDOW = 500                 # 성공률 계산에 쓰는 최근 결과 수
+MIN_SUCCESS_RATE = 0.5
+MIN_SAMPLES = 5                    # 성공률로 후보를 제외하기 위한 최소 시도 수
+DIFF_CONTEXT_LINES = 3
+BLOCK_OVERHEAD_TOKENS = 15         # 파일 경로, 마커 줄
+
+DECISIONS_PATH = '.coe/strategy_decisions.jsonl'
+LEGACY_DECISIONS_PATH = '.swing_backups/strategy_decisions.jsonl'
+HUNK_OVERHEAD_TOKENS = 10          # @@ 헤더
+
+# 전략별 기본 파싱 성공률 (결과가 쌓이기 전 추정치)
+DEFAULT_SUCCESS_RATES = {'whole': 0.95, 'block': 0.85, 'udiff': 0.8}
+
+# 요청 유형: (키워드, 바뀌는 줄 비율, 수정 위치 수)
+REQUEST_TYPES = {
+    'rewrite': (('전체', '다시 작성', '새로 작성', '재작성', '리팩토링', '리팩터링',
+                 'rewrite', 'refactor', 'create', 'from scratch'), 1.0, 1),
+    'broad': (('모든', '모두', '전부', '일괄', '이름 변경', '이름을 바꿔', 'rename', 'all ', 'every'), 0.2, 8),
+    'local': ((), 0.02, 1),
+}
+MIN_CHANGED_LINES = 8
+
+
+@dataclass
+class StrategyDecision:
+    """선택 결과 (estimates: 전략별 (예상 출력 토큰, 파싱 성공률))"""
+    strategy: str
+    request_type: str
+    estimates: Dict[str, Tuple[int, float]] = field(default_factory=dict)
+    decision_id: str = ''
+
+    def summary(self) -> str:
+        tokens, rate = self.estimates.get(self.strategy, (0, 0.0))
+        return f"{self.strategy} (요청 유형: {self.request_type}, 예상 출력 ~{tokens:,} 토큰, 성공률 {rate:.0%})"
+
+
+def classify_request(user_request: str) -> str:
+    """요청 문장에서 수정 범위 유형 추정"""
+    text = user_request.lower()
+    for request_type, (keywords, _, _) in REQUEST_TYPES.items():
+        if any(keyword in text for keyword in keywords):
+            return request_type
+    return 'local'
+
+
+def estimate_output_tokens(strategy: str, files: Dict[str, str], request_type: str) -> Optional[int]:
+    """전략별 예상 출력 토큰 (추정 방법이 없는 전략은 None)"""
+    _, changed_ratio, sites = REQUEST_TYPES[request_type]
+    total = 0
+    for content in files.values():
+        lines = content.count('\n') + 1
+        tokens = len(content) / CHARS_PER_TOKEN
+        tokens_per_line = tokens / lines
+        changed = min(lines, max(MIN_CHANGED_LINES, int(lines * changed_ratio)))
+        changed_tokens = changed * tokens_per_line
+        if strategy == 'whole':
+            total += tokens + BLOCK_OVERHEAD_TOKENS
+        elif strategy == 'block':
+            total += 2 * changed_tokens + sites * BLOCK_OVERHEAD_TOKENS
+        elif strategy == 'udiff':
+            context = min(lines, sites * 2 * DIFF_CONTEXT_LINES) * tokens_per_line
+            total += changed_tokens * 1.5 + context + sites * HUNK_OVERHEAD_TOKENS  # 삭제(-)와 추가(+) 줄 일부 중복
+        else:
+            return None
+    return int(total)
+
+
+class StrategySelector:
+    """전략 선택기 - 결정 로그에서 전략별 최근 파싱 성공률을 계산하고 선택/결과를 기록"""
+
+    def __init__(self, log_path: str = DECISIONS_PATH):
+        path = Path(log_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if log_path == DECISIONS_PATH and not path.exists() and os.path.exists(LEGACY_DECISIONS_PATH):
+            os.replace(LEGACY_DECISIONS_PATH, path)  # 예전 위치의 결정 로그 이어서 사용
+        self.journal = EditJournal(path)
+        self._outcomes = self._load_outcomes()
+
+    def _load_outcomes(self) -> Dict[str, List[int]]:
+        """전략별 [시도 수, 성공 수] (최근 STATS_WINDOW개 결과)"""
+        outcomes: Dict[str, List[int]] = {}
+        count = 0
+        for record in self.journal.iter_reverse():
+            if record.get('type') != 'outcome':
+                continue
+            stats = outcomes.setdefault(record.get('strategy', ''), [0, 0])
+            stats[0] += 1
+            stats[1] += 1 if record.get('success') else 0
+            count += 1
+            if count >= STATS_WINDOW:
+                break
+        return outcomes
+
+    def success_rate(self, strategy: str) -> float:
+        """기본 성공률을 PRIOR_WEIGHT번의 시도로 보고 최근 결과와 합친 추정치"""
+        attempts, successes = self._outcomes.get(strategy, (0, 0))
+        prior = DEFAULT_SUCCESS_RATES.get(strategy, 0.8)
+        return (successes + prior * PRIOR_WEIGHT) / (attempts + PRIOR_WEIGHT)
+
+    def _usable(self, strategy: str) -> bool:
+        attempts, successes = self._outcomes.get(strategy, (0, 0))
+        return attempts < MIN_SAMPLES or successes / attempts >= MIN_SUCCESS_RATE
+
+    def select(self, user_request: str, files: Dict[str, str]) -> StrategyDecision:
+        """예상 비용(출력 토큰 / 성공률)이 가장 낮은 전략 선택 후 결정 기록"""
+        request_type = classify_request(user_request)
+        estimates: Dict[str, Tuple[int, float]] = {}
+        for name in registry._coders:
+            tokens = estimate_output_tokens(name, files, request_type)
+            if tokens is not None:
+                estimates[name] = (tokens, self.success_rate(name))
+
+        candidates = [name for name in estimates if self._usable(name)] or list(estimates)
+        if not files or request_type == 'rewrite' or not candidates:
+            strategy = 'whole'  # 새 파일/전체 재작성은 부분 편집으로 표현할 이득이 없음
+        else:
+            strategy = min(candidates, key=lambda name: estimates[name][0] / estimates[name][1])
+
+        decision = StrategyDecision(strategy, request_type, estimates, uuid.uuid4().hex[:12])
+        self.journal.append({
+            'type': 'decision',
+            'decision_id': decision.decision_id,
+            'timestamp': time.time(),
+            'strategy': strategy,
+            'request_type': request_type,
+            'files': {path: content.count('\n') + 1 for path, content in files.items()},
+            'estimates': {name: {'tokens': tokens, 'success_rate': round(rate, 3)}
+                          for name, (tokens, rate) in estimates.items()},
+        })
+        DebugManager.info("[StrategySelector] %s", decision.summary())
+        return decision
+
+    def record_outcome(self, decision: StrategyDecision, success: bool, output_chars: int = 0):
+        """선택한 전략의 응답 파싱 결과 기록 (이후 선택의 성공률에 반영)"""
+        stats = self._outcomes.setdefault(decision.strategy, [0, 0])
+        stats[0] += 1
+        stats[1] += 1 if success else 0
+        self.journal.append({
+            'type': 'outcome',
+            'decision_id': decision.decision_id,
+            'timestamp': time.time(),
+            'strategy': decision.strategy,
+            'success': success,
+            'output_tokens': output_chars // CHARS_PER_TOKEN,
+        })
@@ -2,10 +2,11 @@
 UDiff Coder - 유닉스 unified diff 형식을 사용하는 편집 전략
 정밀한 라인 단위 수정에 최적화됨
 """
-import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+from actions.response_parser import DiffBlock, parse_events
 from .base_coder import BaseCoder, registry
 from .udiff_prompts import UDiffPrompts
+from .patch_engine import apply_patch, parse_patch
 from ..core.debug_manager import DebugManager
 
 class UDiffCoder(BaseCoder):
@@ -18,122 +19,82 @@ class UDiffCoder(BaseCoder):
         """AI 응답에서 unified diff 추출하여 파일에 적용"""
         files = {}
         
-        DebugManager.info(f"[UDiff] 파싱 시작, 응답 길이: {len(response)}")
+        DebugManager.info("[UDiff] 파싱 시작, 응답 길이: %s", len(response))
         
-        # 여러 패턴으로 diff 블록 찾기
-        patterns = [
-            r'```diff\s*\n(.*?)\n```',  # 표준 diff 블록
-            r'```\s*\n(---.*?)\n```',   # 백틱만 있는 경우
-            r'(---.*?\+\+\+.*?@@.*?)(?=\n---|\n```|\Z)',  # diff 헤더 패턴
-        ]
-        
-        diff_matches = []
-        for pattern in patterns:
-            matches = re.findall(pattern, response, re.DOTALL)
-            if matches:
-                diff_matches.extend(matches)
-                DebugManager.info(f"[UDiff] 패턴 매치: {len(matches)}개 diff")
-                break
-        
-        if not diff_matches:
-            # 백틱 없는 전체 diff도 시도
-            if '---' in response and '+++' in response and '@@' in response:
-                diff_matches = [response]
-                DebugManager.info(f"[UDiff] 전체 응답을 diff로 처리")
-            else:
-                DebugManager.info(f"[UDiff] diff 패턴 매치 실패")
-                DebugManager.info(f"[UDiff] 응답 미리보기: {response[:200]}...")
-                return files
+        # ```diff 블록, --- 로 시작하는 코드 블록, 코드 블록 밖의 diff
+        diff_matches = [event.text for event in parse_events(response) if isinstance(event, DiffBlock)]
+        if diff_matches:
+            DebugManager.info("[UDiff] diff 블록 %s개 발견", len(diff_matches))
+        else:
+            DebugManager.info("[UDiff] diff 패턴 매치 실패")
+            DebugManager.info("[UDiff] 응답 미리보기: %s...", response[:200])
+            return files
         
         for diff_content in diff_matches:
-            parsed_files = self._parse_unified_diff(diff_content, context_files)
+            # 앞 블록의 결과를 먼저 보고 컨텍스트는 필요한 파일만 읽음 (FileContentStore를 dict로 복사하지 않음)
+            parsed_files = self._parse_unified_diff(diff_content, context_files, files)
             files.update(parsed_files)
-            DebugManager.info(f"[UDiff] diff에서 {len(parsed_files)}개 파일 파싱됨")
+            DebugManager.info("[UDiff] diff에서 %s개 파일 파싱됨", len(parsed_files))
         
         return files
     
-    def _parse_unified_diff(self, diff_content: str, context_files: Dict[str, str]) -> Dict[str, str]:
-        """Unified diff 형식을 파싱하여 파일별 결과 생성"""
+    def _parse_unified_diff(self, diff_content: str, context_files: Dict[str, str],
+                            previous: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Unified diff 형식을 파싱하여 파일별 결과 생성 (한 블록에 여러 파일 가능, previous는 앞 블록 결과)"""
         files = {}
-        lines = diff_content.split('\n')
+        previous = previous or {}
         
-        current_file = None
-        original_file = None
-        hunks = []
-        i = 0
-        
-        while i < len(lines):
-            line = lines[i]
-            
-            # 파일 헤더 처리
-            if line.startswith('--- '):
-                original_file = line[4:].strip()
-                if i + 1 < len(lines) and lines[i + 1].startswith('+++ '):
-                    current_file = lines[i + 1][4:].strip()
-                    i += 2
-                    continue
-            
-            # Hunk 헤더 처리 (@@ -old_start,old_count +new_start,new_count @@)
-            elif line.startswith('@@'):
-                if current_file:
-                    hunk_match = re.match(r'@@ -(\d+),(\d+) \+(\d+),(\d+) @@', line)
-                    if hunk_match:
-                        old_start, old_count, new_start, new_count = map(int, hunk_match.groups())
-                        
-                        # Hunk 내용 수집
-                        hunk_lines = []
-                        i += 1
-                        while i < len(lines) and not lines[i].startswith('@@') and not lines[i].startswith('---'):
-                            if lines[i].startswith(' ') or lines[i].startswith('-') or lines[i].startswith('+'):
-                                hunk_lines.append(lines[i])
-                            i += 1
-                        
-                        hunks.append({
-                            'old_start': old_start,
-                            'old_count': old_count,
-                            'new_start': new_start,
-                            'new_count': new_count,
-                            'lines': hunk_lines
-                        })
-                        continue
+        for patch in parse_patch(diff_content):
+            if patch.is_deletion:
+                DebugManager.info("[UDiff] 파일 삭제 diff는 지원하지 않음: %s", patch.old_path)
+                continue
             
-            i += 1
-        
-        # 파일에 hunk 적용
-        if current_file and hunks:
-            if current_file in context_files:
-                modified_content = self._apply_hunks(context_files[current_file], hunks)
-                files[current_file] = modified_content
+            target_file = self._resolve_target(patch.path, context_files, {**previous, **files})
+            if patch.is_new_file and target_file is None:
+                target_file = patch.path
+                original_content = ''
+            elif target_file is None:
+                DebugManager.info("[UDiff] 컨텍스트에 없는 파일: %s", patch.path)
+                first_line = '\n'.join(patch.hunks[0].before()) if patch.hunks else ''
+                self._record_failure(patch.path or '', 0, 'file' if patch.path else 'path', first_line)
+                continue
+            elif target_file in files:
+                original_content = files[target_file]
+            elif target_file in previous:
+                original_content = previous[target_file]
             else:
-                DebugManager.info(f"[UDiff] 컨텍스트에 없는 파일: {current_file}")
+                original_content = context_files[target_file]
+            
+            modified_content, results = apply_patch(original_content, patch.hunks)
+            for result in results:
+                self.block_stats['matched' if result.applied else 'missed'] += 1
+                if result.applied:
+                    DebugManager.info("[UDiff] %s hunk %s 적용: %s행 (offset %+d, fuzz %s, %s)", target_file, result.index+1, result.line, result.offset, result.fuzz, result.kind)
+                else:
+                    DebugManager.info("[UDiff] %s hunk %s 위치를 찾지 못해 건너뜀", target_file, result.index+1)
+                    hunk = patch.hunks[result.index]
+                    self._record_failure(target_file, result.index + 1, 'hunk', '\n'.join(hunk.before()), hunk.old_start)
+            if any(result.applied for result in results):
+                files[target_file] = modified_content
         
         return files
     
-    def _apply_hunks(self, original_content: str, hunks: List[Dict]) -> str:
-        """Hunk들을 원본 파일에 적용"""
-        lines = original_content.split('\n')
-        
-        # Hunk를 역순으로 적용 (뒤에서부터 적용해야 라인 번호가 안 꼬임)
-        for hunk in reversed(hunks):
-            old_start = hunk['old_start'] - 1  # 0-based 인덱스
-            old_count = hunk['old_count']
-            hunk_lines = hunk['lines']
-            
-            # 새로운 라인들 생성
-            new_lines = []
-            for hunk_line in hunk_lines:
-                if hunk_line.startswith(' '):
-                    # 컨텍스트 라인 (변경 없음)
-                    new_lines.append(hunk_line[1:])
-                elif hunk_line.startswith('+'):
-                    # 추가된 라인
-                    new_lines.append(hunk_line[1:])
-                # '-'로 시작하는 라인은 제거되므로 new_lines에 추가하지 않음
-            
-            # 원본 라인 교체
-            lines[old_start:old_start + old_count] = new_lines
-        
-        return '\n'.join(lines)
+    def _resolve_target(self, path, context_files: Dict[str, str], produced: Optional[Dict[str, str]] = None):
+        """diff의 파일 경로를 앞에서 만든 파일, 컨텍스트 파일 순으로 매핑 (경로 없는 hunk는 대상이 하나일 때만)"""
+        produced = produced or {}
+        if path is None:
+            names = set(produced) | set(context_files)
+            return next(iter(names)) if len(names) == 1 else None
+        for candidates in (produced, context_files):
+            if path in candidates:
+                return path
+        filename = path.split('/')[-1]
+        for candidates in (produced, context_files):
+            for ctx_file in candidates.keys():
+                if ctx_file.endswith('/' + path) or ctx_file.split('/')[-1] == filename:
+                    DebugManager.info("[UDiff] 파일명으로 매칭: %s -> %s", path, ctx_file)
+                    return ctx_file
+        return None
     
     def validate_response(self, parsed_files: Dict[str, str]) -> Tuple[bool, str]:
         """UDiff 전략 응답 유효성 검증"""
@@ -2,8 +2,8 @@
 WholeFile Coder - 전체 파일을 완전히 교체하는 편집 전략
 작은 파일이나 대규모 변경에 최적화됨
 """
-import re
 from typing import Dict, List, Tuple
+from actions.response_parser import FencedBlock, parse_events
 from .base_coder import BaseCoder, registry
 from .wholefile_prompts import WholeFilePrompts
 from ..core.debug_manager import DebugManager
@@ -18,35 +18,23 @@ class WholeFileCoder(BaseCoder):
         """AI 응답에서 파일별 완전한 내용 추출"""
         files = {}
         
-        # WholeFile 전략용 패턴들 (더 엄격한 매칭)
-        patterns = [
-            # @ 기호 포함 형식: @path/file.ext\n```lang\ncontent\n```
-            r'^@([^\s\n`]+\.[a-zA-Z0-9]+)\s*\n```[a-zA-Z0-9]*\s*\n(.*?)\n```',
-            # 표준 형식: path/file.ext\n```lang\ncontent\n```
-            r'^([^\s\n`]+\.[a-zA-Z0-9]+)\s*\n```[a-zA-Z0-9]*\s*\n(.*?)\n```',
-            # 상대 경로: ./path/file.ext\n```lang\ncontent\n```
-            r'^(\./[^\s\n`]+\.[a-zA-Z0-9]+)\s*\n```[a-zA-Z0-9]*\s*\n(.*?)\n```',
-            # 단순 파일명: filename.ext\n```lang\ncontent\n```
-            r'^([a-zA-Z0-9_.-]+\.[a-zA-Z0-9]+)\s*\n```[a-zA-Z0-9]*\s*\n(.*?)\n```'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, response, re.MULTILINE | re.DOTALL)
-            for file_path, content in matches:
-                file_path = file_path.strip()
-                content = content.strip()
-                
-                # 내용이 너무 짧으면 의심 (완전한 파일이 아닐 가능성)
-                if file_path and content and len(content) > 10:
-                    files[file_path] = content
+        # 파일 경로 다음 줄에 오는 코드 블록: path/file.ext, @path/file.ext, ./path/file.ext
+        for event in parse_events(response):
+            if not isinstance(event, FencedBlock) or not event.path:
+                continue
+            content = event.content.strip()
+            
+            # 내용이 너무 짧으면 의심 (완전한 파일이 아닐 가능성)
+            if content and len(content) > 10:
+                files[event.path] = content
         
         # 디버깅 정보 출력
         if not files:
-            DebugManager.info(f"[WholeFile] 파싱 실패. 응답 미리보기:")
+            DebugManager.info("[WholeFile] 파싱 실패. 응답 미리보기:")
             preview = response[:300] + ("..." if len(response) > 300 else "")
-            DebugManager.info(f"[WholeFile] '{preview}'")
+            DebugManager.info("[WholeFile] '%s'", preview)
         else:
-            DebugManager.info(f"[WholeFile] {len(files)}개 파일 파싱 성공: {list(files.keys())}")
+            DebugManager.info("[WholeFile] %s개 파일 파싱 성공: %s", len(files), list(files.keys()))
         
         return files
     
@@ -5,6 +5,10 @@ from prompt_toolkit.completion import Completer, Completion
 class PathCompleter(Completer):
     def __init__(self):
         self._file_cache = {}
+
+    def invalidate_cache(self):
+        """파일 목록 캐시 초기화 (파일 감시에서 변경을 감지했을 때 호출)"""
+        self._file_cache.clear()
         
     def get_completions(self, document, complete_event):
         text = document.text_before_cursor
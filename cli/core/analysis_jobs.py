@@ -0,0 +1,298 @@
+"""
+체크포인트 분석 작업 - 디렉토리 단위 분석 결과를 파일별로 디스크에 기록하며 진행하고, 중단되면 남은 파일부터 이어서 실행
+
+    .coe/jobs/<작업 ID>.json   작업 정보 (대상, 옵션, 파일 목록, 상태)
+    .coe/jobs/<작업 ID>.jsonl  파일별 결과 저널 (추가 전용, 파일 하나가 끝날 때마다 fsync)
+
+성공/건너뜀으로 기록된 파일은 다시 분석하지 않고, 오류가 난 파일은 이어서 실행할 때 다시 분석한다.
+REPL에서는 JobManager가 작업을 백그라운드 스레드로 실행하고 /jobs로 진행 상황을 조회한다.
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from actions.edit_journal import EditJournal
+from .batch_analysis import DEFAULT_WORKERS, DONE_STATUSES, collect_files, make_record
+from .debug_manager import DebugManager
+
+JOBS_DIR = '.coe/jobs'
+
+# 작업 상태: pending(생성됨) -> running -> done | cancelled | failed
+# 실행 중으로 기록되어 있지만 실행하던 프로세스가 없으면 interrupted로 보고한다
+FINISHED_STATUSES = ('done', 'cancelled', 'failed')
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class AnalysisJob:
+    """작업 하나의 정보와 파일별 결과 저널"""
+
+    def __init__(self, job_id: str, jobs_dir: str = JOBS_DIR):
+        self.job_id = job_id
+        self.jobs_dir = Path(jobs_dir)
+        self.meta_path = self.jobs_dir / f'{job_id}.json'
+        self.journal = EditJournal(self.jobs_dir / f'{job_id}.jsonl')
+        with open(self.meta_path, encoding='utf-8') as f:
+            self.meta = json.load(f)
+
+    @classmethod
+    def create(cls, targets: List[str], use_llm: bool = True, workers: int = DEFAULT_WORKERS,
+               jobs_dir: str = JOBS_DIR) -> 'AnalysisJob':
+        """대상 파일을 수집해 새 작업 생성 (실행은 run)"""
+        files = [os.path.abspath(path) for path in collect_files(targets)]
+        job_id = uuid.uuid4().hex[:8]
+        now = time.time()
+        meta = {
+            'job_id': job_id,
+            'targets': list(targets),
+            'use_llm': use_llm,
+            'workers': workers,
+            'files': files,
+            'status': 'pending',
+            'pid': None,
+            'error': None,
+            'created_at': now,
+            'started_at': None,
+            'updated_at': now,
+        }
+        Path(jobs_dir).mkdir(parents=True, exist_ok=True)
+        _write_json(Path(jobs_dir) / f'{job_id}.json', meta)
+        return cls(job_id, jobs_dir)
+
+    def save(self):
+        self.meta['updated_at'] = time.time()
+        _write_json(self.meta_path, self.meta)
+
+    @property
+    def status(self) -> str:
+        """현재 상태 (실행 중으로 기록됐지만 실행하던 프로세스가 사라졌으면 interrupted)"""
+        status = self.meta['status']
+        if status == 'running' and not _pid_alive(self.meta.get('pid')):
+            return 'interrupted'
+        return status
+
+    def latest_records(self) -> Dict[str, Dict]:
+        """파일별 마지막 결과 레코드"""
+        records = {}
+        for record in self.journal.iter_forward():
+            if record.get('type') == 'file':
+                records[record['file']] = record
+        return records
+
+    def pending_files(self, records: Optional[Dict[str, Dict]] = None) -> List[str]:
+        """아직 끝나지 않은 파일 (기록이 없거나 오류였던 파일)"""
+        records = self.latest_records() if records is None else records
+        return [path for path in self.meta['files']
+                if records.get(path, {}).get('status') not in DONE_STATUSES]
+
+    def progress(self) -> Dict:
+        """진행 상황 요약 (/jobs 표시용)"""
+        records = self.latest_records()
+        counts = {'ok': 0, 'error': 0, 'skipped': 0}
+        for record in records.values():
+            counts[record['status']] = counts.get(record['status'], 0) + 1
+        total = len(self.meta['files'])
+        done = counts['ok'] + counts['skipped']
+        status = self.status
+
+        # 이번 실행에서 끝난 파일의 평균 소요 시간으로 남은 시간 추정
+        eta = None
+        started_at = self.meta.get('started_at')
+        if status == 'running' and started_at:
+            finished = [record['finished_at'] for record in records.values()
+                        if record.get('finished_at', 0) >= started_at]
+            if finished:
+                per_file = (max(finished) - started_at) / len(finished)
+                eta = per_file * (total - done)
+
+        return {
+            'job_id': self.job_id,
+            'status': status,
+            'targets': self.meta['targets'],
+            'use_llm': self.meta['use_llm'],
+            'total': total,
+            'done': done,
+            'ok': counts['ok'],
+            'errors': counts['error'],
+            'skipped': counts['skipped'],
+            'remaining': total - done,
+            'eta_seconds': eta,
+            'created_at': self.meta['created_at'],
+            'updated_at': self.meta['updated_at'],
+            'error': self.meta.get('error'),
+            'failed_files': {path: record.get('error') for path, record in records.items()
+                             if record['status'] == 'error'},
+        }
+
+    def run(self, analyzer=None, stop_event: Optional[threading.Event] = None,
+            on_record: Optional[Callable[[Dict], None]] = None,
+            analyzer_factory: Optional[Callable[[], Any]] = None) -> str:
+        """남은 파일을 분석하며 결과를 한 줄씩 저널에 기록 (최종 상태 반환)
+
+        analyzer_factory는 실행 상태를 기록한 뒤 호출하므로 생성에 실패해도 작업은 failed로 남는다.
+        """
+        self._repair_journal_tail()
+        pending = self.pending_files()
+        self.meta.update(status='running', pid=os.getpid(), error=None, started_at=time.time())
+        self.save()
+        DebugManager.info("분석 작업 %s 시작: 남은 파일 %s/%s개", self.job_id, len(pending), len(self.meta['files']))
+
+        status = 'done'
+        try:
+            if analyzer is None:
+                analyzer = (analyzer_factory or _quiet_analyzer)()
+            analyses = analyzer.iter_analyses(pending, use_llm=self.meta['use_llm'], workers=self.meta['workers'])
+            try:
+                for file_path, file_info, error in analyses:
+                    record = {'type': 'file', **make_record(file_path, file_info, error), 'finished_at': time.time()}
+                    self.journal.append(record, sync=True)  # 중단되어도 끝난 파일은 남도록
+                    analyzer.file_manager.remove_file(file_path)
+                    if on_record:
+                        on_record(record)
+                    if stop_event is not None and stop_event.is_set():
+                        status = 'cancelled'
+                        break
+            finally:
+                analyses.close()  # 취소 시 시작하지 않은 파일은 버림
+        except Exception as e:
+            status = 'failed'
+            self.meta['error'] = f"{type(e).__name__}: {e}"
+        finally:
+            self.meta.update(status=status, pid=None)
+            self.save()
+        DebugManager.info("분석 작업 %s 종료: %s", self.job_id, status)
+        return status
+
+    def results(self, analyzer=None) -> Dict:
+        """CoeAnalyzer.analyze_files와 같은 구조의 전체 결과 (+ 오류 파일)"""
+        records = self.latest_records()
+        files = {path: {key: record.get(key) for key in ('file_type', 'basic_analysis', 'llm_analysis')}
+                 for path, record in records.items() if record['status'] == 'ok'}
+        analyzer = analyzer or _quiet_analyzer()
+        return {'files': files, **analyzer.summarize(files),
+                'errors': {path: record.get('error') for path, record in records.items() if record['status'] == 'error'}}
+
+    def _repair_journal_tail(self):
+        """기록 도중 중단되어 줄바꿈 없이 끝난 저널이면 다음 레코드가 붙지 않도록 줄을 끊음"""
+        try:
+            with open(self.journal.path, 'rb+') as f:
+                if f.seek(0, os.SEEK_END) == 0:
+                    return
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+        except FileNotFoundError:
+            pass
+
+
+class JobManager:
+    """REPL에서 분석 작업을 백그라운드 스레드로 실행하고 조회"""
+
+    def __init__(self, jobs_dir: str = JOBS_DIR, analyzer_factory: Optional[Callable] = None):
+        self.jobs_dir = jobs_dir
+        self.analyzer_factory = analyzer_factory or _quiet_analyzer
+        self._threads: Dict[str, threading.Thread] = {}
+        self._stop_events: Dict[str, threading.Event] = {}
+        self._finished: List[Dict] = []  # 다음 프롬프트 전에 알릴 완료 작업
+        self._lock = threading.Lock()
+
+    def start(self, targets: List[str], use_llm: bool = True, workers: int = DEFAULT_WORKERS) -> AnalysisJob:
+        job = AnalysisJob.create(targets, use_llm, workers, self.jobs_dir)
+        self._launch(job)
+        return job
+
+    def resume(self, job_id: str) -> AnalysisJob:
+        job = self.load(job_id)
+        if self.is_active(job.job_id) or job.status == 'running':
+            raise ValueError(f"이미 실행 중인 작업입니다: {job.job_id}")
+        self._launch(job)
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """실행 중인 작업에 중지 요청 (진행 중인 파일이 끝나면 멈춤, 이어서 실행 가능)"""
+        job = self.load(job_id)
+        stop_event = self._stop_events.get(job.job_id)
+        if stop_event is None or not self.is_active(job.job_id):
+            return False
+        stop_event.set()
+        return True
+
+    def is_active(self, job_id: str) -> bool:
+        thread = self._threads.get(job_id)
+        return thread is not None and thread.is_alive()
+
+    def load(self, job_id: str) -> AnalysisJob:
+        """작업 ID(앞부분만 입력해도 됨)로 작업 로드"""
+        matches = [path.stem for path in Path(self.jobs_dir).glob(f'{job_id}*.json')]
+        if len(matches) != 1:
+            raise ValueError(f"작업을 찾을 수 없습니다: {job_id}" if not matches
+                             else f"작업 ID가 여러 개와 일치합니다: {', '.join(sorted(matches))}")
+        return AnalysisJob(matches[0], self.jobs_dir)
+
+    def list_jobs(self) -> List[Dict]:
+        """모든 작업의 진행 상황 (최신순)"""
+        jobs = []
+        for path in Path(self.jobs_dir).glob('*.json'):
+            try:
+                jobs.append(AnalysisJob(path.stem, self.jobs_dir).progress())
+            except (OSError, ValueError, KeyError):
+                continue  # 쓰는 도중이거나 손상된 작업 정보
+        return sorted(jobs, key=lambda job: job['created_at'], reverse=True)
+
+    def pop_finished(self) -> List[Dict]:
+        """마지막 조회 이후 끝난 작업의 진행 상황"""
+        with self._lock:
+            finished, self._finished = self._finished, []
+        return finished
+
+    def wait(self, job_id: str, timeout: Optional[float] = None):
+        thread = self._threads.get(job_id)
+        if thread is not None:
+            thread.join(timeout)
+
+    def _launch(self, job: AnalysisJob):
+        stop_event = threading.Event()
+
+        def work():
+            try:
+                job.run(stop_event=stop_event, analyzer_factory=self.analyzer_factory)
+            finally:
+                with self._lock:
+                    self._finished.append(job.progress())
+
+        thread = threading.Thread(target=work, name=f'coe-job-{job.job_id}', daemon=True)
+        self._stop_events[job.job_id] = stop_event
+        self._threads[job.job_id] = thread
+        thread.start()
+
+
+def _quiet_analyzer():
+    """화면 출력이 REPL 프롬프트를 가리지 않도록 콘솔을 버리는 CoeAnalyzer"""
+    import io
+    from rich.console import Console
+    from .analyzer import CoeAnalyzer
+    analyzer = CoeAnalyzer()
+    analyzer.console = Console(file=io.StringIO())
+    return analyzer
+
+
+def _write_json(path: Path, data: Dict):
+    """임시 파일에 쓴 뒤 교체 (중간에 중단되어도 이전 내용 유지)"""
+    temp_path = path.with_name(path.name + '.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, path)
@@ -6,7 +6,10 @@
 
 import sys
 import os
-from typing import Dict, List
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -26,9 +29,10 @@ class CoeAnalyzer:
         self.file_manager = FileManager()
         self.llm_service = LLMService()
         self.console = Console()
+        self._file_lock = threading.Lock()  # 동시 분석 시 FileManager 등록은 한 번에 하나씩
 
-    def analyze_files(self, file_paths: List[str], use_llm: bool = True) -> Dict:
-        """파일들을 분석하고 결과를 반환"""
+    def analyze_files(self, file_paths: List[str], use_llm: bool = True, workers: int = 1) -> Dict:
+        """파일들을 분석하고 결과를 반환 (workers > 1 이면 파일별 LLM 분석을 동시에 수행)"""
         analysis_results = {
             'files': {},
             'summary': {},
@@ -36,88 +40,131 @@ class CoeAnalyzer:
             'file_categories': {}
         }
         
-        # 파일들 추가 및 기본 분석
+        # 파일들 추가 및 기본 분석 (+ LLM 기반 분석)
         self.console.print("[bold blue]📁 파일들을 분석하고 있습니다...[/bold blue]")
+        if use_llm:
+            self.console.print("[bold blue] LLM을 통한 심화 분석을 수행하고 있습니다...[/bold blue]")
+        
+        for file_path, file_info, error in self.iter_analyses(file_paths, use_llm, workers):
+            if error:
+                self.console.print(f"[red]LLM 분석 실패 ({file_path}): {error}[/red]")
+            if file_info:
+                analysis_results['files'][file_path] = file_info
         
-        for file_path in file_paths:
-            if os.path.exists(file_path):
-                result = self.file_manager.add_single_file(file_path)
-                if result['analysis']:
-                    analysis_results['files'][file_path] = {
-                        'file_type': result['file_type'],
-                        'basic_analysis': result['analysis'],
-                        'llm_analysis': None
-                    }
-        
-        # LLM 기반 분석
+        # 전체 요약 생성
         if use_llm and analysis_results['files']:
-            self.console.print("[bold blue] LLM을 통한 심화 분석을 수행하고 있습니다...[/bold blue]")
-            llm_analysis = self._perform_llm_analysis(analysis_results['files'])
-            
-            # LLM 분석 결과를 통합
-            for file_path, llm_result in llm_analysis.items():
-                if file_path in analysis_results['files']:
-                    analysis_results['files'][file_path]['llm_analysis'] = llm_result
-            
-            # 전체 요약 생성
-            analysis_results['summary'] = self._generate_summary(analysis_results['files'])
-            analysis_results['call_graph'] = self._extract_call_relationships(analysis_results['files'])
-            analysis_results['file_categories'] = self._categorize_files(analysis_results['files'])
+            analysis_results.update(self.summarize(analysis_results['files']))
         
         return analysis_results
 
+    def iter_analyses(self, file_paths: List[str], use_llm: bool = True,
+                      workers: int = 1) -> Iterator[Tuple[str, Optional[Dict], Optional[str]]]:
+        """파일별 분석이 끝나는 순서대로 (경로, 분석 결과 또는 None, 오류 메시지 또는 None) 반환"""
+        if workers <= 1 or len(file_paths) <= 1:
+            for file_path in file_paths:
+                yield (file_path, *self._analyze_file_safely(file_path, use_llm))
+            return
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='coe-analyze')
+        try:
+            futures = {executor.submit(self._analyze_file_safely, file_path, use_llm): file_path
+                       for file_path in file_paths}
+            for future in as_completed(futures):
+                yield (futures[future], *future.result())
+        finally:
+            # 중간에 멈추면(생성기 종료/인터럽트) 아직 시작하지 않은 파일은 취소
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def analyze_file(self, file_path: str, use_llm: bool = True) -> Optional[Dict]:
+        """파일 하나의 기본 분석 + (선택) LLM 분석, 분석할 수 없는 파일이면 None"""
+        if not os.path.exists(file_path):
+            return None
+        with self._file_lock:
+            result = self.file_manager.add_single_file(file_path)
+        if not result['analysis']:
+            return None
+        file_info = {
+            'file_type': result['file_type'],
+            'basic_analysis': result['analysis'],
+            'llm_analysis': None
+        }
+        if use_llm:
+            file_info['llm_analysis'] = self._analyze_with_llm(file_path, file_info)
+        return file_info
+
+    def _analyze_file_safely(self, file_path: str, use_llm: bool) -> Tuple[Optional[Dict], Optional[str]]:
+        """analyze_file 결과와 오류 메시지 (LLM 분석이 실패해도 기본 분석 결과는 유지)"""
+        file_info = None
+        try:
+            file_info = self.analyze_file(file_path, use_llm=False)
+            if use_llm and file_info:
+                file_info['llm_analysis'] = self._analyze_with_llm(file_path, file_info)
+            return file_info, None
+        except Exception as e:
+            DebugManager.llm(traceback.format_exc)
+            return file_info, f"{type(e).__name__}: {e}"
+
+    def summarize(self, files_data: Dict) -> Dict:
+        """전체 요약, 호출 관계, 파일 카테고리"""
+        return {
+            'summary': self._generate_summary(files_data),
+            'call_graph': self._extract_call_relationships(files_data),
+            'file_categories': self._categorize_files(files_data)
+        }
+
     def _perform_llm_analysis(self, files_data: Dict) -> Dict:
-        """LLM을 통한 파일 분석"""
+        """LLM을 통한 파일 분석 (실패한 파일은 결과에서 제외)"""
         llm_results = {}
         
-        DebugManager.llm(f"_perform_llm_analysis 시작, 파일 수: {len(files_data)}")
+        DebugManager.llm("_perform_llm_analysis 시작, 파일 수: %s", len(files_data))
         
         for file_path, file_info in files_data.items():
             try:
-                DebugManager.llm(f"파일 처리 시작: {file_path}")
-                
-                # 파일 내용 가져오기
-                content = self.file_manager.files.get(file_path, "")
-                DebugManager.llm(f"파일 내용 길이: {len(content)}")
-
-                if not content:
-                    DebugManager.llm(f"파일 내용이 비어있어 건너뜀: {file_path}")
-                    continue
-
-                # LLM 분석 프롬프트 구성
-                analysis_prompt = self._build_analysis_prompt(file_path, file_info, content)
-                DebugManager.llm(f"프롬프트 길이: {len(analysis_prompt)}")
-                
-                # LLM 호출
-                messages = [
-                    {"role": "system", "content": "You are a code analysis expert. Analyze the given file and provide structured insights."},
-                    {"role": "user", "content": analysis_prompt}
-                ]
-                
-                DebugManager.llm("LLM 호출 시작")
-                response = self.llm_service.chat_completion(messages)
-                
-                if response and "choices" in response:
-                    llm_content = response["choices"][0]["message"]["content"]
-                    DebugManager.llm(f"LLM 응답 길이: {len(llm_content)}")
-                    DebugManager.llm(f"LLM 응답 미리보기: {llm_content[:200]}...")
-                    
-                    parsed_result = self._parse_llm_response(llm_content)
-                    DebugManager.llm(f"파싱 결과 키들: {list(parsed_result.keys()) if isinstance(parsed_result, dict) else 'not dict'}")
-                    
-                    llm_results[file_path] = parsed_result
-                else:
-                    DebugManager.llm("LLM 응답이 비어있음 또는 형식 오류")
-                
+                llm_results[file_path] = self._analyze_with_llm(file_path, file_info)
             except Exception as e:
                 self.console.print(f"[red]LLM 분석 실패 ({file_path}): {e}[/red]")
-                import traceback
                 self.console.print(f"[dim]{traceback.format_exc()}[/dim]")
-                continue
         
-        DebugManager.llm(f"_perform_llm_analysis 완료, 결과 수: {len(llm_results)}")
+        DebugManager.llm("_perform_llm_analysis 완료, 결과 수: %s", len(llm_results))
         return llm_results
 
+    def _analyze_with_llm(self, file_path: str, file_info: Dict) -> Optional[Dict]:
+        """파일 하나를 LLM으로 분석 (내용이 비어 있으면 None, 응답이 없으면 RuntimeError)"""
+        DebugManager.llm("파일 처리 시작: %s", file_path)
+        
+        # 파일 내용 가져오기
+        content = self.file_manager.files.get(file_path, "")
+        DebugManager.llm("파일 내용 길이: %s", len(content))
+
+        if not content:
+            DebugManager.llm("파일 내용이 비어있어 건너뜀: %s", file_path)
+            return None
+
+        # LLM 분석 프롬프트 구성
+        analysis_prompt = self._build_analysis_prompt(file_path, file_info, content)
+        DebugManager.llm("프롬프트 길이: %s", len(analysis_prompt))
+        
+        # LLM 호출 (파일마다 독립적인 분석이므로 대화 세션을 이어 쓰지 않음 - 동시 요청 가능)
+        messages = [
+            {"role": "system", "content": "You are a code analysis expert. Analyze the given file and provide structured insights."},
+            {"role": "user", "content": analysis_prompt}
+        ]
+        
+        DebugManager.llm("LLM 호출 시작")
+        response = self.llm_service.chat_completion(messages, use_session=False)
+        
+        if not response or "choices" not in response:
+            DebugManager.llm("LLM 응답이 비어있음 또는 형식 오류")
+            raise RuntimeError("LLM 응답이 비어있거나 형식이 올바르지 않습니다.")
+        
+        llm_content = response["choices"][0]["message"]["content"]
+        DebugManager.llm("LLM 응답 길이: %s", len(llm_content))
+        DebugManager.llm("LLM 응답 미리보기: %s...", llm_content[:200])
+        
+        parsed_result = self._parse_llm_response(llm_content)
+        DebugManager.llm("파싱 결과 키들: %s", list(parsed_result.keys()) if isinstance(parsed_result, dict) else 'not dict')
+        return parsed_result
+
     def _build_analysis_prompt(self, file_path: str, file_info: Dict, content: str) -> str:
         """파일 타입별 특화된 LLM 분석 프롬프트 구성"""
         file_type = file_info.get('file_type', 'unknown')
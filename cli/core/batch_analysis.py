@@ -0,0 +1,185 @@
+"""
+헤드리스 일괄 분석 - python coe.py analyze <디렉토리|글롭|파일> ...
+
+CoeAnalyzer.iter_analyses로 파일별 기본 분석과 LLM 분석을 워커 풀에서 수행하고, 끝나는 순서대로 파일당 한 줄(NDJSON)씩 기록한다.
+중단된 실행은 --resume으로 같은 출력 파일에서 이어서 진행한다. 성공/건너뜀으로 기록된 파일은 다시 분석하지 않고,
+오류로 기록된 파일과 마지막의 잘린 줄은 지운 뒤 다시 분석한다.
+
+    python coe.py analyze src/ --no-llm                           # 표준 출력으로 NDJSON
+    python coe.py analyze src/ 'batch/**/*.c' -j 8 -o nightly.ndjson --resume
+    python coe.py analyze src/ -o analysis_result.json            # 끝난 뒤 전체 결과를 JSON 하나로 저장
+
+레코드: {"file", "status": "ok"|"error"|"skipped", "file_type", "basic_analysis", "llm_analysis", "error"}
+종료 코드: 0 = 모든 파일 성공, 1 = 오류가 난 파일이 있음, 2 = 잘못된 인자
+"""
+import glob
+import json
+import os
+import sys
+import time
+from typing import Dict, IO, List, Optional, Set
+
+DEFAULT_WORKERS = 4
+# 디렉토리를 지정하면 구조 분석을 지원하는 파일만 수집 (FileManager.analyze_content 기준)
+ANALYZABLE_SUFFIXES = ('.c', '.h', '.sql')
+SKIP_DIRS = {'.git', '.coe', '.swing_backups', '__pycache__', 'node_modules', '.venv'}
+DONE_STATUSES = ('ok', 'skipped')
+
+
+def is_analyzable(path: str) -> bool:
+    return path.endswith(ANALYZABLE_SUFFIXES) or path.lower().endswith('.xml')
+
+
+def collect_files(targets: List[str]) -> List[str]:
+    """디렉토리(재귀, 분석 가능한 파일만), 글롭 패턴, 개별 파일을 중복 없이 순서대로 수집"""
+    files, seen = [], set()
+
+    def add(path: str):
+        path = os.path.normpath(path)
+        if path not in seen:
+            seen.add(path)
+            files.append(path)
+
+    for target in targets:
+        if os.path.isdir(target):
+            for root, dirs, names in os.walk(target):
+                dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith('.'))
+                for name in sorted(names):
+                    if is_analyzable(name):
+                        add(os.path.join(root, name))
+        elif any(ch in target for ch in '*?[') and not os.path.exists(target):
+            for match in sorted(glob.glob(target, recursive=True)):
+                if os.path.isfile(match):
+                    add(match)
+        else:
+            add(target)
+    return files
+
+
+def prepare_resume(output_path: str) -> Set[str]:
+    """이전 출력에서 끝난 파일 목록을 읽고, 오류 레코드와 잘린 마지막 줄을 지운 상태로 파일을 다시 씀"""
+    if not os.path.exists(output_path):
+        return set()
+    done, kept = set(), []
+    with open(output_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # 기록 도중 중단된 줄
+            if record.get('status') in DONE_STATUSES and record.get('file'):
+                done.add(record['file'])
+                kept.append(line if line.endswith('\n') else line + '\n')
+    temp_path = output_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.writelines(kept)
+    os.replace(temp_path, output_path)
+    return done
+
+
+def make_record(file_path: str, file_info: Optional[Dict], error: Optional[str]) -> Dict:
+    if error:
+        status = 'error'
+    elif file_info is None:
+        status = 'skipped'  # 없는 파일 또는 구조 분석을 지원하지 않는 파일
+    else:
+        status = 'ok'
+    record = {'file': file_path, 'status': status}
+    if file_info:
+        record.update(file_info)
+    if error:
+        record['error'] = error
+    return record
+
+
+def run(targets: List[str], output: Optional[str] = None, use_llm: bool = True,
+        workers: int = DEFAULT_WORKERS, resume: bool = False, output_format: str = 'ndjson',
+        analyzer=None, progress: IO = sys.stderr) -> int:
+    """파일을 수집해 분석하고 결과를 기록 (종료 코드 반환)"""
+    files = collect_files(targets)
+    done = prepare_resume(output) if resume and output else set()
+    pending = [path for path in files if path not in done]
+    print(f"분석 대상 {len(files)}개 (이미 완료 {len(files) - len(pending)}개, 남은 파일 {len(pending)}개, "
+          f"워커 {workers}개, LLM {'사용' if use_llm else '생략'})", file=progress, flush=True)
+
+    if analyzer is None:
+        from rich.console import Console
+        from .analyzer import CoeAnalyzer
+        analyzer = CoeAnalyzer()
+        analyzer.console = Console(stderr=True)  # 표준 출력은 결과(NDJSON) 전용
+
+    if output_format == 'json':
+        stream = None
+    elif output:
+        stream = open(output, 'a', encoding='utf-8')
+    else:
+        stream = sys.stdout
+
+    started = time.perf_counter()
+    counts = {'ok': 0, 'error': 0, 'skipped': 0}
+    records = []
+    try:
+        for index, (file_path, file_info, error) in enumerate(
+                analyzer.iter_analyses(pending, use_llm=use_llm, workers=workers), 1):
+            record = make_record(file_path, file_info, error)
+            counts[record['status']] += 1
+            if stream is None:
+                records.append(record)
+            else:
+                stream.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+                stream.flush()  # 중단되어도 끝난 파일까지는 남도록 한 줄씩 기록
+            analyzer.file_manager.remove_file(file_path)  # 수천 개 파일을 돌 때 내용을 계속 들고 있지 않도록
+            detail = f" - {error}" if error else ''
+            print(f"[{index}/{len(pending)}] {record['status']:<7} {file_path}{detail}", file=progress, flush=True)
+    finally:
+        if stream is not None and stream is not sys.stdout:
+            stream.close()
+
+    if stream is None:
+        write_json_result(records, analyzer, output)
+
+    print(f"완료: 성공 {counts['ok']}, 오류 {counts['error']}, 건너뜀 {counts['skipped']} "
+          f"({time.perf_counter() - started:.1f}초)", file=progress, flush=True)
+    return 1 if counts['error'] else 0
+
+
+def write_json_result(records: List[Dict], analyzer, output: Optional[str]):
+    """전체 결과를 analyze_files와 같은 구조의 JSON 하나로 저장 (output이 없으면 표준 출력)"""
+    files = {record['file']: {key: record.get(key) for key in ('file_type', 'basic_analysis', 'llm_analysis')}
+             for record in records if record['status'] == 'ok'}
+    result = {'files': files, **analyzer.summarize(files),
+              'errors': {record['file']: record['error'] for record in records if record['status'] == 'error'}}
+    text = json.dumps(result, ensure_ascii=False, indent=2, default=str)
+    if not output:
+        print(text)
+        return
+    temp_path = output + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text + '\n')
+    os.replace(temp_path, output)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='coe.py analyze', description='디렉토리/글롭/파일을 일괄 분석해 NDJSON 또는 JSON으로 출력')
+    parser.add_argument('targets', nargs='+', help='분석할 디렉토리, 글롭 패턴(따옴표로 감싸기), 파일')
+    parser.add_argument('--no-llm', action='store_true', help='LLM 분석 없이 기본 구조 분석만')
+    parser.add_argument('-o', '--output', help='결과 파일 (.json이면 JSON 하나, 그 외는 NDJSON, 없으면 표준 출력)')
+    parser.add_argument('-j', '--workers', type=int, default=DEFAULT_WORKERS, help=f'동시 분석 워커 수 (기본 {DEFAULT_WORKERS})')
+    parser.add_argument('--resume', action='store_true', help='NDJSON 출력 파일에서 끝난 파일을 건너뛰고 이어서 분석')
+    parser.add_argument('--format', choices=('ndjson', 'json'), help='출력 형식 (기본: 출력 파일 확장자로 결정)')
+    args = parser.parse_args(argv)
+
+    output_format = args.format or ('json' if args.output and args.output.endswith('.json') else 'ndjson')
+    if args.resume and (output_format != 'ndjson' or not args.output):
+        parser.error('--resume은 NDJSON 출력 파일(-o)과 함께 사용해야 합니다.')
+    if args.workers < 1:
+        parser.error('--workers는 1 이상이어야 합니다.')
+
+    try:
+        return run(args.targets, args.output, use_llm=not args.no_llm, workers=args.workers,
+                   resume=args.resume, output_format=output_format)
+    except KeyboardInterrupt:
+        print("\n중단되었습니다. 같은 명령에 --resume을 붙이면 이어서 분석합니다.", file=sys.stderr)
+        return 130
@@ -1,5 +1,6 @@
 import importlib
 from .debug_manager import DebugManager
+from . import tracing
 
 class PromptBuilder:
     def __init__(self, task: str):
@@ -32,7 +33,9 @@ class PromptBuilder:
         messages.append({"role": "system", "content": self.prompts.main_system})
 
         # 2. Add repository map (if manually generated)
-        repo_map = self._get_cached_repo_map()
+        with tracing.span('repo_map.lookup') as repo_span:
+            repo_map = self._get_cached_repo_map()
+            repo_span.set(chars=len(repo_map) if repo_map else 0)
         if repo_map:
             repo_prompt_content = f"Repository Structure Overview:\n```\n{repo_map}\n```\n\nUse this overview to better understand the codebase structure when answering questions."
             messages.append({
@@ -51,7 +54,8 @@ class PromptBuilder:
                 file_str = f"File: {file_path}\n```\n{content}\n```"
 
                 # 상세 구조 분석 정보 추가 (백그라운드에서 CoeAnalyzer 사용)
-                detailed_analysis = self._get_detailed_analysis(file_path, content)
+                with tracing.span('file.analysis', path=file_path, bytes=len(content)):
+                    detailed_analysis = self._get_detailed_analysis(file_path, content)
                 if detailed_analysis:
                     file_str += f"\n\n{detailed_analysis}"
 
@@ -67,14 +71,15 @@ class PromptBuilder:
         if self.prompts.system_reminder:
             messages.append({"role": "system", "content": self.prompts.system_reminder})
 
-        # 전체 프롬프트 구성 디버그 출력
-        DebugManager.prompt(f"전체 프롬프트 메시지 수: {len(messages)}")
-        for i, msg in enumerate(messages):
-            role = msg.get('role', 'unknown')
-            content = msg.get('content', '')
-            DebugManager.prompt(f"Message {i+1} [{role}]: {len(content)} chars")
-            if i < 5:  # 처음 5개 메시지만 내용도 출력
-                DebugManager.prompt_content(f"Message {i+1} [{role}] 내용", content, max_length=200)
+        # 전체 프롬프트 구성 디버그 출력 (꺼져 있으면 메시지 순회도 하지 않음)
+        if DebugManager.enabled('prompt'):
+            DebugManager.prompt("전체 프롬프트 메시지 수: %s", len(messages))
+            for i, msg in enumerate(messages):
+                role = msg.get('role', 'unknown')
+                content = msg.get('content', '')
+                DebugManager.prompt("Message %s [%s]: %s chars", i+1, role, len(content))
+                if i < 5:  # 처음 5개 메시지만 내용도 출력
+                    DebugManager.prompt_content(f"Message {i+1} [{role}] 내용", content, max_length=200)
 
         return messages
 
@@ -295,7 +300,7 @@ class PromptBuilder:
             # 가장 최근 캐시된 레포맵 반환
             latest_key = list(self._repo_map_cache.keys())[-1]
             cached_repo_map = self._repo_map_cache[latest_key]
-            DebugManager.repo_map(f"✅ 캐시된 레포맵 사용 ({len(cached_repo_map)} chars)")
+            DebugManager.repo_map("✅ 캐시된 레포맵 사용 (%s chars)", len(cached_repo_map))
             return cached_repo_map
 
         DebugManager.repo_map("캐시된 레포맵 없음 - /repo 명령으로 생성 필요")
@@ -304,7 +309,7 @@ class PromptBuilder:
     def generate_repo_map_manually(self, target_files: list, file_manager=None):
         """수동으로 레포맵 생성 (/repo 명령어용)"""
         DebugManager.repo_map("수동 레포맵 생성 시작")
-        DebugManager.repo_map(f"- 대상 파일들: {target_files}")
+        DebugManager.repo_map("- 대상 파일들: %s", target_files)
 
         try:
             from cli.coders.repo_mapper import RepoMapper
@@ -333,11 +338,11 @@ class PromptBuilder:
                 DebugManager.repo_map("✅ 수동 레포맵 생성 성공하여 캐시에 저장")
                 return repo_map
             else:
-                DebugManager.repo_map(f"❌ 레포맵이 너무 짧음 ({len(repo_map) if repo_map else 0} chars)")
+                DebugManager.repo_map("❌ 레포맵이 너무 짧음 (%s chars)", len(repo_map) if repo_map else 0)
                 return None
 
         except Exception as e:
-            DebugManager.error(f"수동 레포맵 생성 실패: {e}")
+            DebugManager.error("수동 레포맵 생성 실패: %s", e)
             return None
 
     def _generate_cache_key(self, file_context: dict, file_manager=None):
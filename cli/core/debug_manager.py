@@ -1,97 +1,259 @@
 """
 디버그 출력 전용 매니저 클래스
-Rich Console을 사용하여 통일된 색깔과 포맷으로 디버그 메시지를 출력
+카테고리별 레벨을 가진 지연 포맷 로거 - 꺼져 있으면 레벨 비교 한 번으로 끝난다.
+
+    DebugManager.repo_map("분석 중: %s (%d chars)", file_path, len(content))   # % 형식 인자
+    DebugManager.llm(lambda: f"파싱 결과: {summarize(result)}")                # 호출 가능한 객체
+메시지는 출력할 때만 포맷한다 (f-string을 넘기면 꺼져 있어도 매번 문자열을 만드므로 쓰지 않음).
+비용이 큰 준비 작업은 DebugManager.enabled('prompt') 로 감싼다.
+
+설정 (기본: 모두 꺼짐)
+- COE_DEBUG=1 (또는 all, debug): 모든 카테고리 debug 레벨
+- COE_DEBUG=info: 모든 카테고리 info 레벨 이상 (info, error 메시지만)
+- COE_DEBUG=llm,prompt=info,repo_map: 카테고리별 (레벨 생략 시 debug)
+- COE_DEBUG_FILE=<경로>: 콘솔 대신 파일에 기록 (COE_DEBUG가 없으면 모든 카테고리 debug)
+  파일 기록은 백그라운드 스레드가 모아서 쓰므로 호출한 쪽은 큐에 넣고 바로 돌아간다.
+- 실행 중: /debug on | off | <카테고리>=<레벨>,...
+
+색깔 코드:
+- RepoMap: cyan
+- FileAnalysis: yellow
+- Context: blue
+- Error: red
+- LLM: magenta
+- Prompt: green
 """
-from rich.console import Console
-from typing import Optional
+import atexit
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+DEBUG = 10
+INFO = 20
+ERROR = 40
+OFF = 100
+LEVELS = {'debug': DEBUG, 'info': INFO, 'error': ERROR, 'off': OFF}
+
+# 카테고리: (머리말, 색, 메시지 레벨)
+CATEGORIES: Dict[str, Tuple[str, str, int]] = {
+    'repo_map': ('RepoMap DEBUG', 'cyan', DEBUG),
+    'file_analysis': ('FileAnalysis DEBUG', 'yellow', DEBUG),
+    'context': ('Context DEBUG', 'blue', DEBUG),
+    'error': ('Error DEBUG', 'red', ERROR),
+    'info': ('INFO DEBUG', '', INFO),
+    'llm': ('LLM DEBUG', 'magenta', DEBUG),
+    'prompt': ('Prompt DEBUG', 'green', DEBUG),
+}
+
+Message = Union[str, Callable[[], str]]
+
+
+def format_message(message: Message, args: tuple) -> str:
+    """지연 메시지 포맷 (호출 가능한 객체면 호출, 인자가 있으면 % 형식)"""
+    if callable(message):
+        return str(message())
+    if args:
+        try:
+            return message % args
+        except (TypeError, ValueError):
+            return ' '.join([message, *map(str, args)])
+    return message
+
+
+def parse_levels(spec: str) -> Dict[str, int]:
+    """COE_DEBUG 값 → 카테고리별 최소 레벨"""
+    spec = spec.strip().lower()
+    if spec in ('', '0', 'off', 'false', 'no'):
+        return {category: OFF for category in CATEGORIES}
+    if spec in ('1', 'on', 'true', 'yes', 'all'):
+        return {category: DEBUG for category in CATEGORIES}
+    if spec in LEVELS:
+        return {category: LEVELS[spec] for category in CATEGORIES}
+    levels = {category: OFF for category in CATEGORIES}
+    for item in spec.split(','):
+        name, _, level = item.strip().partition('=')
+        if name in CATEGORIES:
+            levels[name] = LEVELS.get(level.strip(), DEBUG)
+    return levels
+
+
+class _FileSink:
+    """버퍼링 파일 기록기 - 호출한 쪽은 큐에만 넣고 포맷/쓰기는 백그라운드 스레드에서"""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name='coe-debug-log', daemon=True)
+        self._thread.start()
+
+    def put(self, label: str, message: Message, args: tuple):
+        self._queue.put((time.time(), label, message, args))
+
+    def close(self, timeout: float = 2.0):
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            while True:
+                item = self._queue.get()
+                batch = [item]
+                while item is not None and not self._queue.empty():
+                    item = self._queue.get()
+                    batch.append(item)
+                lines = []
+                for entry in batch:
+                    if entry is None:
+                        continue
+                    timestamp, label, message, args = entry
+                    try:
+                        text = format_message(message, args)
+                    except Exception as e:  # 메시지 포맷 실패가 기록 스레드를 멈추지 않도록
+                        text = f'<포맷 실패: {e}>'
+                    clock = time.strftime('%H:%M:%S', time.localtime(timestamp))
+                    lines.append(f'{clock}.{int(timestamp % 1 * 1000):03d} [{label}] {text}\n')
+                f.writelines(lines)
+                f.flush()
+                if batch[-1] is None:
+                    return
+
 
 class DebugManager:
     """
-    디버그 출력을 관리하는 전용 클래스
-
-    색깔 코드:
-    - RepoMap: cyan
-    - FileAnalysis: yellow
-    - Context: blue
-    - Error: red
+    디버그 출력을 관리하는 전용 클래스 (카테고리별 레벨, 지연 포맷, 콘솔/파일 출력)
     """
 
-    _console: Optional[Console] = None
-    _debug_enabled: bool = True
+    _console = None
+    _levels: Dict[str, int] = {category: OFF for category in CATEGORIES}
+    _file_sink: Optional[_FileSink] = None
 
     @classmethod
-    def _get_console(cls) -> Console:
-        """Console 인스턴스를 반환 (싱글톤 패턴)"""
+    def _get_console(cls):
+        """Console 인스턴스를 반환 (싱글톤 패턴, 콘솔 출력을 켤 때만 Rich를 불러옴)"""
         if cls._console is None:
+            from rich.console import Console
             cls._console = Console()
         return cls._console
 
+    @classmethod
+    def configure(cls, levels: Optional[str] = None, file_path: Optional[str] = None):
+        """레벨 설정 문자열(COE_DEBUG 형식)과 파일 경로로 설정 (file_path가 있으면 콘솔 대신 파일에 기록)"""
+        if file_path and levels is None:
+            levels = 'debug'
+        cls._levels = parse_levels(levels or '')
+        if cls._file_sink is not None and cls._file_sink.path != file_path:
+            cls._file_sink.close()
+            cls._file_sink = None
+        if file_path and cls._file_sink is None:
+            cls._file_sink = _FileSink(file_path)
+
+    @classmethod
+    def configure_from_env(cls):
+        cls.configure(os.getenv('COE_DEBUG'), os.getenv('COE_DEBUG_FILE') or None)
+
+    @classmethod
+    def set_level(cls, category: str, level: Union[int, str]):
+        """카테고리 하나의 최소 레벨 설정"""
+        if category not in CATEGORIES:
+            raise ValueError(f"알 수 없는 디버그 카테고리: {category}")
+        cls._levels[category] = LEVELS[level] if isinstance(level, str) else level
+
+    @classmethod
+    def levels(cls) -> Dict[str, str]:
+        names = {value: name for name, value in LEVELS.items()}
+        return {category: names.get(level, str(level)) for category, level in cls._levels.items()}
+
     @classmethod
     def set_debug_enabled(cls, enabled: bool):
-        """디버그 출력 ON/OFF 설정"""
-        cls._debug_enabled = enabled
+        """디버그 출력 ON/OFF 설정 (켜면 모든 카테고리 debug 레벨)"""
+        cls._levels = parse_levels('debug' if enabled else 'off')
 
     @classmethod
     def is_debug_enabled(cls) -> bool:
-        """디버그 출력 상태 확인"""
-        return cls._debug_enabled
+        """디버그 출력 상태 확인 (하나라도 켜진 카테고리가 있으면 True)"""
+        return any(level < OFF for level in cls._levels.values())
 
     @classmethod
-    def repo_map(cls, message: str):
+    def enabled(cls, category: str) -> bool:
+        """카테고리 메시지가 출력되는지 (비용이 큰 디버그 준비 작업을 감쌀 때)"""
+        return CATEGORIES[category][2] >= cls._levels[category]
+
+    @classmethod
+    def flush(cls):
+        """파일 기록 마무리 (종료 시)"""
+        if cls._file_sink is not None:
+            cls._file_sink.close()
+            cls._file_sink = None
+
+    @classmethod
+    def _emit(cls, category: str, message: Message, args: tuple):
+        label, color, _ = CATEGORIES[category]
+        if cls._file_sink is not None:
+            cls._file_sink.put(label, message, args)
+            return
+        text = format_message(message, args)
+        if color:
+            cls._get_console().print(f"[{color} dim][{label}][/{color} dim] [dim]{text}[/dim]")
+        else:
+            cls._get_console().print(f"[dim][{label}] {text}[/dim]")
+
+    @classmethod
+    def repo_map(cls, message: Message, *args: Any):
         """RepoMap 관련 디버그 출력 (dim cyan)"""
-        if cls._debug_enabled:
-            console = cls._get_console()
-            console.print(f"[cyan dim][RepoMap DEBUG][/cyan dim] [dim]{message}[/dim]")
+        if cls._levels['repo_map'] <= DEBUG:
+            cls._emit('repo_map', message, args)
 
     @classmethod
-    def file_analysis(cls, message: str):
+    def file_analysis(cls, message: Message, *args: Any):
         """파일 분석 관련 디버그 출력 (dim yellow)"""
-        if cls._debug_enabled:
-            console = cls._get_console()
-            console.print(f"[yellow dim][FileAnalysis DEBUG][/yellow dim] [dim]{message}[/dim]")
+        if cls._levels['file_analysis'] <= DEBUG:
+            cls._emit('file_analysis', message, args)
 
     @classmethod
-    def context(cls, message: str):
+    def context(cls, message: Message, *args: Any):
         """컨텍스트 관련 디버그 출력 (dim blue)"""
-        if cls._debug_enabled:
-            console = cls._get_console()
-            console.print(f"[blue dim][Context DEBUG][/blue dim] [dim]{message}[/dim]")
+        if cls._levels['context'] <= DEBUG:
+            cls._emit('context', message, args)
 
     @classmethod
-    def error(cls, message: str):
+    def error(cls, message: Message, *args: Any):
         """에러 관련 디버그 출력 (dim red)"""
-        if cls._debug_enabled:
-            console = cls._get_console()
-            console.print(f"[red dim][Error DEBUG][/red dim] [dim]{message}[/dim]")
+        if cls._levels['error'] <= ERROR:
+            cls._emit('error', message, args)
 
     @classmethod
-    def info(cls, message: str):
+    def info(cls, message: Message, *args: Any):
         """일반 정보 디버그 출력 (dim)"""
-        if cls._debug_enabled:
-            console = cls._get_console()
-            console.print(f"[dim][INFO DEBUG] {message}[/dim]")
+        if cls._levels['info'] <= INFO:
+            cls._emit('info', message, args)
 
     @classmethod
-    def llm(cls, message: str):
+    def llm(cls, message: Message, *args: Any):
         """LLM 호출 관련 디버그 출력 (dim magenta)"""
-        if cls._debug_enabled:
-            console = cls._get_console()
-            console.print(f"[magenta dim][LLM DEBUG][/magenta dim] [dim]{message}[/dim]")
+        if cls._levels['llm'] <= DEBUG:
+            cls._emit('llm', message, args)
 
     @classmethod
-    def prompt(cls, message: str):
+    def prompt(cls, message: Message, *args: Any):
         """프롬프트 관련 디버그 출력 (dim green)"""
-        if cls._debug_enabled:
-            console = cls._get_console()
-            console.print(f"[green dim][Prompt DEBUG][/green dim] [dim]{message}[/dim]")
+        if cls._levels['prompt'] <= DEBUG:
+            cls._emit('prompt', message, args)
 
     @classmethod
     def prompt_content(cls, title: str, content: str, max_length: int = 500):
-        """프롬프트 내용 전체 출력 (긴 내용 지원)"""
-        if cls._debug_enabled:
-            console = cls._get_console()
-            console.print(f"[green dim][Prompt DEBUG][/green dim] [dim]{title}:[/dim]")
-            if len(content) > max_length:
-                console.print(f"[dim]{content[:max_length]}...[truncated, total: {len(content)} chars][/dim]")
-            else:
-                console.print(f"[dim]{content}[/dim]")
\ No newline at end of file
+        """프롬프트 내용 출력 (긴 내용은 max_length까지만)"""
+        if cls._levels['prompt'] > DEBUG:
+            return
+        if len(content) > max_length:
+            cls._emit('prompt', "%s:\n%s...[truncated, total: %d chars]", (title, content[:max_length], len(content)))
+        else:
+            cls._emit('prompt', "%s:\n%s", (title, content))
+
+
+DebugManager.configure_from_env()
+atexit.register(DebugManager.flush)
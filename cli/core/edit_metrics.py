@@ -0,0 +1,107 @@
+"""
+편집 지표 저장소 - 코더별 파싱 성공률, 블록 매칭, 응답 크기, 소요 시간 (/stats edits)
+
+.coe/edit_metrics.jsonl 에 이벤트를 한 줄씩 추가 기록하고 (파일 내용은 저장하지 않음), 보고서는 최근 기록만
+역방향으로 읽어 전략별로 집계한다.
+- response: LLM 응답 (전략, 글자 수, 토큰 수, 응답 대기 시간)
+- parse: parse_response + validate_response (파싱 시간, 성공 여부, 블록/헝크 매칭/실패 수)
+  같은 응답을 /preview, /apply 에서 다시 파싱해도 응답 해시로 한 번만 집계
+- apply: 파일 적용 (작업 ID, 소요 시간, 성공 여부)
+- rollback: 롤백 (작업 ID로 적용한 전략을 찾아 집계)
+"""
+import hashlib
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from actions.edit_journal import EditJournal
+from .debug_manager import DebugManager
+
+METRICS_PATH = '.coe/edit_metrics.jsonl'
+REPORT_WINDOW = 5000  # 보고서에 쓰는 최근 기록 수
+# 예전 기록은 코더 클래스 이름으로 남아 있음 - 전략 선택기/레지스트리 이름으로 합쳐서 집계
+LEGACY_STRATEGY_KEYS = {'wholefile': 'whole', 'editblock': 'block'}
+
+_active_metrics: Optional['EditMetrics'] = None
+
+
+def set_edit_metrics(metrics: Optional['EditMetrics']):
+    """코더가 기록할 지표 저장소 설정 (None이면 기록하지 않음)"""
+    global _active_metrics
+    _active_metrics = metrics
+
+
+def get_edit_metrics() -> Optional['EditMetrics']:
+    return _active_metrics
+
+
+def response_key(response: str) -> str:
+    """같은 응답의 반복 파싱을 구분하기 위한 짧은 해시"""
+    return hashlib.sha1(response.encode('utf-8', errors='replace')).hexdigest()[:12]
+
+
+class EditMetrics:
+    """편집 지표 기록/집계"""
+
+    def __init__(self, path: str = METRICS_PATH):
+        self.journal = EditJournal(Path(path))
+
+    def record(self, event: str, **fields: Any):
+        """이벤트 한 줄 기록 (기록 실패가 편집 흐름을 막지 않도록 오류는 로그만 남김)"""
+        try:
+            self.journal.path.parent.mkdir(parents=True, exist_ok=True)
+            self.journal.append({'type': event, 'timestamp': time.time(), **fields})
+        except OSError as e:
+            DebugManager.error("[EditMetrics] 기록 실패: %s", e)
+
+    def summary(self, window: int = REPORT_WINDOW) -> Dict[str, Dict[str, Any]]:
+        """전략별 집계 (최근 window개 기록)"""
+        records = []
+        for record in self.journal.iter_reverse():
+            records.append(record)
+            if len(records) >= window:
+                break
+        records.reverse()
+
+        stats: Dict[str, Dict[str, Any]] = {}
+        operations: Dict[str, str] = {}
+        parsed = set()
+
+        def entry(strategy: str) -> Dict[str, Any]:
+            return stats.setdefault(strategy or '?', {
+                'responses': 0, 'response_chars': 0, 'completion_tokens': 0, 'llm_seconds': 0.0,
+                'parses': 0, 'parse_failures': 0, 'parse_ms': 0.0, 'blocks_matched': 0, 'blocks_missed': 0,
+                'applies': 0, 'apply_failures': 0, 'apply_ms': 0.0, 'rollbacks': 0,
+            })
+
+        for record in records:
+            kind = record.get('type')
+            strategy = record.get('strategy', '')
+            strategy = LEGACY_STRATEGY_KEYS.get(strategy, strategy)
+            if kind == 'response':
+                item = entry(strategy)
+                item['responses'] += 1
+                item['response_chars'] += record.get('chars', 0)
+                item['completion_tokens'] += record.get('completion_tokens') or record.get('chars', 0) // 4
+                item['llm_seconds'] += record.get('seconds', 0.0)
+            elif kind == 'parse':
+                key = (strategy, record.get('response'))
+                if key in parsed:
+                    continue
+                parsed.add(key)
+                item = entry(strategy)
+                item['parses'] += 1
+                item['parse_failures'] += 0 if record.get('valid') else 1
+                item['parse_ms'] += record.get('parse_ms', 0.0)
+                item['blocks_matched'] += record.get('blocks_matched', 0)
+                item['blocks_missed'] += record.get('blocks_missed', 0)
+            elif kind == 'apply':
+                item = entry(strategy)
+                item['applies'] += 1
+                item['apply_failures'] += 0 if record.get('success') else 1
+                item['apply_ms'] += record.get('apply_ms', 0.0)
+                if record.get('operation_id'):
+                    operations[record['operation_id']] = strategy
+            elif kind == 'rollback' and record.get('success', True):
+                entry(operations.get(record.get('operation_id'), strategy))['rollbacks'] += 1
+        return stats
@@ -0,0 +1,60 @@
+"""
+지연 생성 객체 - 시작 시 만들 필요가 없는 하위 시스템(FileEditor, MCP, 템플릿 등)을 처음 쓸 때 생성
+
+    file_editor = Lazy(lambda: FileEditor(...))
+    file_editor.get_history(10)   # 이때 처음 생성 (이후에는 같은 객체)
+
+속성 접근은 실제 객체로 그대로 전달되므로 호출하는 쪽 코드는 바꿀 필요가 없다.
+네트워크 조회처럼 느린 생성은 warm_up()으로 프롬프트를 띄운 뒤 백그라운드에서 미리 시작할 수 있고,
+생성 중에 사용하면 생성이 끝날 때까지 기다린다.
+"""
+import threading
+from typing import Any, Callable, Optional
+
+
+class Lazy:
+    """처음 속성에 접근할 때 factory()로 만드는 지연 객체"""
+
+    __slots__ = ('_factory', '_instance', '_lock', '_built')
+
+    def __init__(self, factory: Callable[[], Any]):
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_instance', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+        object.__setattr__(self, '_built', False)
+
+    def get(self) -> Any:
+        """실제 객체 (없으면 생성, 다른 스레드가 생성 중이면 대기)"""
+        if not self._built:
+            with self._lock:
+                if not self._built:
+                    object.__setattr__(self, '_instance', self._factory())
+                    object.__setattr__(self, '_built', True)
+        return self._instance
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    def warm_up(self) -> Optional[threading.Thread]:
+        """백그라운드 스레드에서 미리 생성 (이미 생성되었으면 None)"""
+        if self._built:
+            return None
+        thread = threading.Thread(target=self._warm, name='coe-warm-up', daemon=True)
+        thread.start()
+        return thread
+
+    def _warm(self):
+        try:
+            self.get()
+        except Exception:
+            pass  # 실패하면 처음 사용할 때 다시 생성하면서 오류가 드러남
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self.get(), name, value)
+
+    def __repr__(self) -> str:
+        return f"Lazy({self._instance!r})" if self._built else "Lazy(<생성 전>)"
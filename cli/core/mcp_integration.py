@@ -27,12 +27,12 @@ class MCPPromptBuilder(PromptBuilder):
             from rich.console import Console
             DebugManager.info("MCP 도구 정보를 프롬프트에 추가 중...")
             mcp_tools_info = self.mcp_client.format_tools_for_llm()
-            DebugManager.info(f"MCP 도구 정보 길이: {len(mcp_tools_info)} 글자")
+            DebugManager.info("MCP 도구 정보 길이: %s 글자", len(mcp_tools_info))
             messages.insert(-1, {  # 마지막 사용자 메시지 앞에 삽입
                 "role": "system", 
                 "content": mcp_tools_info
             })
-            DebugManager.info(f"최종 메시지 수: {len(messages)}개")
+            DebugManager.info("최종 메시지 수: %s개", len(messages))
         
         return messages
     
@@ -92,9 +92,9 @@ class MCPIntegration:
             return {"has_tool_calls": False}
         
         from rich.console import Console
-        DebugManager.info(f"LLM 응답에서 도구 호출 확인 중... (응답 길이: {len(response_content)})")
+        DebugManager.info("LLM 응답에서 도구 호출 확인 중... (응답 길이: %s)", len(response_content))
         result = self.tool_manager.execute_tool_calls(response_content, original_question)
-        DebugManager.info(f"도구 호출 결과: {result.get('has_tool_calls', False)}")
+        DebugManager.info("도구 호출 결과: %s", result.get('has_tool_calls', False))
         
         return result
     
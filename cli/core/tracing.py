@@ -0,0 +1,213 @@
+"""
+요청 처리 구간 추적 (span) - 한 턴의 시간이 어디에 쓰였는지 확인용
+
+COE_TRACE 환경변수로 켠다 (기본 꺼짐).
+- COE_TRACE=1: .coe/traces/trace-<시각>.json
+- COE_TRACE=<경로>: 지정한 파일
+기록은 Chrome trace(JSON 배열) 형식이며 Perfetto(ui.perfetto.dev)나 chrome://tracing 에서 바로 열 수 있다.
+이벤트를 한 줄에 하나씩 이어 쓰고 닫는 ']'는 생략하므로 (형식상 허용) 중간에 종료되어도 그때까지의 기록을 볼 수 있다.
+
+    with span('llm.request', model=model) as s:
+        ...
+        s.set(completion_tokens=123)
+
+시간은 perf_counter_ns(단조 시계) 기준이고 같은 스레드에서 열린 span은 뷰어에서 중첩되어 보인다.
+꺼져 있으면 span()은 아무 일도 하지 않는 공용 객체를 돌려주므로 호출 비용만 든다
+(속성 계산 비용이 큰 곳은 is_enabled()로 감쌀 것).
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+TRACE_ENV = 'COE_TRACE'
+TRACE_DIR = '.coe/traces'
+FLUSH_EVENTS = 256  # 이 개수만큼 쌓이거나 최상위 span이 끝나면 파일에 기록
+
+
+class _NullSpan:
+    """추적이 꺼져 있을 때의 span (모든 동작이 no-op)"""
+    __slots__ = ()
+
+    def set(self, **attrs: Any) -> '_NullSpan':
+        return self
+
+    def end(self):
+        pass
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """구간 하나 (end() 또는 with 블록 종료 시 기록, end()는 여러 번 불러도 한 번만 기록)"""
+    __slots__ = ('tracer', 'name', 'attrs', 'start_ns', 'tid', 'depth', 'ended')
+
+    def __init__(self, tracer: 'Tracer', name: str, attrs: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.tid = threading.get_ident()
+        self.depth = tracer._enter()
+        self.ended = False
+        self.start_ns = time.perf_counter_ns()
+
+    def set(self, **attrs: Any) -> 'Span':
+        self.attrs.update(attrs)
+        return self
+
+    def end(self):
+        if self.ended:
+            return
+        self.ended = True
+        end_ns = time.perf_counter_ns()
+        self.tracer._exit()
+        self.tracer._emit(self, end_ns)
+
+    def __enter__(self) -> 'Span':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.attrs['error'] = exc_type.__name__
+        self.end()
+        return False
+
+
+class Tracer:
+    """span 이벤트를 Chrome trace 파일로 기록"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.pid = os.getpid()
+        self.origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._pending: List[str] = []
+        self._threads = set()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('[\n')
+        self._add(self._thread_name_event(threading.get_ident()))
+
+    def _enter(self) -> int:
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
+        return depth
+
+    def _exit(self):
+        self._local.depth = max(0, getattr(self._local, 'depth', 1) - 1)
+
+    def _thread_name_event(self, tid: int) -> Dict[str, Any]:
+        self._threads.add(tid)
+        name = next((t.name for t in threading.enumerate() if t.ident == tid), str(tid))
+        return {'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid, 'args': {'name': name}}
+
+    def _emit(self, span: Span, end_ns: int):
+        event = {
+            'name': span.name,
+            'cat': span.name.split('.', 1)[0],
+            'ph': 'X',
+            'ts': (span.start_ns - self.origin_ns) / 1000,
+            'dur': (end_ns - span.start_ns) / 1000,
+            'pid': self.pid,
+            'tid': span.tid,
+        }
+        if span.attrs:
+            event['args'] = span.attrs
+        with self._lock:
+            if span.tid not in self._threads:
+                self._add(self._thread_name_event(span.tid))
+            self._add(event)
+            if span.depth == 0 or len(self._pending) >= FLUSH_EVENTS:
+                self._flush_locked()
+
+    def _add(self, event: Dict[str, Any]):
+        self._pending.append(json.dumps(event, ensure_ascii=False, default=str) + ',\n')
+
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.writelines(self._pending)
+        except OSError:
+            pass  # 추적 기록 실패가 요청 처리를 막지 않도록 함
+        self._pending.clear()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+
+_tracer: Optional[Tracer] = None
+
+
+def configure(path: Optional[str]) -> Optional[Tracer]:
+    """추적 켜기/끄기 (path가 None이면 끔) - 켜기 전에 남은 기록은 파일에 씀"""
+    global _tracer
+    if _tracer is not None:
+        _tracer.flush()
+    _tracer = Tracer(path) if path else None
+    return _tracer
+
+
+def _path_from_env() -> Optional[str]:
+    value = os.getenv(TRACE_ENV, '').strip()
+    if value.lower() in ('', '0', 'false', 'off', 'no'):
+        return None
+    if value.lower() in ('1', 'true', 'on', 'yes'):
+        return os.path.join(TRACE_DIR, time.strftime('trace-%Y%m%d-%H%M%S.json'))
+    return value
+
+
+def is_enabled() -> bool:
+    return _tracer is not None
+
+
+def trace_path() -> Optional[str]:
+    return _tracer.path if _tracer is not None else None
+
+
+def span(name: str, **attrs: Any):
+    """with 블록 구간 (꺼져 있으면 NULL_SPAN)"""
+    if _tracer is None:
+        return NULL_SPAN
+    return Span(_tracer, name, attrs)
+
+
+# 명시적으로 끝내는 구간 (with로 감쌀 수 없는 긴 흐름용)
+start_span = span
+
+
+def llm_response_attrs(llm_response: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """LLM 응답의 크기/토큰 속성 (llm.request span용, 꺼져 있으면 빈 dict)"""
+    if _tracer is None or not llm_response or 'choices' not in llm_response:
+        return {}
+    attrs = {'response_chars': len(llm_response['choices'][0]['message'].get('content') or '')}
+    for key, value in (llm_response.get('usage') or {}).items():
+        if isinstance(value, int):
+            attrs[key] = value
+    return attrs
+
+
+def flush():
+    if _tracer is not None:
+        _tracer.flush()
+
+
+try:
+    configure(_path_from_env())
+except OSError:
+    _tracer = None  # 추적 파일을 만들 수 없으면 끈 상태로 동작
+atexit.register(flush)
@@ -0,0 +1,318 @@
+"""
+CoE 백그라운드 데몬 - FileManager, 레포맵 캐시, 파일 분석 캐시, LLM 연결 풀을 유지하는 로컬 Unix 소켓 서버
+
+coe.py(얇은 클라이언트)가 명령을 한 줄 JSON으로 보내면 데몬이 이미 로드된 상태로 처리하고 한 줄 JSON으로 응답한다.
+에디터 연동이나 스크립트에서 반복 호출해도 인터프리터 기동/import/인덱싱 비용을 매번 내지 않는다.
+
+    요청: {"command": "add", "args": ["src/"], "cwd": "/path/to/project"}
+    응답: {"ok": true, "output": "...", "result": ...}  또는  {"ok": false, "error": "..."}
+
+실행: python coe.py daemon start|stop|status  (명령을 보내면 데몬이 없을 때 자동으로 시작)
+클라이언트 시작 시간에 포함되므로 이 모듈의 최상위 import는 표준 라이브러리만 사용한다.
+"""
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+SOCKET_ENV = 'COE_DAEMON_SOCKET'
+DEFAULT_SOCKET_PATH = '.coe/daemon.sock'
+LOG_PATH = '.coe/daemon.log'
+MAX_SOCKET_PATH = 100  # AF_UNIX 경로 길이 제한(108바이트) 여유분
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# 잠금 없이 처리하는 명령 (긴 LLM 요청 중에도 상태 확인/종료는 바로 응답)
+UNLOCKED_COMMANDS = {'ping', 'shutdown'}
+# 상태를 읽고 쓰는 구간만 직접 잠그는 명령 (LLM 응답을 기다리는 동안 다른 명령을 막지 않음)
+SELF_LOCKED_COMMANDS = {'ask'}
+
+
+class DaemonError(Exception):
+    """데몬 연결 또는 응답 오류"""
+
+
+class DaemonNotRunning(DaemonError):
+    """소켓이 없거나 연결을 받지 않음"""
+
+
+def socket_path(project_dir: Optional[str] = None) -> str:
+    """프로젝트별 데몬 소켓 경로 (COE_DAEMON_SOCKET으로 지정 가능)"""
+    configured = os.getenv(SOCKET_ENV)
+    if configured:
+        return configured
+    path = os.path.abspath(os.path.join(project_dir or os.getcwd(), DEFAULT_SOCKET_PATH))
+    if len(path.encode('utf-8')) > MAX_SOCKET_PATH:
+        # 경로가 너무 길면 임시 디렉토리에 프로젝트 경로 해시로 생성
+        import hashlib
+        import tempfile
+        digest = hashlib.sha1(path.encode('utf-8')).hexdigest()[:12]
+        path = os.path.join(tempfile.gettempdir(), f'coe-{digest}.sock')
+    return path
+
+
+# ---------------------------------------------------------------- 클라이언트
+
+def _read_line(sock: socket.socket) -> bytes:
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        if chunk.endswith(b'\n'):
+            break
+    return b''.join(chunks)
+
+
+def send_command(command: str, args: Sequence[str] = (), path: Optional[str] = None,
+                 timeout: Optional[float] = None) -> Dict[str, Any]:
+    """데몬에 명령 하나를 보내고 응답을 반환"""
+    path = path or socket_path()
+    request = {'command': command, 'args': list(args), 'cwd': os.getcwd()}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(json.dumps(request, ensure_ascii=False).encode('utf-8') + b'\n')
+            data = _read_line(sock)
+    except (FileNotFoundError, ConnectionRefusedError) as e:
+        raise DaemonNotRunning(f"데몬이 실행 중이 아닙니다: {path}") from e
+    except OSError as e:
+        raise DaemonError(f"데몬 통신 실패: {e}") from e
+    if not data:
+        raise DaemonError("데몬이 응답 없이 연결을 닫았습니다.")
+    return json.loads(data.decode('utf-8'))
+
+
+def is_running(path: Optional[str] = None) -> bool:
+    try:
+        return send_command('ping', path=path, timeout=2.0).get('ok', False)
+    except DaemonError:
+        return False
+
+
+def start_daemon(path: Optional[str] = None, wait: float = 10.0) -> int:
+    """데몬 프로세스를 백그라운드로 시작하고 소켓이 응답할 때까지 대기 (pid 반환)"""
+    import subprocess
+    path = path or socket_path()
+    os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get('PYTHONPATH')]))
+    with open(LOG_PATH, 'ab') as log:
+        process = subprocess.Popen([sys.executable, '-m', 'cli.daemon', '--socket', path],
+                                   stdin=subprocess.DEVNULL, stdout=log, stderr=log,
+                                   env=env, start_new_session=True)
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if is_running(path):
+            return process.pid
+        if process.poll() is not None:
+            raise DaemonError(f"데몬 시작 실패 (종료 코드 {process.returncode}, 로그: {LOG_PATH})")
+        time.sleep(0.05)
+    raise DaemonError(f"데몬이 {wait:.0f}초 안에 응답하지 않습니다 (로그: {LOG_PATH})")
+
+
+def stop_daemon(path: Optional[str] = None) -> bool:
+    """실행 중인 데몬 종료 (실행 중이 아니었으면 False)"""
+    try:
+        send_command('shutdown', path=path, timeout=5.0)
+    except DaemonNotRunning:
+        return False
+    return True
+
+
+# ---------------------------------------------------------------- 서버
+
+class CoeDaemon:
+    """워밍된 상태를 보관하고 클라이언트 명령을 처리하는 데몬 본체"""
+
+    def __init__(self, project_dir: Optional[str] = None, llm_service=None):
+        from actions.file_manager import FileManager
+        from actions.file_watcher import FileWatcher
+        from cli.core.context_manager import PromptBuilder
+
+        self.project_dir = os.path.abspath(project_dir or os.getcwd())
+        self.started_at = time.time()
+        self.file_manager = FileManager()
+        self.prompt_builder = PromptBuilder('ask')  # 레포맵 캐시를 요청 사이에 유지
+        if llm_service is None:
+            from llm.service import LLMService
+            llm_service = LLMService()  # requests.Session 커넥션 풀을 요청 사이에 재사용
+        self.llm_service = llm_service
+        self.chat_history: List[Dict[str, str]] = []
+        self.requests_served = 0
+        self._lock = threading.Lock()  # FileManager/히스토리 상태를 바꾸는 명령은 한 번에 하나씩
+        self._shutdown: Optional[Callable[[], None]] = None
+
+        # 컨텍스트 파일이 바뀌면 다시 분석하고 레포맵 캐시를 비움 (COE_FILE_WATCH=0 이면 끔)
+        self.file_manager.add_change_listener(lambda path, result: self.prompt_builder.clear_repo_map_cache())
+        self.file_watcher = FileWatcher(self.file_manager)
+        if os.getenv('COE_FILE_WATCH', '1') != '0':
+            self.file_watcher.start()
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """요청 하나 처리 (오류는 응답으로 돌려주고 데몬은 계속 실행)"""
+        command = str(request.get('command', '')).lower().lstrip('/')
+        handler = getattr(self, '_cmd_' + command.replace('-', '_'), None)
+        if handler is None:
+            return {'ok': False, 'error': f"알 수 없는 명령: {command} (사용 가능: {', '.join(self.commands())})"}
+        args = [str(arg) for arg in request.get('args') or []]
+        cwd = request.get('cwd') or self.project_dir
+        self.requests_served += 1
+        try:
+            if command in UNLOCKED_COMMANDS or command in SELF_LOCKED_COMMANDS:
+                output, result = handler(args, cwd)
+            else:
+                with self._lock:
+                    self.file_watcher.apply_pending()  # 감시 스레드가 찾은 변경은 명령 처리 스레드에서 재분석
+                    output, result = handler(args, cwd)
+        except Exception as e:
+            return {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+        return {'ok': True, 'output': output, 'result': result}
+
+    @classmethod
+    def commands(cls) -> List[str]:
+        return sorted(name[5:].replace('_', '-') for name in dir(cls) if name.startswith('_cmd_'))
+
+    def close(self):
+        self.file_watcher.stop()
+
+    def _resolve(self, paths: List[str], cwd: str) -> List[str]:
+        """클라이언트 작업 디렉토리 기준 상대 경로를 절대 경로로 (글롭 패턴 포함)"""
+        return [os.path.normpath(os.path.join(cwd, path.replace('@', ''))) for path in paths]
+
+    def _find_file(self, path: str) -> Optional[str]:
+        if path in self.file_manager.files:
+            return path
+        basename = os.path.basename(path)
+        for file_path in self.file_manager.files.keys():
+            if os.path.basename(file_path) == basename:
+                return file_path
+        return None
+
+    # 명령 처리기: (인자, 클라이언트 cwd) -> (출력 텍스트, JSON 결과)
+
+    def _cmd_ping(self, args, cwd):
+        status = {'pid': os.getpid(), 'project': self.project_dir, 'files': len(self.file_manager.files),
+                  'uptime': round(time.time() - self.started_at, 1), 'requests': self.requests_served}
+        return (f"데몬 실행 중 (pid {status['pid']}, 파일 {status['files']}개, "
+                f"가동 {status['uptime']}초, 요청 {status['requests']}건)"), status
+
+    def _cmd_add(self, args, cwd):
+        if not args:
+            raise ValueError("사용법: add <파일|디렉토리|글롭> ...")
+        before = len(self.file_manager.files)
+        result = self.file_manager.add(self._resolve(args, cwd))
+        added = len(self.file_manager.files) - before
+        lines = list(result['messages']) + [f"컨텍스트 파일 {len(self.file_manager.files)}개 (새로 추가 {added}개)"]
+        return '\n'.join(lines), {'added': added, 'files': len(self.file_manager.files), 'messages': result['messages']}
+
+    def _cmd_remove(self, args, cwd):
+        removed = [path for path in self._resolve(args, cwd) if self.file_manager.remove_file(path)]
+        return f"{len(removed)}개 파일 제거", {'removed': removed}
+
+    def _cmd_files(self, args, cwd):
+        files = sorted(self.file_manager.files.keys())
+        return '\n'.join(files) if files else "추가된 파일이 없습니다.", files
+
+    def _cmd_info(self, args, cwd):
+        if not args:
+            raise ValueError("사용법: info <파일>")
+        found = self._find_file(self._resolve(args[:1], cwd)[0])
+        if not found:
+            raise ValueError(f"컨텍스트에 없는 파일입니다: {args[0]} (먼저 add)")
+        # 프롬프트에 넣는 것과 같은 구조 분석 요약 (LLM 호출 없음)
+        analysis = self.prompt_builder._get_detailed_analysis(found, self.file_manager.files[found])
+        return analysis or f"분석 정보가 없습니다: {found}", {'file': found, 'analysis': analysis}
+
+    def _cmd_repo(self, args, cwd):
+        if not args:
+            return self.prompt_builder.get_repo_map_status(), None
+        repo_map = self.prompt_builder.generate_repo_map_manually(self._resolve(args, cwd), self.file_manager)
+        if not repo_map:
+            raise ValueError("RepoMap 생성에 실패했습니다.")
+        return repo_map, None
+
+    def _cmd_ask(self, args, cwd):
+        question = ' '.join(args).strip()
+        if not question:
+            raise ValueError("사용법: ask <질문>")
+        with self._lock:
+            self.file_watcher.apply_pending()
+            messages = self.prompt_builder.build(question, self.file_manager.files, list(self.chat_history),
+                                                 self.file_manager)
+        # LLM 호출은 잠금 밖에서 (그동안 add/files 등 다른 명령 처리, HTTP 세션은 스레드별)
+        response = self.llm_service.chat_completion(messages)
+        if not response or 'choices' not in response:
+            raise RuntimeError("AI가 응답을 생성하지 못했습니다.")
+        answer = response['choices'][0]['message']['content'] or ''
+        with self._lock:
+            self.chat_history.append({'role': 'user', 'content': question})
+            self.chat_history.append({'role': 'assistant', 'content': answer})
+        return answer, {'session_id': self.llm_service.get_session_id()}
+
+    def _cmd_session_reset(self, args, cwd):
+        self.llm_service.reset_session()
+        self.chat_history.clear()
+        return "세션과 대화 히스토리를 초기화했습니다.", None
+
+    def _cmd_shutdown(self, args, cwd):
+        if self._shutdown:
+            threading.Thread(target=self._shutdown, daemon=True).start()
+        return "데몬을 종료합니다.", None
+
+
+def serve(path: Optional[str] = None, daemon: Optional[CoeDaemon] = None,
+          ready: Optional[threading.Event] = None):
+    """Unix 소켓에서 요청을 받아 처리 (shutdown 명령을 받을 때까지 블록)"""
+    import socketserver
+
+    path = path or socket_path()
+    if os.path.exists(path):
+        if is_running(path):
+            raise DaemonError(f"이미 실행 중인 데몬이 있습니다: {path}")
+        os.unlink(path)  # 비정상 종료로 남은 소켓 파일
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    daemon = daemon or CoeDaemon()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            line = self.rfile.readline()
+            if not line:
+                return
+            try:
+                request = json.loads(line.decode('utf-8'))
+            except ValueError as e:
+                response = {'ok': False, 'error': f"잘못된 요청: {e}"}
+            else:
+                response = daemon.handle(request)
+            self.wfile.write(json.dumps(response, ensure_ascii=False, default=str).encode('utf-8') + b'\n')
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    server = Server(path, Handler)
+    daemon._shutdown = server.shutdown
+    if ready is not None:
+        ready.set()
+    try:
+        server.serve_forever(poll_interval=0.5)
+    finally:
+        server.server_close()
+        daemon.close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def main(argv: Optional[List[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    path = argv[argv.index('--socket') + 1] if '--socket' in argv else None
+    print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] CoE 데몬 시작 (pid {os.getpid()}, {path or socket_path()})", flush=True)
+    serve(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,51 +1,124 @@
 import sys
 import os
+import time
 
-# Load environment variables first
-from dotenv import load_dotenv
-load_dotenv()
+
+def _has_dotenv_file() -> bool:
+    """load_dotenv()가 찾는 위치(이 파일의 디렉토리부터 상위로)에 .env가 있는지"""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        if os.path.isfile(os.path.join(directory, '.env')):
+            return True
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return False
+        directory = parent
+
+
+# Load environment variables first (.env가 없으면 dotenv import 생략)
+if _has_dotenv_file():
+    from dotenv import load_dotenv
+    load_dotenv()
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+# 시작 시간 최적화: 프롬프트를 띄우는 데 필요한 모듈만 여기서 import 하고
+# LLM/MCP/템플릿/코더/편집기 등은 처음 사용할 때 만든다 (tests/test_startup.py 참고)
 import click
 from prompt_toolkit import PromptSession
 from prompt_toolkit.history import FileHistory
 from actions.file_manager import FileManager
-from actions.file_editor import FileEditor
-from actions.template_manager import TemplateManager
+from actions.file_watcher import FileWatcher
 # AI 템플릿 어시스턴트 제거됨 (단순한 /new 명령어로 대체)
 #from actions.ai_template_assistant import AITemplateAssistant
 from cli.completer import PathCompleter
-from llm.service import LLMService
 from cli.core.context_manager import PromptBuilder
-from cli.core.mcp_integration import MCPIntegration
 from cli.core.debug_manager import DebugManager
+from cli.core import tracing
+from cli.core.lazy import Lazy
+from cli.coders import load_registry
 from rich.console import Console
 from rich.panel import Panel
-from cli.ui.components import SwingUIComponents
-from cli.ui.panels import UIPanels
-from cli.ui.formatters import ResponseFormatter
 from cli.ui.interactive import InteractiveUI
+from cli.core.edit_metrics import EditMetrics, set_edit_metrics
+
+
+def _create_llm_service():
+    from llm.service import LLMService
+    return LLMService()
+
+
+def _create_mcp_integration(console):
+    """MCP 통합 초기화 (서버에서 도구 목록을 받아오므로 처음 LLM 요청을 보낼 때 생성)"""
+    from cli.core.mcp_integration import MCPIntegration
+    mcp_integration = MCPIntegration()
+    mcp_integration.initialize(console)
+    return mcp_integration
+
+
+def _create_file_editor(file_manager):
+    from actions.file_editor import FileEditor
+    return FileEditor(encoding_detector=file_manager.encoding_detector)  # 로드 시 감지한 인코딩 재사용
+
+
+def _create_template_manager(llm_service):
+    from actions.template_manager import TemplateManager
+    return TemplateManager(llm_service=llm_service)
+
+
+def _create_job_manager():
+    from cli.core.analysis_jobs import JobManager
+    return JobManager()
+
+
+def _create_ui(console):
+    from cli.ui.components import SwingUIComponents
+    return SwingUIComponents(console)
+
+
+def _create_panels(console):
+    from cli.ui.panels import UIPanels
+    return UIPanels(console)
+
+
+def _create_formatter(console):
+    from cli.ui.formatters import ResponseFormatter
+    return ResponseFormatter(console)
 
-# 편집 전략 import
-from cli.coders.base_coder import registry
-from cli.coders import wholefile_coder, editblock_coder, udiff_coder
 
 @click.command()
 def main():
     """An interactive REPL for the Swing LLM assistant."""
     console = Console()
-    ui = SwingUIComponents(console)
-    panels = UIPanels(console)
-    formatter = ResponseFormatter(console)
+    ui = Lazy(lambda: _create_ui(console))
+    panels = Lazy(lambda: _create_panels(console))
+    formatter = Lazy(lambda: _create_formatter(console))
     interactive_ui = InteractiveUI(console)
     history = FileHistory('.swing-cli-history')
-    session = PromptSession(history=history, completer=PathCompleter())
+    completer = PathCompleter()
+    session = PromptSession(history=history, completer=completer)
     file_manager = FileManager()
-    file_editor = FileEditor()
-    llm_service = LLMService()
-    template_manager = TemplateManager(llm_service=llm_service)
+    repo_prompt_builder = PromptBuilder('ask')  # /repo로 생성한 레포맵 캐시 보관
+
+    # 컨텍스트 파일 감시 (Hot Reload) - 감시 스레드는 변경만 찾고, 재분석은 이 스레드에서
+    # 프롬프트 전후에 apply_pending으로 수행한 뒤 알림 (COE_FILE_WATCH=0 이면 끔)
+    reloaded_files = []
+
+    def on_context_file_changed(file_path, result):
+        reloaded_files.append((file_path, result))
+        completer.invalidate_cache()
+        repo_prompt_builder.clear_repo_map_cache()
+
+    file_manager.add_change_listener(on_context_file_changed)
+    file_watcher = FileWatcher(file_manager)
+    if os.getenv('COE_FILE_WATCH', '1') != '0':
+        file_watcher.start()
+    file_editor = Lazy(lambda: _create_file_editor(file_manager))
+    llm_service = Lazy(_create_llm_service)
+    edit_metrics = EditMetrics()  # 코더별 파싱/적용 지표 (.coe/edit_metrics.jsonl, /stats edits)
+    set_edit_metrics(edit_metrics)
+    template_manager = Lazy(lambda: _create_template_manager(llm_service))
     # AI 어시스턴트 제거됨
     chat_history = []
     
@@ -57,23 +130,47 @@ def main():
     # 의도 분석 함수들 제거됨 (단순화)
     
     
-    # MCP 통합 초기화
-    mcp_integration = MCPIntegration()
-    mcp_integration.initialize(console)
+    # MCP 통합 (처음 LLM 요청 시 초기화)
+    mcp_integration = Lazy(lambda: _create_mcp_integration(console))
     task = 'ask'  # Default task
     edit_strategy = 'whole'  # 기본 편집 전략
     last_edit_response = None  # 마지막 edit 응답 저장
+    last_edit_strategy = None  # 마지막 edit 응답을 만든 전략 (후보/자동 선택은 그 턴에만 전략이 바뀜)
     last_user_request = None  # 마지막 사용자 요청 저장
-    current_coder = registry.get_coder(edit_strategy, file_editor)  # 현재 코더
+    diff_viewer = None  # 마지막 미리보기 (/preview next|prev 페이지 이동)
+    registry = Lazy(load_registry)  # 편집 전략 레지스트리 (코더 모듈은 처음 사용할 때 import)
+    current_coder = Lazy(lambda: registry.get_coder(edit_strategy, file_editor))  # 현재 코더
+    candidate_strategies_list = None  # /edit --candidates N 으로 설정한 후보별 전략
+    strategy_selector = None  # /edit auto 로 켠 전략 자동 선택기
+    job_manager = Lazy(_create_job_manager)  # /jobs 백그라운드 분석 작업 (.coe/jobs)
 
     # 웰컴 메시지
     interactive_ui.display_welcome_banner(task)
+    file_editor.warm_up()  # 중단된 편집 복구/히스토리 로드는 입력을 기다리는 동안 백그라운드에서
+    turn_span = tracing.NULL_SPAN  # 한 턴(프롬프트 생성 ~ 출력) 전체 구간, 다음 입력을 받기 전에 닫음
+    if tracing.is_enabled():
+        console.print(f"[dim]⏱️ 구간 추적 기록 중: {tracing.trace_path()} (Perfetto/chrome://tracing 에서 열기)[/dim]")
 
     while True:
         try:
+            turn_span.end()
+            file_watcher.apply_pending()
+            if reloaded_files:
+                changes, reloaded_files[:] = list(reloaded_files), []
+                interactive_ui.display_file_reload_notice(changes)
+            if job_manager.is_built:
+                for job in job_manager.pop_finished():
+                    console.print(f"[dim]🗂️ 분석 작업 {job['job_id']} {job['status']}: "
+                                  f"{job['done']}/{job['total']}개 완료, 오류 {job['errors']}개 (/jobs show {job['job_id']})[/dim]")
+
             user_input = session.prompt("> ")
+            if file_watcher.apply_pending():  # 입력을 기다리는 동안 바뀐 파일도 이번 요청 전에 반영
+                changes, reloaded_files[:] = list(reloaded_files), []
+                interactive_ui.display_file_reload_notice(changes)
 
             if user_input.strip().lower() in ('/exit', '/quit'):
+                tracing.flush()
+                file_watcher.stop()
                 console.print(panels.create_goodbye_panel())
                 break
 
@@ -82,18 +179,12 @@ def main():
                 continue
 
             elif user_input.strip().lower().startswith('/repo'):
-                # PromptBuilder import를 블록 밖으로 이동
-                from cli.core.context_manager import PromptBuilder
-
                 parts = user_input.strip().split()
                 if len(parts) > 1:
                     target_files = [p.replace('@', '') for p in parts[1:]]
 
-                    # PromptBuilder 인스턴스 생성 (ask용)
-                    prompt_builder = PromptBuilder('ask')
-
-                    # 수동으로 레포맵 생성
-                    repo_map = prompt_builder.generate_repo_map_manually(target_files, file_manager)
+                    # 수동으로 레포맵 생성 (파일이 외부에서 바뀌면 캐시가 비워짐)
+                    repo_map = repo_prompt_builder.generate_repo_map_manually(target_files, file_manager)
 
                     if repo_map:
                         console.print(panels.create_repo_map_panel(repo_map))
@@ -102,8 +193,7 @@ def main():
                         console.print("[red]•  RepoMap 생성에 실패했습니다.[/red]")
                 else:
                     # 상태 확인
-                    prompt_builder = PromptBuilder('ask')
-                    status = prompt_builder.get_repo_map_status()
+                    status = repo_prompt_builder.get_repo_map_status()
                     console.print(f"[cyan]•  RepoMap 상태: {status}[/cyan]")
                     console.print("[dim]사용법: /repo <파일1> <파일2> ... 또는 /repo (상태 확인)[/dim]")
                 continue
@@ -112,7 +202,9 @@ def main():
                 parts = user_input.strip().split()
                 if len(parts) > 1:
                     files_to_add = [p.replace('@', '') for p in parts[1:]]
-                    result = file_manager.add(files_to_add)
+                    status, on_progress = interactive_ui.display_file_load_progress()
+                    with status:
+                        result = file_manager.add(files_to_add, progress_callback=on_progress)
                     
                     # 파일 추가 결과 표시 (UI 모듈로 이동)
                     interactive_ui.display_file_add_results(result, file_manager, ui, console)
@@ -219,26 +311,43 @@ def main():
                 interactive_ui.display_command_results('/clear', {'success': True, 'message': '대화 기록이 초기화되었습니다.'}, console)
                 continue
 
+            elif user_input.strip().lower() in ('/preview next', '/preview prev'):
+                if diff_viewer is None:
+                    interactive_ui.display_command_results('/preview', {'message': '먼저 /preview로 미리보기를 생성하세요.'}, console)
+                else:
+                    moved = diff_viewer.next() if user_input.strip().lower().endswith('next') else diff_viewer.prev()
+                    if not moved:
+                        console.print("[dim]더 이동할 페이지가 없습니다.[/dim]")
+                    for panel in diff_viewer.render_page():
+                        console.print(panel)
+                continue
+
             elif user_input.strip().lower() == '/preview':
                 if not last_edit_response:
                     interactive_ui.display_command_results('/preview', {'message': '미리볼 edit 응답이 없습니다. edit 모드에서 먼저 요청하세요.'}, console)
                 else:
-                    preview = current_coder.preview_changes(last_edit_response, file_manager.files)
+                    edit_coder = registry.get_coder(last_edit_strategy, file_editor)
+                    preview = edit_coder.preview_changes(last_edit_response, file_manager.files)
                     if 'error' in preview:
                         interactive_ui.display_command_results('/preview', {'error': True, 'message': f"{preview['error']['message']} (전략: {preview['error']['strategy']})"}, console)
                     else:
-                        panels = ui.file_changes_preview(preview)
-                        for panel in panels:
+                        from cli.ui.diff_viewer import DiffViewer
+                        diff_viewer = DiffViewer(preview, ui.diff_page_lines())
+                        for panel in diff_viewer.render_page():
                             console.print(panel)
+                    if edit_coder.edit_failures:
+                        console.print(ui.edit_failures_panel(edit_coder.edit_failures))
                 continue
 
-            elif user_input.strip().lower() == '/apply':
+            elif user_input.strip().lower() in ('/apply', '/apply partial'):
+                allow_partial = user_input.strip().lower() == '/apply partial'
                 if not last_edit_response:
                     interactive_ui.display_command_results('/apply', {'message': '적용할 edit 응답이 없습니다. edit 모드에서 먼저 요청하세요.'}, console)
                 else:
                     try:
                         # 더 구체적인 설명 생성
-                        summary = current_coder.preview_changes(last_edit_response, file_manager.files)
+                        edit_coder = registry.get_coder(last_edit_strategy, file_editor)
+                        summary = edit_coder.preview_changes(last_edit_response, file_manager.files)
                         if summary and 'error' not in summary:
                             file_names = list(summary.keys())
                             if len(file_names) == 1:
@@ -250,11 +359,17 @@ def main():
                         
                         # 사용자 요청 내용 포함
                         if last_user_request and len(last_user_request) < 50:
-                            description = f"{file_desc}: {last_user_request} ({edit_strategy})"
+                            description = f"{file_desc}: {last_user_request} ({last_edit_strategy})"
                         else:
-                            description = f"{file_desc} ({edit_strategy} 전략)"
+                            description = f"{file_desc} ({last_edit_strategy} 전략)"
                         
-                        operation = current_coder.apply_changes(last_edit_response, file_manager.files, description)
+                        if edit_coder.edit_failures and not allow_partial:
+                            # 일부 블록/헝크를 찾지 못함 - 사용자가 확인하고 '/apply partial'로 적용해야 함
+                            console.print(ui.edit_failures_panel(edit_coder.edit_failures))
+                            continue
+
+                        operation = edit_coder.apply_changes(last_edit_response, file_manager.files, description,
+                                                                allow_partial=allow_partial)
                         console.print(ui.apply_confirmation(len(operation.changes)))
                         
                         # 편집 요약 표시
@@ -262,28 +377,108 @@ def main():
                         console.print(ui.edit_summary_panel(summary))
                         
                         last_edit_response = None  # 적용 후 초기화
+                        diff_viewer = None
                     except Exception as e:
                         interactive_ui.display_command_results('/apply', {'error': True, 'message': f'파일 적용 중 오류 발생: {e}'}, console)
                 continue
 
+            elif user_input.strip().lower() in ('/stats', '/stats edits'):
+                console.print(ui.edit_stats_table(edit_metrics.summary()))
+                continue
+
+            elif user_input.strip().lower() == '/jobs' or user_input.strip().lower().startswith('/jobs '):
+                # 체크포인트 분석 작업: 파일별 결과를 .coe/jobs에 기록하며 백그라운드로 실행
+                from cli.core.batch_analysis import DEFAULT_WORKERS
+                parts = user_input.strip().split()
+                action = parts[1].lower() if len(parts) > 1 else ''
+                try:
+                    if not action:
+                        console.print(ui.analysis_jobs_table(job_manager.list_jobs()))
+                    elif action == 'start':
+                        targets = [p.replace('@', '') for p in parts[2:] if p != '--no-llm']
+                        workers = DEFAULT_WORKERS
+                        if '-j' in targets:
+                            index = targets.index('-j')
+                            value = targets[index + 1] if index + 1 < len(targets) else ''
+                            if not value.isdigit() or int(value) < 1:
+                                raise ValueError('-j 뒤에는 1 이상의 워커 수를 입력하세요.')
+                            workers = int(value)
+                            del targets[index:index + 2]
+                        if not targets:
+                            raise ValueError('사용법: /jobs start <디렉토리|글롭|파일> ... (옵션: --no-llm, -j N)')
+                        job = job_manager.start(targets, use_llm='--no-llm' not in parts, workers=workers)
+                        console.print(f"[bold green]✅ 분석 작업 {job.job_id} 시작: 파일 {len(job.meta['files'])}개[/bold green]")
+                        console.print(f"[dim]🗂️ 진행 상황은 /jobs, 중지는 /jobs cancel {job.job_id} (중단돼도 /jobs resume 으로 이어서 실행)[/dim]")
+                    elif action in ('resume', 'cancel', 'show') and len(parts) > 2:
+                        if action == 'resume':
+                            job = job_manager.resume(parts[2])
+                            console.print(f"[bold green]✅ 분석 작업 {job.job_id} 재개: 남은 파일 {len(job.pending_files())}개[/bold green]")
+                        elif action == 'cancel':
+                            stopped = job_manager.cancel(parts[2])
+                            console.print("[yellow]⏹️ 진행 중인 파일이 끝나면 작업을 멈춥니다.[/yellow]" if stopped
+                                          else "[yellow]실행 중인 작업이 아닙니다.[/yellow]")
+                        else:
+                            from cli.core.analyzer import CoeAnalyzer
+                            CoeAnalyzer().display_analysis_results(job_manager.load(parts[2]).results())
+                    elif len(parts) == 2:
+                        job = job_manager.load(parts[1]).progress()
+                        console.print(ui.analysis_jobs_table([job]))
+                        for file_path, error in list(job['failed_files'].items())[:20]:
+                            console.print(f"  [red]✘[/red] {file_path} [dim]{error}[/dim]")
+                        if job['error']:
+                            console.print(f"[red]작업 오류: {job['error']}[/red]")
+                    else:
+                        raise ValueError('사용법: /jobs, /jobs <ID>, /jobs start <대상...> (옵션: --no-llm, -j N), /jobs resume|cancel|show <ID>')
+                except ValueError as e:
+                    interactive_ui.display_command_results('/jobs', {'error': True, 'message': str(e)}, console)
+                continue
+
             elif user_input.strip().lower() == '/history':
                 operations = file_editor.get_history(10)
                 console.print(ui.edit_history_table(operations))
                 continue
 
+            elif user_input.strip().lower().startswith('/history prune'):
+                # 최근 N개 작업만 남기고 히스토리와 참조되지 않는 백업 정리 (확인 후 실행)
+                parts = user_input.strip().split()
+                if len(parts) not in (3, 4) or not parts[2].isdigit() or parts[3:] not in ([], ['confirm']):
+                    interactive_ui.display_command_results('/history', {'error': True, 'message': '사용법: /history prune <남길 작업 수>, 확인 후 /history prune <남길 작업 수> confirm'}, console)
+                    continue
+                keep = int(parts[2])
+                if len(parts) == 3:
+                    preview = file_editor.prune_history(keep, dry_run=True)
+                    console.print(f"[yellow]최근 {preview['kept']}개 작업을 남기고 {preview['removed_operations']}개 작업을 히스토리에서 제거합니다. "
+                                  f"제거한 작업은 롤백할 수 없습니다.[/yellow]")
+                    console.print(f"[dim]'/history prune {keep} confirm' 명령으로 실행하세요.[/dim]")
+                    continue
+                result = file_editor.prune_history(keep)
+                interactive_ui.display_command_results('/history', {'success': True, 'message': (
+                    f"작업 {result['removed_operations']}개 제거, 백업 {result['removed_blobs'] + result['removed_files']}개 삭제 "
+                    f"(남은 작업 {result['kept']}개)")}, console)
+                continue
+
+            elif user_input.strip().lower().startswith('/debug '):
+                # 디버그 로그 레벨: /debug on | off | llm,prompt=info,...
+                spec = user_input.strip()[len('/debug '):].strip()
+                DebugManager.configure(spec, os.getenv('COE_DEBUG_FILE') or None)
+                levels = DebugManager.levels()
+                enabled = [f"{category}={level}" for category, level in levels.items() if level != 'off']
+                console.print(f"[dim]🐛 디버그 로그: {', '.join(enabled) if enabled else '꺼짐'}[/dim]")
+                continue
+
             elif user_input.strip().lower() == '/debug':
                 if last_edit_response:
                     console.print(Panel(
-                        f"[bold]현재 전략:[/bold] {edit_strategy}\n"
+                        f"[bold]현재 전략:[/bold] {edit_strategy} (마지막 응답: {last_edit_strategy})\n"
                         f"[bold]마지막 Edit 응답 원문:[/bold]\n\n{last_edit_response[:1000]}{'...' if len(last_edit_response) > 1000 else ''}",
                         title="🐛 디버그 정보",
                         style="yellow"
                     ))
                     
                     # 코더별 파싱 테스트
-                    parsed = current_coder.parse_response(last_edit_response, file_manager.files)
+                    parsed = registry.get_coder(last_edit_strategy, file_editor).parse_response(last_edit_response, file_manager.files)
                     console.print(Panel(
-                        f"[bold]파싱 결과 ({edit_strategy}):[/bold]\n" +
+                        f"[bold]파싱 결과 ({last_edit_strategy}):[/bold]\n" +
                         (f"파일 {len(parsed)}개 감지: {list(parsed.keys())}" if parsed else "파싱된 파일 없음"),
                         title="📝 파싱 결과",
                         style="cyan"
@@ -297,13 +492,8 @@ def main():
                 parts = user_input.strip().split()
                 if len(parts) == 2:
                     operation_id = parts[1]
-                    # 해당 작업 찾기
-                    operations = file_editor.get_history()
-                    target_op = None
-                    for op in operations:
-                        if op.operation_id == operation_id:
-                            target_op = op
-                            break
+                    # 해당 작업 찾기 (최근 작업에 없으면 저널에서 검색)
+                    target_op = file_editor.find_operation(operation_id)
                     
                     if target_op:
                         console.print(ui.rollback_confirmation(operation_id, target_op.description))
@@ -315,6 +505,7 @@ def main():
                     if action == 'confirm':
                         try:
                             success = file_editor.rollback_operation(operation_id)
+                            edit_metrics.record('rollback', operation_id=operation_id, success=success)
                             if success:
                                 console.print(ui.rollback_success(operation_id))
                             else:
@@ -396,14 +587,38 @@ def main():
 
             elif user_input.strip().lower().startswith('/edit'):
                 parts = user_input.strip().split()
+                if len(parts) >= 3 and parts[1] == '--candidates':
+                    # 여러 후보를 동시에 생성하고 검증을 통과한 첫 후보 사용
+                    from cli.coders.edit_candidates import MAX_CANDIDATES, candidate_strategies
+                    requested = parts[3].lower().split(',') if len(parts) > 3 else None
+                    unknown = [name for name in (requested or []) if name not in registry._coders]
+                    if not parts[2].isdigit() or not 2 <= int(parts[2]) <= MAX_CANDIDATES or unknown:
+                        interactive_ui.display_command_results('/edit', {'error': True, 'message': f'사용법: /edit --candidates N [전략1,전략2,...] (N: 2~{MAX_CANDIDATES}, 전략: {", ".join(registry._coders)})'}, console)
+                    else:
+                        candidate_strategies_list = candidate_strategies(int(parts[2]), edit_strategy, requested)
+                        task = 'edit'
+                        console.print(f"[bold green]✅ 후보 {len(candidate_strategies_list)}개 동시 생성 모드로 edit 모드가 설정되었습니다.[/bold green]")
+                        console.print(f"[dim]✏️ 후보 전략: {', '.join(candidate_strategies_list)} - 검증을 먼저 통과한 후보를 보여줍니다.[/dim]\n")
+                    continue
+                candidate_strategies_list = None
+                if len(parts) == 2 and parts[1].lower() == 'auto':
+                    # 요청마다 파일 크기/요청 유형/파싱 성공률로 전략 자동 선택
+                    from cli.coders.strategy_selector import StrategySelector
+                    strategy_selector = StrategySelector()
+                    task = 'edit'
+                    console.print("[bold green]✅ 전략 자동 선택으로 edit 모드가 설정되었습니다.[/bold green]")
+                    console.print("[dim]✏️ 요청마다 예상 출력 토큰이 가장 적은 전략(whole/block/udiff)을 고릅니다.[/dim]\n")
+                    continue
                 if len(parts) == 1:
-                    # 기본 edit 모드
+                    # 기본 edit 모드 (자동 선택을 끄고 현재 전략 사용)
+                    strategy_selector = None
                     task = 'edit'
                     interactive_ui.display_mode_switch_message(task)
                 elif len(parts) == 2:
                     # 전략과 함께 edit 모드
                     strategy_name = parts[1].lower()
                     if strategy_name in registry._coders:
+                        strategy_selector = None
                         edit_strategy = strategy_name
                         current_coder = registry.get_coder(edit_strategy, file_editor)
                         task = 'edit'
@@ -413,7 +628,7 @@ def main():
                         available = list(registry._coders.keys())
                         interactive_ui.display_command_results('/edit', {'error': True, 'message': f"알 수 없는 전략: {strategy_name}\n사용 가능: {', '.join(available)}"}, console)
                 else:
-                    interactive_ui.display_command_results('/edit', {'error': True, 'message': '사용법: /edit 또는 /edit <전략명> (예: /edit udiff)'}, console)
+                    interactive_ui.display_command_results('/edit', {'error': True, 'message': '사용법: /edit, /edit <전략명> (예: /edit udiff) 또는 /edit auto'}, console)
                 continue
 
             elif user_input.strip() == "":
@@ -435,7 +650,7 @@ def main():
             # 잘못된 명령어 처리 (/ 로 시작하지만 알려진 명령어가 아닌 경우)
             elif user_input.startswith('/'):
                 known_commands = ['/add', '/files', '/tree', '/info', '/clear', '/preview', '/apply',
-                                '/history', '/debug', '/rollback', '/ask', '/edit', '/new', '/session', '/session-reset', '/mcp', '/repo', '/help', '/exit', '/quit']
+                                '/history', '/stats', '/jobs', '/debug', '/rollback', '/ask', '/edit', '/new', '/session', '/session-reset', '/mcp', '/repo', '/help', '/exit', '/quit']
                 
                 # 명령어 부분만 추출 (공백 전까지)
                 command_part = user_input.split()[0].lower()
@@ -451,30 +666,74 @@ def main():
                 interactive_ui.display_separator()
 
             # Build the prompt using MCP-integrated PromptBuilder
-            prompt_builder = mcp_integration.create_prompt_builder(task)
-            messages = prompt_builder.build(user_input, file_manager.files, chat_history, file_manager)
+            turn_span = tracing.start_span('turn', task=task, strategy=edit_strategy if task == 'edit' else None)
+            with tracing.span('prompt.build', files=len(file_manager.files)) as build_span:
+                prompt_builder = mcp_integration.create_prompt_builder(task)
+                messages = prompt_builder.build(user_input, file_manager.files, chat_history, file_manager)
+                if tracing.is_enabled():
+                    build_span.set(messages=len(messages), chars=sum(len(m.get('content') or '') for m in messages))
 
             # 입출력 관련 질문인지 확인하고 JSON 강제 모드 사용
             force_json = hasattr(prompt_builder, 'is_io_question') and prompt_builder.is_io_question
             
-            # 로딩 메시지
-            with interactive_ui.display_loading_message():
-                llm_response = llm_service.chat_completion(messages, force_json=force_json)
+            strategy_decision = None  # /edit auto 선택 결과 (미리보기 파싱 결과를 기록)
+            # 이번 턴의 응답을 파싱할 전략/코더 (후보 승자나 자동 선택은 사용자가 고른 전략을 바꾸지 않음)
+            turn_strategy, turn_coder = edit_strategy, current_coder
+            if task == 'edit' and candidate_strategies_list:
+                # 후보 동시 생성 - 먼저 검증을 통과한 후보의 응답과 코더로 이후 흐름 진행
+                def show_candidate(candidate):
+                    mark = "[green]✔[/green]" if candidate.valid else "[red]✘[/red]"
+                    console.print(f"  {mark} 후보 #{candidate.index + 1} ({candidate.strategy}) {candidate.message} [dim]{candidate.elapsed:.1f}초[/dim]")
+
+                from cli.coders.edit_candidates import CandidateRunner
+                with interactive_ui.display_loading_message(), \
+                        tracing.span('candidates', count=len(candidate_strategies_list)) as candidates_span:
+                    winner, candidates = CandidateRunner(llm_service, file_editor).run(
+                        messages, file_manager.files, candidate_strategies_list, on_result=show_candidate)
+                    candidates_span.set(winner=winner.strategy if winner else None, finished=len(candidates))
+                if winner is None:
+                    interactive_ui.display_command_results('/edit', {'error': True, 'message': f'검증을 통과한 후보가 없습니다. ({len(candidates)}개 시도)'}, console)
+                    continue
+                turn_strategy = winner.strategy
+                turn_coder = registry.get_coder(turn_strategy, file_editor)
+                llm_response = {"choices": [{"message": {"role": "assistant", "content": winner.response}}]}
+            else:
+                if task == 'edit' and strategy_selector is not None:
+                    # 선택한 전략의 응답 형식을 따르도록 첫 시스템 프롬프트를 코더의 것으로 교체
+                    strategy_decision = strategy_selector.select(user_input, file_manager.files)
+                    turn_strategy = strategy_decision.strategy
+                    turn_coder = registry.get_coder(turn_strategy, file_editor)
+                    messages[0] = {'role': 'system', 'content': turn_coder.get_system_prompt(file_manager.files)}
+                    console.print(f"[dim]✏️ 자동 선택 전략: {strategy_decision.summary()}[/dim]")
+
+                # 로딩 메시지
+                llm_started = time.perf_counter()
+                with interactive_ui.display_loading_message(), \
+                        tracing.span('llm.request', messages=len(messages), force_json=force_json) as llm_span:
+                    llm_response = llm_service.chat_completion(messages, force_json=force_json)
+                    llm_span.set(**tracing.llm_response_attrs(llm_response))
+                if task == 'edit' and llm_response and 'choices' in llm_response:
+                    usage = llm_response.get('usage') or {}
+                    edit_metrics.record('response', strategy=turn_strategy,
+                                        chars=len(llm_response['choices'][0]['message']['content'] or ''),
+                                        completion_tokens=usage.get('completion_tokens'),
+                                        seconds=round(time.perf_counter() - llm_started, 3))
 
             if llm_response and "choices" in llm_response:
                 llm_message = llm_response["choices"][0]["message"]
                 response_content = llm_message['content']
                 
                 # DEBUG: LLM 응답 정보 표시
-                DebugManager.llm(f"LLM 응답 길이: {len(response_content)}")
-                DebugManager.llm(f"LLM 응답 미리보기: {response_content[:200]}...")
+                DebugManager.llm("LLM 응답 길이: %s", len(response_content))
+                DebugManager.llm("LLM 응답 미리보기: %s...", response_content[:200])
                 #DebugManager.llm(f"JSON 강제 모드: {force_json}")
                 
                 # MCP 도구 호출 처리
-                mcp_result = mcp_integration.process_llm_response(response_content, user_input)
+                with tracing.span('mcp.dispatch'):
+                    mcp_result = mcp_integration.process_llm_response(response_content, user_input)
                 if mcp_result.get('has_tool_calls'):
                     # MCP 도구 호출 시 LLM 응답은 디버그로만 표시
-                    DebugManager.llm(f"LLM 원본 응답: {response_content[:100]}...")
+                    DebugManager.llm("LLM 원본 응답: %s...", response_content[:100])
                     
                     # LLM이 자연스럽게 변환한 답변을 AI Response로 표시
                     natural_response = mcp_result.get('natural_response', '응답을 생성할 수 없습니다.')
@@ -486,18 +745,25 @@ def main():
                     
                     # 마지막 edit 응답과 사용자 요청 저장
                     last_edit_response = response_content
+                    last_edit_strategy = turn_strategy
                     last_user_request = user_input
                     
                     # 자동으로 미리보기 표시
                     try:
-                        preview = current_coder.preview_changes(response_content, file_manager.files)
+                        preview = turn_coder.preview_changes(response_content, file_manager.files)
+                        if strategy_decision is not None:
+                            strategy_selector.record_outcome(strategy_decision, bool(preview) and 'error' not in preview, len(response_content))
                         if preview and 'error' not in preview:
                             console.print()
-                            panels = ui.file_changes_preview(preview)
-                            for panel in panels:
-                                console.print(panel)
+                            with tracing.span('render', kind='preview', files=len(preview)):
+                                from cli.ui.diff_viewer import DiffViewer
+                                diff_viewer = DiffViewer(preview, ui.diff_page_lines())
+                                for panel in diff_viewer.render_page():
+                                    console.print(panel)
                             
                             console.print()
+                            if turn_coder.edit_failures:
+                                console.print(ui.edit_failures_panel(turn_coder.edit_failures))
                             
                             # 수정 의도 감지로 edit 모드가 된 경우 자동으로 apply 여부 묻기
                             if modification_auto_apply:
@@ -505,7 +771,9 @@ def main():
                                 apply_confirm = session.prompt("적용하시겠습니까? (y/n): ").strip().lower()
                                 if apply_confirm in ['y', 'yes', '네', 'ㅇ']:
                                     # /apply 명령 실행
-                                    apply_result = current_coder.apply_changes(last_edit_response, file_manager.files)
+                                    # 실패 목록을 본 뒤 확인했으므로 부분 적용 허용
+                                    apply_result = turn_coder.apply_changes(last_edit_response, file_manager.files,
+                                                                               allow_partial=True)
                                     if apply_result.get('success'):
                                         message = f"변경사항이 적용되었습니다.\n\n적용된 파일:\n" + '\n'.join(f"• {file}" for file in apply_result.get('applied_files', []))
                                         interactive_ui.display_command_results('auto-apply', {'success': True, 'message': message}, console)
@@ -556,9 +824,10 @@ def main():
                             pass  # 자동 분석 실패는 조용히 넘어감
                 else:
                     # Ask 모드: 응답 처리
-                    formatted = formatter.format_json_response(response_content, force_json)
-                    if formatted is None:
-                        console.print(panels.create_ai_response_panel(response_content))
+                    with tracing.span('render', kind='answer', chars=len(response_content)):
+                        formatted = formatter.format_json_response(response_content, force_json)
+                        if formatted is None:
+                            console.print(panels.create_ai_response_panel(response_content))
 
 
                 # Add user input and LLM response to history
@@ -573,6 +842,7 @@ def main():
             console.print(panels.create_warning_panel("작업이 중단되었습니다."))
             continue
         except EOFError:
+            file_watcher.stop()
             console.print(panels.create_goodbye_panel())
             break
         except ValueError as e:
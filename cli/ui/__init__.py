@@ -3,9 +3,23 @@ UI modules for Swing CLI
 Inspired by Aider's GUI architecture pattern
 """
 
-from .components import SwingUIComponents
-from .panels import UIPanels
-from .formatters import ResponseFormatter
-from .interactive import InteractiveUI
+import importlib
 
-__all__ = ['SwingUIComponents', 'UIPanels', 'ResponseFormatter', 'InteractiveUI']
\ No newline at end of file
+# 패키지 import 시 모든 UI 모듈(rich.markdown 등)을 불러오지 않도록 처음 접근할 때 import
+_EXPORTS = {
+    'SwingUIComponents': '.components',
+    'UIPanels': '.panels',
+    'ResponseFormatter': '.formatters',
+    'InteractiveUI': '.interactive',
+    'DiffViewer': '.diff_viewer',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -15,8 +15,9 @@ from rich.align import Align
 from rich.layout import Layout
 from rich.live import Live
 from rich.syntax import Syntax
+from rich.markup import escape
 from typing import List, Dict, Optional, Tuple, Any
-import time
+from .diff_viewer import DiffViewer
 import os
 from datetime import datetime
 
@@ -44,16 +45,10 @@ class SwingUIComponents:
         # 화면 지우고 애니메이션 효과
         self.console.clear()
         
-        # 점진적으로 배너 표시
+        # 배너 표시 (시작 시간에 포함되므로 인위적인 지연 없이 바로 출력)
         self.console.print()
-        with self.console.status("[bold bright_cyan]🚀 Loading Swing CLI...", spinner="aesthetic"):
-            time.sleep(1)
-        
         self.console.print(main_panel)
         
-        # 짧은 지연 후 상태 패널 표시
-        time.sleep(0.5)
-        
         # 상태 정보 패널
         status_info = f"""
 [bold green]🎯 현재 모드:[/bold green] [bold yellow]{task.upper()}[/bold yellow]
@@ -100,13 +95,20 @@ class SwingUIComponents:
 [yellow]/ask[/yellow] - 질문/분석 모드 (코드 설명, 버그 분석 등)
 [yellow]/edit[/yellow] - 수정/구현 모드 (실제 파일 변경, 코드 생성)
 [yellow]/edit[/yellow] <전략> - 특정 전략으로 edit 모드 (예: /edit udiff, /edit block)
+[yellow]/edit auto[/yellow] - 요청마다 파일 크기/요청 유형/성공률로 편집 전략 자동 선택
+[yellow]/edit --candidates N[/yellow] [전략,...] - 후보 N개를 동시에 생성해 검증 통과한 첫 후보 사용
 
 [bold cyan]📝 파일 편집 명령어:[/bold cyan]
-[yellow]/preview[/yellow] - 마지막 edit 응답의 변경사항 미리보기
+[yellow]/preview[/yellow] - 마지막 edit 응답의 변경사항 미리보기 (/preview next, /preview prev 로 페이지 이동)
 [yellow]/apply[/yellow] - 변경사항을 실제 파일에 적용
+[yellow]/apply partial[/yellow] - 찾지 못한 블록/헝크를 제외하고 나머지만 적용
 [yellow]/history[/yellow] - 편집 히스토리 보기
+[yellow]/history prune[/yellow] <N> - 최근 N개 작업만 남기고 히스토리/백업 정리
+[yellow]/stats edits[/yellow] - 전략별 파싱 성공률/블록 매칭/응답 크기/소요 시간 통계
+[yellow]/jobs[/yellow] [start <대상...> [--no-llm] [-j N] | <ID> | resume|cancel|show <ID>] - 백그라운드 분석 작업 (체크포인트, 이어서 실행)
 [yellow]/rollback[/yellow] <ID> - 특정 편집 작업 되돌리기
 [yellow]/debug[/yellow] - 마지막 edit 응답 디버깅 정보
+[yellow]/debug[/yellow] on|off|<카테고리>=<레벨>,... - 디버그 로그 레벨 (기본 꺼짐, COE_DEBUG / COE_DEBUG_FILE)
 
 [bold cyan]🌐 세션 관리:[/bold cyan]
 [yellow]/session[/yellow] - 현재 세션 ID 확인
@@ -163,8 +165,10 @@ class SwingUIComponents:
         table.add_column("Size", justify="right", style="green")
         table.add_column("Type", justify="center", style="yellow")
         
-        for file_path, content in files.items():
-            file_size = f"{len(content)} chars"
+        for file_path in files:
+            # 지연 로딩 저장소는 디코딩 없이 문자 수를 알려줌
+            char_count = files.char_count(file_path) if hasattr(files, 'char_count') else len(files[file_path])
+            file_size = f"{char_count} chars"
             file_type = "📄 Text"
             if file_path.endswith('.c'):
                 file_type = "🔧 C"
@@ -325,56 +329,16 @@ class SwingUIComponents:
         
         return result
 
-    def file_changes_preview(self, preview_data: Dict[str, Dict[str, Any]]):
-        """파일 변경사항 미리보기"""
+    def diff_page_lines(self) -> int:
+        """diff 미리보기 한 페이지에 그릴 줄 수 (터미널 높이 기준)"""
+        return max(20, self.console.size.height - 10)
+
+    def file_changes_preview(self, preview_data: Dict[str, Dict[str, Any]], max_lines: Optional[int] = None):
+        """파일 변경사항 미리보기 (첫 페이지만 렌더링 - 이후는 DiffViewer로 /preview next|prev)"""
         if not preview_data:
             return [self.warning_panel("변경할 파일이 없습니다.")]
         
-        panels = []
-        
-        for file_path, data in preview_data.items():
-            # 파일 상태 표시
-            status = "🆕 새 파일" if not data['exists'] else "✏️ 수정"
-            
-            # 시각적 diff 렌더링
-            if 'visual_diff' in data and data['visual_diff']:
-                diff_content = self.render_visual_diff(data['visual_diff'])
-            else:
-                # fallback to regular diff
-                diff_content = data.get('diff', "[dim]차이점 없음[/dim]")
-            
-            # diff가 비어있거나 헤더만 있는 경우
-            if not data.get('visual_diff') or len(data['visual_diff']) <= 2:
-                if data['exists']:
-                    diff_content = Text("[dim]파일 내용이 동일합니다[/dim]")
-                else:
-                    # 새 파일의 경우 전체 내용 표시
-                    new_lines = data['new'].splitlines()
-                    diff_content = Text()
-                    diff_content.append(f"새 파일 생성 ({len(new_lines)}줄)\n", style="bold green")
-                    for i, line in enumerate(new_lines[:10]):  # 처음 10줄만 표시
-                        diff_content.append(f"+ {line}\n", style="white on green")
-                    if len(new_lines) > 10:
-                        diff_content.append(f"... ({len(new_lines) - 10}줄 더)\n", style="dim")
-            
-            panel = Panel(
-                diff_content,
-                title=f"{status} {file_path}",
-                style="cyan",
-                border_style="cyan",
-                expand=False
-            )
-            panels.append(panel)
-        
-        # 메인 컨테이너
-        header = Panel(
-            f"[bold cyan]📋 총 {len(preview_data)}개 파일이 변경됩니다[/bold cyan]",
-            style="bright_cyan",
-            title="변경사항 미리보기"
-        )
-        
-        result_panels = [header] + panels
-        return result_panels
+        return DiffViewer(preview_data, max_lines or self.diff_page_lines()).render_page()
 
     def edit_history_table(self, operations: List):
         """편집 히스토리를 테이블로 표시"""
@@ -408,6 +372,43 @@ class SwingUIComponents:
         
         return table
 
+    def analysis_jobs_table(self, jobs: List[Dict[str, Any]]):
+        """/jobs - 분석 작업 목록과 진행 상황"""
+        if not jobs:
+            return Panel(
+                "[yellow]📋 분석 작업이 없습니다.[/yellow]\n[dim]/jobs start <디렉토리|글롭|파일> ... 로 백그라운드 분석을 시작하세요.[/dim]",
+                title="🗂️ 분석 작업",
+                style="yellow"
+            )
+
+        status_styles = {'running': 'bold green', 'done': 'cyan', 'interrupted': 'bold yellow',
+                         'cancelled': 'yellow', 'failed': 'bold red', 'pending': 'dim'}
+        table = Table(title="🗂️ 분석 작업", show_header=True, header_style="bold magenta")
+        table.add_column("ID", style="cyan", width=8)
+        table.add_column("시작", style="green", width=11)
+        table.add_column("상태")
+        table.add_column("진행", justify="right")
+        table.add_column("오류", justify="right", style="red")
+        table.add_column("남은 시간", justify="right")
+        table.add_column("대상", style="white")
+
+        for job in jobs:
+            status = job['status']
+            eta = job.get('eta_seconds')
+            table.add_row(
+                job['job_id'],
+                datetime.fromtimestamp(job['created_at']).strftime("%m/%d %H:%M"),
+                f"[{status_styles.get(status, 'white')}]{status}[/]",
+                f"{job['done']}/{job['total']} ({job['done'] / job['total']:.0%})" if job['total'] else "0/0",
+                str(job['errors']) if job['errors'] else "-",
+                f"{eta / 60:.0f}분" if eta and eta >= 60 else (f"{eta:.0f}초" if eta else "-"),
+                ' '.join(job['targets']) + ("" if job['use_llm'] else " (LLM 생략)")
+            )
+
+        if any(job['status'] == 'interrupted' for job in jobs):
+            table.caption = "중단된 작업은 /jobs resume <ID> 로 남은 파일부터 이어서 실행합니다."
+        return table
+
     def rollback_confirmation(self, operation_id: str, description: str):
         """롤백 확인 메시지"""
         return Panel(
@@ -420,6 +421,29 @@ class SwingUIComponents:
             style="yellow"
         )
 
+    def edit_failures_panel(self, failures: List[Dict[str, Any]]):
+        """적용하지 못한 SEARCH 블록/diff hunk 목록 (부분 적용 경고)"""
+        lines = []
+        for failure in failures[:20]:
+            if failure['kind'] == 'file':
+                lines.append(f"[red]✘[/red] {failure['file']}: 컨텍스트에 없는 파일")
+                continue
+            if failure['kind'] == 'path':
+                lines.append(f"[red]✘[/red] 파일 경로가 없어 대상 파일을 정할 수 없음: [dim]{escape(failure['search'])}[/dim]")
+                continue
+            label = '블록' if failure['kind'] == 'block' else 'hunk'
+            where = ''
+            if failure['line']:
+                where = f" - 가장 유사한 위치 {failure['line']}행"
+                if failure['score'] is not None:
+                    where += f" (유사도 {failure['score']:.2f})"
+            lines.append(f"[red]✘[/red] {failure['file']} {label} #{failure['index']}: "
+                         f"[dim]{escape(failure['search'])}[/dim]{where}")
+        if len(failures) > 20:
+            lines.append(f"[dim]... 외 {len(failures) - 20}개[/dim]")
+        lines.append("\n[yellow]위 변경은 미리보기에 포함되지 않았습니다. 나머지만 적용하려면 '/apply partial'을 입력하세요.[/yellow]")
+        return Panel('\n'.join(lines), title=f"⚠️ 적용하지 못한 변경 {len(failures)}개", style="yellow")
+
     def apply_confirmation(self, file_count: int):
         """변경사항 적용 확인 메시지"""
         return Panel(
@@ -526,6 +550,42 @@ class SwingUIComponents:
         
         return table
 
+    def edit_stats_table(self, stats: Dict[str, Dict[str, Any]]):
+        """/stats edits - 전략별 편집 지표 테이블"""
+        table = Table(title="📈 편집 전략 통계 (.coe/edit_metrics.jsonl)", show_header=True, header_style="bold magenta")
+        table.add_column("전략", style="cyan")
+        table.add_column("응답", justify="right")
+        table.add_column("평균 출력 토큰", justify="right")
+        table.add_column("평균 대기(초)", justify="right")
+        table.add_column("파싱 성공률", justify="right", style="green")
+        table.add_column("평균 파싱(ms)", justify="right")
+        table.add_column("블록 매칭/실패", justify="right")
+        table.add_column("적용(실패)", justify="right")
+        table.add_column("평균 적용(ms)", justify="right")
+        table.add_column("롤백", justify="right", style="yellow")
+
+        if not stats:
+            table.add_row("-", "기록 없음", "", "", "", "", "", "", "", "")
+            return table
+
+        for strategy, item in sorted(stats.items()):
+            responses = item['responses']
+            parses = item['parses']
+            applies = item['applies']
+            table.add_row(
+                strategy,
+                str(responses),
+                f"{item['completion_tokens'] / responses:,.0f}" if responses else "-",
+                f"{item['llm_seconds'] / responses:.1f}" if responses else "-",
+                f"{(parses - item['parse_failures']) / parses:.0%} ({parses})" if parses else "-",
+                f"{item['parse_ms'] / parses:.1f}" if parses else "-",
+                f"{item['blocks_matched']}/{item['blocks_missed']}",
+                f"{applies} ({item['apply_failures']})",
+                f"{item['apply_ms'] / applies:.1f}" if applies else "-",
+                str(item['rollbacks']),
+            )
+        return table
+
     def directory_analysis_panel(self, analysis: Dict):
         """디렉토리 분석 결과를 패널로 표시"""
         if 'error' in analysis:
@@ -0,0 +1,192 @@
+"""
+대용량 diff 페이지 뷰어 - 화면 크기만큼의 hunk만 Rich Text로 렌더링
+
+파일 전체를 다시 쓴 2만 줄짜리 diff도 한 번에 렌더링하지 않고, 현재 위치의 hunk부터
+화면 높이(max_lines)를 채울 만큼만 그린다. hunk 사이의 변경 없는 구간은 한 줄로 접어서 표시한다.
+/preview next, /preview prev 로 페이지 이동 (hunk 경계 기준, 화면보다 긴 hunk는 나누어 표시).
+"""
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from rich.panel import Panel
+from rich.text import Text
+
+HUNK_HEADER_PATTERN = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+LINE_STYLES = {
+    'header': "bold blue",
+    'hunk': "bold magenta",
+    'removed': "white on red",
+    'added': "white on green",
+    'context': "dim white",
+}
+
+
+@dataclass
+class DiffHunk:
+    """visual_diff 목록 안의 hunk 위치 (렌더링 전까지 내용은 복사하지 않음)"""
+    file_path: str
+    start: int          # visual_diff에서 '@@' 줄의 인덱스
+    end: int            # 다음 hunk 시작 (미포함)
+    old_start: int      # 원본 파일 기준 시작 줄 번호
+    old_length: int
+
+
+@dataclass
+class FileDiffStats:
+    """파일별 요약 (추가/삭제 줄 수, hunk 수)"""
+    exists: bool
+    added: int = 0
+    removed: int = 0
+    hunks: int = 0
+
+
+class DiffViewer:
+    """미리보기 데이터(FileEditor.preview_changes*)를 hunk 단위로 나누어 페이지 렌더링"""
+
+    def __init__(self, preview_data: Dict[str, Dict[str, Any]], max_lines: int = 40, max_width: int = 400):
+        self.preview_data = preview_data
+        self.max_lines = max(max_lines, 5)
+        self.max_width = max_width
+        self.hunks: List[DiffHunk] = []
+        self.stats: Dict[str, FileDiffStats] = {}
+        self.position: Tuple[int, int] = (0, 0)  # (hunk 번호, hunk 안의 줄 오프셋)
+        self._history: List[Tuple[int, int]] = []
+        self._index()
+
+    def _index(self):
+        """hunk 위치와 파일별 통계만 계산 (Rich 객체는 만들지 않음)"""
+        for file_path, data in self.preview_data.items():
+            stats = FileDiffStats(exists=data.get('exists', True))
+            visual_diff = data.get('visual_diff') or []
+            starts = []
+            for index, (diff_type, _) in enumerate(visual_diff):
+                if diff_type == 'hunk':
+                    starts.append(index)
+                elif diff_type == 'added':
+                    stats.added += 1
+                elif diff_type == 'removed':
+                    stats.removed += 1
+            for number, start in enumerate(starts):
+                end = starts[number + 1] if number + 1 < len(starts) else len(visual_diff)
+                match = HUNK_HEADER_PATTERN.match(visual_diff[start][1])
+                old_start, old_length = (int(match.group(1)), int(match.group(2) or 1)) if match else (0, 0)
+                self.hunks.append(DiffHunk(file_path, start, end, old_start, old_length))
+            stats.hunks = len(starts)
+            self.stats[file_path] = stats
+
+    # --- 페이지 배치 ---
+
+    def _layout(self, position: Tuple[int, int]) -> Tuple[List[Tuple[int, int, int]], Tuple[int, int]]:
+        """position(hunk 번호, hunk 안의 줄 오프셋)부터 max_lines에 들어가는 구간 계산
+
+        반환: ([(hunk 번호, 시작 줄, 끝 줄)], 다음 페이지 시작 위치)
+        hunk 사이 접힌 구간 표시와 잘린 hunk 안내도 한 줄씩 차지한다.
+        """
+        index, offset = position
+        budget = self.max_lines - (1 if offset else 0)  # 이어서 보기 안내 줄
+        pieces = []
+        while index < len(self.hunks) and budget > 0:
+            hunk = self.hunks[index]
+            if pieces and pieces[-1][0] == index - 1 and self.hunks[index - 1].file_path == hunk.file_path:
+                budget -= 1  # 변경 없는 구간 접힘 표시
+                if budget <= 0:
+                    break
+            start = hunk.start + offset
+            end = min(hunk.end, start + budget)
+            if end < hunk.end:
+                end = max(start + 1, end - 1)  # 잘림 안내 줄 자리
+                pieces.append((index, start, end))
+                return pieces, (index, end - hunk.start)
+            pieces.append((index, start, end))
+            budget -= end - start
+            index += 1
+            offset = 0
+        return pieces, (index, 0)
+
+    # --- 이동 ---
+
+    def next(self) -> bool:
+        """다음 페이지로 이동 (현재 페이지에서 잘린 hunk가 있으면 그 나머지부터, 마지막이면 False)"""
+        _, next_position = self._layout(self.position)
+        if next_position[0] >= len(self.hunks):
+            return False
+        self._history.append(self.position)
+        self.position = next_position
+        return True
+
+    def prev(self) -> bool:
+        """이전 페이지로 이동 (처음이면 False)"""
+        if not self._history:
+            return False
+        self.position = self._history.pop()
+        return True
+
+    # --- 렌더링 ---
+
+    def summary(self) -> str:
+        """전체 요약 한 줄"""
+        added = sum(stats.added for stats in self.stats.values())
+        removed = sum(stats.removed for stats in self.stats.values())
+        text = (f"📋 총 {len(self.preview_data)}개 파일이 변경됩니다  "
+                f"[green]+{added}[/green] [red]-{removed}[/red]  hunk {len(self.hunks)}개")
+        if self.hunks:
+            text += f"  (현재 {self.position[0] + 1}/{len(self.hunks)})"
+        return text
+
+    def _append_line(self, text: Text, diff_type: str, line: str):
+        if len(line) > self.max_width:
+            line = line[:self.max_width] + f" … (+{len(line) - self.max_width}자)"
+        text.append(line + '\n', style=LINE_STYLES.get(diff_type, "white"))
+
+    def render_page(self) -> List[Any]:
+        """현재 위치부터 max_lines만큼만 렌더링한 패널 목록 (요약 패널 포함)"""
+        panels = [Panel(f"[bold cyan]{self.summary()}[/bold cyan]", style="bright_cyan", title="변경사항 미리보기")]
+        pieces, next_position = self._layout(self.position)
+
+        current_file = None
+        body = None
+        previous = None
+        for index, start, end in pieces:
+            hunk = self.hunks[index]
+            if hunk.file_path != current_file:
+                if body is not None:
+                    panels.append(self._file_panel(current_file, body))
+                current_file = hunk.file_path
+                body = Text()
+            elif previous is not None and previous == index - 1:
+                # hunk 사이의 변경 없는 구간은 한 줄로 접음
+                gap = hunk.old_start - (self.hunks[previous].old_start + self.hunks[previous].old_length)
+                body.append(f"⋯ 변경 없는 {max(gap, 0)}줄 ⋯\n", style="dim italic")
+            if start > hunk.start:
+                body.append(f"… (이 hunk의 {start - hunk.start}줄 이후부터)\n", style="dim")
+            for diff_type, line in self.preview_data[hunk.file_path]['visual_diff'][start:end]:
+                self._append_line(body, diff_type, line)
+            if end < hunk.end:
+                body.append(f"… 이 hunk의 {hunk.end - end}줄 더 (/preview next)\n", style="dim")
+            previous = index
+        if body is not None:
+            panels.append(self._file_panel(current_file, body))
+
+        # 변경 사항이 없는 파일 (첫 페이지에만 표시)
+        if self.position == (0, 0):
+            for file_path, stats in self.stats.items():
+                if stats.hunks == 0:
+                    panels.append(self._file_panel(file_path, Text("파일 내용이 동일합니다", style="dim")))
+
+        if next_position[0] < len(self.hunks):
+            remaining = len(self.hunks) - next_position[0]
+            panels.append(Text(f"  남은 hunk {remaining}개 - 다음: /preview next, 이전: /preview prev", style="dim"))
+        return panels
+
+    def _file_panel(self, file_path: str, body: Text) -> Panel:
+        stats = self.stats[file_path]
+        status = "🆕 새 파일" if not stats.exists else "✏️ 수정"
+        return Panel(
+            body,
+            title=f"{status} {file_path}  [green]+{stats.added}[/green] [red]-{stats.removed}[/red]",
+            style="cyan",
+            border_style="cyan",
+            expand=False
+        )
@@ -24,6 +24,26 @@ class InteractiveUI:
         """로딩 메시지 표시"""
         return self.console.status(f"[white]• {message}[/white]", spinner="dots")
 
+    def display_file_load_progress(self):
+        """파일 일괄 로딩 진행 상황 표시 - (status, 진행 콜백) 반환"""
+        import os
+        status = self.console.status("[white]• 파일 로딩 중...[/white]", spinner="dots")
+
+        def on_progress(done: int, total: int, file_path: str):
+            status.update(f"[white]• 파일 로딩 중... {done}/{total} [dim]{os.path.basename(file_path)}[/dim][/white]")
+
+        return status, on_progress
+
+    def display_file_reload_notice(self, changes):
+        """외부에서 수정되어 다시 분석한 파일 알림 - changes: [(경로, 결과 또는 None)]"""
+        import os
+        for file_path, result in changes:
+            name = os.path.basename(file_path)
+            if result is None or result.get('removed'):
+                self.console.print(f"[yellow]• 파일이 삭제되어 컨텍스트에서 제거됨: {name}[/yellow]")
+            else:
+                self.console.print(f"[dim]• 외부 변경 감지, 다시 분석함: {name}[/dim]")
+
     def display_separator(self):
         """구분선 표시"""
         from rich.rule import Rule
@@ -31,7 +51,6 @@ class InteractiveUI:
 
     def display_welcome_banner(self, task: str):
         """환영 배너 표시 - 아이콘 없이 dots 사용"""
-        import time
         from rich.text import Text
         from rich.align import Align
         
@@ -53,16 +72,10 @@ class InteractiveUI:
         # 화면 지우고 애니메이션 효과
         self.console.clear()
         
-        # 점진적으로 배너 표시
+        # 배너 표시 (시작 시간에 포함되므로 인위적인 지연 없이 바로 출력)
         self.console.print()
-        with self.console.status("[bright_white]• Loading Swing CLI...", spinner="dots"):
-            time.sleep(1)
-        
         self.console.print(main_panel)
         
-        # 짧은 지연 후 상태 패널 표시
-        time.sleep(0.5)
-        
         # 상태 정보 패널
         from rich.panel import Panel
         status_info = f"""
@@ -115,16 +128,23 @@ class InteractiveUI:
 [yellow]/ask[/yellow] - 질문/분석 모드 (코드 설명, 버그 분석 등)
 [yellow]/edit[/yellow] - 수정/구현 모드 (실제 파일 변경, 코드 생성)
 [yellow]/edit[/yellow] <전략> - 특정 전략으로 edit 모드 (예: /edit udiff, /edit block)
+[yellow]/edit auto[/yellow] - 요청마다 파일 크기/요청 유형/성공률로 편집 전략 자동 선택
+[yellow]/edit --candidates N[/yellow] [전략,...] - 후보 N개를 동시에 생성해 검증 통과한 첫 후보 사용
 [yellow]/new[/yellow] - 템플릿 기반 새 파일 생성
 
 
 [bold cyan]•  파일 편집 명령어:[/bold cyan]
 
-[yellow]/preview[/yellow] - 마지막 edit 응답의 변경사항 미리보기
+[yellow]/preview[/yellow] - 마지막 edit 응답의 변경사항 미리보기 (/preview next, /preview prev 로 페이지 이동)
 [yellow]/apply[/yellow] - 변경사항을 실제 파일에 적용
+[yellow]/apply partial[/yellow] - 찾지 못한 블록/헝크를 제외하고 나머지만 적용
 [yellow]/history[/yellow] - 편집 히스토리 보기
+[yellow]/history prune[/yellow] <N> - 최근 N개 작업만 남기고 히스토리/백업 정리
+[yellow]/stats edits[/yellow] - 전략별 파싱 성공률/블록 매칭/응답 크기/소요 시간 통계
+[yellow]/jobs[/yellow] [start <대상...> [--no-llm] [-j N] | <ID> | resume|cancel|show <ID>] - 백그라운드 분석 작업 (체크포인트, 이어서 실행)
 [yellow]/rollback[/yellow] <ID> - 특정 편집 작업 되돌리기
 [yellow]/debug[/yellow] - 마지막 edit 응답 디버깅 정보
+[yellow]/debug[/yellow] on|off|<카테고리>=<레벨>,... - 디버그 로그 레벨 (기본 꺼짐, COE_DEBUG / COE_DEBUG_FILE)
 
 
 [bold cyan]•  세션 관리:[/bold cyan]
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+coe 명령 진입점 - 인자 없이 실행하면 대화형 CLI, 명령을 주면 백그라운드 데몬에 전달하는 얇은 클라이언트
+
+    python coe.py                              대화형 CLI (cli/main.py)
+    python coe.py analyze src/ -o out.ndjson   일괄 분석 (데몬 없이 실행, 옵션은 analyze -h)
+    python coe.py daemon start|stop|status     데몬 관리
+    python coe.py add src/*.c                  데몬에 명령 전달 (데몬이 없으면 자동 시작)
+    python coe.py info zordss0100.c
+    python coe.py ask "rc 체크가 빠진 곳 찾아줘"
+    python coe.py files --json                 응답 전체를 JSON으로 출력 (에디터 연동용)
+
+데몬 명령: ping, add, remove, files, info, repo, ask, session-reset, shutdown
+COE_DAEMON_AUTOSTART=0 이면 데몬을 자동으로 시작하지 않는다.
+"""
+import json
+import os
+import sys
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+# 클라이언트는 표준 라이브러리만 쓰는 cli.daemon 클라이언트 함수만 import (무거운 모듈은 데몬에서 로드)
+from cli.daemon import DaemonError, DaemonNotRunning, is_running, send_command, socket_path, start_daemon, stop_daemon
+
+
+def daemon_command(action: str) -> int:
+    path = socket_path()
+    if action == 'start':
+        if is_running(path):
+            print(f"데몬이 이미 실행 중입니다: {path}")
+            return 0
+        pid = start_daemon(path)
+        print(f"데몬 시작 (pid {pid}, {path})")
+    elif action == 'stop':
+        print("데몬을 종료했습니다." if stop_daemon(path) else "실행 중인 데몬이 없습니다.")
+    elif action == 'status':
+        try:
+            print(send_command('ping', path=path, timeout=2.0)['output'])
+        except DaemonNotRunning:
+            print(f"실행 중인 데몬이 없습니다: {path}")
+            return 1
+    else:
+        print("사용법: coe.py daemon start|stop|status", file=sys.stderr)
+        return 2
+    return 0
+
+
+def forward(command: str, args: list) -> int:
+    as_json = '--json' in args
+    args = [arg for arg in args if arg != '--json']
+    try:
+        response = send_command(command, args)
+    except DaemonNotRunning:
+        if os.getenv('COE_DAEMON_AUTOSTART', '1') == '0':
+            raise
+        start_daemon()
+        response = send_command(command, args)
+
+    if as_json:
+        print(json.dumps(response, ensure_ascii=False, indent=2, default=str))
+    elif response.get('ok'):
+        if response.get('output'):
+            print(response['output'])
+    else:
+        print(f"오류: {response.get('error')}", file=sys.stderr)
+    return 0 if response.get('ok') else 1
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        from cli.main import main as repl
+        repl()
+        return 0
+    if argv[0] in ('-h', '--help', 'help'):
+        print(__doc__.strip())
+        return 0
+    if argv[0] == 'analyze':
+        from cli.core.batch_analysis import main as analyze
+        return analyze(argv[1:])
+    try:
+        if argv[0] == 'daemon':
+            return daemon_command(argv[1] if len(argv) > 1 else 'status')
+        return forward(argv[0], argv[1:])
+    except DaemonError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
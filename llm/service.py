@@ -1,13 +1,27 @@
 import requests
 import os
+import sys
+import threading
 
 class LLMService:
     def __init__(self, base_url=None):
         self.base_url = base_url or os.getenv("COE_BACKEND_URL", "http://localhost:8000")
         self.chat_completions_url = f"{self.base_url}/v1/chat/completions"
         self.current_session_id = None
+        # 스레드별 커넥션 풀 (같은 백엔드로의 연속 요청에서 TCP/TLS 연결 재사용)
+        # requests.Session은 스레드 안전이 보장되지 않으므로 후보 생성/데몬 스레드끼리 공유하지 않는다
+        self._local = threading.local()
 
-    def chat_completion(self, messages, model="gpt-4o-mini", context="aider", session_id=None, force_json=False):
+    @property
+    def http(self):
+        """현재 스레드의 백엔드 요청용 requests.Session (스레드마다 처음 요청 시 생성)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def chat_completion(self, messages, model="gpt-4o-mini", context="aider", session_id=None, force_json=False, use_session=True):
+        """채팅 완성 요청 (use_session=False면 현재 세션을 보내지도 갱신하지도 않음 - 동시 후보 요청용)"""
         headers = {
             "Content-Type": "application/json",
             # "Authorization": f"Bearer {os.getenv("OPENAI_API_KEY")}" # CoE-Backend handles its own auth
@@ -27,23 +41,23 @@ class LLMService:
             
         if session_id:
             payload["session_id"] = session_id
-        elif self.current_session_id:
+        elif self.current_session_id and use_session:
             payload["session_id"] = self.current_session_id
             
         try:
-            response = requests.post(self.chat_completions_url, headers=headers, json=payload)
+            response = self.http.post(self.chat_completions_url, headers=headers, json=payload)
             response.raise_for_status() # Raise an exception for HTTP errors
 
             result = response.json()
             
             # 응답에서 session_id 추출하여 저장
-            if "session_id" in result:
+            if "session_id" in result and use_session:
                 self.current_session_id = result["session_id"]
             
             return result
             
         except requests.exceptions.RequestException as e:
-            print(f"Error communicating with LLM backend: {e}")
+            print(f"Error communicating with LLM backend: {e}", file=sys.stderr)  # 표준 출력은 결과(NDJSON 등) 전용
             return None
     
     def set_context(self, context):
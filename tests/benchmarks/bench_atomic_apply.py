@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+다중 파일 적용 벤치마크 - 제자리 쓰기 vs 파일별 fsync vs 일괄 fsync
+
+FileEditor 항목은 일괄 fsync 트랜잭션에 백업 저장과 저널 기록까지 포함한 전체 적용 시간이다.
+
+실행: python tests/benchmarks/bench_atomic_apply.py [파일 수(기본 100)] [반복 수(기본 5)]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.blob_store import fsync_path
+from actions.file_editor import FileEditor
+
+C_BODY = ''.join(
+    f'static long b{i:03d}_proc(ctx_t *ctx)\n{{\n    PFM_DBG("단계 {i}");\n    return RC_NRM;\n}}\n'
+    for i in range(80)
+)
+
+
+def build_files(root: Path, count: int):
+    files = {}
+    for i in range(count):
+        path = root / f'dir{i % 4}' / f'zordss{i:04d}.c'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(C_BODY, encoding='utf-8')
+        files[str(path)] = C_BODY.replace('RC_NRM', f'RC_NRM_{i}')
+    return files
+
+
+def write_in_place(files):
+    """이전 방식: 대상 파일을 'w'로 열어 그대로 덮어씀 (원자성/내구성 없음)"""
+    for file_path, content in files.items():
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+
+def write_fsync_each(files):
+    """파일마다 임시 파일 쓰기 → fsync → rename → 디렉토리 fsync"""
+    for file_path, content in files.items():
+        temp_path = file_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+        fsync_path(os.path.dirname(file_path))
+
+
+def write_batched(files):
+    """FileEditor와 같은 순서: 임시 파일을 모두 쓰고 → 한 번에 fsync → rename → 디렉토리별 fsync 1회"""
+    temp_paths = {}
+    for file_path, content in files.items():
+        temp_paths[file_path] = file_path + '.tmp'
+        with open(temp_paths[file_path], 'w', encoding='utf-8') as f:
+            f.write(content)
+    for temp_path in temp_paths.values():
+        fsync_path(temp_path)
+    for file_path, temp_path in temp_paths.items():
+        os.replace(temp_path, file_path)
+    for directory in {os.path.dirname(file_path) for file_path in files}:
+        fsync_path(directory)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    root = Path(tempfile.mkdtemp(prefix='coe_apply_bench_'))
+    try:
+        files = build_files(root / 'src', count)
+        editor = FileEditor(str(root / 'backups'))
+        print(f"{count} files x {repeat}\n")
+
+        results = {}
+        for label, func in [
+            ('in-place write', write_in_place),
+            ('fsync per file', write_fsync_each),
+            ('batched fsync', write_batched),
+            ('FileEditor (+ backup/journal)', lambda files: editor.apply_changes_from_dict(files, 'bench')),
+        ]:
+            elapsed = []
+            for _ in range(repeat):
+                # 매번 내용이 달라야 백업 중복 제거로 생략되지 않음
+                files = {path: content + f'/* {time.perf_counter_ns()} */\n' for path, content in files.items()}
+                start = time.perf_counter()
+                func(files)
+                elapsed.append(time.perf_counter() - start)
+            results[label] = min(elapsed)
+            print(f"{label:<30} {results[label] * 1000:9.1f} ms  {count / results[label]:8.0f} files/s")
+
+        print(f"\nbatched vs fsync per file: x{results['fsync per file'] / results['batched fsync']:.2f}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+SEARCH 블록 매칭 벤치마크 - 기존 str.replace + 줄 단위 strip 스캔 vs 색인 기반 block_matcher
+
+대형 C 소스에 정확히 일치/들여쓰기만 다름/오타가 있는 블록을 섞어 적용 시간과 적용된 블록 수를 비교한다.
+실행: python tests/benchmarks/bench_block_matcher.py [줄 수(쉼표 구분, 기본 5000,20000,50000)] [블록 수(기본 48)]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from cli.coders.block_matcher import apply_blocks
+
+
+def generate_source(lines: int) -> list:
+    source = []
+    i = 0
+    while len(source) < lines:
+        source.extend([
+            f'static long b{i:05d}_proc(ctx_t *ctx)',
+            '{',
+            '    long rc = RC_NRM;',
+            '',
+            f'    rc = z{i:05d}_call(ctx, "{i}");',
+            '    if (rc != RC_NRM) {',
+            '        return rc;',
+            '    }',
+            '    return RC_NRM;',
+            '}',
+            '',
+        ])
+        i += 1
+    return source[:lines]
+
+
+def make_blocks(source: list, count: int, seed: int = 7) -> list:
+    """1/3은 정확히 일치, 1/3은 들여쓰기 제거, 1/3은 한 줄에 오타"""
+    rng = random.Random(seed)
+    functions = rng.sample(range(len(source) // 11), count)
+    blocks = []
+    for n, function in enumerate(functions):
+        start = function * 11
+        search = source[start:start + 6]
+        if n % 3 == 1:
+            search = [line.strip() for line in search]
+        elif n % 3 == 2:
+            search = list(search)
+            search[4] = search[4].replace('ctx,', 'ctx ,').replace('_call', '_cal')
+        replace = list(source[start:start + 6])
+        replace[4] = replace[4].replace('_call', '_call_v2')
+        blocks.append(('\n'.join(search), '\n'.join(replace)))
+    return blocks
+
+
+def legacy_apply(content: str, blocks: list) -> tuple:
+    """이전 방식: 정확히 일치하면 str.replace, 아니면 모든 위치에서 strip 비교 (오타 블록은 버려짐)"""
+    applied = 0
+    for search, replace in blocks:
+        if search in content:
+            content = content.replace(search, replace, 1)
+            applied += 1
+            continue
+        search_lines = [line.strip() for line in search.split('\n') if line.strip()]
+        replace_lines = [line.strip() for line in replace.split('\n') if line.strip()]
+        content_lines = content.split('\n')
+        for i in range(len(content_lines) - len(search_lines) + 1):
+            if all(content_lines[i + j].strip() == line for j, line in enumerate(search_lines)):
+                content = '\n'.join(content_lines[:i] + replace_lines + content_lines[i + len(search_lines):])
+                applied += 1
+                break
+    return content, applied
+
+
+def main():
+    sizes = [int(n) for n in sys.argv[1].split(',')] if len(sys.argv) > 1 else [5000, 20000, 50000]
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 48
+
+    print(f"{'lines':>7} {'legacy':>10} {'matcher':>10} {'speedup':>8}  applied(legacy/matcher)")
+    for size in sizes:
+        source = generate_source(size)
+        content = '\n'.join(source)
+        blocks = make_blocks(source, count)
+
+        start = time.perf_counter()
+        _, legacy_applied = legacy_apply(content, blocks)
+        legacy = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _, results = apply_blocks(content, blocks)
+        current = time.perf_counter() - start
+
+        applied = sum(result.applied for result in results)
+        print(f"{size:>7} {legacy * 1000:>7.1f} ms {current * 1000:>7.1f} ms {legacy / current:>7.1f}x"
+              f"  {legacy_applied}/{applied}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+대량 파일 로딩 벤치마크 - 순차 add_single_file vs BulkLoader
+
+tests/fixtures가 있으면 그 파일들을, 없으면 합성 fixture를 N배 복제하여 측정한다.
+실행: python tests/benchmarks/bench_bulk_load.py [복제 수(기본 1000)]
+"""
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.bulk_loader import BulkLoader
+from actions.file_manager import FileManager
+
+FIXTURES_DIR = PROJECT_ROOT / 'tests' / 'fixtures'
+
+SYNTHETIC_FIXTURES = {
+    'ordss04s2050t01.c': (
+        '/* 주문 상품 그룹 조회 */\n#include <stdio.h>\n#include "pfmcom.h"\n#include "pfmdbio.h"\n'
+        '/* ---------------------- IO Formatter ---------------------- */\n#include "ordss04s2050t01_in.h"\n'
+        + ''.join(
+            f'static long b{i:03d}_proc(ordss04s2050t01_ctx_t *ctx)\n{{\n'
+            f'    /* 처리 단계 {i} */\n    PFM_DBG("단계 {i}");\n    return RC_NRM;\n}}\n'
+            for i in range(40))
+    ),
+    'ordss04s2050t01_in.h': (
+        '#ifndef ORDSS04S2050T01_IN_H\n#define ORDSS04S2050T01_IN_H\n'
+        'typedef struct {\n    char ord_no[20];\n    long qty;\n} ordss04s2050t01_in_t;\n#endif\n'
+    ),
+    'zord_order_s01.sql': (
+        '/* 주문 조회 */\nSELECT /*+ INDEX(A IX_ORD_01) */ A.ORD_NO, NVL(B.QTY, 0)\n'
+        '  FROM ZORD_ORDER A, ZORD_ITEM B\n WHERE A.ORD_NO = :ord_no\n   AND B.ORD_NO(+) = A.ORD_NO\n' * 20
+    ),
+    'ZORDSS0100.xml': (
+        '<?xml version="1.0" encoding="UTF-8"?>\n<screen id="ZORDSS0100">\n'
+        + ''.join(f'  <grid id="grd{i}"><column id="col{i}" text="주문{i}"/></grid>\n' for i in range(60))
+        + '  <script><![CDATA[ function fn_search() { return true; } ]]></script>\n</screen>\n'
+    ),
+}
+
+
+def build_tree(root: Path, copies: int):
+    """fixture 파일을 copies배 복제한 디렉토리 생성"""
+    sources = []
+    if FIXTURES_DIR.is_dir():
+        sources = [(p.name, p.read_bytes()) for p in FIXTURES_DIR.iterdir() if p.is_file()]
+    if not sources:
+        sources = [(name, text.encode('cp949')) for name, text in SYNTHETIC_FIXTURES.items()]
+
+    paths = []
+    for i in range(copies):
+        for name, data in sources:
+            path = root / f'{i:04d}_{name}'
+            path.write_bytes(data)
+            paths.append(str(path))
+    return paths
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000:9.1f} ms")
+    return elapsed
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    root = Path(tempfile.mkdtemp(prefix='coe_bulk_bench_'))
+    try:
+        paths = build_tree(root, copies)
+        total_mb = sum(Path(p).stat().st_size for p in paths) / (1024 * 1024)
+        print(f"{len(paths)} files, {total_mb:.1f} MB\n")
+
+        def sequential():
+            fm = FileManager()
+            for path in paths:
+                fm.add_single_file(path)
+
+        def bulk_threads():
+            BulkLoader(FileManager(), max_processes=0).load(paths)
+
+        def bulk_processes():
+            # 모든 파일을 프로세스 풀로 보내는 경우 (큰 파일 위주의 트리에 해당)
+            BulkLoader(FileManager(), process_threshold=1).load(paths)
+
+        base = timed('sequential add_single_file', sequential)
+        for label, func in [('bulk (threads)', bulk_threads), ('bulk (threads + processes)', bulk_processes)]:
+            elapsed = timed(label, func)
+            print(f"{'':<28} x{base / elapsed:.2f}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
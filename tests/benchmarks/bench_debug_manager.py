@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+턴당 디버그 출력 오버헤드 벤치마크 - 이전 DebugManager(기본 켜짐, f-string, Rich 콘솔) vs 지연 포맷 로거
+
+한 턴에서 나오는 디버그 호출(프롬프트 메시지 순회, 레포맵, 코더 파싱 로그)을 흉내 내어 턴당 시간을 비교한다.
+콘솔 출력은 StringIO로 보내므로 원격 터미널에서는 이전 방식의 실제 비용이 더 크다.
+실행: python tests/benchmarks/bench_debug_manager.py [턴 수(기본 50)] [컨텍스트 파일 KB(기본 200)]
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from rich.console import Console
+
+from cli.core.debug_manager import DebugManager
+
+
+class LegacyDebugManager:
+    """이전 구현: 호출 전에 f-string을 만들고, 켜져 있으면 Rich로 바로 출력"""
+    enabled = True
+    console = Console(file=io.StringIO(), width=120)
+
+    @classmethod
+    def out(cls, label: str, message: str):
+        if cls.enabled:
+            cls.console.print(f"[dim][{label}] {message}[/dim]")
+
+    @classmethod
+    def prompt_content(cls, title: str, content: str, max_length: int = 500):
+        if cls.enabled:
+            cls.console.print(f"[green dim][Prompt DEBUG][/green dim] [dim]{title}:[/dim]")
+            cls.console.print(f"[dim]{content[:max_length]}...[truncated, total: {len(content)} chars][/dim]")
+
+
+def make_messages(file_kb: int) -> list:
+    content = ''.join(f'    rc = a{i:05d}_proc(ctx, &in, &out);  /* 처리 */\n' for i in range(file_kb * 1024 // 48))
+    return [{'role': 'system', 'content': 'You are an expert AI software developer.' * 20},
+            {'role': 'system', 'content': 'File: zordss0100.c\n```\n' + content + '```'},
+            {'role': 'user', 'content': 'rc 체크 추가해줘'}]
+
+
+def legacy_turn(messages: list, response: str, symbols: list):
+    log = LegacyDebugManager
+    log.out('Prompt DEBUG', f"전체 프롬프트 메시지 수: {len(messages)}")
+    for i, msg in enumerate(messages):
+        log.out('Prompt DEBUG', f"Message {i+1} [{msg['role']}]: {len(msg['content'])} chars")
+        log.prompt_content(f"Message {i+1} [{msg['role']}] 내용", msg['content'], max_length=200)
+    for i in range(40):
+        log.out('RepoMap DEBUG', f"분석 중: file{i}.c ({len(messages[1]['content'])} chars)")
+        log.out('RepoMap DEBUG', f"중요 심볼 {len(symbols)}개 추출: {symbols[:5]}...")
+    log.out('LLM DEBUG', f"LLM 응답 길이: {len(response)}")
+    log.out('LLM DEBUG', f"LLM 응답 미리보기: {response[:200]}...")
+    for i in range(20):
+        log.out('INFO DEBUG', f"[EditBlock] 블록 {i+1} 교체 성공 (exact, {i * 10}행, 유사도 {1.0:.2f})")
+
+
+def current_turn(messages: list, response: str, symbols: list):
+    log = DebugManager
+    if log.enabled('prompt'):
+        log.prompt("전체 프롬프트 메시지 수: %s", len(messages))
+        for i, msg in enumerate(messages):
+            log.prompt("Message %s [%s]: %s chars", i+1, msg['role'], len(msg['content']))
+            log.prompt_content(f"Message {i+1} [{msg['role']}] 내용", msg['content'], max_length=200)
+    for i in range(40):
+        log.repo_map("분석 중: %s (%s chars)", f'file{i}.c', len(messages[1]['content']))
+        log.repo_map("중요 심볼 %s개 추출: %s...", len(symbols), symbols[:5])
+    log.llm("LLM 응답 길이: %s", len(response))
+    log.llm("LLM 응답 미리보기: %s...", response[:200])
+    for i in range(20):
+        log.info("[EditBlock] 블록 %s 교체 성공 (%s, %s행, 유사도 %.2f)", i + 1, 'exact', i * 10, 1.0)
+
+
+def measure(turn, turns: int, messages: list, response: str) -> float:
+    symbols = [f'a{i:05d}_proc' for i in range(2000)]
+    start = time.perf_counter()
+    for _ in range(turns):
+        turn(messages, response, symbols)
+    return (time.perf_counter() - start) / turns
+
+
+def main():
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    file_kb = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    messages = make_messages(file_kb)
+    response = 'zordss0100.c\n<<<<<<< SEARCH\n' + messages[1]['content'][:4000]
+
+    results = []
+    LegacyDebugManager.enabled = True
+    results.append(('이전 (기본 켜짐, 콘솔)', measure(legacy_turn, turns, messages, response)))
+    LegacyDebugManager.enabled = False
+    results.append(('이전 (꺼짐, f-string은 생성)', measure(legacy_turn, turns, messages, response)))
+
+    DebugManager.configure('off')
+    results.append(('현재 (기본 꺼짐)', measure(current_turn, turns, messages, response)))
+    with tempfile.TemporaryDirectory() as directory:
+        DebugManager.configure('debug', os.path.join(directory, 'debug.log'))
+        results.append(('현재 (켜짐, 파일 기록)', measure(current_turn, turns, messages, response)))
+        DebugManager.flush()
+    DebugManager.configure('off')
+
+    baseline = results[0][1]
+    print(f"턴 {turns}회, 컨텍스트 파일 {file_kb}KB")
+    for label, seconds in results:
+        print(f"  {label:<28} {seconds * 1000:>9.3f} ms/턴  ({baseline / seconds:>7.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
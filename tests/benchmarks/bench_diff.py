@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+미리보기 diff 벤치마크 - difflib 3회(텍스트 diff/시각적 diff/변경 요약) vs line_diff 1회 계산 공유
+
+반복되는 줄이 많은 C 소스를 생성하고 곳곳을 수정한 뒤 미리보기 + 요약 생성 시간을 비교한다.
+실행: python tests/benchmarks/bench_diff.py [줄 수(쉼표 구분, 기본 5000,20000,50000)] [수정 수(기본 200)]
+"""
+import difflib
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.line_diff import compute_diff, diff_opcodes
+
+FUNCTION_BODY = [
+    '{\n',
+    '    long rc = RC_NRM;\n',
+    '\n',
+    '    PFM_TRY(rc);\n',
+    '    if (rc != RC_NRM) {\n',
+    '        return rc;\n',
+    '    }\n',
+    '\n',
+    '    return RC_NRM;\n',
+    '}\n',
+    '\n',
+]
+
+
+def generate_source(lines: int) -> list:
+    """함수 본문이 거의 같은 대형 C 소스 (반복 줄이 대부분)"""
+    source = []
+    i = 0
+    while len(source) < lines:
+        source.append(f'static long b{i:05d}_proc(ctx_t *ctx)\n')
+        source.extend(FUNCTION_BODY)
+        i += 1
+    return source[:lines]
+
+
+def mutate(source: list, edits: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    result = list(source)
+    for n in range(edits):
+        position = rng.randrange(len(result))
+        choice = rng.random()
+        if choice < 0.4:
+            result[position] = f'    PFM_DBG("수정 {n}");\n'
+        elif choice < 0.7:
+            result.insert(position, '    rc = RC_NRM;\n')
+        else:
+            del result[position]
+    return result
+
+
+def legacy_preview(original: str, new: str):
+    """이전 방식: generate_diff, generate_visual_diff, _analyze_changes가 각각 unified_diff 실행"""
+    a, b = original.splitlines(keepends=True), new.splitlines(keepends=True)
+    list(difflib.unified_diff(a, b, 'f (original)', 'f (modified)', lineterm=''))
+    list(difflib.unified_diff(a, b, 'f (original)', 'f (modified)', lineterm='', n=3))
+    list(difflib.unified_diff(original.splitlines(), new.splitlines(), lineterm=''))
+
+
+def new_preview(original: str, new: str):
+    diff = compute_diff(original, new)
+    diff.unified('f (original)', 'f (modified)')
+    diff.unified('f (original)', 'f (modified)', n=3)
+    diff.added_lines()
+    diff.removed_lines()
+
+
+def changed_lines(opcodes) -> int:
+    return sum(max(i2 - i1, j2 - j1) for tag, i1, i2, j1, j2 in opcodes if tag != 'equal')
+
+
+def main():
+    sizes = [int(n) for n in sys.argv[1].split(',')] if len(sys.argv) > 1 else [5000, 20000, 50000]
+    edits = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    print(f"{'lines':>7} {'difflib x3':>12} {'line_diff':>12} {'speedup':>8}  changed(difflib/line_diff)")
+    for size in sizes:
+        source = generate_source(size)
+        original, new = ''.join(source), ''.join(mutate(source, edits))
+
+        start = time.perf_counter()
+        legacy_preview(original, new)
+        legacy = time.perf_counter() - start
+
+        compute_diff.cache_clear()
+        start = time.perf_counter()
+        new_preview(original, new)
+        current = time.perf_counter() - start
+
+        a, b = original.splitlines(keepends=True), new.splitlines(keepends=True)
+        legacy_changed = changed_lines(difflib.SequenceMatcher(None, a, b).get_opcodes())
+        current_changed = changed_lines(diff_opcodes(a, b))
+        print(f"{size:>7} {legacy * 1000:>9.1f} ms {current * 1000:>9.1f} ms {legacy / current:>7.1f}x"
+              f"  {legacy_changed}/{current_changed}")
+
+
+if __name__ == '__main__':
+    main()
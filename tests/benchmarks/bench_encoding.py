@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+인코딩 감지 벤치마크 - 전체 파일 charset_normalizer 감지 vs 단계별 감지
+
+실행: python tests/benchmarks/bench_encoding.py [크기(MB)]
+"""
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.encoding_detector import EncodingDetector
+
+try:
+    from charset_normalizer import from_bytes
+except ImportError:
+    from_bytes = None
+
+C_BLOCK = (
+    '/* 주문 상품 그룹 조회 - 입력 데이터 검증 */\n'
+    'static long b000_input_validation(ordss04s2050t01_ctx_t *ctx)\n'
+    '{\n'
+    '    PFM_DBG("입력 검증 시작 [%s]", ctx->in->svc_cd);\n'
+    '    return RC_NRM;\n'
+    '}\n'
+)
+
+
+def legacy_decode(raw_data: bytes):
+    """기존 방식: 전체 파일 감지 후 인코딩 목록 순차 시도"""
+    detected_encoding = None
+    if from_bytes:
+        best_match = from_bytes(raw_data).best()
+        if best_match and best_match.encoding:
+            detected_encoding = best_match.encoding
+    encodings_to_try = ([detected_encoding] if detected_encoding else []) + ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr', 'shift_jis']
+    for enc in encodings_to_try:
+        try:
+            return raw_data.decode(enc), enc
+        except Exception:
+            continue
+    return raw_data.decode('utf-8', errors='replace'), 'utf-8 (fallback with replace)'
+
+
+def build_samples(size_mb: float):
+    """UTF-8 / CP949 / 혼합(대부분 ASCII + 끝부분 CP949) 샘플 생성"""
+    repeat = max(1, int(size_mb * 1024 * 1024 / len(C_BLOCK.encode('utf-8'))))
+    text = C_BLOCK * repeat
+    ascii_body = text.replace('주문 상품 그룹 조회 - 입력 데이터 검증', 'order product group').replace('입력 검증 시작', 'validate')
+    return {
+        'utf-8': text.encode('utf-8'),
+        'cp949': text.encode('cp949'),
+        'mixed': ascii_body.encode('ascii') + C_BLOCK.encode('cp949'),
+    }
+
+
+def timed(func, *args, repeat=3):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 4
+    samples = build_samples(size_mb)
+
+    print(f"{'sample':<8} {'size':>10} {'legacy':>10} {'tiered':>10} {'cached':>10}  encoding")
+    for name, raw in samples.items():
+        legacy_time, _ = timed(legacy_decode, raw, repeat=1)
+
+        detector = EncodingDetector()
+        tiered_time, (_, encoding) = timed(lambda: EncodingDetector().decode(raw))
+
+        # 경로 + mtime 캐시 적중 시나리오 (재로드)
+        stat_result = type('Stat', (), {'st_mtime_ns': 1, 'st_size': len(raw)})()
+        detector.decode(raw, f'/bench/{name}', stat_result)
+        cached_time, _ = timed(detector.decode, raw, f'/bench/{name}', stat_result)
+
+        print(f"{name:<8} {len(raw):>10,} {legacy_time * 1000:>8.1f}ms {tiered_time * 1000:>8.1f}ms {cached_time * 1000:>8.1f}ms  {encoding}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+SQL 구조 분석 벤치마크 - 기존 다중 패스 분석 vs 단일 패스 토크나이저
+
+대용량 PL/SQL 패키지(합성)를 대상으로 측정한다.
+실행: python tests/benchmarks/bench_sql_tokenizer.py [크기(MB)]
+"""
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.sql_tokenizer import extract_sql_features
+
+PROCEDURE = """
+  /* 주문 상품 그룹 조회 - 프로시저 {n} */
+  PROCEDURE p_get_order_{n}(p_ord_no IN VARCHAR2, p_cur OUT SYS_REFCURSOR) IS
+    v_fmt  VARCHAR2(20) := 'YYYYMMDD HH24:MI:SS';
+    v_cnt  NUMBER := 0;
+  BEGIN
+    -- 유효 주문 건수 확인 :not_a_bind
+    SELECT /*+ INDEX(A IX_ZORD_ORDER_01) */ COUNT(*)
+      INTO v_cnt
+      FROM ZORD.ZORD_ORDER A
+     WHERE A.ORD_NO = :ord_no
+       AND A.EFF_END_DTM = '99991231235959';
+
+    OPEN p_cur FOR
+      SELECT A.ORD_NO, TO_CHAR(A.REG_DTM, v_fmt) AS REG_DTM
+           , NVL(B.ORD_QTY, 0) AS ORD_QTY
+           , DECODE(B.ITEM_STAT_CD, '01', '정상', '해지') AS STAT_NM
+        FROM ZORD_ORDER A, ZORD_ITEM B, ZPRD_MST@PRD_LINK C
+       WHERE A.ORD_NO = :ord_no
+         AND B.ORD_NO(+) = A.ORD_NO
+         AND C.PRD_ID = B.PRD_ID
+         AND A.REG_DTM BETWEEN TO_DATE(:from_dt, 'YYYYMMDD') AND SYSDATE;
+  EXCEPTION
+    WHEN OTHERS THEN
+      RAISE_APPLICATION_ERROR(-20001, 'p_get_order_{n}: ' || SQLERRM);
+  END p_get_order_{n};
+"""
+
+
+def legacy_analyze(content):
+    """기존 FileManager._analyze_sql_file_structure"""
+    sql_features = {'hints': [], 'bind_variables': [], 'table_aliases': [], 'outer_joins': [],
+                    'oracle_functions': [], 'table_names': []}
+    lines = content.splitlines()
+    content_upper = content.upper()
+    hints = re.findall(r'/\*\+([^*]+)\*/', content)
+    sql_features['hints'] = [hint.strip() for hint in hints]
+    content_no_line_comments = re.sub(r'--.*$', '', content, flags=re.MULTILINE)
+    content_no_comments = re.sub(r'/\*.*?\*/', '', content_no_line_comments, flags=re.DOTALL)
+    sql_features['bind_variables'] = list(set(re.findall(r':(\w+)', content_no_comments)))
+    if '(+)' in content:
+        sql_features['outer_joins'] = ['Oracle outer join syntax detected']
+    for func in ['NVL', 'TO_CHAR', 'SYSDATE', 'TO_DATE', 'DECODE', 'CASE']:
+        if func in content_upper:
+            sql_features['oracle_functions'].append(func)
+    validity_patterns = []
+    if '99991231235959' in content:
+        validity_patterns.append('99991231235959 (timestamp format)')
+    if '99991231' in content:
+        validity_patterns.append('99991231 (date format)')
+    sql_features['validity_patterns'] = validity_patterns
+    for line in lines:
+        line_stripped = line.strip()
+        if 'from' in line_stripped.lower() or 'join' in line_stripped.lower():
+            for match in re.findall(r'(\w+)\s+(\w+)(?:\s|$|,)', line_stripped, re.IGNORECASE):
+                if len(match[1]) <= 4:
+                    sql_features['table_aliases'].append(f"{match[0]} as {match[1]}")
+    return sql_features
+
+
+def timed(label, func, content):
+    start = time.perf_counter()
+    result = func(content)
+    elapsed = time.perf_counter() - start
+
+    # 분석 중 추가로 할당한 메모리 최대치 (별도 실행으로 측정하여 시간 측정에 영향 없음)
+    tracemalloc.start()
+    func(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:<22} {elapsed * 1000:9.1f} ms  peak {peak / (1024 * 1024):7.1f} MB  "
+          f"binds={sorted(result['bind_variables'])}")
+    return elapsed
+
+
+def main():
+    size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 8
+    body = []
+    n = 0
+    while sum(map(len, body)) < size_mb * 1024 * 1024:
+        body.append(PROCEDURE.format(n=n))
+        n += 1
+    content = 'CREATE OR REPLACE PACKAGE BODY pkg_zord_order AS\n' + ''.join(body) + 'END pkg_zord_order;\n'
+    print(f"{n} procedures, {len(content) / (1024 * 1024):.1f} MB\n")
+
+    legacy = timed('legacy (multi-pass)', legacy_analyze, content)
+    tokenizer = timed('tokenizer (1 pass)', extract_sql_features, content)
+    print(f"\nx{legacy / tokenizer:.2f}")
+
+
+if __name__ == '__main__':
+    main()
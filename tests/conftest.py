@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+테스트 공용 대역 - LLM 백엔드 대신 쓰는 FakeLLMService와 분석기/소스 도우미
+
+분석 작업(/jobs), 헤드리스 일괄 분석, 데몬 테스트가 같은 대역을 쓴다.
+"""
+import io
+import sys
+import threading
+from pathlib import Path
+
+from rich.console import Console
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+C_SOURCE = 'long a000_init_proc(void)\n{\n    return 0;\n}\n'
+ANALYSIS_REPLY = '{"purpose": "초기화"}'
+
+
+class FakeLLMService:
+    """받은 요청을 기록하고 정해진 응답을 돌려주는 LLM 대역 (여러 스레드에서 호출 가능)"""
+
+    def __init__(self, fail=(), gate=None, barrier=None, reply=None):
+        self.fail = set(fail)    # 마지막 메시지에 이 문자열이 있으면 실패(None) 응답
+        self.gate = gate         # threading.Event - 테스트가 열어줄 때까지 응답 대기
+        self.barrier = barrier   # threading.Barrier - 워커 수만큼 동시에 호출되어야 통과
+        self.reply = reply       # 호출 순번 -> 응답 내용 (없으면 파일 분석 JSON)
+        self.calls = []
+        self.session_id = None
+        self.lock = threading.Lock()
+
+    @property
+    def prompts(self):
+        return [messages[-1]['content'] for messages in self.calls]
+
+    def chat_completion(self, messages, **kwargs):
+        with self.lock:
+            self.calls.append(messages)
+            count = len(self.calls)
+        if self.gate is not None:
+            self.gate.wait(10)
+        if self.barrier is not None:
+            self.barrier.wait()
+        if any(name in messages[-1]['content'] for name in self.fail):
+            return None
+        self.session_id = 'session-1'
+        content = self.reply(count) if self.reply else ANALYSIS_REPLY
+        return {'choices': [{'message': {'content': content}}]}
+
+    def get_session_id(self):
+        return self.session_id
+
+    def reset_session(self):
+        self.session_id = None
+
+
+def make_analyzer(llm):
+    """화면 출력을 버리고 LLM 대역을 쓰는 CoeAnalyzer"""
+    from cli.core.analyzer import CoeAnalyzer
+    analyzer = CoeAnalyzer()
+    analyzer.llm_service = llm
+    analyzer.console = Console(file=io.StringIO())
+    return analyzer
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+체크포인트 분석 작업(/jobs) 파일별 기록 / 중단 후 이어서 실행 / 취소 테스트
+"""
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from cli.core.analysis_jobs import AnalysisJob, JobManager
+from tests.conftest import C_SOURCE, FakeLLMService, make_analyzer
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    src = tmp_path / 'src'
+    src.mkdir()
+    for i in range(4):
+        (src / f'zordss{i:04d}.c').write_text(C_SOURCE.replace('a000', f'a{i:03d}'), encoding='utf-8')
+    return src
+
+
+def test_job_records_each_file_and_finishes(sources, tmp_path):
+    llm = FakeLLMService(fail=['zordss0003'])
+    manager = JobManager(jobs_dir=str(tmp_path / 'jobs'), analyzer_factory=lambda: make_analyzer(llm))
+
+    job = manager.start(['src'], workers=2)
+    manager.wait(job.job_id, 30)
+
+    progress = manager.load(job.job_id[:4]).progress()
+    assert progress['status'] == 'done'
+    assert (progress['total'], progress['done'], progress['errors'], progress['remaining']) == (4, 3, 1, 1)
+    assert list(progress['failed_files']) == [str(sources / 'zordss0003.c')]
+    assert [finished['job_id'] for finished in manager.pop_finished()] == [job.job_id]
+    assert manager.pop_finished() == []
+
+    results = job.results(make_analyzer(llm))
+    assert len(results['files']) == 3
+    assert results['files'][str(sources / 'zordss0000.c')]['llm_analysis'] == {'purpose': '초기화'}
+    assert list(results['errors']) == [str(sources / 'zordss0003.c')]
+
+
+def test_interrupted_job_resumes_pending_and_failed_files(sources, tmp_path):
+    jobs_dir = tmp_path / 'jobs'
+    job = AnalysisJob.create(['src'], jobs_dir=str(jobs_dir))
+    files = job.meta['files']
+    # 실행하던 프로세스가 죽은 상태: 실행 중 기록, 파일 두 개 기록, 마지막 줄은 쓰다 만 상태
+    job.meta.update(status='running', pid=2 ** 22 + 12345)
+    job.save()
+    with open(job.journal.path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'type': 'file', 'file': files[0], 'status': 'ok',
+                            'llm_analysis': {'purpose': '이전 결과'}}) + '\n')
+        f.write(json.dumps({'type': 'file', 'file': files[1], 'status': 'error', 'error': 'timeout'}) + '\n')
+        f.write('{"type": "file", "file": "' + files[2])
+
+    llm = FakeLLMService()
+    manager = JobManager(jobs_dir=str(jobs_dir), analyzer_factory=lambda: make_analyzer(llm))
+    assert manager.list_jobs()[0]['status'] == 'interrupted'
+    assert manager.load(job.job_id).pending_files() == files[1:]
+
+    manager.resume(job.job_id)
+    manager.wait(job.job_id, 30)
+
+    resumed = manager.load(job.job_id)
+    records = resumed.latest_records()
+    assert resumed.status == 'done'
+    assert all(record['status'] == 'ok' for record in records.values()) and len(records) == 4
+    assert records[files[0]]['llm_analysis'] == {'purpose': '이전 결과'}
+    assert len(llm.prompts) == 3 and not any('zordss0000' in prompt for prompt in llm.prompts)
+
+
+def test_cancel_stops_after_current_file_and_can_resume(sources, tmp_path):
+    gate = threading.Event()
+    llm = FakeLLMService(gate=gate)
+    manager = JobManager(jobs_dir=str(tmp_path / 'jobs'), analyzer_factory=lambda: make_analyzer(llm))
+
+    job = manager.start(['src'], workers=1)
+    with pytest.raises(ValueError):
+        manager.resume(job.job_id)  # 실행 중인 작업은 다시 시작하지 않음
+    assert manager.cancel(job.job_id)
+    gate.set()
+    manager.wait(job.job_id, 30)
+
+    progress = manager.load(job.job_id).progress()
+    assert progress['status'] == 'cancelled'
+    assert progress['done'] == 1 and progress['remaining'] == 3
+    assert not manager.cancel(job.job_id)
+
+    manager.resume(job.job_id)
+    manager.wait(job.job_id, 30)
+    assert manager.load(job.job_id).progress()['done'] == 4
+
+
+def test_failing_analyzer_factory_marks_job_failed(sources, tmp_path):
+    def broken_factory():
+        raise RuntimeError('LLM 설정 없음')
+
+    manager = JobManager(jobs_dir=str(tmp_path / 'jobs'), analyzer_factory=broken_factory)
+    job = manager.start(['src'], workers=1)
+    manager.wait(job.job_id, 30)
+
+    progress = manager.load(job.job_id).progress()
+    assert progress['status'] == 'failed' and 'LLM 설정 없음' in progress['error']
+    assert not manager.is_active(job.job_id)
+    assert [finished['job_id'] for finished in manager.pop_finished()] == [job.job_id]
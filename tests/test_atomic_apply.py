@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+다중 파일 원자적 적용 / 중단 복구 테스트
+"""
+import os
+import stat
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.edit_journal import EditJournal
+from actions.file_editor import FileEditor, TEMP_SUFFIX
+
+
+def make_tree(tmp_path, count=3):
+    paths = []
+    for i in range(count):
+        path = tmp_path / 'src' / f'zord_s{i:02d}.sql'
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(f'SELECT {i} FROM DUAL', encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+def leftover_temp_files(tmp_path):
+    return [path for path in tmp_path.rglob('*') if path.name.endswith(TEMP_SUFFIX)]
+
+
+def test_apply_preserves_mode_and_records_history(tmp_path):
+    paths = make_tree(tmp_path)
+    os.chmod(paths[0], 0o750)
+    editor = FileEditor(str(tmp_path / 'backups'))
+
+    new_file = tmp_path / 'src' / 'sub' / 'zord_new.sql'
+    files = {str(path): f'SELECT 9 FROM {path.stem}' for path in paths}
+    files[str(new_file)] = 'SELECT 1 FROM ZORD_NEW'
+    operation = editor.apply_changes_from_dict(files, '전체 수정')
+
+    for file_path, content in files.items():
+        assert Path(file_path).read_text(encoding='utf-8') == content
+    assert stat.S_IMODE(os.stat(paths[0]).st_mode) == 0o750
+    assert not leftover_temp_files(tmp_path)
+    assert FileEditor(str(tmp_path / 'backups')).find_operation(operation.operation_id) is not None
+
+
+def test_failure_mid_apply_leaves_no_file_modified(tmp_path, monkeypatch):
+    """교체 도중 실패하면 이미 교체한 파일도 원래대로 되돌리고 히스토리에 남기지 않음"""
+    paths = make_tree(tmp_path)
+    new_file = tmp_path / 'src' / 'zord_new.sql'
+    editor = FileEditor(str(tmp_path / 'backups'))
+
+    real_replace = os.replace
+    calls = []
+
+    def failing_replace(src, dst):
+        calls.append(dst)
+        if len(calls) == 3:
+            raise OSError('디스크 오류')
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(os, 'replace', failing_replace)
+    files = {str(path): 'DELETE FROM ZORD_ORDER' for path in paths}
+    files[str(new_file)] = 'SELECT 1 FROM DUAL'
+    with pytest.raises(OSError):
+        editor.apply_changes_from_dict(files)
+    monkeypatch.setattr(os, 'replace', real_replace)
+
+    for i, path in enumerate(paths):
+        assert path.read_text(encoding='utf-8') == f'SELECT {i} FROM DUAL'
+    assert not new_file.exists()
+    assert not leftover_temp_files(tmp_path)
+    assert FileEditor(str(tmp_path / 'backups')).get_history() == []
+
+
+def test_interrupted_apply_is_recovered_on_next_start(tmp_path, monkeypatch):
+    """파일 교체 후 commit 전에 프로세스가 죽으면 다음 시작 시 적용 전 상태로 복구"""
+    paths = make_tree(tmp_path)
+    new_file = tmp_path / 'src' / 'zord_new.sql'
+    editor = FileEditor(str(tmp_path / 'backups'))
+
+    # 저널 commit 직전에 종료된 상황
+    monkeypatch.setattr(FileEditor, '_record_operation', lambda self, operation: None)
+    files = {str(path): 'DELETE FROM ZORD_ORDER' for path in paths}
+    files[str(new_file)] = 'SELECT 1 FROM DUAL'
+    editor.apply_changes_from_dict(files)
+    # 복구 전에 사용자가 한 파일을 다시 수정
+    paths[1].write_text('사용자가 직접 수정', encoding='utf-8')
+    monkeypatch.undo()
+
+    restarted = FileEditor(str(tmp_path / 'backups'))
+
+    assert paths[0].read_text(encoding='utf-8') == 'SELECT 0 FROM DUAL'
+    assert paths[1].read_text(encoding='utf-8') == '사용자가 직접 수정'  # 작업과 무관한 변경은 건드리지 않음
+    assert paths[2].read_text(encoding='utf-8') == 'SELECT 2 FROM DUAL'
+    assert not new_file.exists()
+    assert restarted.get_history() == []
+
+    # 복구는 한 번만
+    paths[0].write_text('DELETE FROM ZORD_ORDER', encoding='utf-8')
+    FileEditor(str(tmp_path / 'backups'))
+    assert paths[0].read_text(encoding='utf-8') == 'DELETE FROM ZORD_ORDER'
+
+
+def test_failed_commit_fails_the_apply(tmp_path, monkeypatch):
+    """commit 레코드를 쓰지 못하면 적용도 실패로 처리하고 파일을 되돌림 (다음 시작 때 되돌려지는 대신)"""
+    paths = make_tree(tmp_path)
+    editor = FileEditor(str(tmp_path / 'backups'))
+
+    real_append = EditJournal.append
+
+    def failing_append(self, record, sync=False):
+        if record.get('type') == 'operation':
+            raise OSError('디스크 가득 참')
+        return real_append(self, record, sync)
+
+    monkeypatch.setattr(EditJournal, 'append', failing_append)
+    with pytest.raises(OSError):
+        editor.apply_changes_from_dict({str(path): 'DELETE FROM ZORD_ORDER' for path in paths})
+    monkeypatch.undo()
+
+    for i, path in enumerate(paths):
+        assert path.read_text(encoding='utf-8') == f'SELECT {i} FROM DUAL'
+    assert editor.get_history() == []
+    assert not leftover_temp_files(tmp_path)
+
+
+def test_recovery_waits_for_apply_in_progress(tmp_path, monkeypatch):
+    """다른 FileEditor가 적용 중인 작업을 중단된 작업으로 보고 되돌리지 않음"""
+    paths = make_tree(tmp_path)
+    editor = FileEditor(str(tmp_path / 'backups'))
+    started = []
+    real_record = FileEditor._record_operation
+
+    def slow_commit(self, operation):
+        # 파일 교체는 끝났고 commit 전인 상태에서 두 번째 FileEditor 생성 (두 번째 REPL, warm_up 등)
+        thread = threading.Thread(target=lambda: started.append(FileEditor(str(tmp_path / 'backups'))))
+        thread.start()
+        thread.join(0.3)
+        assert thread.is_alive()  # 잠금을 기다리는 중
+        real_record(self, operation)
+        started.append(thread)
+
+    monkeypatch.setattr(FileEditor, '_record_operation', slow_commit)
+    operation = editor.apply_changes_from_dict({str(paths[0]): 'DELETE FROM ZORD_ORDER'})
+    monkeypatch.undo()
+    started[0].join(10)
+
+    assert paths[0].read_text(encoding='utf-8') == 'DELETE FROM ZORD_ORDER'
+    assert started[1].find_operation(operation.operation_id) is not None
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+헤드리스 일괄 분석(coe.py analyze) 수집 / 병렬 실행 / NDJSON 이어하기 테스트
+"""
+import io
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from cli.core.batch_analysis import collect_files, main, run
+from tests.conftest import C_SOURCE, FakeLLMService, make_analyzer
+
+
+def make_sources(root: Path, count: int) -> Path:
+    src = root / 'src'
+    (src / 'sub').mkdir(parents=True)
+    (src / '.hidden').mkdir()
+    for i in range(count):
+        (src / f'zordss{i:04d}.c').write_text(C_SOURCE.replace('a000', f'a{i:03d}'), encoding='utf-8')
+    (src / 'sub' / 'query.sql').write_text('SELECT 1 FROM dual;\n', encoding='utf-8')
+    (src / 'readme.txt').write_text('문서\n', encoding='utf-8')
+    (src / '.hidden' / 'skip.c').write_text(C_SOURCE, encoding='utf-8')
+    return src
+
+
+def read_records(path: Path) -> dict:
+    return {record['file']: record for record in map(json.loads, path.read_text(encoding='utf-8').splitlines())}
+
+
+def test_collect_files_filters_directories_and_expands_globs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    make_sources(tmp_path, 2)
+    files = collect_files(['src', 'src/*.txt', 'src/zordss0000.c'])
+    assert files == ['src/zordss0000.c', 'src/zordss0001.c', 'src/sub/query.sql', 'src/readme.txt']
+
+
+def test_workers_analyze_concurrently_and_stream_ndjson(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    make_sources(tmp_path, 3)
+    llm = FakeLLMService(fail=['zordss0002'], barrier=threading.Barrier(3, timeout=10))
+    output = tmp_path / 'out.ndjson'
+
+    code = run(['src/*.c'], str(output), workers=3, analyzer=make_analyzer(llm), progress=io.StringIO())
+
+    records = read_records(output)
+    assert code == 1  # 오류가 난 파일이 있으면 실패 코드
+    assert records['src/zordss0000.c']['status'] == 'ok'
+    assert records['src/zordss0000.c']['llm_analysis'] == {'purpose': '초기화'}
+    assert records['src/zordss0002.c']['status'] == 'error'
+    assert records['src/zordss0002.c']['basic_analysis']  # LLM이 실패해도 기본 분석은 남김
+
+
+def test_resume_skips_finished_files_and_retries_errors(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    make_sources(tmp_path, 3)
+    output = tmp_path / 'out.ndjson'
+    output.write_text(
+        json.dumps({'file': 'src/zordss0000.c', 'status': 'ok', 'llm_analysis': {'purpose': '이전 결과'}}) + '\n'
+        + json.dumps({'file': 'src/zordss0001.c', 'status': 'error', 'error': 'timeout'}) + '\n'
+        + '{"file": "src/zordss0002.c", "sta', encoding='utf-8')  # 기록 도중 중단된 줄
+    llm = FakeLLMService()
+
+    code = run(['src'], str(output), workers=2, resume=True, analyzer=make_analyzer(llm), progress=io.StringIO())
+
+    records = read_records(output)
+    assert code == 0
+    assert len(output.read_text(encoding='utf-8').splitlines()) == len(records) == 4
+    assert records['src/zordss0000.c']['llm_analysis'] == {'purpose': '이전 결과'}
+    assert all(record['status'] == 'ok' for record in records.values())
+    assert not any('zordss0000' in prompt for prompt in llm.prompts)
+
+
+def test_json_output_and_resume_requires_ndjson(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    make_sources(tmp_path, 2)
+    output = tmp_path / 'result.json'
+    assert run(['src'], str(output), use_llm=False, output_format='json',
+               analyzer=make_analyzer(FakeLLMService()), progress=io.StringIO()) == 0
+
+    result = json.loads(output.read_text(encoding='utf-8'))
+    assert set(result['files']) == {'src/sub/query.sql', 'src/zordss0000.c', 'src/zordss0001.c'}
+    assert result['summary']['file_types'] == {'sql_file': 1, 'c_file': 2}
+    assert result['errors'] == {}
+
+    with pytest.raises(SystemExit) as exit_info:
+        main(['src', '-o', 'result.json', '--resume'])
+    assert exit_info.value.code == 2
+    assert '--resume' in capsys.readouterr().err
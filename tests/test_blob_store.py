@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+내용 주소 기반 백업 저장소 테스트
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.blob_store import BlobStore, MAX_DELTA_DEPTH
+from actions.file_editor import FileEditor
+
+
+def make_source(lines=2000):
+    return ''.join(f'    rc = z{i:04d}_proc(&ctx, "{i}");\n' for i in range(lines))
+
+
+def test_dedup_and_delta_roundtrip(tmp_path):
+    """같은 내용은 한 번만 저장하고, 조금 바뀐 버전은 델타로 작게 저장"""
+    store = BlobStore(tmp_path / 'objects')
+    v1 = make_source().encode('utf-8')
+    v2 = v1.replace(b'z0100_proc', b'z0100_proc_v2')
+
+    d1 = store.put(v1)
+    assert store.put(v1) == d1
+    assert store.stats()['objects'] == 1
+
+    full_size = store.stats()['bytes']
+    d2 = store.put(v2, base=d1)
+    assert store.get(d2) == v2
+    assert store.references(d2) == [d1]
+    assert store.stats()['bytes'] - full_size < full_size / 4
+
+
+def test_delta_chain_depth_is_bounded(tmp_path):
+    """델타 체인이 MAX_DELTA_DEPTH를 넘으면 전체 내용으로 다시 저장"""
+    store = BlobStore(tmp_path / 'objects')
+    text = make_source(500)
+    digest = store.put_text(text)
+    for i in range(MAX_DELTA_DEPTH + 2):
+        text += f'/* {i} */\n'
+        digest = store.put_text(text, base=digest)
+    assert store.get_text(digest) == text
+    assert store.references(digest)  # 한계 이후 다시 델타 체인 시작
+    depth = 0
+    while store.references(digest):
+        digest = store.references(digest)[0]
+        depth += 1
+    assert depth <= MAX_DELTA_DEPTH
+
+
+def test_corrupted_blob_is_detected(tmp_path):
+    store = BlobStore(tmp_path / 'objects')
+    digest = store.put(b'SELECT 1 FROM DUAL')
+    other = store.put(b'SELECT 2 FROM DUAL')
+    os.replace(store._object_path(other), store._object_path(digest))
+    with pytest.raises(ValueError):
+        store.get(digest)
+
+
+def test_gc_keeps_delta_bases_of_live_history(tmp_path):
+    """GC는 히스토리가 참조하는 blob과 그 델타 base를 지우지 않음"""
+    target = tmp_path / 'zord_s01.c'
+    target.write_text(make_source(), encoding='utf-8')
+    backup_dir = tmp_path / 'backups'
+    editor = FileEditor(str(backup_dir))
+
+    first = editor.apply_changes_from_dict({str(target): make_source() + '/* 1 */\n'}, '첫 번째')
+    second = editor.apply_changes_from_dict({str(target): make_source() + '/* 2 */\n'}, '두 번째')
+    assert first.changes[0].new_blob == second.changes[0].original_blob  # 중복 저장 없음
+
+    # 최근 작업 하나만 남기고 정리 (남은 작업의 델타 base와 참조되지 않는 blob 구분)
+    editor = FileEditor(str(backup_dir))
+    orphan = editor.blobs.put(b'unreferenced')
+    assert editor.prune_history(1, dry_run=True)['removed_operations'] == 1
+    assert editor.find_operation(first.operation_id) is not None
+    result = editor.prune_history(1)
+
+    assert result['kept'] == 1 and result['removed_operations'] == 1 and result['removed_blobs'] >= 1
+    assert editor.find_operation(first.operation_id) is None
+    assert editor.find_operation(second.operation_id) is not None
+    assert not editor.blobs.exists(orphan)
+    # 두 번째 작업의 원본은 첫 번째 작업의 원본에 대한 델타이므로 함께 남아야 함
+    assert editor.blobs.exists(first.changes[0].original_blob)
+
+    assert editor.rollback_operation(second.operation_id)
+    assert target.read_text(encoding='utf-8') == make_source() + '/* 1 */\n'
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+SEARCH 블록 색인 매칭 테스트
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.file_editor import FileEditor
+from cli.coders.block_matcher import BlockMatcher, apply_blocks
+from cli.coders.editblock_coder import EditBlockCoder
+
+SOURCE = '\n'.join(
+    line
+    for i in range(300)
+    for line in (f'static long b{i:04d}_proc(ctx_t *ctx)', '{', '    long rc = RC_NRM;', '',
+                 f'    rc = z{i:04d}_call(ctx);', '    return rc;', '}', '')
+)
+
+
+def test_exact_and_whitespace_matches():
+    matcher = BlockMatcher(SOURCE)
+    match = matcher.find('    rc = z0120_call(ctx);\n    return rc;')
+    assert (match.kind, match.start) == ('exact', 120 * 8 + 4)
+
+    match = matcher.find('rc   = z0120_call(ctx);\n\treturn rc;')
+    assert (match.kind, match.start, match.end) == ('whitespace', 120 * 8 + 4, 120 * 8 + 6)
+
+
+def test_fuzzy_match_finds_near_miss_block():
+    """오타와 빠진 줄이 있어도 드문 줄 기준으로 위치를 찾아 치환"""
+    search = 'static long b0200_proc(ctx_t *ctx)\n{\n    long rc = RC_NRM\n    rc = z0200_call(ctx);\n    return rc;'
+    replace = 'static long b0200_proc(ctx_t *ctx)\n{\n    long rc = RC_NRM;\n\n    rc = z0200_call2(ctx);\n    return rc;'
+    content, results = apply_blocks(SOURCE, [(search, replace)])
+
+    assert results[0].applied and results[0].kind == 'fuzzy'
+    assert results[0].line == 200 * 8 + 1
+    assert 'z0200_call2(ctx)' in content
+    assert content.count('\n') == SOURCE.count('\n')
+
+
+def test_unrelated_block_is_not_applied_but_located():
+    search = 'static long b0050_proc(ctx_t *ctx)\n{\n    PFM_DBG("start");\n    long rc = RC_ERR;'
+    content, results = apply_blocks(SOURCE, [(search, 'x')])
+    assert content == SOURCE
+    assert not results[0].applied
+    assert results[0].line == 50 * 8 + 1
+    assert 0 < results[0].score < 0.9
+
+
+def test_blocks_apply_in_order_with_reindent():
+    """앞 블록의 결과를 찾는 블록은 순서대로, 들여쓰기가 다른 블록은 파일 들여쓰기로 치환"""
+    blocks = [
+        ('    rc = z0001_call(ctx);', '    rc = z0001_call_v2(ctx);'),
+        ('rc = z0001_call_v2(ctx);\nreturn rc;', 'rc = z0001_call_v2(ctx);\nif (rc != RC_NRM) {\n    return rc;\n}\nreturn rc;'),
+    ]
+    content, results = apply_blocks(SOURCE, blocks)
+    assert [result.applied for result in results] == [True, True]
+    assert '    if (rc != RC_NRM) {\n        return rc;\n    }\n    return rc;' in content
+
+
+def test_editblock_coder_uses_matcher(tmp_path):
+    coder = EditBlockCoder(FileEditor(str(tmp_path / 'backups')))
+    response = (
+        'zordss0100.c\n'
+        '<<<<<<< SEARCH\n'
+        '  rc = z0007_call(ctx);\n'
+        '=======\n'
+        '  rc = z0007_call(ctx);\n'
+        '  PFM_DBG("done");\n'
+        '>>>>>>> REPLACE\n'
+    )
+    files = coder.parse_response(response, {'zordss0100.c': SOURCE})
+    assert '    rc = z0007_call(ctx);\n    PFM_DBG("done");\n' in files['zordss0100.c']
+
+
+def test_editblock_coder_reports_missed_block_with_nearest_line(tmp_path):
+    coder = EditBlockCoder(FileEditor(str(tmp_path / 'backups')))
+    response = (
+        'zordss0100.c\n'
+        '<<<<<<< SEARCH\n'
+        '    rc = z0007_call(ctx);\n'
+        '=======\n'
+        '    rc = z0007_call(ctx, 0);\n'
+        '>>>>>>> REPLACE\n'
+        'zordss0100.c\n'
+        '<<<<<<< SEARCH\n'
+        '    ret = unknown_entry(ctx, handle, flags);\n'
+        '=======\n'
+        '    ret = 0;\n'
+        '>>>>>>> REPLACE\n'
+    )
+    files = coder.parse_response(response, {'zordss0100.c': SOURCE})
+    assert 'z0007_call(ctx, 0);' in files['zordss0100.c']
+    assert coder.block_stats == {'matched': 1, 'missed': 1}
+    assert [(f['file'], f['index'], f['kind'], f['search']) for f in coder.edit_failures] == \
+        [('zordss0100.c', 2, 'block', 'ret = unknown_entry(ctx, handle, flags);')]
+
+
+def test_editblock_coder_reports_block_without_target(tmp_path):
+    coder = EditBlockCoder(FileEditor(str(tmp_path / 'backups')))
+    response = '<<<<<<< SEARCH\n    rc = z0007_call(ctx);\n=======\n    rc = 0;\n>>>>>>> REPLACE\n'
+    assert coder.parse_response(response, {}) == {}
+    assert [(f['kind'], f['search']) for f in coder.edit_failures] == [('path', 'rc = z0007_call(ctx);')]
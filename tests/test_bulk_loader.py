@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+BulkLoader 병렬 로딩 테스트
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.bulk_loader import BulkLoader
+from actions.file_manager import FileManager
+
+C_SOURCE = '/* 주문 조회 */\n#include "pfmcom.h"\nlong a000_init_proc(void)\n{\n    return 0;\n}\n'
+SQL_SOURCE = 'SELECT A.ORD_NO\n  FROM ZORD_ORDER A\n WHERE A.ORD_NO = :ord_no\n'
+
+
+def _make_project(root: Path):
+    """주요 파일과 기타 파일이 섞인 프로젝트 생성"""
+    (root / 'src').mkdir()
+    (root / 'README.md').write_text('# readme\n')
+    (root / 'notes.txt').write_text('notes\n')
+    for i in range(5):
+        (root / 'src' / f'svc{i}.c').write_bytes(C_SOURCE.encode('cp949'))
+        (root / 'src' / f'q{i}.sql').write_text(SQL_SOURCE)
+
+
+def test_results_match_sequential_path(tmp_path):
+    """병렬 로드 결과가 add_single_file과 동일하고 입력 순서를 유지"""
+    _make_project(tmp_path)
+    paths = sorted(str(p) for p in (tmp_path / 'src').iterdir())
+
+    sequential = FileManager()
+    expected = [sequential.add_single_file(p) for p in paths]
+
+    fm = FileManager()
+    progress = []
+    results = BulkLoader(fm, max_processes=0).load(paths, lambda done, total, path: progress.append(done))
+
+    assert results == expected
+    assert list(fm.files.keys()) == list(sequential.files.keys())
+    assert fm.c_file_info == sequential.c_file_info
+    assert progress[-1] == len(paths)
+
+
+def test_large_files_use_process_pool(tmp_path):
+    """임계값 이상 파일은 프로세스 풀에서 처리해도 같은 결과"""
+    _make_project(tmp_path)
+    paths = sorted(str(p) for p in (tmp_path / 'src').iterdir())
+
+    expected = [FileManager().add_single_file(p) for p in paths]
+    fm = FileManager()
+    results = BulkLoader(fm, max_processes=2, process_threshold=1).load(paths)
+
+    assert results == expected
+    assert fm.files[str(tmp_path / 'src' / 'svc0.c')] == C_SOURCE
+
+
+def test_add_directory_keeps_primary_first_and_cap(tmp_path):
+    """주요 파일 우선 순서와 max_files 제한 유지"""
+    _make_project(tmp_path)
+
+    fm = FileManager()
+    fm.add_directory(str(tmp_path), max_files=10)
+
+    assert len(fm.files) == 10
+    assert all(p.endswith(('.c', '.sql')) for p in fm.files)
+
+
+def test_add_expands_glob(tmp_path):
+    """/add 글롭 패턴 확장"""
+    _make_project(tmp_path)
+
+    fm = FileManager()
+    result = fm.add([str(tmp_path / 'src' / '*.sql'), str(tmp_path / 'none' / '*.c')])
+
+    assert len(fm.files) == 5
+    assert all(p.endswith('.sql') for p in fm.files)
+    assert any('No files match' in m for m in result['messages'])
+
+
+def test_process_pool_does_not_fork():
+    """REPL의 다른 스레드가 잡은 락을 복사하지 않도록 fork 대신 forkserver/spawn 사용"""
+    from actions.bulk_loader import _make_process_pool
+
+    pool = _make_process_pool(1)
+    try:
+        assert pool._mp_context.get_start_method() in ('forkserver', 'spawn')
+    finally:
+        pool.shutdown()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+C 단일 패스 스캐너 동등성 테스트 - 기존 줄 단위 분석 결과와 비교
+"""
+import random
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.c_scanner import STANDARD_FUNCTIONS, scan_c_source
+from actions.file_manager import FileManager
+
+FIXTURES_DIR = PROJECT_ROOT / 'tests' / 'fixtures'
+
+
+def legacy_found_functions(content):
+    """기존 _analyze_c_file_structure의 함수 탐색"""
+    found_functions = {}
+    for i, line in enumerate(content.splitlines()):
+        for func_name, description in STANDARD_FUNCTIONS.items():
+            if func_name in line and ('(' in line or 'void' in line or 'int' in line):
+                found_functions[func_name] = {'description': description, 'line_number': i + 1}
+    return found_functions
+
+
+def legacy_includes(content):
+    """기존 _categorize_includes"""
+    categories = {'system': [], 'io_formatter': [], 'static_library': [], 'dbio_library': [], 'other': []}
+    current_section = 'other'
+    for line in content.split('\n'):
+        line = line.strip()
+        if 'IO Formatter' in line:
+            current_section = 'io_formatter'
+            continue
+        elif 'Static Library' in line:
+            current_section = 'static_library'
+            continue
+        elif 'DBIO Library' in line:
+            current_section = 'dbio_library'
+            continue
+        include_match = re.match(r'#include\s*[<"](.*?)[>"]', line)
+        if include_match:
+            include_file = include_match.group(1)
+            if include_file.startswith('pfm') or include_file.startswith('<'):
+                categories['system'].append(include_file)
+            else:
+                categories[current_section].append(include_file)
+    return categories
+
+
+def legacy_ctx_structs(content):
+    """기존 ctx 구조체 탐색"""
+    return [m.group(2) for m in re.finditer(r'typedef\s+struct\s+(\w*ctx\w*)\s+(\w+);', content, re.IGNORECASE)]
+
+
+def assert_equivalent(content):
+    fm = FileManager()
+    scan = scan_c_source(content)
+    basic = fm._analyze_c_file_structure(scan)
+    enhanced = fm._enhance_c_file_analysis(scan, basic)
+
+    assert list(basic['found_functions'].items()) == list(legacy_found_functions(content).items())
+    assert enhanced['includes'] == legacy_includes(content)
+    assert enhanced['io_structures']['context_structs'] == legacy_ctx_structs(content)
+
+
+EDGE_CASES = [
+    # 섹션 마커 + include가 같은 줄 (include 무시), 마커 우선순위
+    '/* IO Formatter */ #include "a_in.h"\n#include "pio_a_in.h"\n'
+    '/* Static Library ... DBIO Library */\n#include "lib.h"\n',
+    '/* DBIO Library ... IO Formatter */\n#include "x.h"\n#include <stdio.h>\n#include "pfmcom.h"\n',
+    # 한 줄에 여러 표준 함수, 같은 함수 여러 번 (마지막 줄 번호)
+    'z999_err_exit_proc(); a000_init_proc();\nlong a000_init_proc(void)\n{\n}\n',
+    'c000_main_proc\nstatic int c000_main_proc;\n',
+    # ctx typedef - 줄 시작, 여러 줄, 대소문자, 마커 줄
+    'typedef struct my_ctx_s my_ctx_t;\nTYPEDEF STRUCT A_CTX_S\n  a_ctx_t;\n',
+    'typedef struct x_ctx_s x_ctx_t; /* IO Formatter */\n#include "y.h"\n',
+    # CRLF, form feed, 빈 파일, 닫히지 않은 include
+    '#include "a.h"\r\n\x0clong b000_input_validation(void)\r\n#include "broken.h\n',
+    '',
+    '   #include   <pfmdbio.h>  \n\t#include"tab.h"\n#includefoo\n',
+]
+
+
+@pytest.mark.parametrize('content', EDGE_CASES)
+def test_edge_cases_match_legacy(content):
+    """경계 사례에서 기존 분석 결과와 동일"""
+    assert_equivalent(content)
+
+
+def test_random_sources_match_legacy():
+    """무작위로 조합한 C 소스에서 기존 분석 결과와 동일"""
+    fragments = [
+        '#include "pio_ord_in.h"', '#include <stdio.h>', '  #include "pfmcom.h"', '#include "ordlib.h"',
+        '/* ---- IO Formatter ---- */', '/* Static Library */', '/* --- DBIO Library --- */',
+        'typedef struct ord_ctx_s ord_ctx_t;', 'typedef struct\n  Svc_Ctx_s\n  svc_ctx_t;',
+        'long a000_init_proc(void)', 'rc = c000_main_proc(ctx);', '/* b999_output_setting 참고 */',
+        'int z999_err_exit_proc', '{', '}', '', 'x000_mpfmoutq_proc z000_norm_exit_proc()', '\x0c',
+    ]
+    rng = random.Random(29)
+    for _ in range(300):
+        content = '\n'.join(rng.choice(fragments) for _ in range(rng.randint(0, 40)))
+        assert_equivalent(content)
+
+
+@pytest.mark.skipif(not FIXTURES_DIR.is_dir(), reason='tests/fixtures 없음')
+def test_fixtures_match_legacy():
+    """fixture C 파일들에서 기존 분석 결과와 동일"""
+    for path in FIXTURES_DIR.glob('*.c'):
+        raw = path.read_bytes()
+        content, _ = FileManager().encoding_detector.decode(raw)
+        assert_equivalent(content)
+
+
+def test_analyze_content_scans_each_file_once(monkeypatch):
+    """구조 분석/include 분류/ctx 탐색이 파일당 한 번의 스캔 결과를 공유 (내용 기준 캐시 없음)"""
+    import actions.c_scanner
+    import actions.file_manager
+    calls = []
+    monkeypatch.setattr(actions.file_manager, 'scan_c_source',
+                        lambda content: calls.append(1) or scan_c_source(content))
+    content = EDGE_CASES[0] + 'typedef struct ord_ctx_s ord_ctx_t;\nlong a000_init_proc(void)\n'
+
+    summary = FileManager().analyze_content('zordss0100.c', content)
+    assert calls == [1]
+    assert summary['analysis']['io_structures']['context_structs'] == ['ord_ctx_t']
+    assert not hasattr(actions.c_scanner, '_scan_cached')
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+백그라운드 데몬(Unix 소켓) 요청/응답 테스트
+"""
+import socket
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from cli.daemon import CoeDaemon, DaemonNotRunning, send_command, serve, socket_path
+from tests.conftest import C_SOURCE, FakeLLMService
+
+
+@pytest.fixture
+def running_daemon(tmp_path, monkeypatch):
+    monkeypatch.setenv('COE_FILE_WATCH', '0')
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'zordss0100.c').write_text(C_SOURCE, encoding='utf-8')
+    path = str(tmp_path / 'coe.sock')
+    llm = FakeLLMService(reply=lambda count: f'답변 {count}')
+    ready = threading.Event()
+    thread = threading.Thread(target=serve, args=(path, CoeDaemon(str(tmp_path), llm), ready), daemon=True)
+    thread.start()
+    assert ready.wait(10)
+    yield path, llm
+    if thread.is_alive():
+        send_command('shutdown', path=path, timeout=5)
+    thread.join(10)
+
+
+def test_state_persists_across_requests(running_daemon, tmp_path):
+    path, llm = running_daemon
+    added = send_command('add', ['zordss0100.c'], path=path)
+    assert added['ok'] and added['result']['files'] == 1
+
+    files = send_command('files', path=path)
+    assert files['result'] == [str(tmp_path / 'zordss0100.c')]
+    assert send_command('info', ['zordss0100.c'], path=path)['ok']
+
+    first = send_command('ask', ['rc', '체크', '추가'], path=path)
+    second = send_command('ask', ['다시'], path=path)
+    assert (first['output'], second['output']) == ('답변 1', '답변 2')
+    # 두 번째 요청에는 첫 번째 대화와 추가된 파일 내용이 함께 들어감
+    assert any('답변 1' in message['content'] for message in llm.calls[1])
+    assert any('a000_init_proc' in message['content'] for message in llm.calls[1])
+
+    assert send_command('ping', path=path)['result']['requests'] == 6
+
+
+def test_ask_waiting_for_llm_does_not_block_other_commands(running_daemon):
+    path, llm = running_daemon
+    llm.gate = threading.Event()
+    answers = []
+    asking = threading.Thread(target=lambda: answers.append(send_command('ask', ['질문'], path=path, timeout=10)))
+    asking.start()
+    try:
+        # LLM 응답을 기다리는 동안에도 상태 명령은 바로 처리
+        assert send_command('add', ['zordss0100.c'], path=path, timeout=2)['ok']
+        assert send_command('files', path=path, timeout=2)['ok']
+    finally:
+        llm.gate.set()
+        asking.join(10)
+    assert answers[0]['output'] == '답변 1'
+
+
+def test_llm_service_uses_one_http_session_per_thread():
+    from llm.service import LLMService
+    service = LLMService('http://localhost:1')
+    sessions = []
+    threads = [threading.Thread(target=lambda: sessions.append(service.http)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert service.http is service.http
+    assert len({id(session) for session in sessions + [service.http]}) == 4
+
+
+def test_errors_are_returned_without_stopping_daemon(running_daemon):
+    path, _ = running_daemon
+    unknown = send_command('bogus', path=path)
+    assert not unknown['ok'] and 'ask' in unknown['error']
+    assert not send_command('info', ['missing.c'], path=path)['ok']
+    assert send_command('ping', path=path)['ok']
+
+
+def test_shutdown_removes_socket(running_daemon):
+    path, _ = running_daemon
+    assert send_command('shutdown', path=path)['ok']
+    for _ in range(100):
+        if not Path(path).exists():
+            break
+        threading.Event().wait(0.05)
+    assert not Path(path).exists()
+    with pytest.raises(DaemonNotRunning):
+        send_command('ping', path=path)
+
+
+def test_stale_socket_is_replaced(tmp_path, monkeypatch):
+    monkeypatch.setenv('COE_FILE_WATCH', '0')
+    path = str(tmp_path / 'stale.sock')
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()  # 소켓 파일만 남은 상태 (비정상 종료)
+
+    ready = threading.Event()
+    thread = threading.Thread(target=serve, args=(path, CoeDaemon(str(tmp_path), FakeLLMService()), ready), daemon=True)
+    thread.start()
+    assert ready.wait(10)
+    assert send_command('ping', path=path)['ok']
+    send_command('shutdown', path=path)
+    thread.join(10)
+
+
+def test_long_project_paths_fall_back_to_temp_socket(monkeypatch):
+    monkeypatch.delenv('COE_DAEMON_SOCKET', raising=False)
+    path = socket_path('/' + 'x' * 200)
+    assert len(path) < 100 and path.endswith('.sock')
+    monkeypatch.setenv('COE_DAEMON_SOCKET', '/tmp/custom.sock')
+    assert socket_path() == '/tmp/custom.sock'
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+DebugManager 레벨 / 지연 포맷 / 파일 기록 테스트
+"""
+import io
+import sys
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from cli.core.debug_manager import DebugManager, format_message, parse_levels
+
+
+@pytest.fixture
+def console_output():
+    output = io.StringIO()
+    previous = DebugManager._console
+    DebugManager._console = Console(file=output, width=200)
+    yield output
+    DebugManager.configure('off')
+    DebugManager._console = previous
+
+
+def test_disabled_messages_are_never_formatted(console_output):
+    DebugManager.configure('off')
+
+    def expensive():
+        raise AssertionError('꺼져 있으면 호출되면 안 됨')
+
+    DebugManager.llm(expensive)
+    DebugManager.repo_map("%s", object())
+    DebugManager.prompt_content('제목', 'x' * 100000)
+    assert not DebugManager.is_debug_enabled()
+    assert console_output.getvalue() == ''
+
+
+def test_per_category_levels(console_output):
+    DebugManager.configure('llm,info=error,error')
+    DebugManager.llm("응답 길이: %d", 1234)
+    DebugManager.info("보이지 않음")           # info 카테고리는 error 레벨 이상만
+    DebugManager.repo_map("보이지 않음")       # 설정하지 않은 카테고리는 꺼짐
+    DebugManager.error(lambda: "파일 읽기 실패")
+    output = console_output.getvalue()
+    assert '응답 길이: 1234' in output and '파일 읽기 실패' in output
+    assert '보이지 않음' not in output
+    assert DebugManager.enabled('llm') and not DebugManager.enabled('prompt')
+
+
+def test_file_sink_writes_in_background(tmp_path, console_output):
+    log_path = tmp_path / 'logs' / 'debug.log'
+    DebugManager.configure(None, str(log_path))
+    DebugManager.repo_map("분석 중: %s (%d chars)", 'zordss0100.c', 5120)
+    DebugManager.prompt_content('Message 1', 'a' * 50, max_length=10)
+    DebugManager.flush()
+
+    text = log_path.read_text(encoding='utf-8')
+    assert '[RepoMap DEBUG] 분석 중: zordss0100.c (5120 chars)' in text
+    assert 'aaaaaaaaaa...[truncated, total: 50 chars]' in text
+    assert console_output.getvalue() == ''  # 파일로 보내면 콘솔에는 출력하지 않음
+
+
+def test_format_and_level_parsing():
+    assert format_message("%s개", (3,)) == '3개'
+    assert format_message("인자 개수 불일치 %s %s", (1,)) == '인자 개수 불일치 %s %s 1'
+    assert parse_levels('')['llm'] == parse_levels('off')['llm'] == 100
+    assert set(parse_levels('1').values()) == {10}
+    assert parse_levels('prompt=info')['prompt'] == 20
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+대용량 diff 페이지 뷰어 테스트
+"""
+import io
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from rich.console import Console
+from rich.panel import Panel
+
+from actions.file_editor import FileEditor
+from cli.ui.diff_viewer import DiffViewer
+
+
+def render(panels) -> str:
+    console = Console(width=200, record=True, file=io.StringIO())
+    for panel in panels:
+        console.print(panel)
+    return console.export_text()
+
+
+def body_lines(panels) -> int:
+    """파일 패널 본문 줄 수 (요약 패널 제외)"""
+    return sum(len(panel.renderable.plain.splitlines()) for panel in panels[1:] if isinstance(panel, Panel))
+
+
+def test_whole_file_rewrite_is_rendered_in_pages(tmp_path):
+    path = tmp_path / 'zordss0100.c'
+    path.write_text(''.join(f'long a{i:05d};\n' for i in range(20000)), encoding='utf-8')
+    editor = FileEditor(str(tmp_path / 'backups'))
+    preview = editor.preview_changes_from_dict({str(path): ''.join(f'long b{i:05d};\n' for i in range(20000))})
+
+    viewer = DiffViewer(preview, max_lines=30)
+    assert viewer.stats[str(path)].added == 20000
+    panels = viewer.render_page()
+    assert body_lines(panels) <= 30
+    assert '+20000' in viewer.summary()
+
+    assert viewer.next()
+    second = render(viewer.render_page())
+    assert '이후부터' in second
+    assert viewer.prev() and viewer.position == (0, 0)
+    assert not viewer.prev()
+
+
+def test_unchanged_regions_are_collapsed(tmp_path):
+    path = tmp_path / 'zord_s01.sql'
+    original = ''.join(f'line {i}\n' for i in range(1000))
+    path.write_text(original, encoding='utf-8')
+    new = original.replace('line 10\n', 'line ten\n').replace('line 500\n', 'line five hundred\n')
+    editor = FileEditor(str(tmp_path / 'backups'))
+    preview = editor.preview_changes_from_dict({str(path): new})
+
+    viewer = DiffViewer(preview, max_lines=40)
+    assert len(viewer.hunks) == 2
+    output = render(viewer.render_page())
+    assert '변경 없는 483줄' in output
+    assert '+line five hundred' in output
+    assert not viewer.next()
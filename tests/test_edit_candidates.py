@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+다중 후보 편집 생성 / 로컬 구문 검사 테스트
+"""
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.file_editor import FileEditor
+from actions.syntax_check import check_syntax, find_bracket_issues
+from cli.coders import editblock_coder, udiff_coder, wholefile_coder  # 레지스트리 등록
+from cli.coders.edit_candidates import CandidateRunner, candidate_strategies
+
+ORIGINAL = '#include "pfmcom.h"\n\nlong a000_init_proc(void)\n{\n    return RC_NRM;\n}\n'
+
+
+class ScriptedLLM:
+    """전략(시스템 프롬프트)별로 정해진 응답을 정해진 지연 후 돌려주는 LLM 대역"""
+
+    def __init__(self, replies):
+        self.replies = replies  # [(시스템 프롬프트에 포함된 문구, 지연 초, 응답)]
+        self.sessions = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def chat_completion(self, messages, use_session=True, **kwargs):
+        with self.lock:
+            self.sessions.append(use_session)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            for marker, delay, reply in self.replies:
+                if marker in messages[0]['content']:
+                    time.sleep(delay)
+                    return {'choices': [{'message': {'content': reply}}]}
+            return None
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def test_bracket_and_sql_checks_ignore_existing_problems():
+    assert find_bracket_issues('if (a) { x = "}"; /* ) */ }') == []
+    assert find_bracket_issues('if (a) { x = 1;\n') == ["1행: 닫히지 않은 '{'"]
+
+    assert check_syntax('zord_s01.sql', "SELECT (A FROM T").ok is False
+    original = "SELECT 'x FROM T"
+    assert check_syntax('zord_s01.sql', "SELECT 'y FROM T", original).ok
+    assert check_syntax('zord_s01.pc', 'long f() {\n', 'long f() {\n}\n').issues == ["1행: 닫히지 않은 '{'"]
+    assert check_syntax('readme.txt', '((').ok
+
+
+@pytest.mark.skipif(shutil.which('gcc') is None and shutil.which('cc') is None, reason='gcc 없음')
+def test_gcc_check_reports_only_new_errors():
+    broken = ORIGINAL.replace('return RC_NRM;', 'return RC_NRM')
+    # 헤더가 없어 RC_NRM 미정의 오류는 원본에도 있으므로 무시하고, 새 오류(세미콜론 누락)만 실패로 봄
+    assert check_syntax('zordss0100.c', ORIGINAL, ORIGINAL).ok
+    result = check_syntax('zordss0100.c', broken, ORIGINAL)
+    assert result.checker == 'gcc' and not result.ok
+
+
+def test_first_valid_candidate_wins(tmp_path):
+    editor = FileEditor(str(tmp_path / 'backups'))
+    fixed = ORIGINAL.replace('return RC_NRM;', 'PFM_DBG("init");\n    return RC_NRM;')
+    llm = ScriptedLLM([
+        ('REPLACE editing', 0.05, 'zordss0100.c\n<<<<<<< SEARCH\n    return RC_NRM;\n=======\n    return (RC_NRM;\n>>>>>>> REPLACE\n'),
+        ('UDIFF editing', 0.10, '```diff\n--- a/zordss0100.c\n+++ b/zordss0100.c\n@@ -5 +5,2 @@\n+    PFM_DBG("init");\n     return RC_NRM;\n```\n'),
+        ('WHOLEFILE editing', 1.0, 'zordss0100.c\n```c\n' + fixed + '```\n'),
+    ])
+    runner = CandidateRunner(llm, editor)
+    strategies = ['block', 'udiff', 'whole']
+    messages = [{'role': 'system', 'content': 'edit'}, {'role': 'user', 'content': '초기화 로그 추가'}]
+
+    start = time.perf_counter()
+    winner, results = runner.run(messages, {'zordss0100.c': ORIGINAL}, strategies)
+    elapsed = time.perf_counter() - start
+
+    assert winner.strategy == 'udiff'
+    assert winner.files['zordss0100.c'] == fixed
+    assert [result.valid for result in results] == [False, True]
+    assert '구문 검사 실패' in results[0].message
+    assert elapsed < 0.9  # 느린 후보를 기다리지 않음
+    assert llm.max_active == 3 and not any(llm.sessions)
+
+
+def test_candidate_strategies_rotate_from_current():
+    strategies = candidate_strategies(4, 'block')
+    assert strategies[0] == strategies[3] == 'block'
+    assert sorted(strategies[:3]) == ['block', 'udiff', 'whole']
+    assert candidate_strategies(3, 'whole', ['udiff']) == ['udiff', 'udiff', 'udiff']
+
+
+def test_candidates_parse_with_their_own_coder_instances(tmp_path):
+    from cli.coders.base_coder import registry
+    editor = FileEditor(str(tmp_path / 'backups'))
+    shared = registry.get_coder('block', editor)  # REPL 스레드가 쓰는 싱글톤
+    shared.block_stats = {'matched': 7, 'missed': 0}
+    reply = 'zordss0100.c\n<<<<<<< SEARCH\n    return RC_NRM;\n=======\n    PFM_DBG("init");\n    return RC_NRM;\n>>>>>>> REPLACE\n'
+    llm = ScriptedLLM([('REPLACE editing', 0.05, reply)])
+    messages = [{'role': 'system', 'content': 'edit'}, {'role': 'user', 'content': '초기화 로그 추가'}]
+
+    winner, _ = CandidateRunner(llm, editor).run(messages, {'zordss0100.c': ORIGINAL}, ['block', 'block'])
+
+    assert winner.valid and 'PFM_DBG("init");' in winner.files['zordss0100.c']
+    assert shared.block_stats == {'matched': 7, 'missed': 0}
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+편집 히스토리 저널 테스트
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.edit_journal import EditJournal
+from actions.file_editor import FileEditor
+
+
+def test_journal_reads_recent_records_from_the_end(tmp_path):
+    """최근 기록은 파일 끝에서 필요한 만큼만 읽고, 깨진 마지막 줄은 무시"""
+    journal = EditJournal(tmp_path / 'edit_journal.jsonl')
+    for i in range(3000):
+        journal.append({'type': 'operation', 'operation_id': f'op{i}', 'timestamp': str(i),
+                        'description': '한글 설명 ' * 5, 'changes': []})
+    journal.append({'type': 'rollback', 'operation_id': 'op2998'})
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write('{"type": "operation", "operation_id": "broken"')  # 기록 중 중단
+
+    recent = journal.recent_operations(3)
+    assert [record['operation_id'] for record in recent] == ['op2999', 'op2998', 'op2997']
+    assert recent[1]['rolled_back'] and not recent[0].get('rolled_back')
+    assert journal.find_operation('op3')['timestamp'] == '3'
+    assert journal.find_operation('missing') is None
+
+
+def test_journal_compaction(tmp_path):
+    """압축 시 롤백 표시를 합치고 keep 조건에 맞지 않는 작업을 제거"""
+    journal = EditJournal(tmp_path / 'edit_journal.jsonl')
+    for i in range(4):
+        journal.append({'type': 'operation', 'operation_id': f'op{i}', 'timestamp': str(i),
+                        'description': '', 'changes': []})
+    journal.append({'type': 'rollback', 'operation_id': 'op1'})
+
+    assert journal.compact(keep=lambda record: record['operation_id'] != 'op0') == 3
+    records = list(journal.iter_forward())
+    assert [record['operation_id'] for record in records] == ['op1', 'op2', 'op3']
+    assert records[0]['rolled_back']
+
+
+def test_journal_is_compacted_automatically(tmp_path, monkeypatch):
+    """/history prune 없이도 부가 레코드(pending/rollback)가 쌓이면 시작/기록 시 압축"""
+    monkeypatch.setattr(FileEditor, 'JOURNAL_COMPACT_MIN_BYTES', 0)
+    monkeypatch.setattr(FileEditor, 'JOURNAL_MAX_EXTRA', 3)
+    monkeypatch.setattr(FileEditor, 'JOURNAL_CHECK_INTERVAL', 1000)
+    target = tmp_path / 'svc.c'
+    target.write_text('v0\n', encoding='utf-8')
+    backup_dir = tmp_path / 'backups'
+    journal_path = backup_dir / 'edit_journal.jsonl'
+
+    def record_types():
+        return [record['type'] for record in EditJournal(journal_path).iter_forward()]
+
+    editor = FileEditor(str(backup_dir))
+    operations = [editor.apply_changes_from_dict({str(target): f'v{i}\n'}) for i in range(1, 4)]
+    assert editor.rollback_operation(operations[-1].operation_id)
+    assert record_types().count('pending') == 3 and 'rollback' in record_types()
+
+    # 시작할 때 압축 - 롤백 표시는 작업 레코드에 합쳐짐
+    restarted = FileEditor(str(backup_dir))
+    assert record_types() == ['operation'] * 3
+    assert restarted.get_history(1)[0].rolled_back
+
+    # 실행 중에는 부가 레코드를 JOURNAL_CHECK_INTERVAL개 쓸 때마다 검사
+    monkeypatch.setattr(FileEditor, 'JOURNAL_CHECK_INTERVAL', 2)
+    for i in range(4, 8):
+        restarted.apply_changes_from_dict({str(target): f'v{i}\n'})
+    assert record_types() == ['operation'] * 7
+    assert len(restarted.get_history(10)) == 7
+
+
+def test_compaction_keeps_unresolved_pending_records(tmp_path):
+    journal = EditJournal(tmp_path / 'edit_journal.jsonl')
+    journal.append({'type': 'pending', 'operation_id': 'op0', 'changes': []})
+    journal.append({'type': 'operation', 'operation_id': 'op0', 'timestamp': '0', 'description': '', 'changes': []})
+    journal.append({'type': 'pending', 'operation_id': 'op1', 'changes': []})  # 복구하지 못한 작업
+    journal.compact()
+    assert [(record['type'], record['operation_id']) for record in journal.iter_forward()] == \
+        [('operation', 'op0'), ('pending', 'op1')]
+
+
+def test_file_editor_history_stores_only_references(tmp_path):
+    """히스토리에는 내용 대신 백업 참조만 저장되고, 재시작 후에도 롤백 가능"""
+    target = tmp_path / 'svc.c'
+    target.write_text('long a000_init_proc(void) {}\n', encoding='utf-8')
+    backup_dir = tmp_path / 'backups'
+
+    editor = FileEditor(str(backup_dir))
+    big_content = 'int x;\n' * 10000
+    operation = editor.apply_changes_from_dict({str(target): big_content}, 'x 추가')
+
+    line = (backup_dir / 'edit_journal.jsonl').read_text(encoding='utf-8')
+    assert 'int x;' not in line and len(line) < 1000
+
+    restarted = FileEditor(str(backup_dir))
+    found = restarted.find_operation(operation.operation_id)
+    assert found.changes[0].original_content is None  # 필요할 때만 로드
+    assert found.get_summary()['modified_files'] == 1
+    assert found.changes[0].get_new_content() == big_content
+
+    assert restarted.rollback_operation(operation.operation_id)
+    assert target.read_text(encoding='utf-8') == 'long a000_init_proc(void) {}\n'
+    assert FileEditor(str(backup_dir)).get_history(1)[0].rolled_back
+
+
+def test_legacy_history_is_migrated(tmp_path):
+    """이전 edit_history.json은 최초 실행 시 저널로 변환"""
+    backup_dir = tmp_path / 'backups'
+    backup_dir.mkdir()
+    original_backup = backup_dir / '20250101_000000_abcd1234_a.sql'
+    original_backup.write_text('SELECT 1 FROM DUAL', encoding='utf-8')
+    legacy = [{
+        'operation_id': 'legacy01', 'timestamp': '2025-01-01T00:00:00', 'description': '이전 작업',
+        'changes': [{'file_path': str(tmp_path / 'a.sql'), 'original_content': 'SELECT 1 FROM DUAL',
+                     'new_content': 'SELECT 2 FROM DUAL', 'timestamp': '2025-01-01T00:00:00',
+                     'change_id': 'abcd1234', 'backup_path': str(original_backup)}]
+    }]
+    (backup_dir / 'edit_history.json').write_text(json.dumps(legacy), encoding='utf-8')
+
+    editor = FileEditor(str(backup_dir))
+
+    assert not (backup_dir / 'edit_history.json').exists()
+    operation = editor.find_operation('legacy01')
+    assert operation.description == '이전 작업'
+    assert operation.changes[0].get_new_content() == 'SELECT 2 FROM DUAL'
+    assert os.path.exists(operation.changes[0].backup_path)
+
+
+def test_legacy_migration_keeps_inline_content_and_is_atomic(tmp_path, monkeypatch):
+    """이전 백업 파일이 없어도 기록에 있던 내용으로 롤백되고, 변환 도중 중단되면 다음에 처음부터 다시 변환"""
+    backup_dir = tmp_path / 'backups'
+    backup_dir.mkdir()
+    target = tmp_path / 'a.sql'
+    target.write_text('SELECT 2 FROM DUAL', encoding='utf-8')
+    legacy = [{
+        'operation_id': f'legacy{i}', 'timestamp': f'2025-01-0{i + 1}T00:00:00', 'description': '이전 작업',
+        'changes': [{'file_path': str(target), 'original_content': 'SELECT 1 FROM DUAL',
+                     'new_content': 'SELECT 2 FROM DUAL', 'timestamp': '2025-01-01T00:00:00',
+                     'change_id': f'abcd000{i}', 'backup_path': str(backup_dir / 'gone.sql')}]
+    } for i in range(2)]
+    (backup_dir / 'edit_history.json').write_text(json.dumps(legacy), encoding='utf-8')
+
+    # 첫 번째 작업만 기록하고 종료된 상황
+    real_append = EditJournal.append
+    appended = []
+
+    def crashing_append(self, record, sync=False):
+        if appended:
+            raise KeyboardInterrupt
+        appended.append(record)
+        real_append(self, record, sync)
+
+    monkeypatch.setattr(EditJournal, 'append', crashing_append)
+    with pytest.raises(KeyboardInterrupt):
+        FileEditor(str(backup_dir))
+    monkeypatch.undo()
+    assert not (backup_dir / 'edit_journal.jsonl').exists()
+
+    editor = FileEditor(str(backup_dir))
+    assert [record['operation_id'] for record in editor.journal.iter_forward()] == ['legacy0', 'legacy1']
+    assert editor.rollback_operation('legacy1')
+    assert target.read_text(encoding='utf-8') == 'SELECT 1 FROM DUAL'
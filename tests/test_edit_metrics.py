@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+편집 지표 기록 / 집계 테스트
+"""
+import sys
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.file_editor import FileEditor
+from cli.coders.editblock_coder import EditBlockCoder
+from cli.core.edit_metrics import EditMetrics, set_edit_metrics
+from cli.ui.components import SwingUIComponents
+
+
+@pytest.fixture
+def metrics(tmp_path):
+    metrics = EditMetrics(str(tmp_path / '.coe' / 'edit_metrics.jsonl'))
+    set_edit_metrics(metrics)
+    yield metrics
+    set_edit_metrics(None)
+
+
+def test_parse_apply_and_rollback_are_recorded(tmp_path, metrics):
+    source = tmp_path / 'zordss0100.c'
+    source.write_text('long f(void)\n{\n    rc = 0;\n    return rc;\n}\n', encoding='utf-8')
+    context = {str(source): source.read_text(encoding='utf-8')}
+    editor = FileEditor(str(tmp_path / 'backups'))
+    coder = EditBlockCoder(editor)
+    response = (f'{source}\n<<<<<<< SEARCH\n    rc = 0;\n=======\n    rc = 1;\n>>>>>>> REPLACE\n'
+                f'<<<<<<< SEARCH\n    no_such_line();\n=======\n    x();\n>>>>>>> REPLACE\n')
+
+    metrics.record('response', strategy=coder.strategy_key, chars=len(response), completion_tokens=40, seconds=1.5)
+    assert 'error' not in coder.preview_changes(response, context)
+    assert 'error' not in coder.preview_changes(response, context)  # 같은 응답 재파싱은 한 번만 집계
+    operation = coder.apply_changes(response, context, allow_partial=True)  # 두 번째 블록은 찾지 못함
+    assert 'rc = 1;' in source.read_text(encoding='utf-8')
+    assert coder.preview_changes('설명만 있는 응답', context)['error']
+    metrics.record('rollback', operation_id=operation.operation_id, success=True)
+
+    stats = metrics.summary()['block']
+    assert stats['responses'] == 1 and stats['completion_tokens'] == 40
+    assert stats['parses'] == 2 and stats['parse_failures'] == 1
+    assert (stats['blocks_matched'], stats['blocks_missed']) == (1, 1)
+    assert stats['applies'] == 1 and stats['apply_failures'] == 0
+    assert stats['rollbacks'] == 1
+
+
+def test_stats_table_renders(metrics):
+    ui = SwingUIComponents(Console())
+    assert ui.edit_stats_table(metrics.summary()).row_count == 1  # 기록 없음
+    metrics.record('parse', strategy='udiff', response='abc', parse_ms=2.0, valid=True)
+    table = ui.edit_stats_table(metrics.summary())
+    assert table.row_count == 1 and table.columns[0]._cells == ['udiff']
+
+
+def test_metrics_use_registry_keys_and_merge_legacy_names(tmp_path, metrics):
+    from cli.coders.wholefile_coder import WholeFileCoder
+    assert WholeFileCoder(FileEditor(str(tmp_path / 'backups'))).strategy_key == 'whole'
+    # 예전 기록(코더 클래스 이름)은 전략 선택기와 같은 등록 이름으로 합쳐서 집계
+    metrics.record('response', strategy='editblock', chars=40, seconds=1.0)
+    metrics.record('response', strategy='block', chars=40, seconds=1.0)
+    assert list(metrics.summary()) == ['block'] and metrics.summary()['block']['responses'] == 2
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+EncodingDetector 단계별 인코딩 감지 테스트
+"""
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.encoding_detector import EncodingDetector
+from actions.file_manager import FileManager
+
+KOREAN_C_SOURCE = '/* 주문 조회 서비스 - 한글 주석 */\nlong a000_init_proc(void)\n{\n    return 0;\n}\n'
+
+
+def test_utf8_fast_path():
+    """UTF-8 파일은 샘플 감지 없이 바로 디코딩"""
+    detector = EncodingDetector()
+    content, encoding = detector.decode(KOREAN_C_SOURCE.encode('utf-8'))
+    assert content == KOREAN_C_SOURCE
+    assert encoding == 'utf-8'
+
+
+def test_utf8_bom_is_stripped():
+    """BOM이 있는 UTF-8 파일은 utf-8-sig로 디코딩"""
+    detector = EncodingDetector()
+    content, encoding = detector.decode(b'\xef\xbb\xbf' + KOREAN_C_SOURCE.encode('utf-8'))
+    assert content == KOREAN_C_SOURCE
+    assert encoding == 'utf-8-sig'
+
+
+def test_large_cp949_uses_bounded_sample():
+    """샘플 구간보다 큰 CP949 파일도 정상 디코딩"""
+    detector = EncodingDetector(head_window=4096, tail_window=1024)
+    text = KOREAN_C_SOURCE * 2000
+    content, encoding = detector.decode(text.encode('cp949'))
+    assert content == text
+    assert encoding.replace('_', '-').lower() in ('cp949', 'euc-kr')
+
+
+def test_cache_skips_detection_until_file_changes(tmp_path, monkeypatch):
+    """경로 + mtime 캐시가 적중하면 감지를 생략하고, 파일이 바뀌면 다시 감지"""
+    file_path = tmp_path / 'legacy.c'
+    file_path.write_bytes((KOREAN_C_SOURCE * 10).encode('cp949'))
+
+    detector = EncodingDetector()
+    calls = []
+    original = detector._decode_uncached
+    monkeypatch.setattr(detector, '_decode_uncached', lambda raw: calls.append(1) or original(raw))
+
+    raw = file_path.read_bytes()
+    detector.decode(raw, str(file_path))
+    detector.decode(raw, str(file_path))
+    assert len(calls) == 1
+
+    file_path.write_bytes(KOREAN_C_SOURCE.encode('utf-8'))
+    os.utime(file_path, ns=(1, 1))
+    content, encoding = detector.decode(file_path.read_bytes(), str(file_path))
+    assert content == KOREAN_C_SOURCE
+    assert encoding == 'utf-8'
+    assert len(calls) == 2
+
+
+def test_file_manager_reads_cp949_file(tmp_path):
+    """FileManager.add_single_file이 CP949 파일을 읽어 분석"""
+    file_path = tmp_path / 'sample.c'
+    file_path.write_bytes(KOREAN_C_SOURCE.encode('cp949'))
+
+    file_manager = FileManager()
+    result = file_manager.add_single_file(str(file_path))
+
+    assert result['file_type'] == 'c_file'
+    assert file_manager.files[str(file_path)] == KOREAN_C_SOURCE
+    assert 'a000_init_proc' in result['analysis']['found_functions']
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+컨텍스트 파일 감시 / 자동 재분석 테스트
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.file_manager import FileManager
+from actions.file_watcher import FileWatcher
+
+SQL_V1 = "SELECT A.ORD_NO FROM ZORD_ORDER A WHERE A.ORD_NO = :ord_no"
+SQL_V2 = "SELECT B.ITEM_NO FROM ZORD_ITEM B WHERE B.ORD_NO = :ord_no AND B.SEQ = :seq"
+
+
+def write(path, text):
+    path.write_text(text, encoding='utf-8')
+    # mtime 해상도가 낮은 파일 시스템에서도 변경으로 인식되도록
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def poll_until(watcher, predicate, timeout=3.0):
+    """조건을 만족할 때까지 감시 루프를 직접 돌림 (백그라운드 스레드 없이 결정적으로 테스트)"""
+    reloaded = []
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        reloaded.extend(watcher.poll_once(timeout=0.05))
+        if predicate(reloaded):
+            return reloaded
+    return reloaded
+
+
+def test_reload_file_only_when_changed(tmp_path):
+    """reload_file은 바뀐 파일만 재분석하고 리스너에 알림"""
+    path = tmp_path / 'zord_s01.sql'
+    write(path, SQL_V1)
+    fm = FileManager()
+    fm.add_single_file(str(path))
+    events = []
+    fm.add_change_listener(lambda file_path, result: events.append((file_path, result)))
+
+    assert fm.reload_file(str(path)) is None
+    assert events == []
+
+    write(path, SQL_V2)
+    result = fm.reload_file(str(path))
+    assert result['analysis']['bind_variables'] == ['ord_no', 'seq']
+    assert fm.sql_file_info[str(path)]['table_names'] == ['ZORD_ITEM']
+    assert fm.files[str(path)] == SQL_V2
+    assert [file_path for file_path, _ in events] == [str(path)]
+
+    path.unlink()
+    assert fm.reload_file(str(path))['removed']
+    assert str(path) not in fm.files
+    assert str(path) not in fm.sql_file_info
+    assert events[-1] == (str(path), None)
+
+
+@pytest.mark.parametrize('use_inotify', [True, False])
+def test_watcher_debounces_and_reanalyzes(tmp_path, use_inotify):
+    """여러 번 연속 저장해도 debounce 후 한 번만 재분석, 감시하지 않는 파일은 무시"""
+    path = tmp_path / 'zord_s01.sql'
+    other = tmp_path / 'not_in_context.sql'
+    write(path, SQL_V1)
+    fm = FileManager()
+    fm.add_single_file(str(path))
+
+    watcher = FileWatcher(fm, debounce=0.1, poll_interval=0.05, use_inotify=use_inotify)
+    watcher.backend = watcher._create_backend()
+    try:
+        watcher.backend.sync(set(fm.files))
+        for text in (SQL_V1 + ' ', SQL_V1 + '  ', SQL_V2):
+            write(path, text)
+        write(other, SQL_V2)
+
+        reloaded = poll_until(watcher, lambda reloaded: reloaded)
+        assert [file_path for file_path, _ in reloaded] == [str(path)]
+        assert reloaded[0][1]['analysis']['bind_variables'] == ['ord_no', 'seq']
+        assert poll_until(watcher, lambda reloaded: reloaded, timeout=0.3) == []
+    finally:
+        watcher.backend.close()
+
+
+def test_watcher_thread_picks_up_atomic_rename(tmp_path):
+    """편집기처럼 임시 파일을 쓰고 rename해도 백그라운드 감시가 찾고, 재분석은 apply_pending을 부른 스레드에서"""
+    path = tmp_path / 'zord_s01.sql'
+    write(path, SQL_V1)
+    fm = FileManager()
+    fm.add_single_file(str(path))
+    changes = []
+
+    watcher = FileWatcher(fm, debounce=0.05, poll_interval=0.05, on_reload=changes.extend).start()
+    try:
+        temp = tmp_path / '.zord_s01.sql.swp'
+        write(temp, SQL_V2)
+        os.replace(temp, path)
+
+        deadline = time.monotonic() + 3.0
+        while not watcher.has_pending and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert changes == [] and fm.sql_file_info[str(path)]['table_names'] == ['ZORD_ORDER']  # 감시 스레드는 상태를 바꾸지 않음
+        watcher.apply_pending()
+    finally:
+        watcher.stop()
+
+    assert [file_path for file_path, _ in changes] == [str(path)]
+    assert fm.files[str(path)] == SQL_V2
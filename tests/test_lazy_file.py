@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+LazyFileContent / FileContentStore 지연 로딩 테스트
+"""
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.lazy_file import FileContentStore, LazyFileContent
+from actions.file_manager import FileManager
+
+KOREAN_SOURCE = '/* 첫 줄 주석 */\nlong a000_init(void)\n{\n    /* 한글 */\n    return 0;\n}\n'
+
+
+def test_line_offset_indexing(tmp_path):
+    """전체 디코딩 없이 특정 줄만 읽기 (CP949)"""
+    path = tmp_path / 'legacy.c'
+    path.write_bytes(KOREAN_SOURCE.encode('cp949'))
+
+    handle = LazyFileContent(str(path), 'cp949')
+    assert handle.line_count() == 6
+    assert handle.line(3) == '    /* 한글 */'
+    assert handle.lines(1, 3) == ['long a000_init(void)', '{']
+    assert handle.text() == KOREAN_SOURCE
+    handle.close()
+
+
+def test_empty_file(tmp_path):
+    """빈 파일은 mmap 없이 처리"""
+    path = tmp_path / 'empty.sql'
+    path.write_bytes(b'')
+
+    handle = LazyFileContent(str(path))
+    assert handle.text() == ''
+    assert handle.line_count() == 0
+    assert handle.lines(0) == []
+
+
+def test_store_lru_and_dict_api(tmp_path):
+    """dict API 호환성과 상주 문자 수 제한"""
+    store = FileContentStore(max_resident_chars=100)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f'f{i}.txt'
+        path.write_text('x' * 60)
+        paths.append(str(path))
+        store[str(path)] = LazyFileContent(str(path))
+    store['inline.txt'] = 'plain'
+
+    assert len(store) == 4
+    assert list(store.keys()) == paths + ['inline.txt']
+    assert all(store[p] == 'x' * 60 for p in paths)
+    assert store.resident_chars() <= 100
+    assert store.char_count(paths[0]) == 60
+    assert dict(store.items())['inline.txt'] == 'plain'
+
+    del store[paths[0]]
+    assert paths[0] not in store
+
+
+def test_store_sees_file_changes(tmp_path):
+    """디스크의 파일이 바뀌면 상주 내용 대신 새 내용을 반환"""
+    path = tmp_path / 'edit.c'
+    path.write_text('int a;\n')
+    store = FileContentStore()
+    store.set_lazy(str(path), LazyFileContent(str(path)), 'int a;\n')
+
+    path.write_text('int a;\nint b;\n')
+    os.utime(path, ns=(0, 1))
+    assert store[str(path)] == 'int a;\nint b;\n'
+
+
+def test_file_manager_uses_lazy_store(tmp_path):
+    """FileManager.files는 지연 핸들을 보관하면서 기존처럼 문자열 반환"""
+    path = tmp_path / 'legacy.c'
+    path.write_bytes(KOREAN_SOURCE.encode('cp949'))
+
+    fm = FileManager()
+    fm.add_single_file(str(path))
+    resolved = os.path.abspath(str(path))
+    key = resolved if resolved in fm.files else str(path)
+
+    assert fm.files.get_handle(key) is not None
+    assert fm.files[key] == KOREAN_SOURCE
+
+
+def test_store_redetects_encoding_after_change(tmp_path):
+    """다른 인코딩으로 다시 저장된 파일도 디코딩 오류 없이 읽음"""
+    path = tmp_path / 'legacy.c'
+    path.write_bytes(KOREAN_SOURCE.encode('cp949'))
+    store = FileContentStore()
+    store.set_lazy(str(path), LazyFileContent(str(path), 'cp949'))
+    assert store[str(path)] == KOREAN_SOURCE
+
+    path.write_bytes(('/* UTF-8로 저장 */\n' + KOREAN_SOURCE).encode('utf-8'))
+    os.utime(path, ns=(0, 1))
+    assert store[str(path)] == '/* UTF-8로 저장 */\n' + KOREAN_SOURCE
+    assert store.get_handle(str(path)).encoding == 'utf-8'
+
+
+def test_store_does_not_hold_descriptors(tmp_path):
+    """상주하지 않는 항목은 mmap(파일 디스크립터)을 열어 두지 않음"""
+    store = FileContentStore(max_resident_chars=100)
+    handles = []
+    for i in range(3):
+        path = tmp_path / f'f{i}.txt'
+        path.write_text('x' * 60)
+        handles.append(LazyFileContent(str(path)))
+        store[str(path)] = handles[-1]
+        assert store[str(path)] == 'x' * 60
+
+    assert all(handle._mmap is None for handle in handles)
+    assert handles[0].line(0) == 'x' * 60  # 직접 줄 단위로 읽으면 다시 매핑
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+줄 단위 diff 엔진 테스트
+"""
+import difflib
+import random
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.file_editor import FileEditor
+from actions.line_diff import FileDiff, compute_diff, diff_opcodes
+
+
+def apply_opcodes(a, b, opcodes):
+    """opcode가 a 전체/b 전체를 빈틈없이 덮고 equal 구간이 실제로 같은지 확인하며 b 복원"""
+    result = []
+    i = j = 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        assert (i1, j1) == (i, j)
+        if tag == 'equal':
+            assert a[i1:i2] == b[j1:j2]
+        result.extend(b[j1:j2])
+        i, j = i2, j2
+    assert (i, j) == (len(a), len(b))
+    return result
+
+
+def test_opcodes_cover_random_edits():
+    rng = random.Random(7)
+    for _ in range(2000):
+        alphabet = ['{\n', '}\n', '    return rc;\n', '\n', 'x\n'][:rng.randint(1, 5)]
+        a = [rng.choice(alphabet) for _ in range(rng.randint(0, 40))]
+        b = list(a)
+        for _ in range(rng.randint(0, 6)):
+            position = rng.randint(0, len(b))
+            if rng.random() < 0.5 and position < len(b):
+                del b[position]
+            else:
+                b.insert(position, rng.choice(alphabet + ['new\n']))
+        assert apply_opcodes(a, b, diff_opcodes(a, b)) == b
+
+
+def test_unified_output_matches_difflib_format():
+    original = ''.join(f'line {i}\n' for i in range(30))
+    new = original.replace('line 3\n', 'line three\n').replace('line 20\n', '') + 'tail'
+    expected = list(difflib.unified_diff(original.splitlines(keepends=True), new.splitlines(keepends=True),
+                                         'a (original)', 'a (modified)', lineterm=''))
+    assert FileDiff(original, new).unified('a (original)', 'a (modified)') == expected
+    assert FileDiff(original, original).unified('a', 'b') == []
+
+
+def test_repetitive_source_diff_is_minimal():
+    """같은 함수 본문이 반복되어도 수정한 줄만 변경으로 잡음"""
+    body = '{\n    long rc = RC_NRM;\n\n    return RC_NRM;\n}\n\n'
+    original = ''.join(f'static long b{i:04d}_proc(void)\n' + body for i in range(2000))
+    new = original.replace('b0100_proc(void)\n{\n', 'b0100_proc(void)\n{\n    PFM_DBG("x");\n')
+    new = new.replace('static long b1500_proc(void)\n' + body, '')
+
+    diff = compute_diff(original, new)
+    assert diff.added_lines() == ['    PFM_DBG("x");']
+    assert len(diff.removed_lines()) == body.count('\n') + 1
+
+
+def test_preview_computes_diff_once(tmp_path, monkeypatch):
+    """텍스트 diff, 시각적 diff, 변경 요약이 같은 diff 결과를 공유"""
+    path = tmp_path / 'zord_s01.sql'
+    path.write_text('SELECT A.ORD_NO\n  FROM ZORD_ORDER A\n', encoding='utf-8')
+    editor = FileEditor(str(tmp_path / 'backups'))
+    compute_diff.cache_clear()
+
+    calls = []
+    original_init = FileDiff.__init__
+    monkeypatch.setattr(FileDiff, '__init__', lambda self, *args: calls.append(1) or original_init(self, *args))
+
+    new_content = 'SELECT A.ORD_NO, A.ORD_DT\n  FROM ZORD_ORDER A\n'
+    preview = editor.preview_changes_from_dict({str(path): new_content})
+    operation = editor.apply_changes_from_dict({str(path): new_content})
+    operation.get_summary()
+
+    assert preview[str(path)]['visual_diff'][-2] == ('added', '+SELECT A.ORD_NO, A.ORD_DT')
+    assert len(calls) == 1
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+내용 기준 unified diff 적용 테스트
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.file_editor import FileEditor
+from cli.coders.patch_engine import apply_patch, parse_patch
+from cli.coders.udiff_coder import UDiffCoder
+
+SOURCE = '\n'.join(
+    line
+    for i in range(100)
+    for line in (f'static long b{i:04d}_proc(ctx_t *ctx)', '{', '    long rc = RC_NRM;',
+                 f'    rc = z{i:04d}_call(ctx);', '    return rc;', '}', '')
+)
+
+
+def test_wrong_line_numbers_are_corrected_by_context():
+    """헤더 줄 번호가 틀려도 컨텍스트로 위치를 찾고, 다음 hunk는 앞 hunk의 offset을 반영"""
+    diff = '\n'.join([
+        '--- a/zordss0100.c',
+        '+++ b/zordss0100.c',
+        '@@ -5,4 +5,5 @@',
+        ' {',
+        '     long rc = RC_NRM;',
+        '+    PFM_DBG("b0010");',
+        '     rc = z0010_call(ctx);',
+        '     return rc;',
+        '@@ -146 +147 @@',
+        '-    rc = z0020_call(ctx);',
+        '+    rc = z0020_call_v2(ctx);',
+    ])
+    patches = parse_patch(diff)
+    assert [patch.path for patch in patches] == ['zordss0100.c']
+    assert patches[0].hunks[1].old_count == 1
+
+    content, results = apply_patch(SOURCE, patches[0].hunks)
+    assert [result.applied for result in results] == [True, True]
+    assert results[0].line == 10 * 7 + 2 and results[0].offset == 67
+    assert 'long rc = RC_NRM;\n    PFM_DBG("b0010");\n    rc = z0010_call(ctx);' in content
+    assert 'z0020_call_v2' in content and 'z0020_call(ctx)' not in content
+    assert content.count('\n') == SOURCE.count('\n') + 1
+
+
+def test_fuzz_drops_mismatched_context():
+    diff = '\n'.join([
+        '@@ -1,4 +1,4 @@',
+        ' static long b0003_proc(ctx_t *ctx)',
+        ' {',
+        '-    long rc = RC_NRM;',
+        '+    long rc = RC_ERR;',
+        '     rc = z0003_call(ctx, 1);',
+    ])
+    content, results = apply_patch(SOURCE, parse_patch(diff)[0].hunks)
+    assert results[0].applied and results[0].fuzz == 1
+    assert content.split('\n')[3 * 7 + 2] == '    long rc = RC_ERR;'
+
+
+def test_unlocatable_hunk_is_not_spliced_by_line_number():
+    diff = '@@ -3,1 +3,1 @@\n-    long rc = RC_UNKNOWN;\n+    long rc = RC_ERR;'
+    content, results = apply_patch(SOURCE, parse_patch(diff)[0].hunks)
+    assert content == SOURCE
+    assert not results[0].applied
+
+
+def test_udiff_coder_multiple_files_in_one_block(tmp_path):
+    coder = UDiffCoder(FileEditor(str(tmp_path / 'backups')))
+    response = '\n'.join([
+        '```diff',
+        '--- a/src/zordss0100.c',
+        '+++ b/src/zordss0100.c',
+        '@@ -999,1 +999,1 @@',
+        '-    rc = z0050_call(ctx);',
+        '+    rc = z0050_call(ctx, 0);',
+        '--- a/sql/zord_s01.sql',
+        '+++ b/sql/zord_s01.sql',
+        '@@ -1,2 +1,2 @@',
+        '--- 주문 조회',
+        '+-- 주문 상세 조회',
+        ' SELECT 1 FROM DUAL',
+        '```',
+    ])
+    context = {'src/zordss0100.c': SOURCE, 'sql/zord_s01.sql': '-- 주문 조회\nSELECT 1 FROM DUAL\n'}
+    files = coder.parse_response(response, context)
+    assert 'z0050_call(ctx, 0);' in files['src/zordss0100.c']
+    assert files['sql/zord_s01.sql'] == '-- 주문 상세 조회\nSELECT 1 FROM DUAL\n'
+
+
+def test_missed_hunk_is_reported_and_needs_partial_apply(tmp_path):
+    target = tmp_path / 'zordss0100.c'
+    target.write_text(SOURCE, encoding='utf-8')
+    coder = UDiffCoder(FileEditor(str(tmp_path / 'backups')))
+    response = '\n'.join([
+        f'--- a/{target}',
+        f'+++ b/{target}',
+        '@@ -30,1 +30,1 @@',
+        '-    rc = z0004_call(ctx);',
+        '+    rc = z0004_call(ctx, 0);',
+        '@@ -60,1 +60,1 @@',
+        '-    rc = z9999_unknown(ctx);',
+        '+    rc = z9999_unknown(ctx, 0);',
+    ])
+    context = {str(target): SOURCE}
+
+    preview = coder.preview_changes(response, context)
+    assert 'error' not in preview
+    assert [(f['file'], f['index'], f['kind'], f['search']) for f in coder.edit_failures] == \
+        [(str(target), 2, 'hunk', 'rc = z9999_unknown(ctx);')]
+
+    with pytest.raises(ValueError, match='/apply partial'):
+        coder.apply_changes(response, context)
+    assert target.read_text(encoding='utf-8') == SOURCE
+
+    coder.apply_changes(response, context, allow_partial=True)
+    assert 'z0004_call(ctx, 0);' in target.read_text(encoding='utf-8')
+
+
+def test_udiff_reads_only_target_files_and_reports_pathless_patch(tmp_path, monkeypatch):
+    from actions.file_manager import FileManager
+    from actions.lazy_file import FileContentStore
+    fm = FileManager()
+    for i in range(3):
+        path = tmp_path / f'zordss010{i}.c'
+        path.write_text(SOURCE, encoding='utf-8')
+        fm.add_single_file(str(path))
+    target = str(tmp_path / 'zordss0101.c')
+    read = []
+    original_getitem = FileContentStore.__getitem__
+    monkeypatch.setattr(FileContentStore, '__getitem__', lambda store, path: read.append(path) or original_getitem(store, path))
+
+    coder = UDiffCoder(FileEditor(str(tmp_path / 'backups')))
+    response = '\n'.join([
+        '```diff', '--- a/zordss0101.c', '+++ b/zordss0101.c', '@@ -30,1 +30,1 @@',
+        '-    rc = z0004_call(ctx);', '+    rc = z0004_call(ctx, 0);', '```',
+        '```diff', '--- a/zordss0101.c', '+++ b/zordss0101.c', '@@ -37,1 +37,1 @@',
+        '-    rc = z0005_call(ctx);', '+    rc = z0005_call(ctx, 0);', '```',
+        '```diff', '@@ -1,1 +1,1 @@', '-static long b0000_proc(ctx_t *ctx)', '+static long b0000_proc(ctx_t *c)', '```',
+    ])
+    files = coder.parse_response(response, fm.files)
+
+    assert read == [target]  # 두 번째 블록은 앞 블록 결과를 사용, 다른 컨텍스트 파일은 읽지 않음
+    assert 'z0004_call(ctx, 0);' in files[target] and 'z0005_call(ctx, 0);' in files[target]
+    assert [(f['kind'], f['search']) for f in coder.edit_failures] == [('path', 'static long b0000_proc(ctx_t *ctx)')]
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+편집 응답 증분 파서 테스트
+"""
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.file_editor import FileEditor
+from actions.response_parser import DiffBlock, EditBlock, FencedBlock, ResponseParser, parse_events
+from cli.coders.wholefile_coder import WholeFileCoder
+
+RESPONSE = '\n'.join([
+    '수정 사항입니다.',
+    '',
+    'src/zordss0100.c',
+    '```c',
+    'src/zordss0100.c',
+    '<<<<<<< SEARCH',
+    '    rc = RC_NRM;',
+    '=======',
+    '    rc = RC_ERR;',
+    '>>>>>>> REPLACE',
+    '<<<<<<< SEARCH',
+    '    return rc;',
+    '=======',
+    '    return RC_NRM;',
+    '>>>>>>> REPLACE',
+    '```',
+    '',
+    'sql/zord_s01.sql',
+    '```sql',
+    'SELECT A.ORD_NO',
+    '  FROM ZORD_ORDER A',
+    '```',
+    '',
+    '```diff',
+    '--- a/x.c',
+    '+++ b/x.c',
+    '@@ -1 +1 @@',
+    '-a',
+    '+b',
+    '```',
+    '--- a/y.c',
+    '+++ b/y.c',
+    '@@ -1 +1 @@',
+    '--- 주석',
+    '+b',
+    '설명 끝',
+])
+
+
+def test_events_from_mixed_response():
+    events = parse_events(RESPONSE)
+    assert events == [
+        EditBlock('src/zordss0100.c', '    rc = RC_NRM;', '    rc = RC_ERR;'),
+        EditBlock('src/zordss0100.c', '    return rc;', '    return RC_NRM;'),
+        FencedBlock('sql/zord_s01.sql', 'sql', 'SELECT A.ORD_NO\n  FROM ZORD_ORDER A'),
+        DiffBlock('--- a/x.c\n+++ b/x.c\n@@ -1 +1 @@\n-a\n+b'),
+        DiffBlock('--- a/y.c\n+++ b/y.c\n@@ -1 +1 @@\n--- 주석\n+b'),
+    ]
+
+
+def test_chunked_feed_matches_whole_response():
+    """스트리밍처럼 몇 글자씩 들어와도 같은 이벤트, 블록이 닫히는 즉시 방출"""
+    for size in (1, 3, 17):
+        parser = ResponseParser()
+        events = []
+        first_edit_at = None
+        for start in range(0, len(RESPONSE), size):
+            events.extend(parser.feed(RESPONSE[start:start + size]))
+            if first_edit_at is None and events:
+                first_edit_at = start
+        events.extend(parser.close())
+        assert events == parse_events(RESPONSE)
+        assert first_edit_at < RESPONSE.index('<<<<<<< SEARCH\n    return rc;')
+
+
+def test_truncated_blocks_are_dropped():
+    assert parse_events('a.c\n```c\nint main(void) {\n') == []
+    assert parse_events('a.c\n<<<<<<< SEARCH\nx\n=======\ny\n') == []
+
+
+def test_unterminated_markers_parse_in_linear_time():
+    """이전 DOTALL 정규식이 크게 되돌아가던 입력 (파일명 + 닫히지 않은 SEARCH 반복)"""
+    response = 'a.c\n<<<<<<< SEARCH\n' + 'x = 1;\n' * 200000
+    start = time.perf_counter()
+    assert parse_events(response) == []
+    assert time.perf_counter() - start < 2.0
+
+
+def test_consumers_share_parser(tmp_path):
+    response = 'zord_s01.sql\n```sql\nSELECT A.ORD_NO, A.ORD_DT\n  FROM ZORD_ORDER A\n```\n'
+    editor = FileEditor(str(tmp_path / 'backups'))
+    assert editor.parse_edit_response(response) == {'zord_s01.sql': 'SELECT A.ORD_NO, A.ORD_DT\n  FROM ZORD_ORDER A'}
+    assert WholeFileCoder(editor).parse_response('@' + response, {}) == {'zord_s01.sql': 'SELECT A.ORD_NO, A.ORD_DT\n  FROM ZORD_ORDER A'}
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+오라클 SQL 토크나이저 테스트
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.sql_tokenizer import extract_sql_features, tokenize_sql
+from actions.file_manager import FileManager
+
+ORDER_SQL = """/* 주문 조회 :comment_bind */
+SELECT /*+ INDEX(A IX_ORD_01) LEADING(A) */
+       A.ORD_NO
+     , TO_CHAR(A.REG_DT, 'YYYYMMDD HH24:MI:SS') AS REG_DT -- :line_comment_bind
+     , NVL(B.QTY, 0) AS QTY
+     , EXTRACT(YEAR FROM A.REG_DT) AS REG_YY
+  FROM ZORD.ZORD_ORDER A, ZORD_ITEM@DBL B
+     , (SELECT C.ORD_NO FROM ZORD_CUST C WHERE C.CUST_ID = :cust_id) V
+  LEFT OUTER JOIN ZPRD_MST P ON P.PRD_ID = B.PRD_ID
+ WHERE A.ORD_NO = :ord_no
+   AND B.ORD_NO(+) = A.ORD_NO
+   AND A.EFF_END_DTM = '99991231235959'
+"""
+
+
+def test_binds_skip_strings_comments_and_assignments():
+    """문자열/주석 안의 ':'와 PL/SQL ':='는 바인드 변수가 아님"""
+    sql = "BEGIN v_fmt := 'HH24:MI'; v_q := q'[it's :x]'; SELECT :a, :b, :a INTO v FROM DUAL; END;"
+    features = extract_sql_features(sql)
+
+    assert features['bind_variables'] == ['a', 'b']
+    assert extract_sql_features(ORDER_SQL)['bind_variables'] == ['cust_id', 'ord_no']
+
+
+def test_tables_aliases_and_hints():
+    """FROM 목록, 서브쿼리, ANSI 조인에서 테이블과 별칭 추출"""
+    features = extract_sql_features(ORDER_SQL)
+
+    assert features['hints'] == ['INDEX(A IX_ORD_01) LEADING(A)']
+    assert features['table_names'] == ['ZORD.ZORD_ORDER', 'ZORD_ITEM@DBL', 'ZORD_CUST', 'ZPRD_MST']
+    assert features['table_aliases'] == [
+        'ZORD.ZORD_ORDER as A', 'ZORD_ITEM@DBL as B', 'ZORD_CUST as C', 'ZPRD_MST as P'
+    ]
+    assert features['outer_joins'] == ['Oracle outer join syntax detected']
+    assert features['oracle_functions'] == ['NVL', 'TO_CHAR']
+    assert features['validity_patterns'] == ['99991231235959 (timestamp format)', '99991231 (date format)']
+
+
+def test_comments_do_not_leak_features():
+    """주석 안의 (+), 함수명, 유효 종료일은 무시"""
+    sql = "-- NVL(+) 99991231\n/* DECODE (+) */ SELECT X FROM T"
+    features = extract_sql_features(sql)
+
+    assert features['outer_joins'] == []
+    assert features['oracle_functions'] == []
+    assert features['validity_patterns'] == []
+    assert features['table_names'] == ['T']
+
+
+def test_tokenizer_handles_unterminated_literals():
+    """닫히지 않은 문자열/주석도 끝까지 한 토큰으로 처리"""
+    tokens = list(tokenize_sql("SELECT 'abc :x"))
+    assert tokens[-1][0] == 'string'
+    tokens = list(tokenize_sql("SELECT 1 /* :x"))
+    assert tokens[-1][0] == 'comment'
+
+
+def test_file_manager_sql_analysis(tmp_path):
+    """FileManager SQL 분석이 토크나이저 결과를 사용"""
+    path = tmp_path / 'zord_order_s01.sql'
+    path.write_text(ORDER_SQL, encoding='utf-8')
+
+    fm = FileManager()
+    result = fm.add_single_file(str(path))
+
+    assert result['file_type'] == 'sql_file'
+    assert result['analysis']['bind_variables'] == ['cust_id', 'ord_no']
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+CLI 시작 시간 회귀 테스트 - 프롬프트를 띄우기 전에 무거운 모듈/하위 시스템을 만들지 않는지 확인
+
+기본 실행에서는 결정적인 import 지연 검사만 하고, 벽시계 시간을 재는 테스트는 부하에 따라 흔들리므로
+COE_STARTUP_BENCH=1 일 때만 실행한다. 시작 시간 예산(인터프리터 자체 기동 시간 제외)은
+COE_STARTUP_BUDGET_MS 로 바꿀 수 있다 (기본 300ms).
+"""
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from cli.core.lazy import Lazy
+
+STARTUP_BUDGET_MS = float(os.getenv('COE_STARTUP_BUDGET_MS', '300'))
+
+# 처음 사용할 때만 import 되어야 하는 모듈 (LLM/MCP 네트워크 스택, 코더, 템플릿, Markdown 렌더링 등)
+DEFERRED_MODULES = [
+    'requests', 'llm.service', 'mcp.client', 'cli.core.mcp_integration',
+    'cli.coders.base_coder', 'cli.coders.editblock_coder', 'cli.coders.edit_candidates',
+    'actions.file_editor', 'actions.template_manager', 'cli.ui.components',
+    'rich.markdown', 'charset_normalizer', 'concurrent.futures.process',
+]
+
+# 프롬프트 입력 직전까지 실행하고 그 시각(time.time())을 출력한 뒤 EOF로 종료
+PROBE = """
+import sys, time
+sys.path.insert(0, {root!r})
+import prompt_toolkit
+def reached_prompt(self, *args, **kwargs):
+    print('PROMPT_AT', time.time(), file=sys.stderr, flush=True)
+    raise EOFError
+prompt_toolkit.PromptSession.prompt = reached_prompt
+import cli.main
+cli.main.main(args=[], standalone_mode=False)
+"""
+
+
+def run_python(code: str, cwd: Path) -> subprocess.CompletedProcess:
+    env = {**os.environ, 'COE_FILE_WATCH': '0', 'COE_TRACE': '', 'COE_DEBUG': ''}
+    return subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env,
+                          capture_output=True, text=True, timeout=60)
+
+
+def test_import_defers_heavy_modules(tmp_path):
+    code = (f"import sys; sys.path.insert(0, {str(PROJECT_ROOT)!r}); import cli.main; "
+            f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))")
+    result = run_python(code, tmp_path)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ''
+
+
+@pytest.mark.skipif(os.getenv('COE_STARTUP_BENCH') != '1', reason='시작 시간 측정은 COE_STARTUP_BENCH=1 일 때만')
+def test_cold_start_to_prompt_within_budget(tmp_path):
+    def time_to_prompt() -> float:
+        start = time.time()
+        result = run_python(PROBE.format(root=str(PROJECT_ROOT)), tmp_path)
+        assert result.returncode == 0, result.stderr
+        return float(result.stderr.split('PROMPT_AT')[1].split()[0]) - start
+
+    def bare_interpreter() -> float:
+        start = time.time()
+        run_python('pass', tmp_path)
+        return time.time() - start
+
+    # 부하에 따른 편차를 줄이려고 각각 가장 빠른 값 사용
+    startup = min(time_to_prompt() for _ in range(3))
+    baseline = min(bare_interpreter() for _ in range(3))
+    elapsed_ms = (startup - baseline) * 1000
+    assert elapsed_ms < STARTUP_BUDGET_MS, (
+        f"프롬프트까지 {elapsed_ms:.0f}ms (인터프리터 기동 {baseline * 1000:.0f}ms 제외, 예산 {STARTUP_BUDGET_MS:.0f}ms)")
+
+
+def test_lazy_builds_once_on_first_use():
+    calls = []
+
+    class Service:
+        name = 'svc'
+
+    service = Lazy(lambda: calls.append(1) or Service())
+    assert not service.is_built and calls == []
+    assert service.name == 'svc'
+    service.name = 'changed'
+    assert service.get().name == 'changed' and calls == [1]
+
+
+def test_lazy_warm_up_shares_instance_with_first_use():
+    started, release = threading.Event(), threading.Event()
+
+    def slow_factory():
+        started.set()
+        release.wait(5)
+        return object()
+
+    lazy = Lazy(slow_factory)
+    thread = lazy.warm_up()
+    started.wait(5)
+    result = []
+    waiter = threading.Thread(target=lambda: result.append(lazy.get()))
+    waiter.start()
+    release.set()
+    thread.join(5)
+    waiter.join(5)
+    assert result == [lazy.get()]
+    assert lazy.warm_up() is None
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+편집 전략 자동 선택 테스트
+"""
+import json
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from cli.coders import editblock_coder, udiff_coder, wholefile_coder  # 레지스트리 등록
+from cli.coders.strategy_selector import StrategySelector, classify_request, estimate_output_tokens
+
+LARGE_C = ''.join(f'    rc = a{i:04d}_proc(ctx);  /* 처리 {i} */\n' for i in range(5000))
+SMALL_SQL = 'SELECT A.ORD_NO\n  FROM ZORD_ORDER A\n'
+
+
+def test_classify_request():
+    assert classify_request('rc 체크 누락된 부분 수정해줘') == 'local'
+    assert classify_request('모든 함수명을 바꿔줘') == 'broad'
+    assert classify_request('이 파일 전체를 리팩토링해줘') == 'rewrite'
+
+
+def test_partial_strategies_are_cheaper_for_large_files():
+    whole = estimate_output_tokens('whole', {'zordss0100.c': LARGE_C}, 'local')
+    block = estimate_output_tokens('block', {'zordss0100.c': LARGE_C}, 'local')
+    udiff = estimate_output_tokens('udiff', {'zordss0100.c': LARGE_C}, 'local')
+    assert block * 5 < whole and udiff * 5 < whole
+    assert estimate_output_tokens('unknown', {'a.c': 'x'}, 'local') is None
+
+
+def test_select_by_size_and_request_type(tmp_path):
+    selector = StrategySelector(str(tmp_path / 'decisions.jsonl'))
+    assert selector.select('rc 체크 추가해줘', {'zordss0100.c': LARGE_C}).strategy in ('block', 'udiff')
+    assert selector.select('전체를 다시 작성해줘', {'zordss0100.c': LARGE_C}).strategy == 'whole'
+    assert selector.select('새 파일 만들어줘', {}).strategy == 'whole'
+
+
+def test_failures_steer_selection_and_persist(tmp_path):
+    log_path = tmp_path / 'decisions.jsonl'
+    selector = StrategySelector(str(log_path))
+    files = {'zordss0100.c': LARGE_C}
+    first = selector.select('rc 체크 추가해줘', files)
+    for _ in range(10):
+        selector.record_outcome(first, False, 400)
+
+    # 새 세션에서도 로그의 결과로 성공률을 다시 계산
+    reloaded = StrategySelector(str(log_path))
+    second = reloaded.select('rc 체크 추가해줘', files)
+    assert second.strategy != first.strategy
+    assert reloaded.success_rate(first.strategy) < 0.5
+
+    records = [json.loads(line) for line in log_path.read_text(encoding='utf-8').splitlines()]
+    decisions = [record for record in records if record['type'] == 'decision']
+    assert len(decisions) == 2 and decisions[0]['files'] == {'zordss0100.c': 5001}
+    assert set(decisions[0]['estimates']) == {'whole', 'block', 'udiff'}
+
+
+def test_default_log_lives_in_coe_and_adopts_legacy_log(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    legacy = tmp_path / '.swing_backups' / 'strategy_decisions.jsonl'
+    legacy.parent.mkdir()
+    legacy.write_text(''.join(json.dumps({'type': 'outcome', 'strategy': 'udiff', 'success': False}) + '\n'
+                              for _ in range(10)), encoding='utf-8')
+
+    selector = StrategySelector()
+    assert not legacy.exists() and (tmp_path / '.coe' / 'strategy_decisions.jsonl').exists()
+    assert selector.success_rate('udiff') < 0.5
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+인코딩/BOM/줄바꿈 보존 편집 테스트
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.file_editor import FileEditor
+from actions.file_manager import FileManager
+from actions.text_format import TextFormat
+
+C_SOURCE = '/* 주문 조회 */\r\nlong a000_init_proc(void)\r\n{\r\n    return RC_NRM;\r\n}\r\n'
+
+
+def test_detect_and_roundtrip_formats():
+    raw = '\ufeff-- 주문\nSELECT 1 FROM DUAL\n'.encode('utf-8')
+    text_format = TextFormat.detect(raw, 'utf-8-sig')
+    assert text_format == TextFormat(encoding='utf-8', bom=True, newline='\n')
+    assert text_format.encode(text_format.decode(raw)) == raw
+
+    raw = C_SOURCE.encode('cp949')
+    text_format = TextFormat.detect(raw, 'cp949')
+    assert text_format.newline == '\r\n'
+    assert '\r' not in text_format.decode(raw)
+    assert text_format.encode(text_format.decode(raw)) == raw
+
+    mixed = b'a\r\nb\nc'
+    assert TextFormat.detect(mixed, 'utf-8').encode(TextFormat.detect(mixed, 'utf-8').decode(mixed)) == mixed
+
+
+def test_apply_and_rollback_preserve_legacy_format(tmp_path, monkeypatch):
+    """CP949 + CRLF 파일을 수정해도 인코딩/줄바꿈을 유지하고, 롤백은 원래 바이트 그대로"""
+    path = tmp_path / 'zordss0100.c'
+    original_raw = C_SOURCE.encode('cp949')
+    path.write_bytes(original_raw)
+
+    fm = FileManager()
+    fm.add_single_file(str(path))
+    editor = FileEditor(str(tmp_path / 'backups'), encoding_detector=fm.encoding_detector)
+
+    # FileManager가 감지한 인코딩을 재사용 - 미리보기/적용 중 다시 감지하지 않음
+    calls = []
+    original_decode = fm.encoding_detector._decode_uncached
+    monkeypatch.setattr(fm.encoding_detector, '_decode_uncached',
+                        lambda raw: calls.append(1) or original_decode(raw))
+
+    new_content = C_SOURCE.replace('\r\n', '\n').replace('주문 조회', '주문 상세 조회')
+    preview = editor.preview_changes_from_dict({str(path): new_content})
+    assert preview[str(path)]['original'] == C_SOURCE.replace('\r\n', '\n')
+    assert '-long a000_init_proc' not in preview[str(path)]['diff']  # 줄바꿈 차이는 diff에 나타나지 않음
+
+    operation = editor.apply_changes_from_dict({str(path): new_content})
+    assert path.read_bytes() == new_content.replace('\n', '\r\n').encode('cp949')
+    assert calls == []
+
+    restarted = FileEditor(str(tmp_path / 'backups'))
+    assert restarted.find_operation(operation.operation_id).changes[0].get_new_content() == new_content
+    assert restarted.rollback_operation(operation.operation_id)
+    assert path.read_bytes() == original_raw
+
+
+def test_unencodable_content_is_rejected_before_writing(tmp_path):
+    path = tmp_path / 'zord_s01.sql'
+    path.write_bytes('-- 주문\r\nSELECT 1 FROM DUAL\r\n'.encode('euc-kr'))
+    editor = FileEditor(str(tmp_path / 'backups'))
+
+    with pytest.raises(ValueError):
+        editor.apply_changes_from_dict({str(path): '-- 주문 😀\nSELECT 2 FROM DUAL\n'})
+    assert path.read_bytes() == '-- 주문\r\nSELECT 1 FROM DUAL\r\n'.encode('euc-kr')
+    assert editor.get_history() == []
+
+
+def test_crlf_preview_from_coder_shows_only_edited_line(tmp_path):
+    """코더가 FileManager 내용(CRLF 유지)으로 만든 새 내용도 바뀐 줄만 diff에 나타남"""
+    from cli.coders.editblock_coder import EditBlockCoder
+    path = tmp_path / 'zordss0100.c'
+    path.write_bytes(b'int a;\r\nint b;\r\nint c;\r\n')
+    fm = FileManager()
+    fm.add_single_file(str(path))
+    coder = EditBlockCoder(FileEditor(str(tmp_path / 'backups'), encoding_detector=fm.encoding_detector))
+    response = f'{path}\n<<<<<<< SEARCH\nint b;\n=======\nint bb;\n>>>>>>> REPLACE\n'
+
+    diff = coder.preview_changes(response, fm.files)[str(path)]['diff']
+    changed = [line for line in diff.splitlines()
+               if line[:1] in '+-' and not line.startswith(('+++', '---'))]
+    assert changed == ['-int b;', '+int bb;']
+
+    coder.apply_changes(response, fm.files)
+    assert path.read_bytes() == b'int a;\r\nint bb;\r\nint c;\r\n'
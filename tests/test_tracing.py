@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+구간 추적(span) 테스트
+"""
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from cli.core import tracing
+
+
+def load_trace(path):
+    """닫는 ']'가 없는 Chrome trace 파일을 읽음 (뷰어와 같은 방식)"""
+    text = Path(path).read_text(encoding='utf-8').rstrip().rstrip(',')
+    return json.loads(text + ']')
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+    path = tmp_path / 'traces' / 'trace.json'
+    tracing.configure(str(path))
+    yield path
+    tracing.configure(None)
+
+
+def test_nested_spans_are_written_as_chrome_trace(trace_file):
+    turn = tracing.start_span('turn', task='edit')
+    with tracing.span('prompt.build') as build:
+        with tracing.span('file.analysis', path='zordss0100.c', bytes=1024):
+            time.sleep(0.002)
+        build.set(messages=5)
+    try:
+        with tracing.span('llm.request'):
+            raise RuntimeError('timeout')
+    except RuntimeError:
+        pass
+    turn.end()
+    turn.end()  # 두 번 불러도 한 번만 기록
+
+    events = [event for event in load_trace(trace_file) if event['ph'] == 'X']
+    by_name = {event['name']: event for event in events}
+    assert [event['name'] for event in events] == ['file.analysis', 'prompt.build', 'llm.request', 'turn']
+    assert by_name['prompt.build']['args'] == {'messages': 5}
+    assert by_name['file.analysis']['args']['bytes'] == 1024
+    assert by_name['llm.request']['args']['error'] == 'RuntimeError'
+    assert by_name['file.analysis']['dur'] >= 2000  # 마이크로초
+
+    # 자식 구간은 부모 구간 안에 있어야 뷰어에서 중첩되어 보임
+    outer, inner = by_name['turn'], by_name['prompt.build']
+    assert outer['ts'] <= inner['ts'] and inner['ts'] + inner['dur'] <= outer['ts'] + outer['dur']
+
+
+def test_spans_from_worker_threads_get_thread_names(trace_file):
+    def work():
+        with tracing.span('llm.request', candidate=0):
+            pass
+
+    worker = threading.Thread(target=work, name='coe-candidate_0')
+    worker.start()
+    worker.join()
+
+    events = load_trace(trace_file)
+    names = {event['args']['name'] for event in events if event['ph'] == 'M'}
+    assert 'coe-candidate_0' in names
+    assert any(event['name'] == 'llm.request' and event['args'] == {'candidate': 0} for event in events)
+
+
+def test_disabled_tracing_is_a_shared_no_op():
+    tracing.configure(None)
+    assert not tracing.is_enabled()
+    assert tracing.span('turn') is tracing.NULL_SPAN
+    assert tracing.llm_response_attrs({'choices': [{'message': {'content': 'x'}}]}) == {}
+
+    start = time.perf_counter()
+    for _ in range(100000):
+        with tracing.span('render', kind='answer') as s:
+            s.set(chars=1)
+    assert time.perf_counter() - start < 1.0
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+WebSquare XML 스트리밍 스캐너 테스트
+"""
+import re
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from actions.xml_scanner import scan_xml
+from actions.file_manager import FileManager
+
+SCREEN_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<!--
+  FormID(명) : ZORDSS0340082.XML
+  Form 설명 : 주문 상품 그룹 조회
+-->
+<html xmlns="http://www.w3.org/1999/xhtml" xmlns:w2="http://www.inswave.com/websquare">
+<head>
+  <w2:dataCollection>
+    <w2:dataList id="dlt_ordList" baseNode="list"/>
+    <w2:dataList id="dlt_prdGrp" baseNode="list"/>
+  </w2:dataCollection>
+  <script type="javascript"><![CDATA[
+    var TrxCode = "ZORDSS0340082_TR01";
+    scwin.onpageload = function() {
+        com.setCombo(svcCombo1, { TP: "ZORDSS0340082_TR02" });
+    };
+    scwin.btn_search_onclick = function() {
+        if (a < b && c) { gcm.submit(TrxCode); }
+    };
+  ]]></script>
+</head>
+<body>
+  <w2:svcCombo id="svcCombo1"/>
+  <xf:select1 id="svcCombo2" ev:onchange="scwin.cmb_onchange()"/>
+</body>
+</html>
+"""
+
+
+def assert_screen(result):
+    assert result.form_id == 'ZORDSS0340082'
+    assert result.form_description == '주문 상품 그룹 조회'
+    assert result.datalist_ids == ['dlt_ordList', 'dlt_prdGrp']
+    assert result.trx_codes == ['ZORDSS0340082_TR01', 'ZORDSS0340082_TR02']
+    assert result.functions == ['onpageload', 'btn_search_onclick']
+    assert result.svc_combo_count == 4  # 기존 분석과 같이 스크립트 참조/id 속성까지 모두 셈
+
+
+def test_well_formed_screen():
+    """정상 XML은 expat 스트리밍 파서로 분석"""
+    result = scan_xml(SCREEN_XML)
+
+    assert result.well_formed
+    assert_screen(result)
+    assert result.elements[:3] == ['html', 'head', 'w2:dataCollection']
+    assert 'scwin.cmb_onchange' in result.scripts
+    assert result.svc_combo_count == len(re.findall(r'svcCombo', SCREEN_XML, re.IGNORECASE))  # 기존 FileManager 분석
+
+
+def test_small_chunks_give_same_result():
+    """청크 경계가 패턴 중간에 걸려도 같은 결과"""
+    for chunk_size in (1, 7, 64):
+        assert scan_xml(SCREEN_XML, chunk_size=chunk_size) == scan_xml(SCREEN_XML)
+
+
+def test_malformed_screen_falls_back_to_lexical_scan():
+    """미정의 엔티티, CDATA 없는 스크립트의 '<'/'&', 닫히지 않은 태그도 분석"""
+    malformed = (SCREEN_XML
+                 .replace('<![CDATA[', '').replace(']]>', '')
+                 .replace('<body>', '<body>&nbsp;<div>'))
+    result = scan_xml(malformed)
+
+    assert not result.well_formed
+    assert_screen(result)
+
+
+def test_file_manager_xml_analysis(tmp_path):
+    """FileManager XML 분석이 스캐너 결과를 사용"""
+    path = tmp_path / 'ZORDSS0340082.XML'
+    path.write_text(SCREEN_XML, encoding='utf-8')
+
+    fm = FileManager()
+    result = fm.add_single_file(str(path))
+
+    assert result['file_type'] == 'xml_file'
+    assert result['analysis']['form_id'] == 'ZORDSS0340082'
+    assert result['analysis']['svc_combo_count'] == 4